@@ -2,7 +2,6 @@ from __future__ import print_function
 
 __docformat__ = 'restructuredtext'
 
-from distutils.version import LooseVersion
 import os
 import sys
 
@@ -39,7 +38,7 @@ class PytestTester(object):
     def __call__(self, extra_args=None, exit=False):
         try:
             import pytest
-            if not LooseVersion(pytest.__version__) >= LooseVersion('3.0'):
+            if int(pytest.__version__.split('.')[0]) < 3:
                 raise ImportError
             extra_args = ['--tb=short','--disable-pytest-warnings'] if extra_args is None else extra_args
             cmd = [self.package_path] + extra_args
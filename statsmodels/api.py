@@ -1,51 +1,89 @@
 # -*- coding: utf-8 -*-
-from . import iolib
-from . import datasets
-from . import tools
-from .tools.tools import add_constant, categorical
-from . import regression
-from .regression.linear_model import OLS, GLS, WLS, GLSAR
-from .regression.recursive_ls import RecursiveLS
-from .regression.quantile_regression import QuantReg
-from .regression.mixed_linear_model import MixedLM
-from .genmod import api as genmod
-from .genmod.api import (GLM, GEE, OrdinalGEE, NominalGEE, families,
-                         cov_struct,
-                         BinomialBayesMixedGLM, PoissonBayesMixedGLM)
-from . import robust
-from .robust.robust_linear_model import RLM
-from .discrete.discrete_model import (Poisson, Logit, Probit,
-                                      MNLogit, NegativeBinomial,
-                                      GeneralizedPoisson,
-                                      NegativeBinomialP)
-from .discrete.count_model import (ZeroInflatedPoisson,
-                                   ZeroInflatedGeneralizedPoisson,
-                                   ZeroInflatedNegativeBinomialP)
-from .tsa import api as tsa
-from .duration.survfunc import SurvfuncRight
-from .duration.hazard_regression import PHReg
-from .imputation.mice import MICE, MICEData
-from .imputation.bayes_mi import BayesGaussMI, MI
-from .nonparametric import api as nonparametric
-from . import distributions
-from .__init__ import test
+"""
+Main statsmodels API
 
-from .graphics.gofplots import qqplot, qqplot_2samples, qqline, ProbPlot
-from .graphics import api as graphics
-from .stats import api as stats
-from .emplike import api as emplike
-from .duration import api as duration
-from .multivariate.pca import PCA
-from .multivariate.manova import MANOVA
-from .multivariate.factor import Factor
-from .multivariate import api as multivariate
+Models, subpackage APIs and functions are imported on first access, so that
+``import statsmodels.api as sm`` does not load every model family, the
+compiled time series code or matplotlib. See statsmodels.tools._lazy.
+"""
+from statsmodels.tools._lazy import install_lazy_attributes
 
-from .formula import api as formula
+from . import test
 
-from .iolib.smpickle import load_pickle as load
+__all__ = ['test']
 
-from .tools.print_version import show_versions
-from .tools.web import webdoc
+install_lazy_attributes(globals(), {
+    'iolib': ('statsmodels.iolib', None),
+    'datasets': ('statsmodels.datasets', None),
+    'tools': ('statsmodels.tools', None),
+    'add_constant': ('statsmodels.tools.tools', 'add_constant'),
+    'categorical': ('statsmodels.tools.tools', 'categorical'),
+    'regression': ('statsmodels.regression', None),
+    'OLS': ('statsmodels.regression.linear_model', 'OLS'),
+    'GLS': ('statsmodels.regression.linear_model', 'GLS'),
+    'WLS': ('statsmodels.regression.linear_model', 'WLS'),
+    'GLSAR': ('statsmodels.regression.linear_model', 'GLSAR'),
+    'RecursiveLS': ('statsmodels.regression.recursive_ls', 'RecursiveLS'),
+    'QuantReg': ('statsmodels.regression.quantile_regression', 'QuantReg'),
+    'MixedLM': ('statsmodels.regression.mixed_linear_model', 'MixedLM'),
+    'genmod': ('statsmodels.genmod.api', None),
+    'GLM': ('statsmodels.genmod.generalized_linear_model', 'GLM'),
+    'GEE': ('statsmodels.genmod.generalized_estimating_equations', 'GEE'),
+    'OrdinalGEE': ('statsmodels.genmod.generalized_estimating_equations',
+                   'OrdinalGEE'),
+    'NominalGEE': ('statsmodels.genmod.generalized_estimating_equations',
+                   'NominalGEE'),
+    'families': ('statsmodels.genmod.families', None),
+    'cov_struct': ('statsmodels.genmod.cov_struct', None),
+    'BinomialBayesMixedGLM': ('statsmodels.genmod.bayes_mixed_glm',
+                              'BinomialBayesMixedGLM'),
+    'PoissonBayesMixedGLM': ('statsmodels.genmod.bayes_mixed_glm',
+                             'PoissonBayesMixedGLM'),
+    'robust': ('statsmodels.robust', None),
+    'RLM': ('statsmodels.robust.robust_linear_model', 'RLM'),
+    'Poisson': ('statsmodels.discrete.discrete_model', 'Poisson'),
+    'Logit': ('statsmodels.discrete.discrete_model', 'Logit'),
+    'Probit': ('statsmodels.discrete.discrete_model', 'Probit'),
+    'MNLogit': ('statsmodels.discrete.discrete_model', 'MNLogit'),
+    'NegativeBinomial': ('statsmodels.discrete.discrete_model',
+                         'NegativeBinomial'),
+    'GeneralizedPoisson': ('statsmodels.discrete.discrete_model',
+                           'GeneralizedPoisson'),
+    'NegativeBinomialP': ('statsmodels.discrete.discrete_model',
+                          'NegativeBinomialP'),
+    'ZeroInflatedPoisson': ('statsmodels.discrete.count_model',
+                            'ZeroInflatedPoisson'),
+    'ZeroInflatedGeneralizedPoisson': ('statsmodels.discrete.count_model',
+                                       'ZeroInflatedGeneralizedPoisson'),
+    'ZeroInflatedNegativeBinomialP': ('statsmodels.discrete.count_model',
+                                      'ZeroInflatedNegativeBinomialP'),
+    'tsa': ('statsmodels.tsa.api', None),
+    'SurvfuncRight': ('statsmodels.duration.survfunc', 'SurvfuncRight'),
+    'PHReg': ('statsmodels.duration.hazard_regression', 'PHReg'),
+    'MICE': ('statsmodels.imputation.mice', 'MICE'),
+    'MICEData': ('statsmodels.imputation.mice', 'MICEData'),
+    'BayesGaussMI': ('statsmodels.imputation.bayes_mi', 'BayesGaussMI'),
+    'MI': ('statsmodels.imputation.bayes_mi', 'MI'),
+    'nonparametric': ('statsmodels.nonparametric.api', None),
+    'distributions': ('statsmodels.distributions', None),
+    'qqplot': ('statsmodels.graphics.gofplots', 'qqplot'),
+    'qqplot_2samples': ('statsmodels.graphics.gofplots', 'qqplot_2samples'),
+    'qqline': ('statsmodels.graphics.gofplots', 'qqline'),
+    'ProbPlot': ('statsmodels.graphics.gofplots', 'ProbPlot'),
+    'graphics': ('statsmodels.graphics.api', None),
+    'stats': ('statsmodels.stats.api', None),
+    'emplike': ('statsmodels.emplike.api', None),
+    'duration': ('statsmodels.duration.api', None),
+    'PCA': ('statsmodels.multivariate.pca', 'PCA'),
+    'MANOVA': ('statsmodels.multivariate.manova', 'MANOVA'),
+    'Factor': ('statsmodels.multivariate.factor', 'Factor'),
+    'multivariate': ('statsmodels.multivariate.api', None),
+    'formula': ('statsmodels.formula.api', None),
+    'load': ('statsmodels.iolib.smpickle', 'load_pickle'),
+    'show_versions': ('statsmodels.tools.print_version', 'show_versions'),
+    'webdoc': ('statsmodels.tools.web', 'webdoc'),
+    })
+del install_lazy_attributes
 
 import os
 
@@ -1,6 +1,12 @@
+import mmap
+import os
+import shutil
+import tempfile
+from timeit import default_timer
+
 from statsmodels.base.elastic_net import RegularizedResults
-from statsmodels.stats.regularized_covariance import _calc_nodewise_row, \
-    _calc_nodewise_weight, _calc_approx_inv_cov
+from statsmodels.stats.regularized_covariance import _nodewise_from_gram, \
+    _calc_approx_inv_cov
 from statsmodels.base.model import LikelihoodModelResults
 from statsmodels.regression.linear_model import OLS
 import numpy as np
@@ -10,6 +16,9 @@ Distributed estimation routines. Currently, we support several
 methods of distribution
 
 - sequential, has no extra dependencies
+- executor, any object with a ``map`` method such as the executors of
+  concurrent.futures or a multiprocessing pool.  The partitions are
+  passed to the workers as memory mapped files.
 - parallel
     - with joblib
         A variety of backends are supported through joblib
@@ -244,6 +253,37 @@ def _est_regularized_debiased(mod, mnum, partitions, fit_kwds=None,
         A list of array like objects for nodewise_weight
     """
 
+    params, grad, gram = _est_regularized_gram(mod, mnum, partitions,
+                                               fit_kwds, score_kwds,
+                                               hess_kwds)
+
+    nodewise_row_l = []
+    nodewise_weight_l = []
+    for idx in _nodewise_range(mnum, partitions, gram.shape[0]):
+
+        nodewise_row, nodewise_weight = _nodewise_from_gram(
+            gram, idx, fit_kwds["alpha"])
+        nodewise_row_l.append(nodewise_row)
+        nodewise_weight_l.append(nodewise_weight)
+
+    return params, grad, nodewise_row_l, nodewise_weight_l
+
+
+def _est_regularized_gram(mod, mnum, partitions, fit_kwds=None,
+                          score_kwds=None, hess_kwds=None):
+    """the part of _est_regularized_debiased that needs the data of the
+    partition.
+
+    Parameters
+    ----------
+    See _est_regularized_debiased.
+
+    Returns
+    -------
+    A tuple of the fitted parameters, the gradient and the Gram matrix of
+    the weighted design, which is all that the nodewise regressions need.
+    """
+
     score_kwds = {} if score_kwds is None else score_kwds
     hess_kwds = {} if hess_kwds is None else hess_kwds
 
@@ -258,26 +298,32 @@ def _est_regularized_debiased(mod, mnum, partitions, fit_kwds=None,
     else:
         L1_wt = 1
 
-    nobs, p = mod.exog.shape
-    p_part = int(np.ceil((1. * p) / partitions))
+    nobs = mod.exog.shape[0]
 
     params = mod.fit_regularized(**fit_kwds).params
     grad = _calc_grad(mod, params, alpha, L1_wt, score_kwds) / nobs
 
     wexog = _calc_wdesign_mat(mod, params, hess_kwds)
+    gram = wexog.T.dot(wexog) / nobs
 
-    nodewise_row_l = []
-    nodewise_weight_l = []
-    for idx in range(mnum * p_part, min((mnum + 1) * p_part, p)):
+    return params, grad, gram
 
-        nodewise_row = _calc_nodewise_row(wexog, idx, alpha)
-        nodewise_row_l.append(nodewise_row)
 
-        nodewise_weight = _calc_nodewise_weight(wexog, nodewise_row, idx,
-                                                alpha)
-        nodewise_weight_l.append(nodewise_weight)
+def _nodewise_range(mnum, partitions, p):
+    """indices of the variables whose nodewise regressions are run for
+    partition mnum.
+    """
 
-    return params, grad, nodewise_row_l, nodewise_weight_l
+    p_part = int(np.ceil((1. * p) / partitions))
+    return range(mnum * p_part, min((mnum + 1) * p_part, p))
+
+
+def _nodewise_task(task):
+    """unpacks a (gram, idx, alpha) task, gram can be a _SharedArray."""
+    gram, idx, alpha = task
+    if isinstance(gram, _SharedArray):
+        gram = gram.load()
+    return _nodewise_from_gram(gram, idx, alpha)
 
 
 def _join_debiased(results_l, threshold=0):
@@ -326,7 +372,7 @@ def _join_debiased(results_l, threshold=0):
 
 
 def _helper_fit_partition(self, pnum, endog, exog, fit_kwds,
-                          init_kwds_e={}):
+                          init_kwds_e={}, estimation_method=None):
     """handles the model fitting for each machine. NOTE: this
     is primarily handled outside of DistributedModel because
     joblib can't handle class methods.
@@ -345,6 +391,8 @@ def _helper_fit_partition(self, pnum, endog, exog, fit_kwds,
         Keywords needed for the model fitting.
     init_kwds_e : dict-like
         Additional init_kwds to add for each partition.
+    estimation_method : function or None
+        Replaces self.estimation_method if not None.
 
     Returns
     -------
@@ -355,13 +403,113 @@ def _helper_fit_partition(self, pnum, endog, exog, fit_kwds,
     temp_init_kwds = self.init_kwds.copy()
     temp_init_kwds.update(init_kwds_e)
 
+    if estimation_method is None:
+        estimation_method = self.estimation_method
+
     model = self.model_class(endog, exog, **temp_init_kwds)
-    results = self.estimation_method(model, pnum, self.partitions,
-                                     fit_kwds=fit_kwds,
-                                     **self.estimation_kwds)
+    results = estimation_method(model, pnum, self.partitions,
+                                fit_kwds=fit_kwds, **self.estimation_kwds)
     return results
 
 
+def _timed_fit_partition(self, pnum, endog, exog, fit_kwds,
+                         init_kwds_e={}, estimation_method=None):
+    """calls _helper_fit_partition and records the time used.
+
+    Parameters
+    ----------
+    See _helper_fit_partition.  endog and exog can also be _SharedArray
+    instances that are loaded in the worker.
+
+    Returns
+    -------
+    A tuple of the estimation_method result and a dict with the partition
+    index, the time to load the data, the time to fit the model and the
+    process id of the worker.
+    """
+
+    t0 = default_timer()
+    if isinstance(endog, _SharedArray):
+        endog = endog.load()
+    if isinstance(exog, _SharedArray):
+        exog = exog.load()
+    t1 = default_timer()
+    results = _helper_fit_partition(self, pnum, endog, exog, fit_kwds,
+                                    init_kwds_e, estimation_method)
+    t2 = default_timer()
+    timing = {"partition": pnum, "load": t1 - t0, "fit": t2 - t1,
+              "pid": os.getpid()}
+    return results, timing
+
+
+def _timed_fit_task(task):
+    """unpacks a task tuple for executors whose map takes one iterable."""
+    return _timed_fit_partition(*task)
+
+
+class _SharedArray(object):
+    """
+    Reference to an array stored in a file, loaded as a read-only memmap
+
+    Only the file name, dtype, shape and offset are pickled when the
+    reference is sent to a worker process, the data is not copied.
+    """
+
+    def __init__(self, filename, dtype, shape, offset):
+        self.filename = filename
+        self.dtype = np.dtype(dtype)
+        self.shape = tuple(shape)
+        self.offset = offset
+
+    def load(self):
+        if 0 in self.shape:
+            return np.empty(self.shape, dtype=self.dtype)
+        return np.memmap(self.filename, dtype=self.dtype, mode="r",
+                         shape=self.shape, offset=self.offset)
+
+
+def _memmap_location(arr):
+    """file name and offset of a C-contiguous view into a memmap, or None
+    if arr is not backed by a file.
+    """
+
+    mm = getattr(arr, "_mmap", None)
+    if (not isinstance(arr, np.memmap) or mm is None or
+            arr.filename is None or not arr.flags.c_contiguous):
+        return None
+    # np.memmap maps the file from the last allocation boundary before its
+    # offset, views share the mmap but not the offset attribute
+    start = arr.offset - arr.offset % mmap.ALLOCATIONGRANULARITY
+    base = np.frombuffer(mm, dtype=np.uint8).__array_interface__["data"][0]
+    return arr.filename, start + arr.__array_interface__["data"][0] - base
+
+
+def _share_array(arr, dirname, name):
+    """returns a _SharedArray for arr, writing it to dirname if it is not
+    already a view into a file backed memmap.
+    """
+
+    location = _memmap_location(arr)
+    if location is not None:
+        return _SharedArray(location[0], arr.dtype, arr.shape, location[1])
+    arr = np.ascontiguousarray(arr)
+    filename = os.path.join(dirname, name + ".npy")
+    np.save(filename, arr)
+    shared = np.load(filename, mmap_mode="r")
+    return _SharedArray(filename, arr.dtype, arr.shape, shared.offset)
+
+
+def _is_thread_executor(executor):
+    from multiprocessing.pool import ThreadPool
+    if isinstance(executor, ThreadPool):
+        return True
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+    except ImportError:
+        return False
+    return isinstance(executor, ThreadPoolExecutor)
+
+
 class DistributedModel(object):
     __doc__ = """
     Distributed model class
@@ -418,6 +566,11 @@ class DistributedModel(object):
         See Parameters.
     results_kwds : dict-like
         See Parameters.
+    partition_timings : list
+        Set by `fit`.  For each partition a dict with the keys
+        "partition", "load", the seconds used to load the data in the
+        worker, "fit", the seconds used by `estimation_method`, and
+        "pid", the process id of the worker.
 
     Examples
     --------
@@ -473,8 +626,10 @@ class DistributedModel(object):
         else:
             self.results_kwds = results_kwds
 
+        self.partition_timings = []
+
     def fit(self, data_generator, fit_kwds=None, parallel_method="sequential",
-            parallel_backend=None, init_kwds_generator=None):
+            parallel_backend=None, init_kwds_generator=None, executor=None):
         """Performs the distributed estimation using the corresponding
         DistributedModel
 
@@ -488,7 +643,7 @@ class DistributedModel(object):
             Keywords needed for the model fitting.
         parallel_method : str
             type of distributed estimation to be used, currently
-            "sequential", "joblib" and "dask" are supported.
+            "sequential", "executor" and "joblib" are supported.
         parallel_backend : None or joblib parallel_backend object
             used to allow support for more complicated backends,
             ex: dask.distributed
@@ -496,6 +651,9 @@ class DistributedModel(object):
             Additional keyword generator that produces model init_kwds
             that may vary based on data partition.  The current usecase
             is for WLS and GLS
+        executor : executor instance or None
+            Only used if parallel_method is "executor", see
+            `fit_executor`.
 
         Returns
         -------
@@ -510,6 +668,11 @@ class DistributedModel(object):
             results_l = self.fit_sequential(data_generator, fit_kwds,
                                             init_kwds_generator)
 
+        elif parallel_method == "executor":
+            results_l = self.fit_executor(
+                data_generator, fit_kwds, executor=executor,
+                init_kwds_generator=init_kwds_generator)
+
         elif parallel_method == "joblib":
             results_l = self.fit_joblib(data_generator, fit_kwds,
                                         parallel_backend,
@@ -554,15 +717,15 @@ class DistributedModel(object):
         p length array.
         """
 
-        results_l = []
+        timed_l = []
 
         if init_kwds_generator is None:
 
             for pnum, (endog, exog) in enumerate(data_generator):
 
-                results = _helper_fit_partition(self, pnum, endog, exog,
-                                                fit_kwds)
-                results_l.append(results)
+                results = _timed_fit_partition(self, pnum, endog, exog,
+                                               fit_kwds)
+                timed_l.append(results)
 
         else:
 
@@ -571,12 +734,138 @@ class DistributedModel(object):
 
             for pnum, ((endog, exog), init_kwds_e) in tup_gen:
 
-                results = _helper_fit_partition(self, pnum, endog, exog,
-                                                fit_kwds, init_kwds_e)
-                results_l.append(results)
+                results = _timed_fit_partition(self, pnum, endog, exog,
+                                               fit_kwds, init_kwds_e)
+                timed_l.append(results)
+
+        return self._split_timings(timed_l)
+
+    def _split_timings(self, timed_l):
+        """stores the timings of (results, timing) pairs and returns the
+        results
+        """
+        timed_l = list(timed_l)
+        self.partition_timings = [t[1] for t in timed_l]
+        return [t[0] for t in timed_l]
+
+    def fit_executor(self, data_generator, fit_kwds, executor=None,
+                     init_kwds_generator=None, share_data=None):
+        """Performs the distributed estimation in parallel using an
+        executor
+
+        Parameters
+        ----------
+        data_generator : generator
+            A generator that produces a sequence of tuples where the first
+            element in the tuple corresponds to an endog array and the
+            element corresponds to an exog array.
+        fit_kwds : dict-like
+            Keywords needed for the model fitting.
+        executor : executor instance or None
+            An object with a ``map(func, iterable)`` method that returns
+            the results in order, for example a
+            ``concurrent.futures.ProcessPoolExecutor``, a
+            ``concurrent.futures.ThreadPoolExecutor`` or a
+            ``multiprocessing.Pool``.  If None, a process pool with one
+            worker per partition is created and shut down after the fit.
+        init_kwds_generator : generator or None
+            Additional keyword generator that produces model init_kwds
+            that may vary based on data partition.  The current usecase
+            is for WLS and GLS
+        share_data : bool or None
+            If True, the partitions are passed to the workers as memory
+            mapped files instead of being pickled.  Partitions that are
+            C-contiguous views into a file backed ``np.memmap``, for
+            example from ``np.load(fname, mmap_mode="r")``, are passed
+            without copying, other partitions are written once to a
+            temporary directory.  The default is True unless `executor` is
+            a thread pool, where the data is shared anyway.
+
+        Returns
+        -------
+        A list of the estimation_method results for each partition.
+
+        Notes
+        -----
+        With the default estimation_method, _est_regularized_debiased,
+        the nodewise regressions are not run in the task of their
+        partition.  Each nodewise regression is a separate task of
+        `executor` that only needs the Gram matrix of the weighted design
+        of its partition, and the "fit" timings exclude them.
+        """
+
+        own_executor = executor is None
+        if own_executor:
+            try:
+                from concurrent.futures import ProcessPoolExecutor
+                executor = ProcessPoolExecutor(self.partitions)
+            except ImportError:
+                from multiprocessing import Pool
+                executor = Pool(self.partitions)
+        if share_data is None:
+            share_data = not _is_thread_executor(executor)
+
+        if init_kwds_generator is None:
+            tup_gen = ((data, {}) for data in data_generator)
+        else:
+            tup_gen = zip(data_generator, init_kwds_generator)
+
+        # the nodewise regressions are run as separate tasks
+        debiased = self.estimation_method is _est_regularized_debiased
+        estimation_method = _est_regularized_gram if debiased else None
+
+        dirname = tempfile.mkdtemp() if share_data else None
+        try:
+            tasks = []
+            for pnum, ((endog, exog), init_kwds_e) in enumerate(tup_gen):
+                if share_data:
+                    endog = _share_array(endog, dirname, "endog%d" % pnum)
+                    exog = _share_array(exog, dirname, "exog%d" % pnum)
+                tasks.append((self, pnum, endog, exog, fit_kwds,
+                              init_kwds_e, estimation_method))
+            results_l = self._split_timings(executor.map(_timed_fit_task,
+                                                         tasks))
+            if debiased:
+                results_l = self._nodewise_executor(results_l, fit_kwds,
+                                                    executor, dirname)
+        finally:
+            if own_executor:
+                if hasattr(executor, "shutdown"):
+                    executor.shutdown()
+                else:
+                    executor.close()
+                    executor.join()
+            if dirname is not None:
+                shutil.rmtree(dirname, ignore_errors=True)
 
         return results_l
 
+    def _nodewise_executor(self, results_l, fit_kwds, executor, dirname):
+        """runs the nodewise regressions for the (params, grad, gram)
+        results of _est_regularized_gram on executor and returns the
+        results of _est_regularized_debiased.
+        """
+
+        tasks = []
+        ranges = []
+        for pnum, (_, _, gram) in enumerate(results_l):
+            if dirname is not None:
+                gram = _share_array(gram, dirname, "gram%d" % pnum)
+            idx_range = _nodewise_range(pnum, self.partitions, gram.shape[0])
+            tasks.extend((gram, idx, fit_kwds["alpha"]) for idx in idx_range)
+            ranges.append(len(idx_range))
+
+        nodewise_l = list(executor.map(_nodewise_task, tasks))
+
+        debiased_l = []
+        start = 0
+        for (params, grad, _), n_idx in zip(results_l, ranges):
+            nodewise = nodewise_l[start:start + n_idx]
+            start += n_idx
+            debiased_l.append((params, grad, [r[0] for r in nodewise],
+                               [r[1] for r in nodewise]))
+        return debiased_l
+
     def fit_joblib(self, data_generator, fit_kwds, parallel_backend,
                    init_kwds_generator=None):
         """Performs the distributed estimation in parallel using joblib
@@ -605,7 +894,7 @@ class DistributedModel(object):
 
         from statsmodels.tools.parallel import parallel_func
 
-        par, f, n_jobs = parallel_func(_helper_fit_partition, self.partitions)
+        par, f, n_jobs = parallel_func(_timed_fit_partition, self.partitions)
 
         if parallel_backend is None and init_kwds_generator is None:
             results_l = par(f(self, pnum, endog, exog, fit_kwds)
@@ -631,7 +920,7 @@ class DistributedModel(object):
                                 for pnum, ((endog, exog), init_kwds)
                                 in tup_gen)
 
-        return results_l
+        return self._split_timings(results_l)
 
 
 class DistributedResults(LikelihoodModelResults):
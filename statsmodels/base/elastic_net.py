@@ -62,7 +62,8 @@ def _gen_npfuncs(k, L1_wt, alpha, loglike_kwds, score_kwds, hess_kwds):
 def fit_elasticnet(model, method="coord_descent", maxiter=100,
                    alpha=0., L1_wt=1., start_params=None, cnvrg_tol=1e-7,
                    zero_tol=1e-8, refit=False, check_step=True,
-                   loglike_kwds=None, score_kwds=None, hess_kwds=None):
+                   loglike_kwds=None, score_kwds=None, hess_kwds=None,
+                   quadratic=None):
     """
     Return an elastic net regularized fit to a regression model.
 
@@ -107,6 +108,13 @@ def fit_elasticnet(model, method="coord_descent", maxiter=100,
         Keyword arguments for the score function.
     hess_kwds : dict-like or None
         Keyword arguments for the Hessian function.
+    quadratic : callable, optional
+        A function of `params` that returns a tuple ``(gram, xtz, exact)``
+        where ``0.5 * b' gram b - xtz' b`` is a quadratic approximation
+        to ``-loglike / nobs`` at `params` up to a constant, and `exact`
+        is True if the approximation is exact as for OLS. If given, the
+        covariance update coordinate descent algorithm is used, inside
+        IRLS iterations if `exact` is False.
 
     Returns
     -------
@@ -130,6 +138,11 @@ def fit_elasticnet(model, method="coord_descent", maxiter=100,
 
     then repeatedly optimize the L1 penalized version of this function
     along coordinate axes.
+
+    If `quadratic` is provided, the coordinate updates use the gradient
+    of the quadratic approximation, which is updated in O(k) operations
+    after each change of a coefficient, and the sweeps are restricted to
+    the nonzero coefficients between full sweeps over all variables.
     """
 
     k_exog = model.exog.shape[1]
@@ -147,6 +160,15 @@ def fit_elasticnet(model, method="coord_descent", maxiter=100,
     else:
         params = start_params.copy()
 
+    if quadratic is not None:
+        alpha = np.asarray(alpha, dtype=np.float64)
+        objective = _gen_objective(model, alpha, L1_wt, loglike_kwds)
+        params, itr = _fit_quadratic(quadratic, objective,
+                                     alpha * L1_wt, alpha * (1 - L1_wt),
+                                     params, maxiter, cnvrg_tol)
+        params[np.abs(params) < zero_tol] = 0
+        return _elasticnet_results(model, params, method, refit, itr)
+
     btol = 1e-4
     params_zero = np.zeros(len(params), dtype=bool)
 
@@ -208,6 +230,15 @@ def fit_elasticnet(model, method="coord_descent", maxiter=100,
     # Set approximate zero coefficients to be exactly zero
     params[np.abs(params) < zero_tol] = 0
 
+    return _elasticnet_results(model, params, method, refit, itr + 1)
+
+
+def _elasticnet_results(model, params, method, refit, n_iter):
+    """
+    Results instance of an elastic net fit, refit if requested.
+    """
+    k_exog = model.exog.shape[1]
+
     if not refit:
         results = RegularizedResults(model, params)
         return RegularizedResultsWrapper(results)
@@ -255,7 +286,7 @@ def fit_elasticnet(model, method="coord_descent", maxiter=100,
     refit = klass(model, params, cov, scale=scale)
     refit.regularized = True
     refit.method = method
-    refit.fit_history = {'iteration': itr + 1}
+    refit.fit_history = {'iteration': n_iter}
 
     # Restore df in model class, see issue #1723 for discussion.
     model.df_model, model.df_resid = p, q
@@ -263,6 +294,268 @@ def fit_elasticnet(model, method="coord_descent", maxiter=100,
     return refit
 
 
+def _gen_objective(model, alpha, L1_wt, loglike_kwds):
+    """
+    The penalized objective function, -loglike / nobs + penalty.
+    """
+
+    def objective(params):
+        pen = alpha * ((1 - L1_wt) * params**2 / 2 + L1_wt * np.abs(params))
+        llf = model.loglike(params, **loglike_kwds)
+        return -llf / model.nobs + pen.sum()
+
+    return objective
+
+
+def _coord_descent(gram, xtz, l1, l2, params, eligible, maxiter, tol):
+    """
+    Covariance update coordinate descent for a quadratic objective.
+
+    Minimizes
+
+    0.5 * b' gram b - xtz' b + sum(l1 * abs(b)) + sum(l2 * b**2) / 2
+
+    over the coefficients in `eligible`, the others are kept at their
+    current value.
+
+    Parameters
+    ----------
+    gram : ndarray
+        k x k positive semi-definite matrix.
+    xtz : ndarray
+        Vector of length k.
+    l1, l2 : ndarray
+        The L1 and L2 penalty weights for each coefficient.
+    params : ndarray
+        Starting values, modified in place.
+    eligible : ndarray
+        Boolean mask of the coefficients that are optimized.
+    maxiter : int
+        The maximum number of sweeps over all eligible coefficients.
+    tol : float
+        Convergence threshold for the largest change of a coefficient
+        in a sweep.
+
+    Returns
+    -------
+    params : ndarray
+        The minimizer.
+    grad : ndarray
+        ``xtz - gram b``, the negative gradient of the unpenalized
+        quadratic at the minimizer.
+
+    Notes
+    -----
+    After a full sweep the algorithm iterates over the nonzero
+    coefficients until convergence and then performs another full
+    sweep, it stops when a full sweep does not change the coefficients
+    by more than `tol`.
+    """
+    grad = xtz - gram.dot(params)
+    diag = np.diag(gram) + l2
+
+    def sweep(idx):
+        max_change = 0.
+        for j in idx:
+            bj = params[j]
+            r = grad[j] + gram[j, j] * bj
+            if diag[j] <= 0 or abs(r) <= l1[j]:
+                new = 0.
+            elif r > 0:
+                new = (r - l1[j]) / diag[j]
+            else:
+                new = (r + l1[j]) / diag[j]
+            delta = new - bj
+            if delta != 0:
+                # gram is symmetric, a row is contiguous in memory
+                grad[:] -= gram[j] * delta
+                params[j] = new
+                max_change = max(max_change, abs(delta))
+        return max_change
+
+    idx_all = np.flatnonzero(eligible)
+    for _ in range(maxiter):
+        if sweep(idx_all) < tol:
+            break
+        active = idx_all[params[idx_all] != 0]
+        for _ in range(max(maxiter, 1000)):
+            if sweep(active) < tol:
+                break
+
+    return params, grad
+
+
+def _fit_quadratic(quadratic, objective, l1, l2, params, maxiter, tol,
+                   screen=None):
+    """
+    Elastic net fit by coordinate descent on quadratic approximations.
+
+    Parameters
+    ----------
+    quadratic : callable
+        See `fit_elasticnet`.
+    objective : callable
+        The penalized objective function, used for step halving if the
+        quadratic approximation is not exact.
+    l1, l2 : ndarray
+        The L1 and L2 penalty weights for each coefficient.
+    params : ndarray
+        Starting values.
+    maxiter : int
+        The maximum number of IRLS iterations and of coordinate descent
+        sweeps within an iteration.
+    tol : float
+        Convergence threshold for the change in the coefficients.
+    screen : ndarray, optional
+        Boolean mask of the coefficients that are not discarded by a
+        screening rule. Discarded coefficients are fixed at zero unless
+        they violate the optimality conditions at the solution.
+
+    Returns
+    -------
+    params : ndarray
+        The estimated coefficients.
+    itr : int
+        The number of iterations.
+    """
+    params = np.asarray(params, dtype=np.float64).copy()
+    if screen is None:
+        eligible = np.ones(len(params), dtype=bool)
+    else:
+        eligible = screen | (params != 0)
+    params[~eligible] = 0
+    obj = None
+    for itr in range(maxiter):
+        gram, xtz, exact = quadratic(params)
+        params_old = params.copy()
+        while True:
+            params, grad = _coord_descent(gram, xtz, l1, l2, params,
+                                          eligible, maxiter, tol)
+            # check the optimality conditions of the screened coefficients
+            violations = ~eligible & (np.abs(grad) > l1 + tol)
+            if not violations.any():
+                break
+            eligible |= violations
+        if exact:
+            break
+
+        # step halving if the quadratic approximation is poor
+        if obj is None:
+            obj = objective(params_old)
+        obj_new = objective(params)
+        step = params - params_old
+        for _ in range(20):
+            if np.isfinite(obj_new) and obj_new <= obj + 1e-12:
+                break
+            step /= 2
+            params = params_old + step
+            obj_new = objective(params)
+        obj = obj_new
+
+        if np.max(np.abs(params - params_old)) < tol:
+            break
+
+    return params, itr + 1
+
+
+def fit_elasticnet_path(model, alphas, L1_wt=1., start_params=None,
+                        quadratic=None, maxiter=100, cnvrg_tol=1e-7,
+                        zero_tol=1e-8, loglike_kwds=None, **kwargs):
+    """
+    Elastic net fits for a sequence of penalty weights.
+
+    Parameters
+    ----------
+    model : model object
+        A statsmodels object implementing ``loglike``, ``score``, and
+        ``hessian``.
+    alphas : array-like
+        The penalty weights, scalars that apply to all coefficients.
+        Each fit is started at the solution for the previous weight, so
+        that a decreasing sequence is most efficient.
+    L1_wt : scalar
+        The fraction of the penalty given to the L1 penalty term.
+    start_params : array-like
+        Starting values for the first fit.
+    quadratic : callable, optional
+        Quadratic approximation of the log-likelihood, see
+        `fit_elasticnet`. If not given, `fit_elasticnet` is called for
+        each penalty weight.
+    maxiter, cnvrg_tol, zero_tol : scalars
+        See `fit_elasticnet`.
+    loglike_kwds : dict-like or None
+        Keyword arguments for the log-likelihood function.
+    **kwargs
+        Additional keyword arguments for `fit_elasticnet`, only used if
+        `quadratic` is None.
+
+    Returns
+    -------
+    Bunch
+        `alphas`, the penalty weights, `params`, an array with the
+        coefficients for each penalty weight in the rows, and `n_iter`,
+        the number of iterations for each penalty weight.
+
+    Notes
+    -----
+    With `quadratic`, the sequential strong rule of Tibshirani et al.
+    (2012) discards coefficients whose gradient at the previous solution
+    is small relative to the change in the penalty weight. Discarded
+    coefficients are included again if they violate the optimality
+    conditions of the fit.
+
+    References
+    ----------
+    Tibshirani, R., Bien, J., Friedman, J., Hastie, T., Simon, N.,
+    Taylor, J., and Tibshirani, R. J. (2012). Strong rules for discarding
+    predictors in lasso-type problems. Journal of the Royal Statistical
+    Society: Series B, 74(2), 245-266.
+    """
+    from statsmodels.tools.tools import Bunch
+
+    k_exog = model.exog.shape[1]
+    loglike_kwds = {} if loglike_kwds is None else loglike_kwds
+    alphas = np.asarray(alphas, dtype=np.float64)
+    if alphas.ndim != 1:
+        raise ValueError('alphas must be a 1-dimensional sequence of '
+                         'penalty weights')
+    if start_params is None:
+        params = np.zeros(k_exog)
+    else:
+        params = np.array(start_params, dtype=np.float64)
+
+    path = np.zeros((len(alphas), k_exog))
+    n_iter = []
+    alpha_prev = None
+    for i, alpha in enumerate(alphas):
+        if quadratic is None:
+            rslt = fit_elasticnet(model, alpha=alpha, L1_wt=L1_wt,
+                                  start_params=params, maxiter=maxiter,
+                                  cnvrg_tol=cnvrg_tol, zero_tol=zero_tol,
+                                  loglike_kwds=loglike_kwds, **kwargs)
+            params = np.asarray(rslt.params).copy()
+            path[i] = params
+            n_iter.append(None)
+            continue
+
+        l1 = alpha * L1_wt * np.ones(k_exog)
+        l2 = alpha * (1 - L1_wt) * np.ones(k_exog)
+        screen = None
+        if alpha_prev is not None and alpha <= alpha_prev:
+            gram, xtz, _ = quadratic(params)
+            grad = xtz - gram.dot(params) - alpha_prev * (1 - L1_wt) * params
+            screen = np.abs(grad) >= L1_wt * (2 * alpha - alpha_prev)
+        objective = _gen_objective(model, alpha, L1_wt, loglike_kwds)
+        params, itr = _fit_quadratic(quadratic, objective, l1, l2, params,
+                                     maxiter, cnvrg_tol, screen=screen)
+        params[np.abs(params) < zero_tol] = 0
+        path[i] = params
+        n_iter.append(itr)
+        alpha_prev = alpha
+
+    return Bunch(alphas=alphas, params=path, n_iter=n_iter)
+
+
 def _opt_1d(func, grad, hess, model, start, L1_wt, tol,
             check_step=True):
     """
@@ -983,6 +983,7 @@ class Results(object):
         if transform and hasattr(self.model, 'formula') and (exog is not None):
             design_info = self.model.data.design_info
             from patsy import dmatrix
+            from statsmodels.formula.formulatools import _plan_dmatrix
             if isinstance(exog, pd.Series):
                 # we are guessing whether it should be column or row
                 if (hasattr(exog, 'name') and isinstance(exog.name, str) and
@@ -994,7 +995,11 @@ class Results(object):
                     exog = pd.DataFrame(exog).T
             orig_exog_len = len(exog)
             is_dict = isinstance(exog, dict)
-            exog = dmatrix(design_info, exog, return_type="dataframe")
+            exog_plan = _plan_dmatrix(design_info, exog)
+            if exog_plan is not None:
+                exog = exog_plan
+            else:
+                exog = dmatrix(design_info, exog, return_type="dataframe")
             if orig_exog_len > len(exog) and not is_dict:
                 import warnings
                 if exog_index is None:
@@ -2006,6 +2011,27 @@ class LikelihoodModelResults(Results):
 
         save_pickle(self, fname)
 
+    def to_scorer(self, include_cov=False):
+        """
+        Create a lightweight prediction artifact of these results
+
+        Parameters
+        ----------
+        include_cov : bool
+            If True, the covariance of the parameters is included so that
+            standard errors and confidence intervals of predictions are
+            available.
+
+        Returns
+        -------
+        Scorer
+            See :class:`statsmodels.iolib.scorer.Scorer`. The scorer can be
+            saved as JSON and restored with
+            :func:`statsmodels.iolib.scorer.load_scorer`.
+        """
+        from statsmodels.iolib.scorer import Scorer
+        return Scorer.from_results(self, include_cov=include_cov)
+
     @classmethod
     def load(cls, fname):
         """
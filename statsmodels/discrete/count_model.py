@@ -76,12 +76,9 @@ class GenericZeroInflated(CountModel):
         if inflation == 'logit':
             self.model_infl = Logit(np.zeros(self.exog_infl.shape[0]),
                                     self.exog_infl)
-            self._hessian_inflate = self._hessian_logit
         elif inflation == 'probit':
             self.model_infl = Probit(np.zeros(self.exog_infl.shape[0]),
                                     self.exog_infl)
-            self._hessian_inflate = self._hessian_probit
-
         else:
             raise ValueError("inflation == %s, which is not handled"
                              % inflation)
@@ -252,84 +249,61 @@ class GenericZeroInflated(CountModel):
         params_infl = params[:self.k_inflate]
         params_main = params[self.k_inflate:]
 
-        y = self.endog
-        w = self.model_infl.predict(params_infl)
-        w = np.clip(w, np.finfo(float).eps, 1 - np.finfo(float).eps)
+        zero = self.endog == 0
+        w, dw, _ = self._inflation_derivs(params_infl)
         score_main = self.model_main.score_obs(params_main)
-        llf_main = self.model_main.loglikeobs(params_main)
-        llf = self.loglikeobs(params)
-        zero_idx = np.nonzero(y == 0)[0]
-        nonzero_idx = np.nonzero(y)[0]
-
-        mu = self.model_main.predict(params_main)
+        pmf_main = np.exp(self.model_main.loglikeobs(params_main))
+        prob_zero = w + (1 - w) * pmf_main
 
-        dldp = np.zeros((self.exog.shape[0], self.k_exog), dtype=np.float64)
-        dldw = np.zeros_like(self.exog_infl, dtype=np.float64)
+        # derivatives with respect to the main and inflation linear
+        # predictors, y = 0 uses log(w + (1 - w) * pmf_main) and y > 0 uses
+        # log(1 - w) + llf_main
+        weights_main = np.where(zero, (1 - w) * pmf_main / prob_zero, 1)
+        dldw = np.where(zero, dw * (1 - pmf_main) / prob_zero, -dw / (1 - w))
 
-        dldp[zero_idx,:] = (score_main[zero_idx].T *
-                     (1 - (w[zero_idx]) / np.exp(llf[zero_idx]))).T
-        dldp[nonzero_idx,:] = score_main[nonzero_idx]
-
-        if self.inflation == 'logit':
-            dldw[zero_idx,:] =  (self.exog_infl[zero_idx].T * w[zero_idx] *
-                                 (1 - w[zero_idx]) *
-                                 (1 - np.exp(llf_main[zero_idx])) /
-                                  np.exp(llf[zero_idx])).T
-            dldw[nonzero_idx,:] = -(self.exog_infl[nonzero_idx].T *
-                                    w[nonzero_idx]).T
-        elif self.inflation == 'probit':
-            return approx_fprime(params, self.loglikeobs)
+        dldp = score_main * weights_main[:, None]
+        dldw = self.exog_infl * dldw[:, None]
 
         return np.hstack((dldw, dldp))
 
     def score(self, params):
         return self.score_obs(params).sum(0)
 
-    def _hessian_main(self, params):
-        pass
-
-    def _hessian_logit(self, params):
-        params_infl = params[:self.k_inflate]
-        params_main = params[self.k_inflate:]
-
-        y = self.endog
+    def _inflation_derivs(self, params_infl):
+        """
+        Inflation probability and its first two derivatives with respect to
+        the linear predictor of the inflation model
+        """
         w = self.model_infl.predict(params_infl)
         w = np.clip(w, np.finfo(float).eps, 1 - np.finfo(float).eps)
-        score_main = self.model_main.score_obs(params_main)
-        llf_main = self.model_main.loglikeobs(params_main)
-        llf = self.loglikeobs(params)
-        zero_idx = np.nonzero(y == 0)[0]
-        nonzero_idx = np.nonzero(y)[0]
+        if self.inflation == 'logit':
+            dw = w * (1 - w)
+            d2w = dw * (1 - 2 * w)
+        else:
+            linpred = np.dot(self.exog_infl, params_infl)
+            dw = self.model_infl.pdf(linpred)
+            d2w = -linpred * dw
+        return w, dw, d2w
 
-        hess_arr = np.zeros((self.k_inflate, self.k_exog + self.k_inflate))
-
-        pmf = np.exp(llf)
-
-        #d2l/dw2
-        for i in range(self.k_inflate):
-            for j in range(i, -1, -1):
-                hess_arr[i, j] = ((
-                    self.exog_infl[zero_idx, i] * self.exog_infl[zero_idx, j] *
-                    (w[zero_idx] * (1 - w[zero_idx]) * ((1 -
-                    np.exp(llf_main[zero_idx])) * (1 - 2 * w[zero_idx]) *
-                    np.exp(llf[zero_idx]) - (w[zero_idx] - w[zero_idx]**2) *
-                    (1 - np.exp(llf_main[zero_idx]))**2) /
-                    pmf[zero_idx]**2)).sum() -
-                    (self.exog_infl[nonzero_idx, i] * self.exog_infl[nonzero_idx, j] *
-                    w[nonzero_idx] * (1 - w[nonzero_idx])).sum())
-
-        #d2l/dpdw
-        for i in range(self.k_inflate):
-            for j in range(self.k_exog):
-                hess_arr[i, j + self.k_inflate] = -(score_main[zero_idx, j] *
-                    w[zero_idx] * (1 - w[zero_idx]) *
-                    self.exog_infl[zero_idx, i] / pmf[zero_idx]).sum()
+    def _hessian_main(self, params_main, weights):
+        """
+        Weighted sum of the observation Hessians of the main model
 
+        Returns None if the main model does not provide observation factors
+        of its Hessian, in which case the Hessian is computed numerically.
+        """
+        hessian_factors = getattr(self.model_main, '_hessian_factors', None)
+        if hessian_factors is None:
+            return None
+        hbb, hba, haa = hessian_factors(params_main)
+        exog = self.model_main.exog
+        k = exog.shape[1]
+        hess_arr = np.empty((k + 1, k + 1))
+        hess_arr[:-1, :-1] = np.dot(exog.T * (weights * hbb), exog)
+        hess_arr[-1, :-1] = hess_arr[:-1, -1] = np.dot(weights * hba, exog)
+        hess_arr[-1, -1] = np.dot(weights, haa)
         return hess_arr
 
-    def _hessian_probit(self, params):
-        pass
-
     def hessian(self, params):
         """
         Generic Zero Inflated model Hessian matrix of the loglikelihood
@@ -347,22 +321,50 @@ class GenericZeroInflated(CountModel):
 
         Notes
         -----
+        For y = 0 the loglikelihood is :math:`\\ln P` with
+        :math:`P = w + (1 - w) f`, where f is the pmf of the main model at
+        zero. With :math:`a = (1 - w) f / P` the main block is
+        :math:`a H_{main} + a (1 - a) s s'`, where s is the score and
+        :math:`H_{main}` the Hessian of the main model, and the cross
+        derivative with the inflation linear predictor is
+        :math:`-w' f s / P^2`. All blocks are computed as weighted cross
+        products of the observation arrays.
         """
-        hess_arr_main = self._hessian_main(params)
-        hess_arr_infl = self._hessian_inflate(params)
+        params_infl = params[:self.k_inflate]
+        params_main = params[self.k_inflate:]
 
-        if hess_arr_main is None or hess_arr_infl is None:
+        zero = self.endog == 0
+        w, dw, d2w = self._inflation_derivs(params_infl)
+        score_main = self.model_main.score_obs(params_main)
+        pmf_main = np.exp(self.model_main.loglikeobs(params_main))
+        prob_zero = w + (1 - w) * pmf_main
+
+        weights_main = np.where(zero, (1 - w) * pmf_main / prob_zero, 1)
+        hess_arr_main = self._hessian_main(params_main, weights_main)
+        if hess_arr_main is None:
             return approx_hess(params, self.loglike)
 
-        dim = self.k_exog + self.k_inflate
+        hess_arr_main += np.dot(score_main.T *
+                                (weights_main * (1 - weights_main)),
+                                score_main)
 
-        hess_arr = np.zeros((dim, dim))
+        h_infl = np.where(zero,
+                          (1 - pmf_main) * (d2w * prob_zero -
+                                            dw**2 * (1 - pmf_main)) /
+                          prob_zero**2,
+                          -(d2w * (1 - w) + dw**2) / (1 - w)**2)
+        hess_arr_infl = np.dot(self.exog_infl.T * h_infl, self.exog_infl)
 
-        hess_arr[:self.k_inflate,:] = hess_arr_infl
-        hess_arr[self.k_inflate:,self.k_inflate:] = hess_arr_main
+        h_cross = np.where(zero, -dw * pmf_main / prob_zero**2, 0)
+        hess_arr_cross = np.dot(self.exog_infl.T * h_cross, score_main)
 
-        tri_idx = np.triu_indices(self.k_exog + self.k_inflate, k=1)
-        hess_arr[tri_idx] = hess_arr.T[tri_idx]
+        k_inflate = self.k_inflate
+        dim = self.k_exog + k_inflate
+        hess_arr = np.empty((dim, dim))
+        hess_arr[:k_inflate, :k_inflate] = hess_arr_infl
+        hess_arr[:k_inflate, k_inflate:] = hess_arr_cross
+        hess_arr[k_inflate:, :k_inflate] = hess_arr_cross.T
+        hess_arr[k_inflate:, k_inflate:] = hess_arr_main
 
         return hess_arr
 
@@ -494,34 +496,21 @@ class ZeroInflatedPoisson(GenericZeroInflated):
         self.result_class_reg = L1ZeroInflatedPoissonResults
         self.result_class_reg_wrapper = L1ZeroInflatedPoissonResultsWrapper
 
-    def _hessian_main(self, params):
-        params_infl = params[:self.k_inflate]
-        params_main = params[self.k_inflate:]
+    def fit(self, start_params=None, method='newton', maxiter=35,
+            full_output=1, disp=1, callback=None,
+            cov_type='nonrobust', cov_kwds=None, use_t=None, **kwargs):
+        # the loglikelihood has an analytic Hessian without dispersion
+        # parameter, so Newton steps are cheap and safe by default
+        return super(ZeroInflatedPoisson, self).fit(
+            start_params=start_params, method=method, maxiter=maxiter,
+            full_output=full_output, disp=disp, callback=callback,
+            cov_type=cov_type, cov_kwds=cov_kwds, use_t=use_t, **kwargs)
 
-        y = self.endog
-        w = self.model_infl.predict(params_infl)
-        w = np.clip(w, np.finfo(float).eps, 1 - np.finfo(float).eps)
-        score = self.score(params)
-        zero_idx = np.nonzero(y == 0)[0]
-        nonzero_idx = np.nonzero(y)[0]
+    fit.__doc__ = DiscreteModel.fit.__doc__
 
+    def _hessian_main(self, params_main, weights):
         mu = self.model_main.predict(params_main)
-
-        hess_arr = np.zeros((self.k_exog, self.k_exog))
-
-        coeff = (1 + w[zero_idx] * (np.exp(mu[zero_idx]) - 1))
-
-        #d2l/dp2
-        for i in range(self.k_exog):
-            for j in range(i, -1, -1):
-                hess_arr[i, j] = ((
-                    self.exog[zero_idx, i] * self.exog[zero_idx, j] *
-                    mu[zero_idx] * (w[zero_idx] - 1) * (1 / coeff -
-                    w[zero_idx] * mu[zero_idx] * np.exp(mu[zero_idx]) /
-                    coeff**2)).sum() - (mu[nonzero_idx] * self.exog[nonzero_idx, i] *
-                    self.exog[nonzero_idx, j]).sum())
-
-        return hess_arr
+        return -np.dot(self.exog.T * (weights * mu), self.exog)
 
     def _predict_prob(self, params, exog, exog_infl, exposure, offset):
         params_infl = params[:self.k_inflate]
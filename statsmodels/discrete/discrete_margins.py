@@ -252,6 +252,200 @@ def _margeff_cov_params_count(model, cov_margins, params, exog, count_ind,
             cov_margins[i, :len(dfdb)] = dfdb # how each F changes with change in B
     return cov_margins
 
+def _row_chunks(nobs, width):
+    """
+    Slices over the rows so that a chunk with `width` values per row has
+    about 2**20 elements
+    """
+    chunksize = max(1, 2**20 // max(int(width), 1))
+    for start in range(0, nobs, chunksize):
+        yield slice(start, start + chunksize)
+
+def _discrete_changes(exog, dummy_idx, count_idx):
+    """
+    Columns of discrete regressors, the values at which the prediction is
+    compared and the scale of the difference
+    """
+    changes = []
+    if count_idx is not None:
+        changes.extend((i, -1, 1, .5) for i in count_idx)
+    if dummy_idx is not None:
+        changes.extend((i, None, None, 1.) for i in dummy_idx)
+    return changes
+
+def _index_margeff(model, params, exog, method, dummy_idx, count_idx):
+    """
+    Average marginal effects of a single index model and their Jacobian
+
+    The model needs a `_cdf_derivatives` method that returns the prediction
+    and its first two derivatives at the linear predictor. The sums over
+    observations are accumulated over chunks of rows.
+
+    Returns
+    -------
+    effects : ndarray, (k_exog,)
+    jacobian : ndarray, (k_exog, k_params)
+        Derivative of the effects with respect to params.
+    """
+    nobs, k = exog.shape
+    params = np.asarray(params)
+    beta = params[:k]
+    ey = 'ey' in method
+    ex = 'ex' in method
+    changes = _discrete_changes(exog, dummy_idx, count_idx)
+    idx = np.array([c[0] for c in changes], dtype=int)
+    scale = np.array([c[3] for c in changes])
+    is_count = np.array([c[1] is not None for c in changes], dtype=bool)
+
+    effects = np.zeros(k)
+    jacobian = np.zeros((k, len(params)))
+    effects_d = np.zeros(len(idx))
+    jacobian_d = np.zeros((len(idx), k))
+
+    def _factors(linpred):
+        cdf, pdf, dpdf = model._cdf_derivatives(linpred)
+        if ey:
+            pdf_cdf = pdf / cdf
+            return np.log(cdf), pdf_cdf, dpdf / cdf - pdf_cdf**2
+        return cdf, pdf, dpdf
+
+    for sl in _row_chunks(nobs, 3 * k + 4 * len(idx)):
+        x = exog[sl]
+        linpred = np.dot(x, beta)
+        _, a, da = _factors(linpred)
+        # effect_ik = a_i * beta_k * s_ik with s_ik = x_ik for 'ex'
+        if ex:
+            sa = np.dot(a, x)
+            jacobian[:, :k] += beta[:, None] * np.dot(x.T * da, x)
+        else:
+            sa = a.sum() * np.ones(k)
+            jacobian[:, :k] += beta[:, None] * np.dot(da, x)
+        jacobian[:, :k] += np.diag(sa)
+        effects += beta * sa
+
+        if len(idx):
+            # all discrete regressors at once, only the linear predictor
+            # changes
+            xd = x[:, idx]
+            val0 = np.where(is_count, xd - 1, 0)
+            val1 = np.where(is_count, xd + 1, 1)
+            pred0, f0, _ = _factors(linpred[:, None] + (val0 - xd) * beta[idx])
+            pred1, f1, _ = _factors(linpred[:, None] + (val1 - xd) * beta[idx])
+            effects_d += (pred1 - pred0).sum(0)
+            # d pred / d beta is f * x with the column of the regressor
+            # replaced by the value at which it is evaluated
+            jac = np.dot((f1 - f0).T, x)
+            jac[np.arange(len(idx)), idx] += (f1 * (val1 - xd) -
+                                              f0 * (val0 - xd)).sum(0)
+            jacobian_d += jac
+
+    effects /= nobs
+    jacobian /= nobs
+    if len(idx):
+        effects[idx] = effects_d * scale / nobs
+        jacobian[idx] = 0
+        jacobian[idx, :k] = jacobian_d * scale[:, None] / nobs
+    return effects, jacobian
+
+def _mnlogit_margeff(model, params, exog, method, dummy_idx, count_idx):
+    """
+    Average marginal effects of MNLogit and their Jacobian
+
+    Effects and the rows of the Jacobian are ordered by choice and then by
+    regressor, the columns by the flattened params as in the model.
+
+    Returns
+    -------
+    effects : ndarray, (K * J,)
+    jacobian : ndarray, (K * J, K * (J - 1))
+    """
+    nobs, K = exog.shape
+    J = int(model.J)
+    J1 = J - 1
+    params = np.asarray(params).reshape(K, J1, order='F')
+    zeroparams = np.column_stack((np.zeros(K), params))
+    ey = 'ey' in method
+    ex = 'ex' in method
+    eye = np.eye(J)[:, 1:]  # delta_jl for the non-base choices
+
+    effects = np.zeros((J, K))
+    jacobian = np.zeros((J, K, J1, K))
+    diag_k = np.arange(K)
+
+    for sl in _row_chunks(nobs, 2 * J * J1 * K):
+        x = exog[sl]
+        prob = model.cdf(np.dot(x, params))
+        # D_ijk = params_kj - sum_q prob_iq params_kq
+        dev = zeroparams.T[None, :, :] - np.dot(prob, zeroparams.T)[:, None, :]
+        prob_l = prob[:, 1:]
+        dev_l = dev[:, 1:, :]
+        s3 = x[:, None, :] if ex else 1.
+        s4 = x[:, None, None, :] if ex else 1.
+        if ey:
+            effects += (dev * s3).sum(0)
+            # s_ik * (delta_km (delta_jl - P_il) - x_im P_il D_ilk)
+            delta = (eye[None, :, :] - prob_l[:, None, :])[:, :, :, None] * s4
+            jacobian[:, diag_k, :, diag_k] += delta.sum(0).transpose(2, 0, 1)
+            r = np.tensordot(prob_l[:, :, None] * dev_l * s3, x, axes=(0, 0))
+            jacobian -= r[None, :, :, :].transpose(0, 2, 1, 3)
+        else:
+            pds = prob[:, :, None] * dev * s3
+            effects += pds.sum(0)
+            # s_ik x_im (delta_jl P_ij D_ijk - P_ij P_il (D_ijk + D_ilk))
+            a = np.tensordot(pds[:, 1:, :], x, axes=(0, 0))
+            for l in range(J1):
+                jacobian[l + 1, :, l, :] += a[l]
+            q = (prob[:, :, None, None] * prob_l[:, None, :, None] *
+                 (dev[:, :, None, :] + dev_l[:, None, :, :]) * s4)
+            jacobian -= np.tensordot(q, x, axes=(0, 0)).transpose(0, 2, 1, 3)
+            # s_ik delta_km P_ij (delta_jl - P_il)
+            c = (prob[:, :, None] * (eye[None, :, :] - prob_l[:, None, :]))
+            c = c[:, :, :, None] * s4
+            jacobian[:, diag_k, :, diag_k] += c.sum(0).transpose(2, 0, 1)
+
+    for i, val0, val1, scale in _discrete_changes(exog, dummy_idx,
+                                                  count_idx):
+        effects[:, i] = 0
+        jacobian[:, i] = 0
+        for sl in _row_chunks(nobs, 2 * J * J1 + K):
+            x = exog[sl]
+            linpred = np.dot(x, params)
+            xi = x[:, i]
+            v0 = xi - 1 if val0 is not None else np.zeros_like(xi)
+            v1 = xi + 1 if val1 is not None else np.ones_like(xi)
+            prob0 = model.cdf(linpred + (v0 - xi)[:, None] * params[i])
+            prob1 = model.cdf(linpred + (v1 - xi)[:, None] * params[i])
+            if ey:
+                effects[:, i] += (np.log(prob1) - np.log(prob0)).sum(0) * scale
+                w0 = eye[None, :, :] - prob0[:, None, 1:]
+                w1 = eye[None, :, :] - prob1[:, None, 1:]
+            else:
+                effects[:, i] += (prob1 - prob0).sum(0) * scale
+                w0 = prob0[:, :, None] * (eye[None, :, :] - prob0[:, None, 1:])
+                w1 = prob1[:, :, None] * (eye[None, :, :] - prob1[:, None, 1:])
+            jac = np.tensordot(w1 - w0, x, axes=(0, 0))
+            jac[:, :, i] += (w1 * (v1 - xi)[:, None, None] -
+                             w0 * (v0 - xi)[:, None, None]).sum(0)
+            jacobian[:, i] += jac * scale
+
+    effects /= nobs
+    jacobian /= nobs
+    return effects.ravel(), jacobian.reshape(J * K, J1 * K)
+
+def _analytic_margeff(model, params, exog, method, dummy_idx, count_idx):
+    """
+    Average marginal effects and their Jacobian if the model provides
+    analytic derivatives, None otherwise
+    """
+    from statsmodels.discrete.discrete_model import MNLogit
+    if isinstance(model, MNLogit):
+        return _mnlogit_margeff(model, params, exog, method, dummy_idx,
+                                count_idx)
+    if hasattr(model, '_cdf_derivatives'):
+        return _index_margeff(model, params, exog, method, dummy_idx,
+                              count_idx)
+    return None
+
 def margeff_cov_params(model, params, exog, cov_params, at, derivative,
                        dummy_ind, count_ind, method, J):
     """
@@ -668,7 +862,9 @@ class DiscreteMargins(object):
         results = self.results
         model = results.model
         params = results.params
-        exog = model.exog.copy() # copy because values are changed
+        exog = model.exog
+        if isinstance(atexog, dict):
+            exog = exog.copy() # copy because values are changed
         effects_idx, const_idx =  _get_const_index(exog)
         if hasattr(model, 'k_extra') and model.k_extra > 0:
             effects_idx = np.concatenate((effects_idx, np.zeros(model.k_extra, np.bool_)))
@@ -692,15 +888,24 @@ class DiscreteMargins(object):
         # get the exogenous variables
         exog = _get_margeff_exog(exog, at, atexog, effects_idx)
 
-        # get base marginal effects, handled by sub-classes
-        effects = model._derivative_exog(params, exog, method,
-                                                    dummy_idx, count_idx)
+        # average effects and their Jacobian for models with analytic
+        # derivatives, evaluated over chunks of rows
+        analytic = None
+        if at != 'all':
+            analytic = _analytic_margeff(model, params, exog, method,
+                                         dummy_idx, count_idx)
+        if analytic is not None:
+            effects, derivative = analytic
+        else:
+            # get base marginal effects, handled by sub-classes
+            effects = model._derivative_exog(params, exog, method,
+                                             dummy_idx, count_idx)
+            effects = _effects_at(effects, at)
+            derivative = model._derivative_exog
 
         J = getattr(model, 'J', 1)
         effects_idx = np.tile(effects_idx, J) # adjust for multi-equation.
 
-        effects = _effects_at(effects, at)
-
         if at == 'all':
             if J > 1:
                 K = model.K - np.any(~effects_idx) # subtract constant
@@ -712,7 +917,7 @@ class DiscreteMargins(object):
             # Set standard error of the marginal effects by Delta method.
             margeff_cov, margeff_se = margeff_cov_with_se(model, params, exog,
                                                 results.cov_params(), at,
-                                                model._derivative_exog,
+                                                derivative,
                                                 dummy_idx, count_idx,
                                                 method, J)
 
@@ -24,7 +24,7 @@ from statsmodels.compat.python import lmap, lzip, range
 from statsmodels.compat.scipy import loggamma
 
 import numpy as np
-from pandas import get_dummies
+from pandas import Categorical, Series
 
 from scipy.special import gammaln, digamma, polygamma
 from scipy import stats, special
@@ -33,7 +33,8 @@ from scipy.stats import nbinom
 import statsmodels.tools.tools as tools
 from statsmodels.tools import data as data_tools
 from statsmodels.tools.decorators import resettable_cache, cache_readonly
-from statsmodels.tools.sm_exceptions import PerfectSeparationError
+from statsmodels.tools.sm_exceptions import (PerfectSeparationError,
+                                             MissingDataError)
 from statsmodels.tools.numdiff import approx_fprime_cs
 import statsmodels.base.model as base
 from statsmodels.base.data import handle_data  # for mnlogit
@@ -127,33 +128,44 @@ params : ndarray
 
 # helper for MNLogit (will be generally useful later)
 
-def _numpy_to_dummies(endog):
-    if endog.dtype.kind in ['S', 'O']:
-        endog_dummies, ynames = tools.categorical(endog, drop=True,
-                                                  dictnames=True)
-    elif endog.ndim == 2:
-        endog_dummies = endog
-        ynames = range(endog.shape[1])
-    else:
-        endog_dummies, ynames = tools.categorical(endog, drop=True,
-                                                  dictnames=True)
-    return endog_dummies, ynames
+def _numpy_to_codes(endog):
+    """
+    Integer codes of the categories of endog and their names
+
+    A 2-d numeric endog is taken as dummy coded. Missing values of a dummy
+    coded endog have a nan code.
+    """
+    if endog.ndim == 2 and endog.dtype.kind not in ['S', 'O']:
+        codes = endog.argmax(1).astype(np.float64)
+        codes[np.isnan(endog).any(1)] = np.nan
+        return codes, dict(enumerate(range(endog.shape[1])))
+    levels, codes = np.unique(np.squeeze(endog), return_inverse=True)
+    return codes.astype(np.float64), tools._make_dictnames(levels)
+
 
+def _pandas_to_codes(endog):
+    """
+    Integer codes of the categories of a pandas endog and their names
 
-def _pandas_to_dummies(endog):
+    The categories and their order are the ones of ``pandas.get_dummies``,
+    missing values have a nan code.
+    """
     if endog.ndim == 2:
         if endog.shape[1] == 1:
             yname = endog.columns[0]
-            endog_dummies = get_dummies(endog.iloc[:, 0])
-        else:  # series
-            yname = 'y'
-            endog_dummies = endog
+            endog = endog.iloc[:, 0]
+        else:  # dummy coded
+            codes = np.asarray(endog).argmax(1).astype(np.float64)
+            codes[endog.isnull().any(1).values] = np.nan
+            codes = Series(codes, index=endog.index)
+            return codes, endog.columns.tolist(), 'y'
     else:
         yname = endog.name
-        endog_dummies = get_dummies(endog)
-    ynames = endog_dummies.columns.tolist()
-
-    return endog_dummies, ynames, yname
+    cat = Categorical(endog)
+    codes = cat.codes.astype(np.float64)
+    codes[codes < 0] = np.nan
+    codes = Series(codes, index=endog.index, name=yname)
+    return codes, cat.categories.tolist(), yname
 
 
 #### Private Model Classes ####
@@ -519,24 +531,22 @@ class BinaryModel(DiscreteModel):
 class MultinomialModel(BinaryModel):
 
     def _handle_data(self, endog, exog, missing, hasconst, **kwargs):
-        if data_tools._is_using_ndarray_type(endog, None):
-            endog_dummies, ynames = _numpy_to_dummies(endog)
-            yname = 'y'
-        elif data_tools._is_using_pandas(endog, None):
-            endog_dummies, ynames, yname = _pandas_to_dummies(endog)
+        # endog is stored as integer codes of the categories, the dummy
+        # coded endog is only created on request, see `wendog`
+        if data_tools._is_using_pandas(endog, None):
+            endog_codes, ynames, yname = _pandas_to_codes(endog)
         else:
             endog = np.asarray(endog)
-            endog_dummies, ynames = _numpy_to_dummies(endog)
+            endog_codes, ynames = _numpy_to_codes(endog)
             yname = 'y'
 
         if not isinstance(ynames, dict):
-            ynames = dict(zip(range(endog_dummies.shape[1]), ynames))
+            ynames = dict(zip(range(len(ynames)), ynames))
 
         self._ynames_map = ynames
-        data = handle_data(endog_dummies, exog, missing, hasconst, **kwargs)
+        data = handle_data(endog_codes, exog, missing, hasconst, **kwargs)
         data.ynames = yname  # overwrite this to single endog name
         data.orig_endog = endog
-        self.wendog = data.endog
 
         # repeating from upstream...
         for key in kwargs:
@@ -553,13 +563,31 @@ class MultinomialModel(BinaryModel):
         Preprocesses the data for MNLogit.
         """
         super(MultinomialModel, self).initialize()
-        # This is also a "whiten" method in other models (eg regression)
-        self.endog = self.endog.argmax(1)  # turn it into an array of col idx
-        self.J = self.wendog.shape[1]
+        if np.isnan(self.endog).any():
+            raise MissingDataError('endog contains missing values, use '
+                                   'missing="drop" to drop them')
+        self.endog = self.endog.astype(int)  # array of category indices
+        self.J = len(self._ynames_map)
         self.K = self.exog.shape[1]
         self.df_model *= (self.J-1)  # for each J - 1 equation.
         self.df_resid = self.exog.shape[0] - self.df_model - (self.J-1)
 
+    @property
+    def wendog(self):
+        """
+        Dummy coded endog, a nobs x J array
+        """
+        return (self.endog[:, None] == np.arange(self.J)).astype(np.float64)
+
+    def _endog_resid(self, prob):
+        """
+        Dummy coded endog minus `prob` for the non-base categories
+        """
+        resid = -prob[:, 1:]
+        rows = np.nonzero(self.endog)[0]
+        resid[rows, self.endog[rows] - 1] += 1
+        return resid
+
     def predict(self, params, exog=None, linear=False):
         """
         Predict response variable of a model given exogenous variables.
@@ -593,12 +621,20 @@ class MultinomialModel(BinaryModel):
             pred = np.column_stack((np.zeros(len(exog)), pred))
         return pred
 
-    def fit(self, start_params=None, method='newton', maxiter=35,
+    def fit(self, start_params=None, method=None, maxiter=35,
             full_output=1, disp=1, callback=None, **kwargs):
         if start_params is None:
             start_params = np.zeros((self.K * (self.J-1)))
         else:
             start_params = np.asarray(start_params)
+        if method is None:
+            # the Hessian has (K * (J - 1))**2 elements
+            method = 'newton' if len(start_params) <= 500 else 'lbfgs'
+        if (method == 'lbfgs' and 'loglike_and_score' not in kwargs and
+                hasattr(self, 'loglike_and_score')):
+            nobs = self.endog.shape[0]
+            kwargs['loglike_and_score'] = lambda params: tuple(
+                x / nobs for x in self.loglike_and_score(params))
         callback = lambda x : None # placeholder until check_perfect_pred
         # skip calling super to handle results from LikelihoodModel
         mnfit = base.LikelihoodModel.fit(self, start_params = start_params,
@@ -607,7 +643,13 @@ class MultinomialModel(BinaryModel):
         mnfit.params = mnfit.params.reshape(self.K, -1, order='F')
         mnfit = MultinomialResults(self, mnfit)
         return MultinomialResultsWrapper(mnfit)
-    fit.__doc__ = DiscreteModel.fit.__doc__
+    fit.__doc__ = DiscreteModel.fit.__doc__ + """
+        Notes
+        -----
+        If `method` is None, 'newton' is used if the model has at most 500
+        parameters and 'lbfgs' otherwise. With 'lbfgs' the analytic
+        `loglike_and_score` of the model is used by default.
+        """
 
     def fit_regularized(self, start_params=None, method='l1',
             maxiter='defined_by_method', full_output=1, disp=1, callback=None,
@@ -968,6 +1010,14 @@ class Poisson(CountModel):
         y = self.endog
         return np.exp(stats.poisson.logpmf(y, np.exp(X)))
 
+    def _cdf_derivatives(self, linpred):
+        """
+        Mean and its first two derivatives at the linear predictor, used for
+        the analytic Jacobian of the marginal effects
+        """
+        mu = np.exp(linpred)
+        return mu, mu, mu
+
     def loglike(self, params):
         """
         Loglikelihood of Poisson model
@@ -1602,6 +1652,28 @@ class GeneralizedPoisson(CountModel):
             The Hessian, second derivative of loglikelihood function,
             evaluated at `params`
         """
+        exog = self.exog
+        hbb, hba, haa = self._hessian_factors(params)
+
+        dim = exog.shape[1]
+        hess_arr = np.empty((dim + 1, dim + 1))
+        hess_arr[:-1, :-1] = np.dot(exog.T * hbb, exog)
+        hess_arr[-1, :-1] = hess_arr[:-1, -1] = np.dot(hba, exog)
+        hess_arr[-1, -1] = haa.sum()
+
+        return hess_arr
+
+    def _hessian_factors(self, params):
+        """
+        Observation factors of the Hessian
+
+        Returns
+        -------
+        hbb, hba, haa : ndarray, (nobs,)
+            The Hessian of observation i is ``hbb[i] * outer(x_i, x_i)`` for
+            the mean parameters, ``hba[i] * x_i`` for the cross derivative
+            with alpha and ``haa[i]`` for alpha.
+        """
         if self._transparams:
             alpha = np.exp(params[-1])
         else:
@@ -1609,64 +1681,48 @@ class GeneralizedPoisson(CountModel):
 
         params = params[:-1]
         p = self.parameterization
-        exog = self.exog
-        y = self.endog[:,None]
-        mu = self.predict(params)[:,None]
+        y = self.endog
+        mu = self.predict(params)
         mu_p = np.power(mu, p)
         a1 = 1 + alpha * mu_p
         a2 = mu + alpha * mu_p * y
         a3 = alpha * p * mu ** (p - 1)
         a4 = a3 * y
         a5 = p * mu ** (p - 1)
-        dmudb = mu * exog
 
         # for dl/dparams dparams
-        dim = exog.shape[1]
-        hess_arr = np.empty((dim+1,dim+1))
-
-        for i in range(dim):
-            for j in range(i + 1):
-                hess_arr[i,j] = np.sum(mu * exog[:,i,None] * exog[:,j,None] *
-                    (mu * (a3 * a4 / a1**2 -
-                           2 * a3**2 * a2 / a1**3 +
-                           2 * a3 * (a4 + 1) / a1**2 -
-                           a4 * p / (mu * a1) +
-                           a3 * p * a2 / (mu * a1**2) +
-                           a4 / (mu * a1) -
-                           a3 * a2 / (mu * a1**2) +
-                           (y - 1) * a4 * (p - 1) / (a2 * mu) -
-                           (y - 1) * (1 + a4)**2 / a2**2 -
-                           a4 * (p - 1) / (a1 * mu) -
-                           1 / mu**2) +
-                     (-a4 / a1 +
-                      a3 * a2 / a1**2 +
-                      (y - 1) * (1 + a4) / a2 -
-                      (1 + a4) / a1 +
-                      1 / mu)), axis=0)
-        tri_idx = np.triu_indices(dim, k=1)
-        hess_arr[tri_idx] = hess_arr.T[tri_idx]
+        hbb = mu * (mu * (a3 * a4 / a1**2 -
+                          2 * a3**2 * a2 / a1**3 +
+                          2 * a3 * (a4 + 1) / a1**2 -
+                          a4 * p / (mu * a1) +
+                          a3 * p * a2 / (mu * a1**2) +
+                          a4 / (mu * a1) -
+                          a3 * a2 / (mu * a1**2) +
+                          (y - 1) * a4 * (p - 1) / (a2 * mu) -
+                          (y - 1) * (1 + a4)**2 / a2**2 -
+                          a4 * (p - 1) / (a1 * mu) -
+                          1 / mu**2) +
+                    (-a4 / a1 +
+                     a3 * a2 / a1**2 +
+                     (y - 1) * (1 + a4) / a2 -
+                     (1 + a4) / a1 +
+                     1 / mu))
 
         # for dl/dparams dalpha
-        dldpda = np.sum((2 * a4 * mu_p / a1**2 -
-                         2 * a3 * mu_p * a2 / a1**3 -
-                         mu_p * y * (y - 1) * (1 + a4) / a2**2 +
-                         mu_p * (1 + a4) / a1**2 +
-                         a5 * y * (y - 1) / a2 -
-                         2 * a5 * y / a1 +
-                         a5 * a2 / a1**2) * dmudb,
-                        axis=0)
-
-        hess_arr[-1,:-1] = dldpda
-        hess_arr[:-1,-1] = dldpda
+        hba = mu * (2 * a4 * mu_p / a1**2 -
+                    2 * a3 * mu_p * a2 / a1**3 -
+                    mu_p * y * (y - 1) * (1 + a4) / a2**2 +
+                    mu_p * (1 + a4) / a1**2 +
+                    a5 * y * (y - 1) / a2 -
+                    2 * a5 * y / a1 +
+                    a5 * a2 / a1**2)
 
         # for dl/dalpha dalpha
-        dldada = mu_p**2 * (3 * y / a1**2 -
-                            (y / a2)**2. * (y - 1) -
-                            2 * a2 / a1**3)
+        haa = mu_p**2 * (3 * y / a1**2 -
+                         (y / a2)**2. * (y - 1) -
+                         2 * a2 / a1**3)
 
-        hess_arr[-1,-1] = dldada.sum()
-
-        return hess_arr
+        return hbb, hba, haa
 
     def predict(self, params, exog=None, exposure=None, offset=None,
                 which='mean'):
@@ -1768,6 +1824,15 @@ class Logit(BinaryModel):
         X = np.asarray(X)
         return np.exp(-X)/(1+np.exp(-X))**2
 
+    def _cdf_derivatives(self, linpred):
+        """
+        cdf, pdf and derivative of the pdf at the linear predictor, used
+        for the analytic Jacobian of the marginal effects
+        """
+        cdf = self.cdf(linpred)
+        pdf = cdf * (1 - cdf)
+        return cdf, pdf, pdf * (1 - 2 * cdf)
+
     def loglike(self, params):
         """
         Log-likelihood of logit model.
@@ -1967,6 +2032,14 @@ class Probit(BinaryModel):
         return stats.norm._pdf(X)
 
 
+    def _cdf_derivatives(self, linpred):
+        """
+        cdf, pdf and derivative of the pdf at the linear predictor, used
+        for the analytic Jacobian of the marginal effects
+        """
+        pdf = self.pdf(linpred)
+        return self.cdf(linpred), pdf, -linpred * pdf
+
     def loglike(self, params):
         """
         Log-likelihood of probit model (i.e., the normal distribution).
@@ -2220,10 +2293,7 @@ class MNLogit(MultinomialModel):
         where :math:`d_{ij}=1` if individual `i` chose alternative `j` and 0
         if not.
         """
-        params = params.reshape(self.K, -1, order='F')
-        d = self.wendog
-        logprob = np.log(self.cdf(np.dot(self.exog,params)))
-        return np.sum(d * logprob)
+        return np.sum(self.loglikeobs(params))
 
     def loglikeobs(self, params):
         """
@@ -2250,9 +2320,11 @@ class MNLogit(MultinomialModel):
         if not.
         """
         params = params.reshape(self.K, -1, order='F')
-        d = self.wendog
         logprob = np.log(self.cdf(np.dot(self.exog,params)))
-        return d * logprob
+        llf = np.zeros_like(logprob)
+        rows = np.arange(len(logprob))
+        llf[rows, self.endog] = logprob[rows, self.endog]
+        return llf
 
     def score(self, params):
         """
@@ -2280,8 +2352,7 @@ class MNLogit(MultinomialModel):
         as a flattened array to work with the solvers.
         """
         params = params.reshape(self.K, -1, order='F')
-        firstterm = self.wendog[:,1:] - self.cdf(np.dot(self.exog,
-                                                  params))[:,1:]
+        firstterm = self._endog_resid(self.cdf(np.dot(self.exog, params)))
         #NOTE: might need to switch terms if params is reshaped
         return np.dot(firstterm.T, self.exog).flatten()
 
@@ -2295,8 +2366,9 @@ class MNLogit(MultinomialModel):
         """
         params = params.reshape(self.K, -1, order='F')
         cdf_dot_exog_params = self.cdf(np.dot(self.exog, params))
-        loglike_value = np.sum(self.wendog * np.log(cdf_dot_exog_params))
-        firstterm = self.wendog[:, 1:] - cdf_dot_exog_params[:, 1:]
+        rows = np.arange(len(cdf_dot_exog_params))
+        loglike_value = np.sum(np.log(cdf_dot_exog_params[rows, self.endog]))
+        firstterm = self._endog_resid(cdf_dot_exog_params)
         score_array = np.dot(firstterm.T, self.exog).flatten()
         return loglike_value, score_array
 
@@ -2326,8 +2398,7 @@ class MNLogit(MultinomialModel):
         the flatteded array of derivatives in columns.
         """
         params = params.reshape(self.K, -1, order='F')
-        firstterm = self.wendog[:,1:] - self.cdf(np.dot(self.exog,
-                                                  params))[:,1:]
+        firstterm = self._endog_resid(self.cdf(np.dot(self.exog, params)))
         #NOTE: might need to switch terms if params is reshaped
         return (firstterm[:,:,None] * self.exog[:,None,:]).reshape(self.exog.shape[0], -1)
 
@@ -2357,25 +2428,26 @@ class MNLogit(MultinomialModel):
         The actual Hessian matrix has J**2 * K x K elements. Our Hessian
         is reshaped to be square (J*K, J*K) so that the solvers can use it.
 
-        This implementation does not take advantage of the symmetry of
-        the Hessian and could probably be refactored for speed.
+        The Hessian is computed as the block diagonal of the
+        :math:`X' diag(p_j) X` minus the cross product of the (nobs, J*K)
+        array of :math:`p_j x_i`, which is accumulated over blocks of rows
+        to limit memory.
         """
         params = params.reshape(self.K, -1, order='F')
         X = self.exog
-        pr = self.cdf(np.dot(X,params))
-        partials = []
-        J = self.J
+        pr = self.cdf(np.dot(X, params))[:, 1:]
+        nobs, J1 = pr.shape
         K = self.K
-        for i in range(J-1):
-            for j in range(J-1): # this loop assumes we drop the first col.
-                if i == j:
-                    partials.append(\
-                        -np.dot(((pr[:,i+1]*(1-pr[:,j+1]))[:,None]*X).T,X))
-                else:
-                    partials.append(-np.dot(((pr[:,i+1]*-pr[:,j+1])[:,None]*X).T,X))
-        H = np.array(partials)
-        # the developer's notes on multinomial should clear this math up
-        H = np.transpose(H.reshape(J-1, J-1, K, K), (0, 2, 1, 3)).reshape((J-1)*K, (J-1)*K)
+        H = np.zeros((J1 * K, J1 * K))
+        chunksize = max(1, 2**20 // (J1 * K))
+        for start in range(0, nobs, chunksize):
+            sl = slice(start, start + chunksize)
+            prx = (pr[sl, :, None] * X[sl, None, :]).reshape(-1, J1 * K)
+            H += np.dot(prx.T, prx)
+            # stacked diagonal blocks X' diag(p_j) X
+            diag = np.dot(prx.T, X[sl])
+            for j in range(J1):
+                H[j * K:(j + 1) * K, j * K:(j + 1) * K] -= diag[j * K:(j + 1) * K]
         return H
 
 
@@ -2557,6 +2629,14 @@ class NegativeBinomial(CountModel):
         # we give alpha of 1 because it's actually log(alpha) where alpha=0
         return self._ll_nbin(params, 1, 0)
 
+    def _cdf_derivatives(self, linpred):
+        """
+        Mean and its first two derivatives at the linear predictor, used for
+        the analytic Jacobian of the marginal effects
+        """
+        mu = np.exp(linpred)
+        return mu, mu, mu
+
     def loglike(self, params):
         r"""
         Loglikelihood for negative binomial model
@@ -3082,6 +3162,28 @@ class NegativeBinomialP(CountModel):
         hessian : ndarray, 2-D
             The hessian matrix of the model.
         """
+        exog = self.exog
+        hbb, hba, haa = self._hessian_factors(params)
+
+        dim = exog.shape[1]
+        hess_arr = np.empty((dim + 1, dim + 1))
+        hess_arr[:-1, :-1] = np.dot(exog.T * hbb, exog)
+        hess_arr[-1, :-1] = hess_arr[:-1, -1] = np.dot(hba, exog)
+        hess_arr[-1, -1] = haa.sum()
+
+        return hess_arr
+
+    def _hessian_factors(self, params):
+        """
+        Observation factors of the Hessian
+
+        Returns
+        -------
+        hbb, hba, haa : ndarray, (nobs,)
+            The Hessian of observation i is ``hbb[i] * outer(x_i, x_i)`` for
+            the mean parameters, ``hba[i] * x_i`` for the cross derivative
+            with alpha and ``haa[i]`` for alpha.
+        """
         if self._transparams:
             alpha = np.exp(params[-1])
         else:
@@ -3090,7 +3192,6 @@ class NegativeBinomialP(CountModel):
 
         p = 2 - self.parameterization
         y = self.endog
-        exog = self.exog
         mu = self.predict(params)
 
         mu_p = mu**p
@@ -3102,43 +3203,30 @@ class NegativeBinomialP(CountModel):
 
         dgpart = digamma(a3) - digamma(a1)
 
-        dim = exog.shape[1]
-        hess_arr = np.zeros((dim + 1, dim + 1))
-
-        coeff = mu**2 * (((1 + a4)**2 * a3 / a2**2 -
-                          a3 * (a5 - a4 / mu) / a2 -
-                          y / mu**2 -
-                          2 * a4 * (1 + a4) / a2 +
-                          a5 * (np.log(a1) - np.log(a2) + dgpart + 2) -
-                          a4 * (np.log(a1) - np.log(a2) + dgpart + 1) / mu -
-                          a4**2 * (polygamma(1, a1) - polygamma(1, a3))) +
-                         (-(1 + a4) * a3 / a2 +
-                          y / mu +
-                          a4 * (np.log(a1) - np.log(a2) + dgpart + 1)) / mu)
-
-        for i in range(dim):
-            hess_arr[i, :-1] = np.sum(self.exog[:,:].T * self.exog[:, i] * coeff, axis=1)
-
-
-        hess_arr[-1,:-1] = (self.exog[:,:].T * mu * a1 *
-                ((1 + a4) * (1 - a3 / a2) / a2 -
-                 p * (np.log(a1 / a2) + dgpart + 2) / mu +
-                 p * (a3 / mu + a4) / a2 +
-                 a4 * (polygamma(1, a1) - polygamma(1, a3))) / alpha).sum(axis=1)
-
-
-        da2 = (a1 * (2 * np.log(a1 / a2) +
+        hbb = mu**2 * (((1 + a4)**2 * a3 / a2**2 -
+                        a3 * (a5 - a4 / mu) / a2 -
+                        y / mu**2 -
+                        2 * a4 * (1 + a4) / a2 +
+                        a5 * (np.log(a1) - np.log(a2) + dgpart + 2) -
+                        a4 * (np.log(a1) - np.log(a2) + dgpart + 1) / mu -
+                        a4**2 * (polygamma(1, a1) - polygamma(1, a3))) +
+                       (-(1 + a4) * a3 / a2 +
+                        y / mu +
+                        a4 * (np.log(a1) - np.log(a2) + dgpart + 1)) / mu)
+
+        hba = (mu * a1 *
+               ((1 + a4) * (1 - a3 / a2) / a2 -
+                p * (np.log(a1 / a2) + dgpart + 2) / mu +
+                p * (a3 / mu + a4) / a2 +
+                a4 * (polygamma(1, a1) - polygamma(1, a3))) / alpha)
+
+        haa = (a1 * (2 * np.log(a1 / a2) +
                      2 * dgpart + 3 -
                      2 * a3 / a2 - a1 * polygamma(1, a1) +
                      a1 * polygamma(1, a3) - 2 * a1 / a2 +
                      a1 * a3 / a2**2) / alpha**2)
 
-        hess_arr[-1, -1] = da2.sum()
-
-        tri_idx = np.triu_indices(dim + 1, k=1)
-        hess_arr[tri_idx] = hess_arr.T[tri_idx]
-
-        return hess_arr
+        return hbb, hba, haa
 
     def _get_start_params_null(self):
         offset = getattr(self, "offset", 0)
@@ -4095,7 +4183,7 @@ class MultinomialResults(DiscreteResults):
         and 1 otherwise.
         """
         # it's 0 or 1 - 0 for correct prediction and 1 for a missed one
-        return (self.model.wendog.argmax(1) !=
+        return (self.model.endog !=
                 self.predict().argmax(1)).astype(float)
 
     def summary2(self, alpha=0.05, float_format="%.4f"):
@@ -557,3 +557,26 @@ class TestZeroInflatedNegativeBinomialP_predict2(object):
             mean2 = ((1 - self.res.predict(which='prob-zero').mean()) *
                      self.res.predict(which='mean-nonzero').mean())
             assert_allclose(mean1, mean2, atol=0.2)
+
+
+@pytest.mark.parametrize('inflation', ['logit', 'probit'])
+@pytest.mark.parametrize('model_class, params_extra', [
+    (sm.ZeroInflatedPoisson, []),
+    (sm.ZeroInflatedGeneralizedPoisson, [0.3]),
+    (sm.ZeroInflatedNegativeBinomialP, [1.3])])
+def test_zi_analytic_hessian(model_class, params_extra, inflation):
+    from statsmodels.tools.numdiff import approx_fprime
+    data = sm.datasets.randhie.load(as_pandas=False)
+    exog = sm.add_constant(data.exog[:, 1:4], prepend=False)
+    exog_infl = sm.add_constant(data.exog[:, 0], prepend=False)
+    mod = model_class(data.endog, exog, exog_infl=exog_infl,
+                      offset=0.1 * data.exog[:, 5], inflation=inflation)
+    params = np.array([0.3, -1.0, 0.05, -0.02, 0.1, 0.5] + params_extra)
+
+    score = mod.score(params)
+    assert_allclose(score, approx_fprime(params, mod.loglike, centered=True),
+                    rtol=1e-6, atol=1e-4)
+    hess = mod.hessian(params)
+    assert_allclose(hess, hess.T)
+    assert_allclose(hess, approx_fprime(params, mod.score, centered=True),
+                    rtol=1e-5, atol=1e-3)
@@ -29,7 +29,8 @@ import statsmodels.api as sm
 import statsmodels.formula.api as smf
 from .results.results_discrete import Spector, DiscreteL1, RandHIE, Anes
 from statsmodels.tools.sm_exceptions import (PerfectSeparationError,
-                                             ConvergenceWarning)
+                                             ConvergenceWarning,
+                                             MissingDataError)
 from scipy.stats import nbinom
 
 try:
@@ -1569,6 +1570,45 @@ def test_mnlogit_factor():
     assert_allclose(predicted_f, predicted, rtol=1e-10)
 
 
+def test_mnlogit_codes():
+    # hessian against numerical derivative of the score, and endog stored
+    # as integer codes with missing values
+    from statsmodels.tools.numdiff import approx_fprime
+    np.random.seed(987125)
+    nobs, k_cat = 500, 4
+    exog = sm.add_constant(np.random.randn(nobs, 2))
+    endog = pd.Series(np.random.choice(list('abcd'), size=nobs))
+    endog[[3, 10]] = np.nan
+
+    mod = MNLogit(endog, exog, missing='drop')
+    assert_equal(mod.J, k_cat)
+    assert_equal(mod.endog.dtype.kind, 'i')
+    assert_equal(mod.endog.shape, (nobs - 2,))
+    assert_equal(mod.wendog.shape, (nobs - 2, k_cat))
+    assert_equal(mod.wendog.argmax(1), mod.endog)
+
+    params = np.random.randn(3 * (k_cat - 1)) * 0.2
+    hess = mod.hessian(params)
+    assert_allclose(hess, hess.T)
+    assert_allclose(hess, approx_fprime(params, mod.score, centered=True),
+                    rtol=1e-6, atol=1e-5)
+    llf, score = mod.loglike_and_score(params)
+    assert_allclose(llf, mod.loglike(params), rtol=1e-13)
+    assert_allclose(score, mod.score(params), rtol=1e-13)
+    assert_allclose(mod.score_obs(params).sum(0), score, rtol=1e-13)
+
+    assert_raises(MissingDataError, MNLogit, endog, exog)
+
+    # many parameters use lbfgs with the analytic loglike_and_score
+    res_newton = mod.fit(method='newton', disp=0)
+    exog_many = np.column_stack([exog] + [np.random.randn(nobs, 200)])
+    mod_many = MNLogit(endog, exog_many, missing='drop')
+    res = mod_many.fit(disp=0, maxiter=2)
+    assert_equal(res.mle_settings['optimizer'], 'lbfgs')
+    res = mod.fit(method='lbfgs', disp=0, maxiter=1000, pgtol=1e-10)
+    assert_allclose(res.params, res_newton.params, rtol=1e-4, atol=1e-5)
+
+
 def test_formula_missing_exposure():
     # see 2083
     d = {'Foo': [1, 2, 10, 149], 'Bar': [1, 2, 3, np.nan],
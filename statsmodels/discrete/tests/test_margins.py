@@ -126,3 +126,63 @@ class TestNegBinPMargin(CheckMarginMixin):
         cls.res1 = res_stata.results_negbin_margins_cont
         cls.rtol_fac = 5e1
         # negbin has lower agreement with Stata in this case
+
+
+def test_margins_analytic_jacobian(monkeypatch):
+    # compare with the numerical derivatives used for models without
+    # analytic Jacobian
+    from statsmodels.discrete import discrete_margins
+    from statsmodels.discrete.discrete_model import Logit, Probit, MNLogit
+    from statsmodels.tools.numdiff import approx_fprime
+
+    np.random.seed(987126)
+    nobs = 300
+    x = np.column_stack([np.ones(nobs), np.random.randn(nobs),
+                         np.random.randint(0, 2, nobs),
+                         np.random.poisson(2, nobs)]).astype(float)
+    linpred = x.dot([0.2, 0.5, -0.4, 0.2])
+    y_bin = (linpred + np.random.logistic(size=nobs) > 0).astype(float)
+    y_count = np.random.poisson(np.exp(linpred) *
+                                np.random.gamma(2, 0.5, nobs))
+    y_mn = np.random.randint(0, 3, nobs)
+
+    results = [Logit(y_bin, x).fit(disp=0), Probit(y_bin, x).fit(disp=0),
+               Poisson(y_count, x).fit(disp=0),
+               NegativeBinomial(y_count, x).fit(disp=0),
+               MNLogit(y_mn, x).fit(disp=0)]
+    for res in results:
+        is_mn = isinstance(res.model, MNLogit)
+        options = [dict(at=at, method=method)
+                   for at in ['overall', 'mean']
+                   for method in ['dydx', 'eydx', 'dyex', 'eyex']]
+        options += [dict(at=at, method=method, dummy=True, count=True)
+                    for at in ['overall', 'mean']
+                    for method in ['dydx', 'eydx']]
+        for kwds in options:
+            if is_mn and (kwds.get('dummy') or 'ex' in kwds['method']):
+                # the numerical path does not support these
+                continue
+            marg = res.get_margeff(**kwds)
+            with monkeypatch.context() as m:
+                m.setattr(discrete_margins, '_analytic_margeff',
+                          lambda *args: None)
+                marg_numdiff = res.get_margeff(**kwds)
+            assert_allclose(marg.margeff, marg_numdiff.margeff,
+                            rtol=1e-10, atol=1e-14)
+            assert_allclose(marg.margeff_se, marg_numdiff.margeff_se,
+                            rtol=1e-7)
+
+    # MNLogit options that are only available with analytic derivatives
+    mod = results[-1].model
+    params = results[-1].params.ravel('F')
+    for method, dummy_idx, count_idx in [('dyex', None, None),
+                                         ('eyex', None, None),
+                                         ('dydx', [2], [3]),
+                                         ('eydx', [2], [3])]:
+        def func(p):
+            return discrete_margins._mnlogit_margeff(
+                mod, p, x, method, dummy_idx, count_idx)[0]
+        jac = discrete_margins._mnlogit_margeff(
+            mod, params, x, method, dummy_idx, count_idx)[1]
+        assert_allclose(jac, approx_fprime(params, func, centered=True),
+                        rtol=1e-6, atol=1e-8)
@@ -0,0 +1,466 @@
+"""
+Numpy evaluation plans for patsy design matrices
+
+A DesignPlan is a compiled, data-only description of a patsy DesignInfo.
+Building the design matrix for new data from a plan does not go through
+patsy's interpreted evaluation: numerical factors are evaluated by a small
+whitelisted expression evaluator, categorical factors are mapped to integer
+codes and expanded by indexing the contrast matrices, and interactions are
+formed by broadcasting. A plan can be converted to and from a dictionary of
+plain Python types, which makes it serializable without pickle.
+
+Only the stateful transforms ``center`` and ``standardize`` are supported.
+Formulas using other stateful transforms, for example splines, raise
+NotImplementedError when the plan is compiled.
+"""
+import ast
+import operator
+
+import numpy as np
+
+__all__ = ['DesignPlan']
+
+# numpy functions that can be used in numerical factors, either bare or as
+# an attribute of ``np`` or ``numpy``
+_NUMPY_FUNCS = frozenset([
+    'abs', 'absolute', 'arccos', 'arcsin', 'arctan', 'ceil', 'cos', 'cosh',
+    'exp', 'exp2', 'expm1', 'fabs', 'floor', 'log', 'log10', 'log1p', 'log2',
+    'maximum', 'minimum', 'power', 'round', 'sign', 'sin', 'sinh', 'sqrt',
+    'square', 'tan', 'tanh', 'where', 'clip', 'asarray'])
+
+_BINOPS = {
+    ast.Add: np.add, ast.Sub: np.subtract, ast.Mult: np.multiply,
+    ast.Div: np.true_divide, ast.FloorDiv: np.floor_divide,
+    ast.Mod: np.mod, ast.Pow: np.power,
+    }
+
+_CMPOPS = {
+    ast.Eq: np.equal, ast.NotEq: np.not_equal, ast.Lt: np.less,
+    ast.LtE: np.less_equal, ast.Gt: np.greater, ast.GtE: np.greater_equal,
+    }
+
+_UNARYOPS = {ast.USub: np.negative, ast.UAdd: operator.pos,
+             ast.Not: np.logical_not, ast.Invert: np.invert}
+
+_LITERALS = tuple(getattr(ast, name) for name in
+                  ('Num', 'Str', 'Bytes', 'NameConstant', 'Constant')
+                  if hasattr(ast, name))
+
+
+def _literal(node):
+    for attr in ('value', 'n', 's'):
+        if hasattr(node, attr):
+            return getattr(node, attr)
+    raise NotImplementedError('unsupported literal')
+
+
+def _transform_state(obj):
+    """Serializable state of a memorized patsy stateful transform"""
+    from patsy.state import Center, Standardize
+    if isinstance(obj, Center):
+        mean = np.atleast_1d(np.asarray(obj._sum, dtype=float) / obj._count)
+        return {'kind': 'center', 'mean': mean.tolist()}
+    elif isinstance(obj, Standardize):
+        return {'kind': 'standardize', 'n': int(obj.current_n),
+                'mean': np.atleast_1d(obj.current_mean).astype(float).tolist(),
+                'M2': np.atleast_1d(obj.current_M2).astype(float).tolist()}
+    raise NotImplementedError('stateful transform %s is not supported'
+                              % type(obj).__name__)
+
+
+def _apply_transform(state, x, center=True, rescale=True, ddof=0):
+    x = np.asarray(x, dtype=float)
+    mean = np.asarray(state['mean'])
+    if state['kind'] == 'center':
+        if x.ndim == 1:
+            mean = mean[0]
+        return x - mean
+    if x.ndim == 1:
+        mean = mean[0]
+    if center:
+        x = x - mean
+    if rescale:
+        m2 = np.asarray(state['M2'])
+        if x.ndim == 1:
+            m2 = m2[0]
+        x = x / np.sqrt(m2 / (state['n'] - ddof))
+    return x
+
+
+class _Evaluator(object):
+    """
+    Evaluate a factor expression on a mapping of column arrays
+
+    Only a small subset of Python is accepted: names of data columns,
+    numeric and string literals, arithmetic and comparison operators, the
+    numpy functions in ``_NUMPY_FUNCS``, patsy's ``I``, ``Q`` and ``C`` and
+    the supported stateful transforms. Anything else raises
+    NotImplementedError.
+    """
+    def __init__(self, code, transforms):
+        self.code = code
+        self.tree = ast.parse(code.strip(), mode='eval').body
+        self.transforms = transforms
+        self.names = set()
+        # validate once without data
+        self._visit(self.tree, None)
+
+    def __call__(self, data):
+        return self._visit(self.tree, data)
+
+    def _column(self, name, data):
+        if data is None:
+            self.names.add(name)
+            return None
+        try:
+            return np.asarray(data[name])
+        except (KeyError, IndexError, ValueError):
+            raise KeyError('data does not contain a column named %r' % name)
+
+    def _func(self, node):
+        """Resolve the callee of a Call node to a tag and callable"""
+        func = node.func
+        if isinstance(func, ast.Name):
+            name = func.id
+            if name in ('I', 'Q', 'C'):
+                return name, None
+            if name in _NUMPY_FUNCS:
+                return 'np', getattr(np, name)
+        elif isinstance(func, ast.Attribute):
+            value = func.value
+            if (isinstance(value, ast.Name) and
+                    value.id in ('np', 'numpy') and
+                    func.attr in _NUMPY_FUNCS):
+                return 'np', getattr(np, func.attr)
+            if (isinstance(value, ast.Name) and func.attr == 'transform' and
+                    value.id in self.transforms):
+                return 'transform', self.transforms[value.id]
+        raise NotImplementedError('unsupported function in factor %r'
+                                  % self.code)
+
+    def _visit(self, node, data):
+        if isinstance(node, ast.Name):
+            if node.id in ('True', 'False', 'None'):
+                return {'True': True, 'False': False, 'None': None}[node.id]
+            return self._column(node.id, data)
+        if isinstance(node, _LITERALS):
+            return _literal(node)
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINOPS:
+            left = self._visit(node.left, data)
+            right = self._visit(node.right, data)
+            if data is None:
+                return None
+            return _BINOPS[type(node.op)](left, right)
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARYOPS:
+            operand = self._visit(node.operand, data)
+            if data is None:
+                return None
+            return _UNARYOPS[type(node.op)](operand)
+        if (isinstance(node, ast.Compare) and len(node.ops) == 1 and
+                type(node.ops[0]) in _CMPOPS):
+            left = self._visit(node.left, data)
+            right = self._visit(node.comparators[0], data)
+            if data is None:
+                return None
+            return _CMPOPS[type(node.ops[0])](left, right)
+        if isinstance(node, ast.Call):
+            tag, func = self._func(node)
+            if tag == 'Q':
+                if len(node.args) != 1 or not isinstance(node.args[0],
+                                                         _LITERALS):
+                    raise NotImplementedError('Q requires a literal name')
+                return self._column(_literal(node.args[0]), data)
+            if tag in ('I', 'C'):
+                # contrasts of C(...) are already part of the plan
+                return self._visit(node.args[0], data)
+            args = [self._visit(arg, data) for arg in node.args]
+            kwargs = {}
+            for kw in node.keywords:
+                if not isinstance(kw.value, _LITERALS + (ast.Name,)):
+                    raise NotImplementedError('keyword arguments must be '
+                                              'literals')
+                kwargs[kw.arg] = self._visit(kw.value, data)
+            if data is None:
+                return None
+            if tag == 'transform':
+                return _apply_transform(func, *args, **kwargs)
+            return func(*args, **kwargs)
+        raise NotImplementedError('unsupported expression in factor %r'
+                                  % self.code)
+
+
+def _to_codes(values, levels):
+    """Integer codes of values in levels, raising on unknown values"""
+    values = np.asarray(values)
+    levels_arr = np.asarray(levels)
+    try:
+        sorter = np.argsort(levels_arr)
+        idx = np.searchsorted(levels_arr, values, sorter=sorter)
+        codes = sorter[np.minimum(idx, len(levels_arr) - 1)]
+        bad = levels_arr[codes] != values
+    except TypeError:
+        lookup = dict((level, i) for i, level in enumerate(levels))
+        codes = np.array([lookup.get(v, -1) for v in values.ravel()])
+        bad = codes < 0
+    if np.any(bad):
+        value = values.ravel()[np.nonzero(np.ravel(bad))[0][0]]
+        raise ValueError('observation with value %r does not match any of '
+                         'the expected levels %r' % (value, list(levels)))
+    return codes
+
+
+def _isnull(values):
+    import pandas as pd
+    return pd.isnull(values)
+
+
+def _pyvalue(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+class DesignPlan(object):
+    """
+    Compiled evaluation plan of a patsy design matrix
+
+    Parameters
+    ----------
+    factors : list of dict
+        One dictionary per factor with keys ``type`` ('numerical' or
+        'categorical'), ``code``, and either ``num_columns`` and
+        ``transforms`` for numerical factors or ``levels`` for categorical
+        factors.
+    subterms : list of dict
+        One dictionary per subterm in column order with keys ``factors``,
+        a list of factor indices, and ``contrasts``, a dictionary mapping
+        the index of each categorical factor to its contrast matrix.
+    column_names : list of str
+        Names of the design matrix columns.
+
+    Notes
+    -----
+    Use :meth:`from_design_info` to compile the plan of a patsy DesignInfo.
+    """
+    def __init__(self, factors, subterms, column_names):
+        self.factors = factors
+        self.subterms = subterms
+        self.column_names = list(column_names)
+        self._evaluators = [_Evaluator(f['code'], f.get('transforms', {}))
+                            for f in factors]
+        self._contrasts = [
+            dict((int(i), np.asarray(m, dtype=float))
+                 for i, m in sub['contrasts'].items())
+            for sub in subterms]
+
+    @classmethod
+    def from_design_info(cls, design_info):
+        """
+        Compile the plan of a patsy DesignInfo
+
+        Parameters
+        ----------
+        design_info : patsy.DesignInfo
+            The design information, for example ``model.data.design_info``
+            of a model created with a formula.
+
+        Returns
+        -------
+        DesignPlan
+        """
+        if design_info.term_codings is None:
+            raise ValueError('design_info has no terms, it was not created '
+                             'from a formula')
+        factors = []
+        factor_index = {}
+        subterms = []
+        for term, term_subterms in design_info.term_codings.items():
+            for subterm in term_subterms:
+                idx = []
+                contrasts = {}
+                for factor in subterm.factors:
+                    if factor not in factor_index:
+                        factor_index[factor] = len(factors)
+                        factors.append(cls._compile_factor(
+                            design_info.factor_infos[factor]))
+                    i = factor_index[factor]
+                    idx.append(i)
+                    if factor in subterm.contrast_matrices:
+                        matrix = subterm.contrast_matrices[factor].matrix
+                        contrasts[i] = np.asarray(matrix).tolist()
+                subterms.append({'factors': idx, 'contrasts': contrasts})
+        return cls(factors, subterms, design_info.column_names)
+
+    @staticmethod
+    def _compile_factor(info):
+        state = info.state
+        code = state.get('eval_code', getattr(info.factor, 'code', None))
+        if code is None:
+            raise NotImplementedError('only formula factors are supported')
+        if info.type == 'categorical':
+            levels = [_pyvalue(level) for level in info.categories]
+            return {'type': 'categorical', 'code': code, 'levels': levels}
+        transforms = dict((name, _transform_state(obj)) for name, obj in
+                          state.get('transforms', {}).items())
+        return {'type': 'numerical', 'code': code,
+                'num_columns': int(info.num_columns),
+                'transforms': transforms}
+
+    def to_dict(self):
+        """
+        Plan as a dictionary of plain Python types
+
+        Returns
+        -------
+        dict
+            A JSON serializable description of the plan that can be passed
+            to :meth:`from_dict`.
+        """
+        subterms = [{'factors': list(sub['factors']),
+                     'contrasts': dict((str(i), m) for i, m in
+                                       sub['contrasts'].items())}
+                    for sub in self.subterms]
+        return {'factors': self.factors, 'subterms': subterms,
+                'column_names': self.column_names}
+
+    @classmethod
+    def from_dict(cls, plan):
+        """Create a plan from the output of :meth:`to_dict`"""
+        return cls(plan['factors'], plan['subterms'], plan['column_names'])
+
+    @property
+    def names(self):
+        """Names of the data columns used by the plan"""
+        names = set()
+        for ev in self._evaluators:
+            names |= ev.names
+        return sorted(names)
+
+    @property
+    def stateful(self):
+        """Whether the plan depends on memorized stateful transforms"""
+        return any(f.get('transforms') for f in self.factors)
+
+    def _raw_values(self, data):
+        """
+        Evaluate all factors on data
+
+        Numerical factors are returned as 2-d float arrays, categorical
+        factors as 1-d arrays of the original values.
+        """
+        values = []
+        nobs = None
+        for factor, ev in zip(self.factors, self._evaluators):
+            value = ev(data)
+            if factor['type'] == 'categorical':
+                value = np.atleast_1d(value)
+            else:
+                value = np.asarray(value, dtype=float)
+                if value.ndim < 2:
+                    value = value.reshape(-1, 1)
+            if nobs is None or nobs == 1:
+                nobs = value.shape[0]
+            values.append(value)
+        if nobs is None:
+            # intercept only, size the design from any data column
+            nobs = 1
+            for name in data.keys() if hasattr(data, 'keys') else []:
+                nobs = np.atleast_1d(np.asarray(data[name])).shape[0]
+                break
+        return values, nobs
+
+    def _missing_mask(self, values, nobs):
+        """Rows with a missing value in any factor, as defined by patsy"""
+        mask = np.zeros(nobs, dtype=bool)
+        for factor, value in zip(self.factors, values):
+            if factor['type'] == 'categorical':
+                mask |= np.asarray(_isnull(value))
+            else:
+                mask |= np.isnan(value).any(1)
+        return mask
+
+    def _levels_match(self, values):
+        """Whether the levels patsy would infer from data match the plan"""
+        for factor, value in zip(self.factors, values):
+            if factor['type'] != 'categorical':
+                continue
+            levels = factor['levels']
+            if value.dtype == bool:
+                observed = [False, True]
+                if levels != observed:
+                    return False
+                continue
+            value = value[~np.asarray(_isnull(value))]
+            try:
+                observed = np.unique(value).tolist()
+            except TypeError:
+                return False
+            if observed != levels:
+                return False
+        return True
+
+    def _build(self, values, nobs, rows=None, sparse=False):
+        if rows is not None:
+            values = [v[rows] if v.shape[0] == nobs else v for v in values]
+            nobs = int(np.sum(rows)) if rows.dtype == bool else len(rows)
+        codes = [
+            _to_codes(v, f['levels']) if f['type'] == 'categorical' else v
+            for f, v in zip(self.factors, values)]
+        if sparse:
+            return self._build_sparse(codes, nobs)
+        blocks = []
+        for sub, contrasts in zip(self.subterms, self._contrasts):
+            block = np.ones((nobs, 1))
+            for i in sub['factors']:
+                if i in contrasts:
+                    fb = contrasts[i][codes[i]]
+                else:
+                    fb = codes[i]
+                # the left-most factor iterates fastest over its columns
+                block = (fb[:, :, None] * block[:, None, :]).reshape(nobs, -1)
+            blocks.append(block)
+        return np.column_stack(blocks) if blocks else np.empty((nobs, 0))
+
+    def _build_sparse(self, codes, nobs):
+        from scipy import sparse
+        blocks = []
+        for sub, contrasts in zip(self.subterms, self._contrasts):
+            block = sparse.csc_matrix(np.ones((nobs, 1)))
+            for i in sub['factors']:
+                if i in contrasts:
+                    contrast = contrasts[i]
+                    indicator = sparse.csr_matrix(
+                        (np.ones(nobs), (np.arange(nobs), codes[i])),
+                        shape=(nobs, contrast.shape[0]))
+                    fb = indicator.dot(sparse.csr_matrix(contrast)).tocsc()
+                else:
+                    fb = sparse.csc_matrix(np.broadcast_to(
+                        codes[i], (nobs, codes[i].shape[1])))
+                # row-wise Kronecker product, left-most factor fastest
+                block = sparse.hstack([block.multiply(fb[:, j])
+                                       for j in range(fb.shape[1])])
+                block = block.tocsc()
+            blocks.append(block)
+        if not blocks:
+            return sparse.csr_matrix((nobs, 0))
+        return sparse.hstack(blocks).tocsr()
+
+    def evaluate(self, data, sparse=False):
+        """
+        Build the design matrix for new data
+
+        Parameters
+        ----------
+        data : dict-like
+            Mapping from column names to array-like values, for example a
+            dict of arrays or scalars, or a pandas DataFrame.
+        sparse : bool
+            If True, return a scipy.sparse CSR matrix. Categorical factors
+            and their interactions are then expanded without forming the
+            dense indicator columns.
+
+        Returns
+        -------
+        ndarray or scipy.sparse.csr_matrix
+            The nobs x k design matrix.
+        """
+        values, nobs = self._raw_values(data)
+        return self._build(values, nobs, sparse=sparse)
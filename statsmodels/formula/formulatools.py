@@ -1,7 +1,12 @@
-from statsmodels.compat.python import iterkeys
+from collections import OrderedDict
+import weakref
+
+from statsmodels.compat.python import iterkeys, string_types
+from statsmodels.formula.designplan import DesignPlan
 import statsmodels.tools.data as data_util
 from patsy import dmatrices, NAAction
 import numpy as np
+import pandas as pd
 
 # if users want to pass in a different formula framework, they can
 # add their handler here. how to do it interactively?
@@ -9,6 +14,13 @@ import numpy as np
 # this is a mutable object, so editing it should show up in the below
 formula_handler = {}
 
+# design infos of formulas without stateful transforms, keyed by the formula
+# and the dtypes of the data columns, most recently used last
+_formula_cache = OrderedDict()
+FORMULA_CACHE_SIZE = 64
+# compiled plans of design infos, None if the design cannot be compiled
+_design_plans = weakref.WeakKeyDictionary()
+
 
 class NAAction(NAAction):
     # monkey-patch so we can handle missing values in 'extra' arrays later
@@ -50,6 +62,15 @@ def handle_formula_data(Y, X, formula, depth=0, missing='drop'):
     if isinstance(formula, tuple(iterkeys(formula_handler))):
         return formula_handler[type(formula)]
 
+    key = None
+    if X is None and isinstance(formula, string_types):
+        schema = _data_schema(Y)
+        if schema is not None:
+            key = (formula, schema)
+            cached = _formula_data_from_cache(key, Y, missing)
+            if cached is not None:
+                return cached
+
     na_action = NAAction(on_NA=missing)
 
     if X is not None:
@@ -75,10 +96,168 @@ def handle_formula_data(Y, X, formula, depth=0, missing='drop'):
         design_info = result[1].design_info  # detach it from DataFrame
     else:
         design_info = None
+    if key is not None and len(result) > 1:
+        _store_formula_cache(key, Y, result)
     # NOTE: is there ever a case where we'd need LHS design_info?
     return result, missing_mask, design_info
 
 
+def clear_formula_cache():
+    """
+    Remove all cached formula designs and compiled design plans
+    """
+    _formula_cache.clear()
+    _design_plans.clear()
+
+
+def design_plan(design_info):
+    """
+    Compiled plan of a patsy DesignInfo
+
+    Parameters
+    ----------
+    design_info : patsy.DesignInfo
+        The design information of a model created from a formula.
+
+    Returns
+    -------
+    DesignPlan or None
+        The memoized plan, or None if the design uses factors that cannot
+        be compiled. See :class:`statsmodels.formula.designplan.DesignPlan`.
+    """
+    try:
+        return _design_plans[design_info]
+    except KeyError:
+        pass
+    try:
+        plan = DesignPlan.from_design_info(design_info)
+    except (NotImplementedError, ValueError, SyntaxError):
+        plan = None
+    _design_plans[design_info] = plan
+    return plan
+
+
+def _data_schema(data):
+    """Column names, dtypes and categories of dict-like data, or None"""
+    if isinstance(data, pd.DataFrame):
+        items = data.dtypes.items()
+    elif isinstance(data, dict):
+        items = ((name, np.asarray(value).dtype)
+                 for name, value in data.items())
+    else:
+        return None
+    schema = []
+    for name, dtype in items:
+        categories = getattr(dtype, 'categories', None)
+        if categories is not None:
+            categories = tuple(categories)
+        schema.append((name, str(dtype), categories))
+    return tuple(schema)
+
+
+def _data_index(data, nobs):
+    if isinstance(data, pd.DataFrame):
+        return data.index
+    return pd.Index(np.arange(nobs))
+
+
+def _plan_dmatrices(plans, data, missing):
+    """
+    Design matrices of data from compiled plans
+
+    Returns None if patsy would infer different levels from data, or if
+    there are missing values and missing is 'raise'.
+    """
+    evaluated = []
+    nobs = None
+    for plan in plans:
+        values, n = plan._raw_values(data)
+        if not plan._levels_match(values):
+            return None
+        nobs = n if nobs is None else max(nobs, n)
+        evaluated.append(values)
+    mask = np.zeros(nobs, dtype=bool)
+    for plan, values in zip(plans, evaluated):
+        mask |= plan._missing_mask(values, nobs)
+    keep = None
+    if mask.any():
+        if missing == 'raise':
+            return None
+        keep = ~mask
+    index = _data_index(data, nobs)
+    if keep is not None:
+        index = index[keep]
+    result = []
+    for plan, values in zip(plans, evaluated):
+        matrix = plan._build(values, nobs, rows=keep)
+        result.append(pd.DataFrame(matrix, index=index,
+                                   columns=plan.column_names))
+    return result, (mask if keep is not None else None)
+
+
+def _formula_data_from_cache(key, data, missing):
+    design_infos = _formula_cache.pop(key, None)
+    if design_infos is None:
+        return None
+    # reinsert as most recently used
+    _formula_cache[key] = design_infos
+    plans = [design_plan(di) for di in design_infos]
+    try:
+        out = _plan_dmatrices(plans, data, missing)
+    except Exception:
+        # let patsy evaluate and report any problem with the data
+        return None
+    if out is None:
+        return None
+    result, missing_mask = out
+    return tuple(result), missing_mask, design_infos[1]
+
+
+def _store_formula_cache(key, data, result):
+    design_infos = tuple(r.design_info for r in result)
+    plans = [design_plan(di) for di in design_infos]
+    if any(plan is None or plan.stateful for plan in plans):
+        # stateful transforms have to be memorized on each new dataset
+        return
+    # only cache plans that reproduce patsy on this data
+    try:
+        out = _plan_dmatrices(plans, data, 'drop')
+    except Exception:
+        return
+    if out is None:
+        return
+    for matrix, expected in zip(out[0], result):
+        if (matrix.shape != expected.shape or
+                not matrix.index.equals(expected.index) or
+                not np.allclose(matrix.values, expected.values,
+                                rtol=1e-13, atol=0, equal_nan=True)):
+            return
+    _formula_cache[key] = design_infos
+    while len(_formula_cache) > FORMULA_CACHE_SIZE:
+        _formula_cache.popitem(last=False)
+
+
+def _plan_dmatrix(design_info, data):
+    """
+    Design matrix of new data for prediction from the compiled plan
+
+    Returns None if the plan is not available or the data has missing
+    values, in which case patsy's evaluation is used.
+    """
+    plan = design_plan(design_info)
+    if plan is None:
+        return None
+    try:
+        values, nobs = plan._raw_values(data)
+        if plan._missing_mask(values, nobs).any():
+            return None
+        matrix = plan._build(values, nobs)
+    except Exception:
+        return None
+    return pd.DataFrame(matrix, index=_data_index(data, nobs),
+                        columns=plan.column_names)
+
+
 def _remove_intercept_patsy(terms):
     """
     Remove intercept from Patsy terms.
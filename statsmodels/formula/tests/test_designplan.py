@@ -0,0 +1,64 @@
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+import pandas as pd
+from patsy import dmatrix
+import pytest
+
+from statsmodels.formula.designplan import DesignPlan
+
+
+@pytest.fixture(scope='module')
+def data():
+    rs = np.random.RandomState(0)
+    nobs = 50
+    return pd.DataFrame({'x': rs.standard_normal(nobs),
+                         'z': rs.uniform(1, 2, nobs),
+                         'g': rs.choice(['a', 'b', 'c'], nobs),
+                         'h': rs.choice([1, 2, 3], nobs),
+                         'b': rs.choice([True, False], nobs)})
+
+
+@pytest.mark.parametrize('formula', [
+    'x + z',
+    'x * z - 1',
+    'C(g) * x',
+    'C(g, Sum) : C(h, Treatment(2))',
+    'g + h + b',
+    'C(g):C(h) - 1',
+    'np.log(z) + I(x ** 2) + np.exp(-x) + Q("z")',
+    'center(z) + standardize(x) + standardize(z, rescale=False)',
+    'I(x > 0) + C(h > 1)',
+    '1',
+    ])
+def test_matches_patsy(data, formula):
+    design_info = dmatrix(formula, data).design_info
+    plan = DesignPlan.from_dict(
+        DesignPlan.from_design_info(design_info).to_dict())
+    new = data.iloc[10:30]
+    expected = np.asarray(dmatrix(design_info, new))
+    assert_allclose(plan.evaluate(new), expected, rtol=1e-13)
+    assert_equal(plan.column_names, design_info.column_names)
+
+
+def test_names_and_dict_input(data):
+    design_info = dmatrix('np.log(z) + C(g):x', data).design_info
+    plan = DesignPlan.from_design_info(design_info)
+    assert_equal(plan.names, ['g', 'x', 'z'])
+    row = {'z': 1.5, 'g': 'b', 'x': 2.}
+    expected = np.asarray(dmatrix(design_info, pd.DataFrame([row])))
+    assert_allclose(plan.evaluate(row), expected)
+
+
+def test_unsupported(data):
+    design_info = dmatrix('bs(x, df=4)', data).design_info
+    with pytest.raises(NotImplementedError):
+        DesignPlan.from_design_info(design_info)
+
+
+def test_sparse(data):
+    design_info = dmatrix('C(g) * C(h) + x:C(g) + z', data).design_info
+    plan = DesignPlan.from_design_info(design_info)
+    dense = plan.evaluate(data)
+    sparse = plan.evaluate(data, sparse=True)
+    assert_equal(sparse.format, 'csr')
+    assert_allclose(sparse.toarray(), dense)
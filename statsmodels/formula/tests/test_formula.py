@@ -161,3 +161,37 @@ def test_patsy_missing_data():
         assert 'nan values have been dropped' in repr(w[-1].message)
     # Frist record will be dropped in both cases
     assert_equal(res.fittedvalues, res2)
+
+
+def test_formula_cache():
+    from statsmodels.formula import formulatools
+    formulatools.clear_formula_cache()
+    data = load_pandas().data.copy()
+    data['grp'] = np.where(data['UNEMP'] > data['UNEMP'].median(), 'hi', 'lo')
+    formula = 'TOTEMP ~ np.log(GNP) + C(grp) * UNEMP'
+    res = ols(formula, data).fit()
+    assert_equal(len(formulatools._formula_cache), 1)
+    # later years with the same schema use the cached design
+    data2 = data.copy()
+    data2['GNP'] *= 1.1
+    data2.loc[data2.index[2], 'UNEMP'] = np.nan
+    res_cached = ols(formula, data2).fit()
+    formulatools.clear_formula_cache()
+    res_patsy = ols(formula, data2).fit()
+    npt.assert_allclose(res_cached.model.exog, res_patsy.model.exog)
+    npt.assert_allclose(res_cached.params, res_patsy.params)
+    assert_equal(res_cached.model.data.row_labels,
+                 res_patsy.model.data.row_labels)
+    assert_equal(res_cached.model.exog_names, res.model.exog_names)
+    npt.assert_allclose(res_cached.predict(data), res_patsy.predict(data))
+
+    # different levels in the data are not served from the cache
+    data3 = data.copy()
+    data3.loc[data3.index[:3], 'grp'] = 'mid'
+    res3 = ols(formula, data3).fit()
+    assert_equal(len(res3.params), len(res.params) + 2)
+
+    # stateful transforms are memorized on every dataset
+    formulatools.clear_formula_cache()
+    ols('TOTEMP ~ center(GNP)', data).fit()
+    assert_equal(len(formulatools._formula_cache), 0)
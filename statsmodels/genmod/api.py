@@ -1,5 +1,23 @@
-from .generalized_linear_model import GLM
-from .generalized_estimating_equations import GEE, OrdinalGEE, NominalGEE
-from .bayes_mixed_glm import BinomialBayesMixedGLM, PoissonBayesMixedGLM
-from . import families
-from . import cov_struct
+"""
+Generalized linear models API
+
+Models are imported on first access, see statsmodels.tools._lazy.
+"""
+from statsmodels.tools._lazy import install_lazy_attributes
+
+install_lazy_attributes(globals(), {
+    'GLM': ('statsmodels.genmod.generalized_linear_model', 'GLM'),
+    'ChunkedGLM': ('statsmodels.genmod.chunked_glm', 'ChunkedGLM'),
+    'GEE': ('statsmodels.genmod.generalized_estimating_equations', 'GEE'),
+    'OrdinalGEE': ('statsmodels.genmod.generalized_estimating_equations',
+                   'OrdinalGEE'),
+    'NominalGEE': ('statsmodels.genmod.generalized_estimating_equations',
+                   'NominalGEE'),
+    'BinomialBayesMixedGLM': ('statsmodels.genmod.bayes_mixed_glm',
+                              'BinomialBayesMixedGLM'),
+    'PoissonBayesMixedGLM': ('statsmodels.genmod.bayes_mixed_glm',
+                             'PoissonBayesMixedGLM'),
+    'families': ('statsmodels.genmod.families', None),
+    'cov_struct': ('statsmodels.genmod.cov_struct', None),
+    })
+del install_lazy_attributes
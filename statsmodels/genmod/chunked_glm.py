@@ -0,0 +1,395 @@
+"""
+Generalized linear models for data that does not fit in memory
+
+The model is fitted by IRLS where each iteration streams over the chunks of
+the data and accumulates X'WX, X'Wz, the deviance and Pearson's chi2. Only
+the k x k cross product matrices are kept in memory.
+"""
+import numpy as np
+
+from statsmodels.base.data import handle_data
+from statsmodels.tools.decorators import cache_readonly, resettable_cache
+from statsmodels.tools.sm_exceptions import PerfectSeparationError
+import statsmodels.base.model as base
+import statsmodels.regression._tools as reg_tools
+from . import families
+from .generalized_linear_model import (GLM, GLMResults, GLMResultsWrapper,
+                                       _check_convergence)
+
+__all__ = ['ChunkedGLM']
+
+_CHUNK_KEYS = ('endog', 'exog', 'offset', 'exposure', 'freq_weights',
+               'var_weights')
+
+
+def _as_chunk_dict(chunk):
+    if isinstance(chunk, dict):
+        unknown = set(chunk) - set(_CHUNK_KEYS)
+        if unknown:
+            raise ValueError('unknown chunk keys %s' % sorted(unknown))
+        return chunk
+    if len(chunk) != 2:
+        raise ValueError('chunks must be (endog, exog) tuples or dicts')
+    return {'endog': chunk[0], 'exog': chunk[1]}
+
+
+class _Chunk(object):
+    """
+    Arrays of one chunk of data
+
+    exog is not copied if it is already a float64 array, for example a
+    numpy memmap.
+    """
+
+    def __init__(self, chunk, family, k_exog):
+        chunk = _as_chunk_dict(chunk)
+        self.endog = np.asarray(chunk['endog'], dtype=np.float64)
+        if self.endog.ndim != 1:
+            self.endog = self.endog.squeeze()
+            if self.endog.ndim != 1:
+                raise ValueError('endog of a chunk must be 1-dimensional')
+        nobs = self.endog.shape[0]
+        exog = np.asarray(chunk['exog'], dtype=np.float64)
+        if exog.ndim == 1:
+            exog = exog[:, None]
+        if exog.shape != (nobs, k_exog):
+            raise ValueError('exog of a chunk has shape %s, expected %s'
+                             % (exog.shape, (nobs, k_exog)))
+        self.exog = exog
+        offset = 0.
+        if chunk.get('offset') is not None:
+            offset = np.asarray(chunk['offset'], dtype=np.float64)
+        if chunk.get('exposure') is not None:
+            if not isinstance(family.link, families.links.Log):
+                raise ValueError("exposure can only be used with the log "
+                                 "link function")
+            offset = offset + np.log(chunk['exposure'])
+        self.offset = offset
+        ones = np.ones(nobs)
+        freq_weights = chunk.get('freq_weights')
+        var_weights = chunk.get('var_weights')
+        self.freq_weights = (ones if freq_weights is None else
+                             np.asarray(freq_weights, dtype=np.float64))
+        self.var_weights = (ones if var_weights is None else
+                            np.asarray(var_weights, dtype=np.float64))
+        self.iweights = self.freq_weights * self.var_weights
+
+
+class ChunkedGLM(GLM):
+    """
+    Generalized linear model fitted by streaming over chunks of data
+
+    The data is read through `data_factory` in every IRLS iteration, so that
+    only one chunk and the k x k cross product matrices are held in memory.
+    The estimates are the same as those of `GLM` on the concatenated data.
+
+    Parameters
+    ----------
+    data_factory : callable
+        A function without arguments that returns a new iterable over the
+        chunks of the data each time it is called. A chunk is either a
+        tuple ``(endog, exog)`` or a dict with keys 'endog' and 'exog' and
+        optionally 'offset', 'exposure', 'freq_weights' and
+        'var_weights'. The arrays can be numpy arrays, numpy memmaps or
+        pandas objects, for example from ``pandas.read_csv`` with
+        `chunksize`, or slices of an HDF5 dataset.
+    family : family class instance
+        The default is Gaussian. To specify the binomial distribution
+        endog has to be 1-dimensional.
+
+    Attributes
+    ----------
+    nobs : int
+        The number of observations, available after `fit`.
+    wnobs : float
+        The sum of the frequency weights, available after `fit`.
+
+    Notes
+    -----
+    The results are a `GLMResults` instance with `params`, `bse`, the
+    deviance, Pearson's chi2, the log-likelihood and the information
+    criteria. Attributes that are defined per observation, for example
+    residuals and fitted values, are not available because the data is not
+    kept in memory. Use `predict` with `exog` to compute predictions for a
+    chunk.
+
+    Only nonrobust standard errors are available.
+
+    Examples
+    --------
+    >>> X = np.load('exog.npy', mmap_mode='r')
+    >>> y = np.load('endog.npy', mmap_mode='r')
+    >>> def chunks():
+    ...     for i in range(0, len(y), 100000):
+    ...         yield y[i:i + 100000], X[i:i + 100000]
+    >>> mod = ChunkedGLM(chunks, family=sm.families.Poisson())
+    >>> res = mod.fit()
+
+    A csv file can be read in chunks with pandas
+
+    >>> def chunks():
+    ...     for df in pd.read_csv('data.csv', chunksize=100000):
+    ...         yield df['y'], sm.add_constant(df[['x1', 'x2']],
+    ...                                        has_constant='add')
+    """
+
+    def __init__(self, data_factory, family=None):
+        if family is None:
+            family = families.Gaussian()
+        if not isinstance(family, families.Family):
+            raise ValueError('family must be a family instance')
+        self.family = family
+        self.data_factory = data_factory
+        first = None
+        for first in data_factory():
+            break
+        if first is None:
+            raise ValueError('data_factory returned no chunks')
+        first = _as_chunk_dict(first)
+        # the first chunk is used for the names of endog and exog
+        exog = first['exog']
+        if np.ndim(exog) == 1:
+            exog = np.asarray(exog)[:, None]
+        self.data = handle_data(first['endog'], exog)
+        self.k_exog = self.data.exog.shape[1]
+        self.k_constant = self.data.k_constant
+        self.endog = None
+        self.exog = None
+        self._has_freq_weights = 'freq_weights' in first
+        self._has_var_weights = 'var_weights' in first
+        self.scaletype = None
+        self._init_keys = []
+
+    def _iter_chunks(self):
+        for chunk in self.data_factory():
+            yield _Chunk(chunk, self.family, self.k_exog)
+
+    def _irls_pass(self, params):
+        """
+        Accumulate the IRLS normal equations and statistics at `params`
+
+        If `params` is None, the family specific starting values of the
+        mean are used.
+        """
+        family = self.family
+        wls = None
+        stats = dict(nobs=0, wnobs=0., deviance=0., pearson_chi2=0.,
+                     sum_wendog=0., sum_weights=0.)
+        perfect = True
+        for chunk in self._iter_chunks():
+            endog = chunk.endog
+            if params is None:
+                mu = family.starting_mu(endog)
+                lin_pred = family.predict(mu)
+            else:
+                lin_pred = chunk.exog.dot(params) + chunk.offset
+                mu = family.fitted(lin_pred)
+            weights = chunk.iweights * family.weights(mu)
+            wlsendog = (lin_pred + family.link.deriv(mu) * (endog - mu) -
+                        chunk.offset)
+            if wls is None:
+                wls = reg_tools._ChunkedWLS(wlsendog, chunk.exog, weights)
+            else:
+                wls.update(wlsendog, chunk.exog, weights)
+            stats['nobs'] += endog.shape[0]
+            stats['wnobs'] += chunk.freq_weights.sum()
+            stats['deviance'] += family.deviance(endog, mu,
+                                                 chunk.var_weights,
+                                                 chunk.freq_weights)
+            resid = (endog - mu)**2 * chunk.iweights
+            stats['pearson_chi2'] += np.sum(resid / family.variance(mu))
+            stats['sum_wendog'] += np.dot(chunk.iweights, endog)
+            stats['sum_weights'] += chunk.iweights.sum()
+            perfect = perfect and np.allclose(mu - endog, 0)
+        if wls is None:
+            raise ValueError('data_factory returned no chunks')
+        stats['perfect'] = perfect
+        return wls, stats
+
+    def _loglike_pass(self, params, null_mu, scale, llf_scale):
+        """Log-likelihood and null statistics at the final estimate"""
+        family = self.family
+        llf = llnull = null_deviance = 0.
+        for chunk in self._iter_chunks():
+            mu = family.fitted(chunk.exog.dot(params) + chunk.offset)
+            null = np.full_like(chunk.endog, null_mu)
+            llf += family.loglike(chunk.endog, mu,
+                                  var_weights=chunk.var_weights,
+                                  freq_weights=chunk.freq_weights,
+                                  scale=llf_scale)
+            llnull += family.loglike(chunk.endog, null,
+                                     var_weights=chunk.var_weights,
+                                     freq_weights=chunk.freq_weights,
+                                     scale=scale)
+            null_deviance += family.deviance(chunk.endog, null,
+                                             chunk.var_weights,
+                                             chunk.freq_weights)
+        return llf, llnull, null_deviance
+
+    def _estimate_scale_stats(self, stats):
+        scaletype = self.scaletype
+        if not scaletype:
+            if isinstance(self.family, (families.Binomial, families.Poisson,
+                                        families.NegativeBinomial)):
+                return 1.
+            return stats['pearson_chi2'] / self.df_resid
+        if isinstance(scaletype, float):
+            return scaletype
+        if isinstance(scaletype, str):
+            if scaletype.lower() == 'x2':
+                return stats['pearson_chi2'] / self.df_resid
+            elif scaletype.lower() == 'dev':
+                return stats['deviance'] / self.df_resid
+        raise ValueError("Scale %s with type %s not understood" %
+                         (scaletype, type(scaletype)))
+
+    def fit(self, start_params=None, maxiter=100, tol=1e-8, scale=None,
+            cov_type='nonrobust', use_t=None, **kwargs):
+        """
+        Fit the model by IRLS, streaming over the data in each iteration
+
+        Parameters
+        ----------
+        start_params : array-like, optional
+            Initial guess of the parameters. The default starts from
+            ``family.starting_mu(endog)``.
+        maxiter : int
+            The maximum number of iterations, each iteration is one pass
+            over the data.
+        tol : float
+            Convergence tolerance, see `GLM.fit`.
+        scale : string or float, optional
+            'X2', 'dev' or a float, see `GLM.fit`.
+        cov_type : str
+            Only 'nonrobust' is available.
+        use_t : bool
+            If True, the Student t-distribution is used for inference.
+        **kwargs
+            `atol`, `rtol` and `tol_criterion` as in `GLM.fit`.
+
+        Returns
+        -------
+        GLMResults
+            The results instance. Attributes per observation are not
+            available.
+
+        Notes
+        -----
+        In addition to the iterations, the data is read once more to
+        compute the log-likelihood of the model and of the null model.
+        """
+        if cov_type != 'nonrobust':
+            raise NotImplementedError('only nonrobust standard errors are '
+                                      'available for ChunkedGLM')
+        atol = kwargs.get('atol')
+        rtol = kwargs.get('rtol', 0.)
+        tol_criterion = kwargs.get('tol_criterion', 'deviance')
+        atol = tol if atol is None else atol
+        self.scaletype = scale
+
+        params = start_params
+        if params is not None:
+            params = np.asarray(params, dtype=np.float64)
+        wls, stats = self._irls_pass(params)
+        if params is None:
+            params = np.zeros(self.k_exog)
+        history = dict(params=[np.inf, params],
+                       deviance=[np.inf, stats['deviance']])
+        criterion = history[tol_criterion]
+        converged = False
+        for iteration in range(maxiter):
+            params = wls.fit().params
+            wls, stats = self._irls_pass(params)
+            history['params'].append(params)
+            history['deviance'].append(stats['deviance'])
+            if stats['perfect']:
+                msg = "Perfect separation detected, results not available"
+                raise PerfectSeparationError(msg)
+            converged = _check_convergence(criterion, iteration + 1, atol,
+                                           rtol)
+            if converged:
+                break
+        history['iteration'] = iteration + 1 if maxiter > 0 else 0
+        # the cross products are evaluated at the final params
+        wls.fit()
+        normalized_cov_params = wls.normalized_cov_params
+
+        self.nobs = stats['nobs']
+        self.wnobs = stats['wnobs']
+        self.df_model = np.linalg.matrix_rank(wls.xtwx) - 1
+        self.df_resid = self.wnobs - self.df_model - 1
+        self.scale = self._estimate_scale_stats(stats)
+
+        family = self.family
+        llf_scale = self.scale
+        if (isinstance(family, families.Gaussian) and
+                isinstance(family.link, families.links.Power) and
+                family.link.power == 1.):
+            # same as GLMResults.llf, the pearson chi2 is the weighted SSR
+            llf_scale = stats['pearson_chi2'] / self.wnobs
+        null_mu = stats['sum_wendog'] / stats['sum_weights']
+        llf, llnull, null_deviance = self._loglike_pass(
+            params, null_mu, self.scale, llf_scale)
+
+        results = ChunkedGLMResults(self, params, normalized_cov_params,
+                                    self.scale, use_t=use_t)
+        results._cache.update(deviance=stats['deviance'],
+                              pearson_chi2=stats['pearson_chi2'],
+                              llf=llf, llnull=llnull,
+                              null_deviance=null_deviance)
+        results.method = 'IRLS'
+        results.mle_settings = {'optimizer': 'IRLS'}
+        results.fit_history = history
+        results.converged = converged
+        return GLMResultsWrapper(results)
+
+    def predict(self, params, exog=None, exposure=None, offset=None,
+                linear=False):
+        if exog is None:
+            raise ValueError('exog is required, the data of a ChunkedGLM '
+                             'is not kept in memory')
+        return super(ChunkedGLM, self).predict(params, exog=exog,
+                                               exposure=exposure,
+                                               offset=offset, linear=linear)
+
+    predict.__doc__ = GLM.predict.__doc__
+
+
+class ChunkedGLMResults(GLMResults):
+    """
+    Results of a ChunkedGLM
+
+    The statistics that require the data are computed during `fit`,
+    attributes defined per observation are not available.
+    """
+
+    def __init__(self, model, params, normalized_cov_params, scale,
+                 use_t=None):
+        base.LikelihoodModelResults.__init__(
+            self, model, params, normalized_cov_params=normalized_cov_params,
+            scale=scale)
+        self.family = model.family
+        self._endog = None
+        self._freq_weights = None
+        self._var_weights = None
+        self._iweights = None
+        self._n_trials = 1
+        self.nobs = model.nobs
+        self.df_resid = model.df_resid
+        self.df_model = model.df_model
+        self._cache = resettable_cache()
+        self.use_t = False if use_t is None else use_t
+        self.cov_type = 'nonrobust'
+        self.cov_kwds = {'description': 'Standard Errors assume that the ' +
+                         'covariance matrix of the errors is correctly ' +
+                         'specified.'}
+
+    @cache_readonly
+    def mu(self):
+        raise NotImplementedError('attributes per observation are not '
+                                  'available for ChunkedGLM')
+
+    @cache_readonly
+    def null(self):
+        raise NotImplementedError('attributes per observation are not '
+                                  'available for ChunkedGLM')
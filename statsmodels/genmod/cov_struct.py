@@ -1110,16 +1110,18 @@ class OrdinalIndependence(CategoricalCovStruct):
 
     def covariance_matrix(self, expected_value, index):
 
-        ibd = self.ibd[index]
+        # The indicators derived from one observation are the rows
+        # ibd[index][k, 0]:ibd[index][k, 1], i.e. consecutive blocks
+        # of length _ncut.
         n = len(expected_value)
-        vmat = np.zeros((n, n))
+        m = n // self._ncut
+        ev = np.reshape(expected_value, (m, self._ncut))
+        vmat = np.zeros((m, self._ncut, m, self._ncut))
+        ix = np.arange(m)
+        vmat[ix, :, ix, :] = (np.minimum(ev[:, :, None], ev[:, None, :]) -
+                              ev[:, :, None] * ev[:, None, :])
 
-        for bdl in ibd:
-            ev = expected_value[bdl[0]:bdl[1]]
-            vmat[bdl[0]:bdl[1], bdl[0]:bdl[1]] =\
-                np.minimum.outer(ev, ev) - np.outer(ev, ev)
-
-        return vmat, False
+        return np.reshape(vmat, (n, n)), False
 
     # Nothing to update
     def update(self, params):
@@ -1140,16 +1142,18 @@ class NominalIndependence(CategoricalCovStruct):
 
     def covariance_matrix(self, expected_value, index):
 
-        ibd = self.ibd[index]
+        # The indicators derived from one observation are the rows
+        # ibd[index][k, 0]:ibd[index][k, 1], i.e. consecutive blocks
+        # of length _ncut.
         n = len(expected_value)
-        vmat = np.zeros((n, n))
-
-        for bdl in ibd:
-            ev = expected_value[bdl[0]:bdl[1]]
-            vmat[bdl[0]:bdl[1], bdl[0]:bdl[1]] =\
-                np.diag(ev) - np.outer(ev, ev)
-
-        return vmat, False
+        m = n // self._ncut
+        ev = np.reshape(expected_value, (m, self._ncut))
+        vmat = np.zeros((m, self._ncut, m, self._ncut))
+        ix = np.arange(m)
+        vmat[ix, :, ix, :] = (ev[:, :, None] * np.eye(self._ncut) -
+                              ev[:, :, None] * ev[:, None, :])
+
+        return np.reshape(vmat, (n, n)), False
 
     # Nothing to update
     def update(self, params):
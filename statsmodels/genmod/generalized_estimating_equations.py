@@ -2024,33 +2024,17 @@ class OrdinalGEE(GEE):
         endog_cuts = self.endog_values[0:-1]
         ncut = len(endog_cuts)
 
-        nrows = ncut * len(endog)
-        exog_out = np.zeros((nrows, exog.shape[1]),
-                            dtype=np.float64)
-        endog_out = np.zeros(nrows, dtype=np.float64)
-        intercepts = np.zeros((nrows, ncut), dtype=np.float64)
-        groups_out = np.zeros(nrows, dtype=groups.dtype)
-        time_out = np.zeros((nrows, time.shape[1]),
-                            dtype=np.float64)
-        offset_out = np.zeros(nrows, dtype=np.float64)
-
-        jrow = 0
-        zipper = zip(exog, endog, groups, time, offset)
-        for (exog_row, endog_value, group_value, time_value,
-             offset_value) in zipper:
-
-            # Loop over thresholds for the indicators
-            for thresh_ix, thresh in enumerate(endog_cuts):
-
-                exog_out[jrow, :] = exog_row
-                endog_out[jrow] = (int(endog_value > thresh))
-                intercepts[jrow, thresh_ix] = 1
-                groups_out[jrow] = group_value
-                time_out[jrow] = time_value
-                offset_out[jrow] = offset_value
-                jrow += 1
-
-        exog_out = np.concatenate((intercepts, exog_out), axis=1)
+        # Each observation is expanded into `ncut` consecutive rows, one
+        # per threshold, filled through a 3-d view of the output.
+        nobs, nvar = exog.shape
+        exog_out = np.empty((nobs * ncut, ncut + nvar), dtype=np.float64)
+        exog_view = exog_out.reshape((nobs, ncut, ncut + nvar))
+        exog_view[:, :, :ncut] = np.eye(ncut)
+        exog_view[:, :, ncut:] = exog[:, None, :]
+        endog_out = (endog[:, None] > endog_cuts).ravel().astype(np.float64)
+        groups_out = np.repeat(groups, ncut)
+        time_out = np.repeat(time, ncut, axis=0).astype(np.float64)
+        offset_out = np.repeat(offset, ncut).astype(np.float64)
 
         # exog column names, including intercepts
         xnames = ["I(y>%.1f)" % v for v in endog_cuts]
@@ -2261,31 +2245,19 @@ class NominalGEE(GEE):
         ncut = len(endog_cuts)
         self.ncut = ncut
 
-        nrows = len(endog_cuts) * exog.shape[0]
-        ncols = len(endog_cuts) * exog.shape[1]
-        exog_out = np.zeros((nrows, ncols), dtype=np.float64)
-        endog_out = np.zeros(nrows, dtype=np.float64)
-        groups_out = np.zeros(nrows, dtype=np.float64)
-        time_out = np.zeros((nrows, time.shape[1]),
-                            dtype=np.float64)
-        offset_out = np.zeros(nrows, dtype=np.float64)
-
-        jrow = 0
-        zipper = zip(exog, endog, groups, time, offset)
-        for (exog_row, endog_value, group_value, time_value,
-             offset_value) in zipper:
-
-            # Loop over thresholds for the indicators
-            for thresh_ix, thresh in enumerate(endog_cuts):
-
-                u = np.zeros(len(endog_cuts), dtype=np.float64)
-                u[thresh_ix] = 1
-                exog_out[jrow, :] = np.kron(u, exog_row)
-                endog_out[jrow] = (int(endog_value == thresh))
-                groups_out[jrow] = group_value
-                time_out[jrow] = time_value
-                offset_out[jrow] = offset_value
-                jrow += 1
+        # Each observation is expanded into `ncut` consecutive rows, row
+        # j holds the covariates in the j^th block of columns and zeros
+        # elsewhere.  The diagonal blocks are filled through a 4-d view
+        # of the output.
+        nobs, nvar = exog.shape
+        exog_out = np.zeros((nobs * ncut, ncut * nvar), dtype=np.float64)
+        exog_view = exog_out.reshape((nobs, ncut, ncut, nvar))
+        for j in range(ncut):
+            exog_view[:, j, j, :] = exog
+        endog_out = (endog[:, None] == endog_cuts).ravel().astype(np.float64)
+        groups_out = np.repeat(groups, ncut).astype(np.float64)
+        time_out = np.repeat(time, ncut, axis=0).astype(np.float64)
+        offset_out = np.repeat(offset, ncut).astype(np.float64)
 
         # exog names
         if type(self.exog_orig) == pd.DataFrame:
@@ -2296,7 +2268,6 @@ class NominalGEE(GEE):
         for tr in endog_cuts:
             xnames.extend(["%s[%.1f]" % (v, tr) for v in xnames_in])
         exog_out = pd.DataFrame(exog_out, columns=xnames)
-        exog_out = pd.DataFrame(exog_out, columns=xnames)
 
         # Preserve endog name if there is one
         if type(self.endog_orig) == pd.Series:
@@ -2332,18 +2303,15 @@ class NominalGEE(GEE):
 
         # The normalizing constant for the multinomial probabilities.
         denom = 1 + expval_m.sum(1)
-        denom = np.kron(denom, np.ones(self.ncut, dtype=np.float64))
+        denom = np.repeat(denom, self.ncut)
 
         # The multinomial probabilities
         mprob = expval / denom
 
-        # First term of the derivative: denom * expval' / denom^2 =
-        # expval' / denom.
-        dmat = mprob[:, None] * exog
-
-        # Second term of the derivative: -expval * denom' / denom^2
-        ddenom = expval[:, None] * exog
-        dmat -= mprob[:, None] * ddenom / denom[:, None]
+        # The derivative of expval / denom is the sum of expval' / denom
+        # and -expval * denom' / denom^2, with the latter restricted to
+        # the terms of denom' that involve the same row of exog.
+        dmat = (mprob * (1 - mprob))[:, None] * exog
 
         return dmat
 
@@ -2382,26 +2350,18 @@ class NominalGEE(GEE):
                                        self.ncut))
 
         denom = 1 + expval_m.sum(1)
-        denom = np.kron(denom, np.ones(self.ncut, dtype=np.float64))
-
-        bmat0 = np.outer(np.ones(exog.shape[0]), params)
-
-        # Masking matrix
-        qmat = []
-        for j in range(self.ncut):
-            ee = np.zeros(self.ncut, dtype=np.float64)
-            ee[j] = 1
-            qmat.append(np.kron(ee, np.ones(len(params) // self.ncut)))
-        qmat = np.array(qmat)
-        qmat = np.kron(np.ones((exog.shape[0] // self.ncut, 1)), qmat)
-        bmat = bmat0 * qmat
-
-        dmat = expval[:, None] * bmat / denom[:, None]
-
-        expval_mb = np.kron(expval_m, np.ones((self.ncut, 1)))
-        expval_mb = np.kron(expval_mb, np.ones((1, self.ncut)))
-
-        dmat -= expval[:, None] * (bmat * expval_mb) / denom[:, None] ** 2
+        mprob = expval_m / denom[:, None]
+
+        # The row for the j^th category only depends on the j^th block of
+        # columns, and only through the coefficients of that block.
+        nobs = expval_m.shape[0]
+        ix = np.arange(self.ncut)
+        pmat = np.reshape(params, (self.ncut, -1))
+        dblk = (mprob * (1 - mprob))[:, :, None] * pmat
+        dmat = np.zeros((nobs, self.ncut, self.ncut, pmat.shape[1]),
+                        dtype=dblk.dtype)
+        dmat[:, ix, ix, :] = dblk
+        dmat = np.reshape(dmat, (exog.shape[0], len(params)))
 
         return dmat
 
@@ -2567,7 +2527,7 @@ class _MultinomialLogit(Link):
 
         denom = 1 + np.reshape(expval, (len(expval) // self.ncut,
                                         self.ncut)).sum(1)
-        denom = np.kron(denom, np.ones(self.ncut, dtype=np.float64))
+        denom = np.repeat(denom, self.ncut)
 
         prob = expval / denom
 
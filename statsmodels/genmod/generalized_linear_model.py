@@ -1037,6 +1037,21 @@ class GLM(base.LikelihoodModel):
             near-singular cases by truncating small singular values based
             on `rcond` of the respective numpy.linalg function. 'qr' is
             only valied for cases that are not singular nor near-singular.
+            'cholesky' accumulates X'WX and X'Wz in blocks of rows without
+            copying the design matrix and solves the normal equations by a
+            Cholesky factorization, with a fallback to the pseudoinverse of
+            X'WX if it is singular or near-singular. The factorization of
+            the last iteration is reused for `normalized_cov_params`. This
+            is the fastest option for large `nobs`, but the normal
+            equations are less accurate for ill-conditioned designs.
+        chunksize : int, optional
+            Only used if `wls_method` is 'cholesky'. The number of rows in
+            a block. The default uses blocks of about 2**20 elements.
+        dtype : dtype, optional
+            Only used if `wls_method` is 'cholesky'. If ``np.float32``,
+            the cross products within a block are computed in single
+            precision which is faster for very large `nobs`. The sums
+            over blocks and the solution are computed in double precision.
 
         If a scipy optimizer is used, the following additional parameter is
         available:
@@ -1142,6 +1157,8 @@ class GLM(base.LikelihoodModel):
         rtol = kwargs.get('rtol', 0.)
         tol_criterion = kwargs.get('tol_criterion', 'deviance')
         wls_method = kwargs.get('wls_method', 'lstsq')
+        chunksize = kwargs.get('chunksize')
+        dtype = kwargs.get('dtype')
         atol = tol if atol is None else atol
 
         endog = self.endog
@@ -1178,10 +1195,18 @@ class GLM(base.LikelihoodModel):
                             self.family.weights(mu))
             wlsendog = (lin_pred + self.family.link.deriv(mu) * (self.endog-mu)
                         - self._offset_exposure)
-            wls_results = reg_tools._MinimalWLS(
-                    wlsendog,
-                    wlsexog,
-                    self.weights).fit(method=wls_method)
+            if wls_method == 'cholesky':
+                wls_results = reg_tools._ChunkedWLS(
+                        wlsendog,
+                        wlsexog,
+                        self.weights,
+                        chunksize=chunksize,
+                        dtype=dtype).fit()
+            else:
+                wls_results = reg_tools._MinimalWLS(
+                        wlsendog,
+                        wlsexog,
+                        self.weights).fit(method=wls_method)
             lin_pred = np.dot(self.exog, wls_results.params)
             lin_pred += self._offset_exposure
             mu = self.family.fitted(lin_pred)
@@ -1196,13 +1221,21 @@ class GLM(base.LikelihoodModel):
                 break
         self.mu = mu
 
-        if maxiter > 0:  # Only if iterative used
-            wls_method2 = 'pinv' if wls_method == 'lstsq' else wls_method
-            wls_model = lm.WLS(wlsendog, wlsexog, self.weights)
-            wls_results = wls_model.fit(method=wls_method2)
+        if maxiter > 0 and wls_method == 'cholesky':
+            # X'WX of the last iteration is already factorized
+            normalized_cov_params = wls_results.model.normalized_cov_params
+            if attach_wls:
+                wls_model = lm.WLS(wlsendog, wlsexog, self.weights)
+                wls_results = wls_model.fit(method='pinv')
+        else:
+            if maxiter > 0:  # Only if iterative used
+                wls_method2 = 'pinv' if wls_method == 'lstsq' else wls_method
+                wls_model = lm.WLS(wlsendog, wlsexog, self.weights)
+                wls_results = wls_model.fit(method=wls_method2)
+            normalized_cov_params = wls_results.normalized_cov_params
 
         glm_results = GLMResults(self, wls_results.params,
-                                 wls_results.normalized_cov_params,
+                                 normalized_cov_params,
                                  self.scale,
                                  cov_type=cov_type, cov_kwds=cov_kwds,
                                  use_t=use_t)
@@ -1259,6 +1292,11 @@ class GLM(base.LikelihoodModel):
         Post-estimation results are based on the same data used to
         select variables, hence may be subject to overfitting biases.
 
+        If the scale is fixed, as for the Binomial and Poisson families,
+        coordinate descent is applied to the quadratic IRLS approximation
+        of the log-likelihood. Otherwise each coordinate is optimized
+        numerically.
+
         The elastic_net method uses the following keyword arguments:
 
         maxiter : int
@@ -1284,6 +1322,7 @@ class GLM(base.LikelihoodModel):
                                 alpha=alpha,
                                 start_params=start_params,
                                 refit=refit,
+                                quadratic=self._elastic_net_quadratic_func(),
                                 **defaults)
 
         self.mu = self.predict(result.params)
@@ -1291,6 +1330,78 @@ class GLM(base.LikelihoodModel):
 
         return result
 
+    def fit_regularized_path(self, alphas, L1_wt=1., start_params=None,
+                             **kwargs):
+        """
+        Elastic net fits along a sequence of penalty weights.
+
+        Parameters
+        ----------
+        alphas : array-like
+            Scalar penalty weights. Each fit is warm-started at the
+            solution for the previous weight, a decreasing sequence is
+            most efficient.
+        L1_wt : scalar
+            The fraction of the penalty given to the L1 penalty term.
+        start_params : array-like
+            Starting values for the first fit.
+        **kwargs
+            `maxiter`, `cnvrg_tol` and `zero_tol` as in `fit_regularized`.
+
+        Returns
+        -------
+        Bunch
+            `alphas`, `params`, an array with the coefficients for each
+            penalty weight in the rows, and `n_iter`.
+
+        See Also
+        --------
+        fit_regularized
+        statsmodels.base.elastic_net.fit_elasticnet_path
+
+        Notes
+        -----
+        If the scale is fixed, as for the Binomial and Poisson families,
+        each fit runs coordinate descent within IRLS iterations and uses
+        the sequential strong rule to discard variables.
+        """
+        from statsmodels.base.elastic_net import fit_elasticnet_path
+
+        defaults = {"maxiter": 50, "cnvrg_tol": 1e-10, "zero_tol": 1e-10}
+        defaults.update(kwargs)
+        quadratic = self._elastic_net_quadratic_func()
+        return fit_elasticnet_path(self, alphas, L1_wt=L1_wt,
+                                   start_params=start_params,
+                                   quadratic=quadratic, **defaults)
+
+    def _elastic_net_quadratic_func(self):
+        """
+        IRLS quadratic approximation for elastic net fitting.
+
+        Returns None if the scale is estimated, the penalized objective
+        then depends on the scale estimate which is not quadratic.
+        """
+        fixed_scale = (isinstance(self.scaletype, float) or
+                       (not self.scaletype and
+                        isinstance(self.family, (families.Binomial,
+                                                 families.Poisson,
+                                                 families.NegativeBinomial))))
+        if not fixed_scale:
+            return None
+
+        def quadratic(params):
+            lin_pred = np.dot(self.exog, params) + self._offset_exposure
+            mu = self.family.fitted(lin_pred)
+            scale = self.estimate_scale(mu)
+            weights = (self.iweights * self.n_trials *
+                       self.family.weights(mu) / (scale * self.nobs))
+            wlsendog = (lin_pred - self._offset_exposure +
+                        self.family.link.deriv(mu) * (self.endog - mu))
+            wls = reg_tools._ChunkedWLS(wlsendog, self.exog, weights)
+            return wls.xtwx, wls.xtwz, False
+
+        return quadratic
+
     def fit_constrained(self, constraints, start_params=None, **fit_kwds):
         """fit the model subject to linear equality constraints
 
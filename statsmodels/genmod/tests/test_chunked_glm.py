@@ -0,0 +1,79 @@
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+import pandas as pd
+import pytest
+
+import statsmodels.api as sm
+from statsmodels.genmod.chunked_glm import ChunkedGLM
+from statsmodels.genmod.generalized_linear_model import GLM, GLMResults
+
+
+def _chunk_factory(chunksize, **arrays):
+    nobs = len(arrays['endog'])
+
+    def factory():
+        for i in range(0, nobs, chunksize):
+            yield {key: value[i:i + chunksize]
+                   for key, value in arrays.items()}
+
+    return factory
+
+
+@pytest.mark.parametrize('family', [sm.families.Poisson(),
+                                    sm.families.Gaussian(),
+                                    sm.families.Gamma(sm.families.links.log()),
+                                    sm.families.Binomial()])
+def test_chunked_glm(family):
+    np.random.seed(9876)
+    nobs = 500
+    exog = sm.add_constant(np.random.randn(nobs, 3))
+    linpred = 0.2 * exog.sum(1)
+    offset = 0.1 * np.random.rand(nobs)
+    freq_weights = np.random.randint(1, 4, nobs).astype(float)
+    if isinstance(family, sm.families.Poisson):
+        endog = np.random.poisson(np.exp(linpred))
+    elif isinstance(family, sm.families.Gaussian):
+        endog = linpred + np.random.randn(nobs)
+    elif isinstance(family, sm.families.Gamma):
+        endog = np.random.gamma(2, np.exp(linpred) / 2)
+    else:
+        endog = (np.random.rand(nobs) < 0.4).astype(float)
+
+    res1 = GLM(endog, exog, family=family, offset=offset,
+               freq_weights=freq_weights).fit(tol=1e-12)
+    factory = _chunk_factory(77, endog=endog, exog=exog, offset=offset,
+                             freq_weights=freq_weights)
+    res2 = ChunkedGLM(factory, family=family).fit(tol=1e-12)
+
+    assert isinstance(res2._results, GLMResults)
+    assert res2.converged
+    assert_equal(res2.nobs, nobs)
+    assert_allclose(res2.params, res1.params, rtol=1e-7)
+    assert_allclose(res2.bse, res1.bse, rtol=1e-7)
+    for attr in ['scale', 'deviance', 'pearson_chi2', 'llf', 'llnull',
+                 'null_deviance', 'aic', 'bic', 'df_resid', 'df_model']:
+        assert_allclose(getattr(res2, attr), getattr(res1, attr), rtol=1e-7)
+
+    assert_allclose(res2.predict(exog[:5], offset=offset[:5]),
+                    res1.fittedvalues[:5], rtol=1e-7)
+    with pytest.raises(NotImplementedError):
+        res2.resid_pearson
+
+
+def test_chunked_glm_pandas():
+    np.random.seed(9876)
+    nobs = 300
+    df = pd.DataFrame(np.random.randn(nobs, 2), columns=['a', 'b'])
+    df['y'] = np.random.poisson(np.exp(0.3 * df['a']))
+    exog = sm.add_constant(df[['a', 'b']])
+
+    def factory():
+        for i in range(0, nobs, 50):
+            yield df['y'].iloc[i:i + 50], exog.iloc[i:i + 50]
+
+    res1 = GLM(df['y'], exog, family=sm.families.Poisson()).fit()
+    res2 = ChunkedGLM(factory, family=sm.families.Poisson()).fit()
+    assert_equal(list(res2.params.index), ['const', 'a', 'b'])
+    assert_allclose(res2.params, res1.params, rtol=1e-7)
+    assert_allclose(res2.bse, res1.bse, rtol=1e-7)
+    res2.summary()
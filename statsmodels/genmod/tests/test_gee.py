@@ -26,6 +26,7 @@ import pandas as pd
 import statsmodels.formula.api as smf
 import statsmodels.api as sm
 from scipy.stats.distributions import norm
+from statsmodels.tools.numdiff import approx_fprime
 import warnings
 
 try:
@@ -801,6 +802,67 @@ class TestGEE(object):
             model1 = NominalGEE(y, x, groups, cov_struct=nmi)
             model1.fit()
 
+    def test_categorical_setup(self):
+
+        np.random.seed(434)
+        n = 30
+        y = np.random.randint(0, 4, n)
+        groups = np.kron(np.arange(n / 3), np.r_[1, 1, 1])
+        x = np.random.normal(size=(n, 2))
+        cuts = np.unique(y)[:-1]
+        ncut = len(cuts)
+
+        # Expanded data, one row per observation and threshold
+        mod = OrdinalGEE(y, x, groups)
+        mod_nom = NominalGEE(y, x, groups)
+        icept = np.eye(ncut)
+        jrow = 0
+        for i in range(n):
+            for j in range(ncut):
+                assert_equal(mod.exog[jrow], np.r_[icept[j], x[i]])
+                assert_equal(mod.endog[jrow], y[i] > cuts[j])
+                assert_equal(mod_nom.exog[jrow], np.kron(icept[j], x[i]))
+                assert_equal(mod_nom.endog[jrow], y[i] == cuts[j])
+                assert_equal(mod.groups[jrow], groups[i])
+                assert_equal(mod_nom.groups[jrow], groups[i])
+                jrow += 1
+        assert_equal(mod.exog_names[:ncut + 1], ["I(y>0.0)", "I(y>1.0)",
+                                                 "I(y>2.0)", "x1"])
+        assert_equal(mod_nom.exog_names[:3], ["x1[0.0]", "x2[0.0]",
+                                              "x1[1.0]"])
+
+        # Working covariances are block diagonal
+        ev = np.random.uniform(0.1, 0.3, size=mod.exog_li[0].shape[0])
+        for cs, fun in ((mod.cov_struct,
+                         lambda e: np.minimum.outer(e, e) - np.outer(e, e)),
+                        (mod_nom.cov_struct,
+                         lambda e: np.diag(e) - np.outer(e, e))):
+            vmat, _ = cs.covariance_matrix(ev, 0)
+            vmat1 = np.zeros_like(vmat)
+            for bdl in cs.ibd[0]:
+                ii = slice(bdl[0], bdl[1])
+                vmat1[ii, ii] = fun(ev[ii])
+            assert_allclose(vmat, vmat1, rtol=1e-14, atol=1e-14)
+
+        # The derivatives of the multinomial probabilities with respect
+        # to exog are nonzero only within the own block
+        params = np.random.normal(size=mod_nom.exog.shape[1])
+        exog = mod_nom.exog[:2 * ncut]
+        dmat = mod_nom.mean_deriv_exog(exog, params)
+        dmat1 = np.zeros_like(dmat)
+        for i in range(exog.shape[0]):
+            for j in range(exog.shape[1]):
+                if exog[i, j] == 0:
+                    continue
+
+                def fun(v):
+                    ex = exog.copy()
+                    ex[i, j] = v
+                    return mod_nom.family.link.inverse(np.dot(ex, params))[i]
+                dmat1[i, j] = approx_fprime(np.r_[exog[i, j]], fun,
+                                            centered=True)
+        assert_allclose(dmat, dmat1, rtol=1e-5, atol=1e-7)
+
     @pytest.mark.matplotlib
     def test_ordinal_plot(self, close_figures):
         family = Binomial()
@@ -1261,6 +1261,38 @@ def test_glm_irls_method():
     assert_equal(res_g1.method, 'bfgs')
 
 
+def test_glm_irls_cholesky():
+    np.random.seed(987126)
+    nobs = 500
+    x = np.random.randn(nobs, 3)
+    exog = add_constant(x, has_constant='add')
+    y = np.random.poisson(np.exp(0.2 * exog.sum(1)))
+
+    mod = GLM(y, exog, family=sm.families.Poisson())
+    res1 = mod.fit()
+    res2 = mod.fit(wls_method='cholesky', chunksize=37)
+    assert_equal(res2.mle_settings['wls_method'], 'cholesky')
+    assert_allclose(res2.params, res1.params, rtol=1e-12)
+    assert_allclose(res2.bse, res1.bse, rtol=1e-12)
+    assert_equal(res2.fit_history['iteration'],
+                 res1.fit_history['iteration'])
+
+    res3 = mod.fit(wls_method='cholesky', dtype=np.float32)
+    assert_allclose(res3.params, res1.params, rtol=1e-5)
+    assert_allclose(res3.bse, res1.bse, rtol=1e-5)
+
+    res4 = mod.fit(wls_method='cholesky', attach_wls=True)
+    assert_allclose(res4.results_wls.params, res1.params, rtol=1e-12)
+
+    # singular design uses the pseudoinverse, same as the default
+    exog_s = np.column_stack((exog, exog[:, 1]))
+    mod_s = GLM(y, exog_s, family=sm.families.Poisson())
+    res1 = mod_s.fit()
+    res2 = mod_s.fit(wls_method='cholesky')
+    assert_allclose(res2.params, res1.params, rtol=1e-8)
+    assert_allclose(res2.bse, res1.bse, rtol=1e-8)
+
+
 class CheckWtdDuplicationMixin(object):
     decimal_params = DECIMAL_4
 
@@ -1963,6 +1995,39 @@ class TestRegularized(object):
                 llf_sm = plf(sm_result.params)
                 assert_equal(np.sign(llf_sm - llf_r), 1)
 
+    def test_regularized_path(self):
+        from statsmodels.base.elastic_net import fit_elasticnet
+
+        np.random.seed(3132)
+        exog = np.random.normal(size=(300, 10))
+        linpred = exog[:, :3].sum(1) / 2
+        alphas = [0.1, 0.03, 0.01, 0.003]
+        for fam in sm.families.Binomial(), sm.families.Poisson():
+            if isinstance(fam, sm.families.Binomial):
+                endog = (np.random.uniform(size=300) <
+                         1 / (1 + np.exp(-linpred))).astype(float)
+            else:
+                endog = np.random.poisson(np.exp(linpred))
+            model = GLM(endog, exog, family=fam)
+            path = model.fit_regularized_path(alphas, L1_wt=0.5)
+            for alpha, params in zip(alphas, path.params):
+                result = model.fit_regularized(alpha=alpha, L1_wt=0.5)
+                assert_allclose(params, result.params, rtol=1e-6,
+                                atol=1e-8)
+                # generic coordinate descent with numerical 1-d optimization
+                result = fit_elasticnet(model, alpha=alpha, L1_wt=0.5,
+                                        maxiter=200, cnvrg_tol=1e-12,
+                                        zero_tol=1e-10)
+                assert_allclose(params, result.params, atol=1e-3)
+
+                def objective(params):
+                    pen = (np.sum(params**2) / 2 +
+                           np.sum(np.abs(params))) / 2
+                    return -model.loglike(params) / 300 + alpha * pen
+
+                assert_(objective(params) <=
+                        objective(result.params) + 1e-12)
+
 
 class TestConvergence(object):
     @classmethod
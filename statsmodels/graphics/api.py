@@ -1,12 +1,39 @@
-from .functional import hdrboxplot, fboxplot, rainbowplot
-from .correlation import plot_corr, plot_corr_grid
-from .gofplots import qqplot
-from .boxplots import violinplot, beanplot
-from .regressionplots import (abline_plot, plot_regress_exog, plot_fit,
-                              plot_partregress, plot_partregress_grid,
-                              plot_ccpr, plot_ccpr_grid, influence_plot,
-                              plot_leverage_resid2)
-from .factorplots import interaction_plot
-from .plottools import rainbow
-from . import tsaplots as tsa
-from .agreement import mean_diff_plot
+"""
+Graphics API
+
+Plotting functions are imported on first access, so that matplotlib is only
+loaded when a plot is made, see statsmodels.tools._lazy.
+"""
+from statsmodels.tools._lazy import install_lazy_attributes
+
+install_lazy_attributes(globals(), {
+    'hdrboxplot': ('statsmodels.graphics.functional', 'hdrboxplot'),
+    'fboxplot': ('statsmodels.graphics.functional', 'fboxplot'),
+    'rainbowplot': ('statsmodels.graphics.functional', 'rainbowplot'),
+    'plot_corr': ('statsmodels.graphics.correlation', 'plot_corr'),
+    'plot_corr_grid': ('statsmodels.graphics.correlation', 'plot_corr_grid'),
+    'qqplot': ('statsmodels.graphics.gofplots', 'qqplot'),
+    'violinplot': ('statsmodels.graphics.boxplots', 'violinplot'),
+    'beanplot': ('statsmodels.graphics.boxplots', 'beanplot'),
+    'abline_plot': ('statsmodels.graphics.regressionplots', 'abline_plot'),
+    'plot_regress_exog': ('statsmodels.graphics.regressionplots',
+                          'plot_regress_exog'),
+    'plot_fit': ('statsmodels.graphics.regressionplots', 'plot_fit'),
+    'plot_partregress': ('statsmodels.graphics.regressionplots',
+                         'plot_partregress'),
+    'plot_partregress_grid': ('statsmodels.graphics.regressionplots',
+                              'plot_partregress_grid'),
+    'plot_ccpr': ('statsmodels.graphics.regressionplots', 'plot_ccpr'),
+    'plot_ccpr_grid': ('statsmodels.graphics.regressionplots',
+                       'plot_ccpr_grid'),
+    'influence_plot': ('statsmodels.graphics.regressionplots',
+                       'influence_plot'),
+    'plot_leverage_resid2': ('statsmodels.graphics.regressionplots',
+                             'plot_leverage_resid2'),
+    'interaction_plot': ('statsmodels.graphics.factorplots',
+                         'interaction_plot'),
+    'rainbow': ('statsmodels.graphics.plottools', 'rainbow'),
+    'tsa': ('statsmodels.graphics.tsaplots', None),
+    'mean_diff_plot': ('statsmodels.graphics.agreement', 'mean_diff_plot'),
+    })
+del install_lazy_attributes
@@ -0,0 +1,349 @@
+"""
+Lightweight prediction artifacts
+
+A Scorer holds only what is needed to predict from a fitted model: the
+parameters, the inverse link, the compiled formula plan and optionally the
+parameter covariance. It is stored as versioned JSON, so loading does not
+unpickle arbitrary objects and does not depend on the statsmodels version
+that fitted the model.
+"""
+import json
+
+import numpy as np
+from scipy import stats
+
+from statsmodels.iolib.openfile import get_file_obj
+
+__all__ = ['Scorer', 'load_scorer']
+
+_FORMAT = 'statsmodels.scorer'
+_VERSION = 1
+
+
+def _link_to_dict(link):
+    from statsmodels.genmod.families import links
+    cls = type(link)
+    if cls is links.CDFLink:
+        raise NotImplementedError('CDFLink with a custom distribution cannot '
+                                  'be exported')
+    kwds = {}
+    if cls is links.Power:
+        kwds['power'] = float(link.power)
+    elif issubclass(cls, links.NegativeBinomial):
+        kwds['alpha'] = float(link.alpha)
+    return {'name': cls.__name__, 'kwds': kwds}
+
+
+def _link_from_dict(spec):
+    from statsmodels.genmod.families import links
+    cls = getattr(links, spec['name'], None)
+    if not (isinstance(cls, type) and issubclass(cls, links.Link)):
+        raise ValueError('unknown link %r' % spec['name'])
+    return cls(**spec['kwds'])
+
+
+def _results_link(results):
+    """Link function that maps the linear predictor to the mean"""
+    from statsmodels.genmod.families import links
+    from statsmodels.genmod.generalized_linear_model import GLM
+    from statsmodels.regression.linear_model import RegressionModel
+    from statsmodels.discrete import discrete_model as dm
+    model = results.model
+    if isinstance(model, GLM):
+        return model.family.link
+    if isinstance(model, RegressionModel):
+        return links.identity()
+    if isinstance(model, dm.Logit):
+        return links.logit()
+    if isinstance(model, dm.Probit):
+        return links.probit()
+    if isinstance(model, (dm.Poisson, dm.NegativeBinomial,
+                          dm.NegativeBinomialP, dm.GeneralizedPoisson)):
+        return links.log()
+    raise NotImplementedError('%s models cannot be exported to a Scorer'
+                              % type(model).__name__)
+
+
+class Scorer(object):
+    """
+    Minimal prediction artifact of a fitted model
+
+    Parameters
+    ----------
+    params : array-like
+        The parameters of the mean function, one per column of exog.
+    link : Link instance, optional
+        The link function of the model. The prediction is the inverse link
+        of the linear predictor. Default is the identity link.
+    exog_names : list of str, optional
+        Names of the columns of exog.
+    design_plan : DesignPlan, optional
+        Compiled formula plan. If given, `predict` builds exog from the
+        data columns used in the formula.
+    cov_params : array-like, optional
+        Covariance of `params`, required for standard errors and confidence
+        intervals of the prediction.
+    df_resid : float, optional
+        Residual degrees of freedom used if `use_t` is True.
+    use_t : bool
+        Whether confidence intervals use the t instead of the normal
+        distribution.
+    model_name : str, optional
+        Name of the model class, kept for information only.
+
+    Notes
+    -----
+    Create a Scorer from fitted results with ``results.to_scorer()`` or
+    :meth:`from_results`, store it with :meth:`save` and restore it with
+    :func:`load_scorer`. The stored file is JSON that contains only numbers,
+    strings and the formula expressions. Formula expressions are evaluated
+    by a restricted evaluator that only accepts data columns, arithmetic and
+    a whitelist of numpy functions, see
+    :class:`statsmodels.formula.designplan.DesignPlan`.
+
+    Examples
+    --------
+    >>> res = smf.logit('y ~ x + C(g)', data).fit()
+    >>> res.to_scorer(include_cov=True).save('model.json')
+    >>> scorer = load_scorer('model.json')
+    >>> scorer.predict({'x': 1.5, 'g': 'b'})
+    """
+    def __init__(self, params, link=None, exog_names=None, design_plan=None,
+                 cov_params=None, df_resid=None, use_t=False,
+                 model_name=None):
+        from statsmodels.genmod.families import links
+        self.params = np.asarray(params, dtype=float)
+        self.link = links.identity() if link is None else link
+        if exog_names is None:
+            exog_names = ['x%d' % i for i in range(1, len(self.params) + 1)]
+        self.exog_names = list(exog_names)
+        self.design_plan = design_plan
+        if cov_params is not None:
+            cov_params = np.asarray(cov_params, dtype=float)
+        self.cov_params = cov_params
+        self.df_resid = df_resid
+        self.use_t = use_t
+        self.model_name = model_name
+
+    @classmethod
+    def from_results(cls, results, include_cov=False):
+        """
+        Create a Scorer from fitted model results
+
+        Parameters
+        ----------
+        results : Results instance
+            Results of a linear regression, GLM, Logit, Probit or count
+            model.
+        include_cov : bool
+            If True, the covariance of the parameters is included so that
+            standard errors and confidence intervals of predictions are
+            available.
+
+        Returns
+        -------
+        Scorer
+        """
+        from statsmodels.formula.designplan import DesignPlan
+        model = results.model
+        k = model.exog.shape[1]
+        # drop extra parameters such as the dispersion of count models
+        exog_names = list(model.exog_names)[:k]
+        params = np.asarray(results.params)[:k]
+        plan = None
+        design_info = getattr(model.data, 'design_info', None)
+        if getattr(model, 'formula', None) is not None and design_info:
+            plan = DesignPlan.from_design_info(design_info)
+        cov = None
+        if include_cov:
+            cov = np.asarray(results.cov_params())[:k, :k]
+        df_resid = getattr(results, 'df_resid', None)
+        return cls(params, link=_results_link(results), exog_names=exog_names,
+                   design_plan=plan, cov_params=cov,
+                   df_resid=None if df_resid is None else float(df_resid),
+                   use_t=bool(getattr(results, 'use_t', False)),
+                   model_name=type(model).__name__)
+
+    def _exog(self, exog, transform):
+        if transform and self.design_plan is not None:
+            return self.design_plan.evaluate(exog)
+        exog = np.asarray(exog, dtype=float)
+        if exog.ndim < 2:
+            # a single row, or a single column if there is one parameter
+            exog = exog.reshape(-1, len(self.params))
+        return exog
+
+    def _linpred(self, exog, offset, exposure, transform):
+        exog = self._exog(exog, transform)
+        linpred = exog.dot(self.params)
+        if offset is not None:
+            linpred = linpred + offset
+        if exposure is not None:
+            linpred = linpred + np.log(exposure)
+        return exog, linpred
+
+    def predict(self, exog, offset=None, exposure=None, linear=False,
+                transform=True):
+        """
+        Predict the mean, or the linear predictor, for new data
+
+        Parameters
+        ----------
+        exog : array-like or dict-like
+            If the scorer has a formula plan and `transform` is True, a
+            mapping from the data column names to array-like or scalar
+            values, for example a dict or a pandas DataFrame. Otherwise an
+            array with one column per parameter, or a single row.
+        offset : array-like, optional
+            Offset added to the linear predictor.
+        exposure : array-like, optional
+            Exposure, its log is added to the linear predictor.
+        linear : bool
+            If True, return the linear predictor instead of the mean.
+        transform : bool
+            If False, exog is used as the design matrix even if the scorer
+            has a formula plan.
+
+        Returns
+        -------
+        ndarray
+            1-d array of predictions.
+        """
+        linpred = self._linpred(exog, offset, exposure, transform)[1]
+        if linear:
+            return linpred
+        return self.link.inverse(linpred)
+
+    def _check_cov(self):
+        if self.cov_params is None:
+            raise ValueError('the scorer was created without cov_params')
+
+    def se_linear(self, exog, transform=True):
+        """
+        Standard errors of the linear predictor
+
+        Parameters
+        ----------
+        exog : array-like or dict-like
+            See `predict`.
+        transform : bool
+            See `predict`.
+
+        Returns
+        -------
+        ndarray
+            1-d array of standard errors.
+        """
+        self._check_cov()
+        exog = self._exog(exog, transform)
+        return np.sqrt((exog.dot(self.cov_params) * exog).sum(1))
+
+    def conf_int(self, exog, alpha=0.05, offset=None, exposure=None,
+                 linear=False, transform=True):
+        """
+        Confidence intervals of the predicted mean
+
+        The interval is computed for the linear predictor and transformed
+        by the inverse link, as in ``GLMResults.get_prediction``.
+
+        Parameters
+        ----------
+        exog : array-like or dict-like
+            See `predict`.
+        alpha : float
+            The confidence level is 1 - alpha.
+        offset, exposure : array-like, optional
+            See `predict`.
+        linear : bool
+            If True, return the interval of the linear predictor.
+        transform : bool
+            See `predict`.
+
+        Returns
+        -------
+        ndarray
+            nobs x 2 array of lower and upper bounds.
+        """
+        self._check_cov()
+        exog, linpred = self._linpred(exog, offset, exposure, transform)
+        se = np.sqrt((exog.dot(self.cov_params) * exog).sum(1))
+        if self.use_t:
+            q = stats.t.isf(alpha / 2., self.df_resid)
+        else:
+            q = stats.norm.isf(alpha / 2.)
+        ci = np.column_stack((linpred - q * se, linpred + q * se))
+        if linear:
+            return ci
+        return self.link.inverse(ci)
+
+    def to_dict(self):
+        """
+        Scorer as a dictionary of plain Python types
+
+        Returns
+        -------
+        dict
+            A JSON serializable description that can be passed to
+            :meth:`from_dict`.
+        """
+        plan = self.design_plan
+        cov = self.cov_params
+        return {'format': _FORMAT, 'version': _VERSION,
+                'model': self.model_name,
+                'params': self.params.tolist(),
+                'exog_names': self.exog_names,
+                'link': _link_to_dict(self.link),
+                'design_plan': None if plan is None else plan.to_dict(),
+                'cov_params': None if cov is None else cov.tolist(),
+                'df_resid': self.df_resid,
+                'use_t': self.use_t}
+
+    @classmethod
+    def from_dict(cls, spec):
+        """Create a Scorer from the output of :meth:`to_dict`"""
+        from statsmodels.formula.designplan import DesignPlan
+        if spec.get('format') != _FORMAT:
+            raise ValueError('not a statsmodels scorer')
+        if spec.get('version', 0) > _VERSION:
+            raise ValueError('scorer format version %s is newer than the '
+                             'supported version %s'
+                             % (spec['version'], _VERSION))
+        plan = spec.get('design_plan')
+        if plan is not None:
+            plan = DesignPlan.from_dict(plan)
+        return cls(spec['params'], link=_link_from_dict(spec['link']),
+                   exog_names=spec['exog_names'], design_plan=plan,
+                   cov_params=spec.get('cov_params'),
+                   df_resid=spec.get('df_resid'),
+                   use_t=spec.get('use_t', False),
+                   model_name=spec.get('model'))
+
+    def save(self, fname):
+        """
+        Save the scorer as JSON
+
+        Parameters
+        ----------
+        fname : str or file handle
+            File name or open text file. Names ending in '.gz' are
+            compressed.
+        """
+        with get_file_obj(fname, 'wt') as fout:
+            fout.write(json.dumps(self.to_dict()))
+
+
+def load_scorer(fname):
+    """
+    Load a scorer saved with `Scorer.save`
+
+    Parameters
+    ----------
+    fname : str or file handle
+        File name or open text file.
+
+    Returns
+    -------
+    Scorer
+    """
+    with get_file_obj(fname, 'rt') as fin:
+        return Scorer.from_dict(json.loads(fin.read()))
@@ -0,0 +1,118 @@
+from statsmodels.compat.python import StringIO
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+import pandas as pd
+import pytest
+
+from statsmodels.formula.designplan import DesignPlan
+import statsmodels.formula.api as smf
+from statsmodels.genmod.families import Binomial, Gamma, Poisson, links
+from statsmodels.iolib.scorer import Scorer, load_scorer
+from statsmodels.regression.linear_model import OLS
+
+
+@pytest.fixture(scope='module')
+def data():
+    rs = np.random.RandomState(1234)
+    nobs = 200
+    df = pd.DataFrame({'x': rs.standard_normal(nobs),
+                       'z': rs.uniform(1, 2, nobs),
+                       'g': rs.choice(['a', 'b', 'c'], nobs),
+                       'h': rs.choice([1, 2], nobs)})
+    latent = df.x + (df.g == 'b') + rs.standard_normal(nobs)
+    df['y'] = (latent > 0.5).astype(float)
+    df['count'] = rs.poisson(np.exp(0.3 * df.x))
+    df['pos'] = np.exp(0.2 * df.x + rs.standard_normal(nobs) * 0.1)
+    return df
+
+
+def roundtrip(scorer):
+    fh = StringIO()
+    scorer.save(fh)
+    fh.seek(0)
+    return load_scorer(fh)
+
+
+FORMULA = ('y ~ x + np.log(z) + C(g, Treatment("c")) + x:C(h) + center(z) '
+           '+ standardize(x, rescale=False) + I(x**2)')
+
+
+@pytest.mark.parametrize('fit', [
+    lambda df: smf.logit(FORMULA, df).fit(disp=0),
+    lambda df: smf.probit('y ~ x + g', df).fit(disp=0),
+    lambda df: smf.ols('x ~ g * z', df).fit(),
+    lambda df: smf.glm('count ~ x + g', df, family=Poisson()).fit(),
+    lambda df: smf.glm('y ~ x + g', df,
+                       family=Binomial(links.cloglog())).fit(),
+    lambda df: smf.glm('pos ~ x', df, family=Gamma(links.log())).fit(),
+    lambda df: smf.negativebinomial('count ~ x + g', df).fit(disp=0),
+    ])
+def test_predict_formula(data, fit):
+    res = fit(data)
+    scorer = roundtrip(res.to_scorer(include_cov=True))
+    new = data.iloc[:40]
+    assert_allclose(scorer.predict(new), res.predict(new), rtol=1e-10)
+    # a single observation given as a dict of scalars
+    row = dict(data.iloc[5].items())
+    assert_allclose(scorer.predict(row), res.predict(data.iloc[5:6]),
+                    rtol=1e-10)
+    if hasattr(res, 'get_prediction'):
+        pred = res.get_prediction(new)
+        assert_allclose(scorer.conf_int(new), pred.conf_int(), rtol=1e-8)
+
+
+def test_predict_array():
+    rs = np.random.RandomState(0)
+    exog = np.column_stack((np.ones(50), rs.standard_normal((50, 2))))
+    endog = exog.sum(1) + rs.standard_normal(50)
+    res = OLS(endog, exog).fit()
+    scorer = roundtrip(res.to_scorer(include_cov=True))
+    assert scorer.design_plan is None
+    assert_allclose(scorer.predict(exog), res.fittedvalues)
+    assert_allclose(scorer.predict(exog[3]), res.fittedvalues[3:4])
+    pred = res.get_prediction(exog)
+    assert_allclose(scorer.se_linear(exog), pred.se_mean)
+    assert_allclose(scorer.conf_int(exog), pred.conf_int(), rtol=1e-10)
+
+
+def test_offset_exposure(data):
+    res = smf.glm('count ~ x', data, family=Poisson()).fit()
+    scorer = roundtrip(res.to_scorer())
+    exposure = np.linspace(1, 2, data.shape[0])
+    assert_allclose(scorer.predict(data, exposure=exposure),
+                    res.predict(data, exposure=exposure), rtol=1e-10)
+    assert_allclose(scorer.predict(data, offset=exposure),
+                    res.predict(data, offset=exposure), rtol=1e-10)
+    with pytest.raises(ValueError):
+        scorer.conf_int(data)
+
+
+def test_unknown_level(data):
+    res = smf.ols('x ~ g', data).fit()
+    scorer = res.to_scorer()
+    with pytest.raises(ValueError):
+        scorer.predict({'g': ['a', 'd']})
+
+
+def test_plan_rejects_unsafe_code(data):
+    plan = DesignPlan.from_design_info(
+        smf.ols('x ~ z', data).fit().model.data.design_info)
+    spec = plan.to_dict()
+    spec['factors'][0]['code'] = "__import__('os').getcwd()"
+    with pytest.raises(NotImplementedError):
+        DesignPlan.from_dict(spec)
+
+
+def test_bad_format():
+    with pytest.raises(ValueError):
+        Scorer.from_dict({'format': 'something else'})
+    spec = Scorer([1.]).to_dict()
+    spec['version'] += 1
+    with pytest.raises(ValueError):
+        Scorer.from_dict(spec)
+    spec = Scorer([1.], link=links.Power(2.5)).to_dict()
+    assert_equal(spec['link'], {'name': 'Power', 'kwds': {'power': 2.5}})
+    spec['link']['name'] = 'Scorer'
+    with pytest.raises(ValueError):
+        Scorer.from_dict(spec)
@@ -1,6 +1,6 @@
 
 
-from .pca import PCA
+from .pca import PCA, IncrementalPCA
 from .manova import MANOVA
 from .factor import Factor, FactorResults
 from .cancorr import CanCorr
@@ -16,6 +16,53 @@ def _norm(x):
     return np.sqrt(np.sum(x * x))
 
 
+def _randomized_svd(x, ncomp, oversample=10, n_iter=4, random_state=None,
+                    start=None):
+    """
+    Leading singular values and right singular vectors of x
+
+    Randomized range finder with power iterations followed by the SVD of the
+    projection of x onto the range, Halko, Martinsson and Tropp (2011).
+
+    Parameters
+    ----------
+    x : ndarray
+        nobs by nvar array
+    ncomp : int
+        number of singular values that are required
+    oversample : int
+        number of additional random directions
+    n_iter : int
+        number of power iterations
+    random_state : RandomState, optional
+        random number generator for the random directions
+    start : ndarray, optional
+        nvar by l array used instead of random directions, for example the
+        right singular vectors of a previous call.
+
+    Returns
+    -------
+    s : ndarray
+        the l = min(ncomp + oversample, nobs, nvar) largest singular values
+        in decreasing order. The leading ncomp are accurate.
+    v : ndarray
+        nvar by l array of the corresponding right singular vectors
+    """
+    nobs, nvar = x.shape
+    if start is None:
+        if random_state is None:
+            random_state = np.random.RandomState()
+        size = min(ncomp + oversample, nobs, nvar)
+        start = random_state.standard_normal((nvar, size))
+    q, _ = np.linalg.qr(x.dot(start))
+    for _ in range(n_iter):
+        # orthonormalize in each step to avoid loss of precision
+        z, _ = np.linalg.qr(x.T.dot(q))
+        q, _ = np.linalg.qr(x.dot(z))
+    _, s, vt = np.linalg.svd(q.T.dot(x), full_matrices=False)
+    return s, vt.T
+
+
 class PCA(object):
     """
     Principal Component Analysis
@@ -56,6 +103,10 @@ class PCA(object):
         'nipals' uses the NIPALS algorithm and can be faster than SVD when
         ncomp is small and nvars is large. See notes about additional changes
         when using NIPALS
+        'randomized' uses a randomized SVD that only computes the leading
+        ncomp components and is much faster than SVD when ncomp is small
+        relative to the number of observations and variables. The EM
+        algorithm for missing values then uses the same truncated solver.
     tol : float, optional
         Tolerance to use when checking for convergence when using NIPALS
     max_iter : int, optional
@@ -71,6 +122,14 @@ class PCA(object):
         Tolerance to use when checking for convergence of the EM algorithm
     max_em_iter : int
         Maximum iterations for the EM algorithm
+    oversample : int, optional
+        Number of random directions in addition to ncomp when using the
+        randomized SVD
+    power_iter : int, optional
+        Number of power iterations of the randomized SVD. More iterations
+        improve the accuracy when the singular values decay slowly.
+    seed : {None, int, RandomState}, optional
+        Seed for the random directions of the randomized SVD
 
     Attributes
     ----------
@@ -133,6 +192,10 @@ class PCA(object):
     >>> pc.factors.shape
     (100, 1)
 
+    The leading components of large data sets using a randomized SVD
+
+    >>> pc = PCA(x, ncomp=2, method='randomized', seed=0)
+
     Notes
     -----
     The default options perform principal component analysis on the
@@ -184,7 +247,7 @@ class PCA(object):
     def __init__(self, data, ncomp=None, standardize=True, demean=True,
                  normalize=True, gls=False, weights=None, method='svd',
                  missing=None, tol=5e-8, max_iter=1000, tol_em=5e-8,
-                 max_em_iter=100, ):
+                 max_em_iter=100, oversample=10, power_iter=4, seed=None):
         self._index = None
         self._columns = []
         if isinstance(data, pd.DataFrame):
@@ -201,6 +264,15 @@ class PCA(object):
         self._max_iter = max_iter
         self._max_em_iter = max_em_iter
         self._tol_em = tol_em
+        self._oversample = oversample
+        self._power_iter = power_iter
+        if isinstance(seed, np.random.RandomState):
+            self._random_state = seed
+        else:
+            self._random_state = np.random.RandomState(seed)
+        # basis of the last randomized SVD, used as start in the EM loop
+        self._randomized_basis = None
+        self._randomized_start = None
 
         # Prepare data
         self._standardize = standardize
@@ -230,7 +302,7 @@ class PCA(object):
 
         self._method = method
         # Workaround to avoid instance methods in __dict__
-        if self._method not in ('eig', 'svd', 'nipals'):
+        if self._method not in ('eig', 'svd', 'nipals', 'randomized'):
             raise ValueError('method {0} is not known.'.format(method))
 
         self.rows = np.arange(self._nobs)
@@ -414,16 +486,32 @@ class PCA(object):
             return self._compute_using_eig()
         elif self._method == 'svd':
             return self._compute_using_svd()
+        elif self._method == 'randomized':
+            return self._compute_using_randomized()
         else:  # self._method == 'nipals'
             return self._compute_using_nipals()
 
     def _compute_using_svd(self):
         """SVD method to compute eigenvalues and eigenvecs"""
         x = self.transformed_data
-        u, s, v = np.linalg.svd(x)
+        u, s, v = np.linalg.svd(x, full_matrices=False)
         self.eigenvals = s ** 2.0
         self.eigenvecs = v.T
 
+    def _compute_using_randomized(self):
+        """
+        Randomized SVD to compute the leading eigenvalues and eigenvectors
+        """
+        x = self.transformed_data
+        start = self._randomized_start
+        # a start from the previous EM iteration needs a single power step
+        n_iter = self._power_iter if start is None else 1
+        s, v = _randomized_svd(x, self._ncomp, self._oversample, n_iter,
+                               self._random_state, start=start)
+        self._randomized_basis = v
+        self.eigenvals = s[:self._ncomp] ** 2.0
+        self.eigenvecs = v[:, :self._ncomp]
+
     def _compute_using_eig(self):
         """
         Eigenvalue decomposition method to compute eigenvalues and eigenvectors
@@ -503,6 +591,9 @@ class PCA(object):
             self.transformed_data = data
             # Call correct eig function here
             self._compute_eig()
+            if self._method == 'randomized':
+                # warm start of the truncated solver in the next iteration
+                self._randomized_start = self._randomized_basis
             # Call function to compute factors and projection
             self._compute_pca_from_eig()
             projection = np.asarray(self.project(transform=False, unweight=False))
@@ -511,6 +602,7 @@ class PCA(object):
             delta = last_projection_masked - projection_masked
             diff = _norm(delta) / _norm(projection_masked)
             _iter += 1
+        self._randomized_start = None
         # Must copy to avoid overwriting original data since replacing values
         data = self._adjusted_data + 0.0
         projection = np.asarray(self.project())
@@ -807,7 +899,8 @@ def pca(data, ncomp=None, standardize=True, demean=True, normalize=True,
     method : str, optional
         Determines the linear algebra routine uses.  'eig', the default,
         uses an eigenvalue decomposition. 'svd' uses a singular value
-        decomposition.
+        decomposition. 'randomized' uses a randomized singular value
+        decomposition of the leading components.
 
     Returns
     -------
@@ -842,3 +935,175 @@ def pca(data, ncomp=None, standardize=True, demean=True, normalize=True,
 
     return (pc.factors, pc.loadings, pc.projection, pc.rsquare, pc.ic,
             pc.eigenvals, pc.eigenvecs)
+
+
+class IncrementalPCA(object):
+    """
+    Principal Component Analysis from blocks of observations
+
+    The leading principal components of the demeaned data are updated with
+    each block of rows, so that the full data never needs to be in memory.
+
+    Parameters
+    ----------
+    ncomp : int
+        Number of components to return.
+    demean : bool, optional
+        Flag indicating whether to demean data before computing principal
+        components. The mean is updated with each block.
+    normalize : bool , optional
+        Indicates whether to normalize the factors to have unit inner
+        product.  If False, the loadings will have unit inner product.
+    oversample : int, optional
+        Number of additional components that are kept between updates.
+        Additional components improve the accuracy of the leading components
+        when the eigenvalues decay slowly.
+
+    Attributes
+    ----------
+    nobs : int
+        Number of observations in all blocks
+    mean : array
+        nvar array of the means of the variables
+    eigenvals : array
+        ncomp array of eigenvalues
+    loadings : array
+        nvar by ncomp array of principal component loadings, the
+        eigenvectors
+    coeff : array
+        ncomp by nvar array of principal component loadings for constructing
+        the projections
+
+    Notes
+    -----
+    The update uses the incremental SVD of Ross et al. (2008). The SVD of
+    the block of demeaned data is combined with the current components and
+    a correction for the change of the mean. If ncomp plus oversample is at
+    least the rank of the data, then the results are the same as from PCA
+    with ``standardize=False``, up to the signs of the components.
+    Otherwise, the components are an approximation that is accurate if the
+    discarded eigenvalues are small compared to the leading ones.
+
+    The factors are computed by `project_factors` for any block of data.
+
+    References
+    ----------
+    .. [*] D. Ross, J. Lim, R.-S. Lin and M.-H. Yang, "Incremental learning
+       for robust visual tracking," International Journal of Computer
+       Vision, vol. 77, pp. 125-141, 2008
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from statsmodels.multivariate.pca import IncrementalPCA
+    >>> x = np.random.randn(10000, 2).dot(np.random.randn(2, 50))
+    >>> x += np.random.randn(10000, 50)
+    >>> ipc = IncrementalPCA(ncomp=2)
+    >>> for block in np.array_split(x, 10):
+    ...     ipc.update(block)
+    >>> factors = ipc.project_factors(x)
+    """
+
+    def __init__(self, ncomp, demean=True, normalize=True, oversample=10):
+        self._ncomp = ncomp
+        self._demean = demean
+        self._normalize = normalize
+        self._oversample = oversample
+        self.nobs = 0
+        self.mean = None
+        self._sing_vals = None
+        self._vecs = None
+
+    def update(self, data):
+        """
+        Update the components with a block of observations
+
+        Parameters
+        ----------
+        data : array-like
+            nobs_block by nvar array, variables in columns and observations
+            in rows
+
+        Returns
+        -------
+        self : IncrementalPCA
+        """
+        x = np.asarray(data, dtype=float)
+        if x.ndim != 2:
+            raise ValueError('data must be two-dimensional')
+        nobs_block, nvar = x.shape
+        if self.mean is not None and nvar != self.mean.shape[0]:
+            raise ValueError('data must have {0} columns'.format(
+                self.mean.shape[0]))
+        if nobs_block == 0:
+            return self
+
+        if self._demean:
+            mean_block = x.mean(0)
+        else:
+            mean_block = np.zeros(nvar)
+        x = x - mean_block
+        if self.nobs > 0:
+            nobs = self.nobs + nobs_block
+            # current components, the new block and the mean correction
+            mean_shift = np.sqrt(self.nobs * nobs_block / nobs) * (self.mean -
+                                                                   mean_block)
+            x = np.vstack((self._sing_vals[:, None] * self._vecs.T, x,
+                           mean_shift[None, :]))
+            self.mean = self.mean + nobs_block / nobs * (mean_block -
+                                                          self.mean)
+        else:
+            nobs = nobs_block
+            self.mean = mean_block
+        _, s, vt = np.linalg.svd(x, full_matrices=False)
+        nkeep = min(self._ncomp + self._oversample, s.shape[0])
+        self._sing_vals = s[:nkeep]
+        self._vecs = vt[:nkeep].T
+        self.nobs = nobs
+        return self
+
+    @property
+    def eigenvals(self):
+        if self._sing_vals is None:
+            return None
+        return self._sing_vals[:self._ncomp] ** 2.0
+
+    @property
+    def loadings(self):
+        if self._vecs is None:
+            return None
+        return self._vecs[:, :self._ncomp]
+
+    @property
+    def coeff(self):
+        if self._vecs is None:
+            return None
+        coeff = self.loadings.T
+        if self._normalize:
+            coeff = (coeff.T * np.sqrt(self.eigenvals)).T
+        return coeff
+
+    def project_factors(self, data):
+        """
+        Principal components (factors) of a block of observations
+
+        Parameters
+        ----------
+        data : array-like
+            nobs_block by nvar array, variables in columns and observations
+            in rows
+
+        Returns
+        -------
+        factors : array
+            nobs_block by ncomp array of principal components. If all data
+            are used in this call, then they are the same as the factors of
+            PCA up to signs.
+        """
+        if self._vecs is None:
+            raise ValueError('update has to be called before project_factors')
+        x = np.asarray(data, dtype=float) - self.mean
+        factors = x.dot(self.loadings)
+        if self._normalize:
+            factors /= np.sqrt(self.eigenvals)
+        return factors
@@ -9,7 +9,7 @@ import pandas as pd
 import pytest
 from numpy.testing import assert_allclose, assert_equal, assert_raises
 
-from statsmodels.multivariate.pca import PCA
+from statsmodels.multivariate.pca import PCA, IncrementalPCA
 from statsmodels.multivariate.tests.results.datamlw import data, princomp1, princomp2
 
 DECIMAL_5 = .00001
@@ -403,3 +403,68 @@ class TestPCA(object):
         pc_df = PCA(x_df, missing='drop-min')
         assert_allclose(pc.coeff, pc_df.coeff)
         assert_allclose(pc.factors, pc_df.factors)
+
+    def test_randomized(self):
+        pc_svd = PCA(self.x, ncomp=3)
+        pc = PCA(self.x, ncomp=3, method='randomized', seed=0)
+        assert_allclose(pc.eigenvals, pc_svd.eigenvals, rtol=1e-8)
+        assert_allclose(pc.projection, pc_svd.projection, atol=1e-4)
+        # more power iterations for a slowly decaying spectrum
+        pc = PCA(self.x, ncomp=3, method='randomized', power_iter=12, seed=0)
+        assert_allclose(pc.eigenvals, pc_svd.eigenvals, rtol=1e-12)
+        assert_allclose(np.abs(pc.factors), np.abs(pc_svd.factors),
+                        atol=1e-8)
+        assert_allclose(pc.projection, pc_svd.projection, atol=1e-8)
+        assert_allclose(pc.rsquare, pc_svd.rsquare, rtol=1e-12)
+        pc2 = PCA(self.x, ncomp=3, method='randomized', power_iter=12,
+                  seed=0)
+        assert_equal(pc2.factors, pc.factors)
+
+        pc_svd = PCA(self.x, ncomp=3, gls=True)
+        pc = PCA(self.x, ncomp=3, gls=True, method='randomized',
+                 power_iter=12, seed=0)
+        assert_allclose(pc.projection, pc_svd.projection, atol=1e-8)
+
+        # truncated solver with warm starts in the EM iterations
+        x = self.x.copy()
+        x[::5, ::7] = np.nan
+        pc_svd = PCA(x, ncomp=3, missing='fill-em', tol_em=1e-12)
+        pc = PCA(x, ncomp=3, missing='fill-em', tol_em=1e-12,
+                 method='randomized', power_iter=12, seed=0)
+        assert_allclose(pc._adjusted_data, pc_svd._adjusted_data, rtol=1e-7)
+        assert_allclose(pc.projection, pc_svd.projection, atol=1e-7)
+
+
+def test_incremental_pca():
+    rs = np.random.RandomState(1234)
+    x = rs.standard_normal((500, 3)).dot(rs.standard_gamma(2, (3, 30)))
+    x += rs.standard_normal((500, 30)) + 10
+
+    # all components are kept, same as PCA
+    pc = PCA(x, ncomp=3, standardize=False)
+    ipc = IncrementalPCA(ncomp=3, oversample=30)
+    for block in np.array_split(x, 7):
+        ipc.update(block)
+    assert_equal(ipc.nobs, 500)
+    assert_allclose(ipc.mean, x.mean(0), rtol=1e-12)
+    assert_allclose(ipc.eigenvals, pc.eigenvals, rtol=1e-10)
+    assert_allclose(np.abs(ipc.loadings), np.abs(pc.loadings), atol=1e-10)
+    assert_allclose(np.abs(ipc.coeff), np.abs(pc.coeff), atol=1e-8)
+    assert_allclose(np.abs(ipc.project_factors(x)), np.abs(pc.factors),
+                    atol=1e-10)
+
+    # truncated updates approximate the leading components
+    ipc = IncrementalPCA(ncomp=3, oversample=5)
+    for block in np.array_split(x, 7):
+        ipc.update(block)
+    assert_allclose(ipc.eigenvals, pc.eigenvals, rtol=1e-3)
+    assert_allclose(np.abs(ipc.loadings), np.abs(pc.loadings), atol=1e-2)
+
+    pc = PCA(x, ncomp=3, standardize=False, demean=False, normalize=False)
+    ipc = IncrementalPCA(ncomp=3, demean=False, normalize=False,
+                         oversample=30)
+    ipc.update(x[:250]).update(x[250:])
+    assert_allclose(np.abs(ipc.project_factors(x)), np.abs(pc.factors),
+                    rtol=1e-8)
+    assert_raises(ValueError, ipc.update, x[:, :5])
+    assert_raises(ValueError, IncrementalPCA(2).project_factors, x)
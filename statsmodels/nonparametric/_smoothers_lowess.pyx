@@ -5,6 +5,9 @@
 '''
 Univariate lowess function, like in R.
 
+The local regressions are computed in C functions that do not hold the GIL,
+so that many groups can be smoothed in one call and in several threads.
+
 References
 ----------
 Hastie, Tibshirani, Friedman. (2009) The Elements of Statistical Learning: Data
@@ -14,23 +17,20 @@ Cleveland, W.S. (1979) "Robust Locally Weighted Regression and Smoothing
 Scatterplots". Journal of the American Statistical Association 74 (368): 829-836.
 '''
 
-cimport numpy as np
 import numpy as np
-from cpython cimport bool
 cimport cython
+from libc.math cimport fabs, NAN
+from libc.stdlib cimport malloc, free, qsort
 
 # there's no fmax in math.h with windows SDK apparently
-cdef inline double fmax(double x, double y): return x if x >= y else y
+cdef inline double fmax(double x, double y) nogil: return x if x >= y else y
 
 DTYPE = np.double
-ctypedef np.double_t DTYPE_t
-
-def lowess(np.ndarray[DTYPE_t, ndim = 1] endog,
-           np.ndarray[DTYPE_t, ndim = 1] exog,
-           double frac = 2.0 / 3.0,
-           Py_ssize_t it = 3,
-           double delta = 0.0):
-    '''lowess(endog, exog, frac=2.0/3.0, it=3, delta=0.0)
+
+
+def lowess(endog, exog, double frac = 2.0 / 3.0, Py_ssize_t it = 3,
+           double delta = 0.0, xvals = None):
+    '''lowess(endog, exog, frac=2.0/3.0, it=3, delta=0.0, xvals=None)
     LOWESS (Locally Weighted Scatterplot Smoothing)
 
     A lowess function that outs smoothed estimates of endog
@@ -51,99 +51,173 @@ def lowess(np.ndarray[DTYPE_t, ndim = 1] endog,
     delta: float
         Distance within which to use linear-interpolation
         instead of weighted regression.
+    xvals: None or 1-D numpy array
+        Increasing x-values at which the smooth is evaluated. The local
+        regressions at xvals use the residual weights of the last iteration.
 
     Returns
     -------
     out: numpy array
-        A numpy array with two columns. The first column
+        If xvals is None, a numpy array with two columns. The first column
         is the sorted x values and the second column the
-        associated estimated y-values.
+        associated estimated y-values. Otherwise, the 1-D array of estimated
+        y-values at xvals.
 
     Notes
     -----
-    This lowess function implements the algorithm given in the
-    reference below using local linear estimates.
-
-    Suppose the input data has N points. The algorithm works by
-    estimating the `smooth` y_i by taking the frac*N closest points
-    to (x_i,y_i) based on their x values and estimating y_i
-    using a weighted linear regression. The weight for (x_j,y_j)
-    is tricube function applied to |x_i-x_j|.
-
-    If it > 1, then further weighted local linear regressions
-    are performed, where the weights are the same as above
-    times the _lowess_bisquare function of the residuals. Each iteration
-    takes approximately the same amount of time as the original fit,
-    so these iterations are expensive. They are most useful when
-    the noise has extremely heavy tails, such as Cauchy noise.
-    Noise with less heavy-tails, such as t-distributions with df>2,
-    are less problematic. The weights downgrade the influence of
-    points with large residuals. In the extreme case, points whose
-    residuals are larger than 6 times the median absolute residual
-    are given weight 0.
-
-    delta can be used to save computations. For each x_i, regressions
-    are skipped for points closer than delta. The next regression is
-    fit for the farthest point within delta of x_i and all points in
-    between are estimated by linearly interpolating between the two
-    regression fits.
-
-    Judicious choice of delta can cut computation time considerably
-    for large data (N > 5000). A good choice is delta = 0.01 *
-    range(exog).
-
-    Some experimentation is likely required to find a good
-    choice of frac and iter for a particular dataset.
+    See statsmodels.nonparametric.smoothers_lowess.lowess for a description
+    of the algorithm.
 
     References
     ----------
     Cleveland, W.S. (1979) "Robust Locally Weighted Regression
     and Smoothing Scatterplots". Journal of the American Statistical
     Association 74 (368): 829-836.
+    '''
+    cdef:
+        double[::1] x = np.ascontiguousarray(exog, dtype=DTYPE)
+        double[::1] y = np.ascontiguousarray(endog, dtype=DTYPE)
+        double[::1] y_fit = np.zeros(x.shape[0], dtype=DTYPE)
+        double[::1] x_eval, y_eval
+        Py_ssize_t n = x.shape[0], n_eval = 0
+        double *work
+
+    if xvals is None:
+        x_eval = np.zeros(1, dtype=DTYPE)
+    else:
+        x_eval = np.ascontiguousarray(xvals, dtype=DTYPE)
+        n_eval = x_eval.shape[0]
+    y_eval = np.zeros(max(n_eval, 1), dtype=DTYPE)
+
+    work = <double *>malloc(3 * max(n, 1) * sizeof(double))
+    if work == NULL:
+        raise MemoryError()
+    try:
+        with nogil:
+            _lowess(&x[0] if n > 0 else NULL, &y[0] if n > 0 else NULL, n,
+                    &x_eval[0], &y_eval[0], n_eval, frac, it, delta,
+                    &y_fit[0] if n > 0 else NULL, work)
+    finally:
+        free(work)
+
+    if xvals is None:
+        return np.array([np.asarray(x), np.asarray(y_fit)]).T
+    return np.asarray(y_eval)[:n_eval]
+
+
+def lowess_groups(endog, exog, Py_ssize_t[::1] offsets, double[::1] out,
+                  xvals = None, double frac = 2.0 / 3.0, Py_ssize_t it = 3,
+                  double delta = 0.0, Py_ssize_t start = 0, stop = None):
+    '''
+    lowess of many groups of observations
 
-    Examples
-    --------
-    The below allows a comparison between how different the fits from
-    lowess for different values of frac can be.
-
-    >>> import numpy as np
-    >>> import statsmodels.api as sm
-    >>> lowess = sm.nonparametric.lowess
-    >>> x = np.random.uniform(low = -2*np.pi, high = 2*np.pi, size=500)
-    >>> y = np.sin(x) + np.random.normal(size=len(x))
-    >>> z = lowess(y, x)
-    >>> w = lowess(y, x, frac=1./3)
-
-    This gives a similar comparison for when it is 0 vs not.
-
-    >>> import numpy as np
-    >>> import scipy.stats as stats
-    >>> import statsmodels.api as sm
-    >>> lowess = sm.nonparametric.lowess
-    >>> x = np.random.uniform(low = -2*np.pi, high = 2*np.pi, size=500)
-    >>> y = np.sin(x) + stats.cauchy.rvs(size=len(x))
-    >>> z = lowess(y, x, frac= 1./3, it=0)
-    >>> w = lowess(y, x, frac=1./3)
+    Parameters
+    ----------
+    endog: 1-D numpy array
+        The y-values of the observed points
+    exog: 1-D numpy array
+        The x-values of the observed points. The observations of a group are
+        contiguous and exog is increasing within groups.
+    offsets: 1-D array of intp
+        Group g consists of the observations ``offsets[g]:offsets[g+1]``.
+    out: 1-D numpy array
+        Array for the estimated y-values, changed in place. If xvals is None,
+        then out has the length of endog. Otherwise the estimates at xvals
+        of group g are written to ``out[g * len(xvals):(g + 1) * len(xvals)]``.
+    xvals: None or 1-D numpy array
+        Increasing x-values at which the smooth of each group is evaluated.
+    frac, it, delta: float, int, float
+        lowess options, see lowess. They apply to each group.
+    start, stop: int
+        Only the groups in range(start, stop) are smoothed. The GIL is
+        released while the groups are smoothed, so that ranges of groups can
+        be processed in separate threads.
 
+    Returns
+    -------
+    Nothing, the results are written to out.
     '''
     cdef:
-        Py_ssize_t n
-        int k
-        Py_ssize_t robiter, i, left_end, right_end
-        int last_fit_i,
-        np.ndarray[DTYPE_t, ndim = 1] x, y
-        np.ndarray[DTYPE_t, ndim = 1] y_fit
-        np.ndarray[DTYPE_t, ndim = 1] weights
-        np.ndarray[DTYPE_t, ndim = 1] resid_weights
+        double[::1] x = np.ascontiguousarray(exog, dtype=DTYPE)
+        double[::1] y = np.ascontiguousarray(endog, dtype=DTYPE)
+        double[::1] x_eval
+        Py_ssize_t n_eval = 0, n_max = 1, g, first, n, g_stop
+        double *work
+        double *y_fit
+        double *y_eval
+
+    if xvals is None:
+        x_eval = np.zeros(1, dtype=DTYPE)
+        if out.shape[0] != x.shape[0]:
+            raise ValueError('out needs to have the length of exog')
+    else:
+        x_eval = np.ascontiguousarray(xvals, dtype=DTYPE)
+        n_eval = x_eval.shape[0]
+        if out.shape[0] != (offsets.shape[0] - 1) * n_eval:
+            raise ValueError('out needs to have length ngroups * len(xvals)')
+    g_stop = offsets.shape[0] - 1 if stop is None else stop
+    if start < 0 or g_stop > offsets.shape[0] - 1:
+        raise ValueError('group range out of bounds')
+    for g in range(start, g_stop):
+        n_max = max(n_max, offsets[g + 1] - offsets[g])
+
+    # fitted values at the data are only returned without xvals
+    work = <double *>malloc((4 if n_eval > 0 else 3) * n_max * sizeof(double))
+    if work == NULL:
+        raise MemoryError()
+    try:
+        with nogil:
+            for g in range(start, g_stop):
+                first = offsets[g]
+                n = offsets[g + 1] - first
+                if n_eval > 0:
+                    y_fit = work + 3 * n_max
+                    y_eval = &out[g * n_eval]
+                elif n > 0:
+                    y_fit = &out[first]
+                    y_eval = NULL
+                if n == 0:
+                    if n_eval > 0:
+                        _fill(y_eval, n_eval, NAN)
+                    continue
+                _lowess(&x[first], &y[first], n, &x_eval[0], y_eval, n_eval,
+                        frac, it, delta, y_fit, work)
+    finally:
+        free(work)
+
+
+cdef void _fill(double *a, Py_ssize_t n, double value) nogil:
+    cdef Py_ssize_t i
+    for i in range(n):
+        a[i] = value
+
+
+cdef void _lowess(const double *x, const double *y, Py_ssize_t n,
+                  const double *x_eval, double *y_eval, Py_ssize_t n_eval,
+                  double frac, Py_ssize_t it, double delta,
+                  double *y_fit, double *work) nogil:
+    '''
+    lowess of one sorted sample.
 
-    y = endog   # now just alias
-    x = exog
+    The estimates at x are written to y_fit and, if n_eval > 0, the
+    estimates at the increasing x_eval to y_eval. work needs space for
+    3 * n doubles.
+    '''
+    cdef:
+        Py_ssize_t k, robiter, i, j, m, left_end, last_fit_i, next_k
+        Py_ssize_t n_nonzero
+        double radius, cutpoint, xi
+        double *weights = work
+        double *resid_weights = work + n
+        double *scratch = work + 2 * n
 
-    n = x.shape[0]
+    if n == 0:
+        _fill(y_eval, n_eval, NAN)
+        return
 
     # The number of neighbors in each regression.
     # round up if close to integer
-    k =  int(frac * n + 1e-10)
+    k = <Py_ssize_t>(frac * n + 1e-10)
 
     # frac should be set, so that 2 <= k <= n.
     # Conform them instead of throwing error.
@@ -152,464 +226,226 @@ def lowess(np.ndarray[DTYPE_t, ndim = 1] endog,
     if k > n:
         k = n
 
-    y_fit = np.zeros(n, dtype = DTYPE)
-    resid_weights = np.zeros(n, dtype = DTYPE)
-
-    it += 1 # Add one to it for initial run.
-    for robiter in xrange(it):
+    _fill(resid_weights, n, 1.0)
+    for robiter in range(it + 1):
+        _fill(y_fit, n, 0.0)
         i = 0
         last_fit_i = -1
         left_end = 0
-        right_end = k
-        y_fit = np.zeros(n, dtype = DTYPE)
 
         # 'do' Fit y[i]'s 'until' the end of the regression
         while True:
-            # Re-initialize the weights for each point x[i].
-            weights = np.zeros(n, dtype = DTYPE)
-
             # Describe the neighborhood around the current x[i].
-            left_end, right_end, radius = update_neighborhood(x, i, n,
-                                                              left_end,
-                                                              right_end)
+            xi = x[i]
+            left_end = _update_neighborhood(x, n, k, xi, left_end)
+            radius = fmax(xi - x[left_end], x[left_end + k - 1] - xi)
 
             # Calculate the weights for the regression in this neighborhood.
-            # Determine if at least some weights are positive, so a regression
-            # is ok.
-            reg_ok = calculate_weights(x, weights, resid_weights, i, left_end,
-                                       right_end, radius, robiter > 0)
-
-            # If ok, run the regression
-            calculate_y_fit(x, y, i, y_fit, weights, left_end, right_end,
-                            reg_ok)
+            # Run the regression if enough weights are positive, otherwise
+            # use the observed value.
+            if _calculate_weights(x, weights, resid_weights, xi, left_end,
+                                  left_end + k, radius, robiter > 0):
+                y_fit[i] = _calculate_y_fit(x, y, weights, xi, left_end,
+                                            left_end + k)
+            else:
+                y_fit[i] = y[i]
 
-            # If we skipped some points (because of how delta was set), go back
-            # and fit them by linear interpolation.
+            # If we skipped some points (because of how delta was set), go
+            # back and fit them by linear interpolation.
             if last_fit_i < (i - 1):
-                interpolate_skipped_fits(x, y_fit, i, last_fit_i)
-
-            # Update the last fit counter to indicate we've now fit this point.
-            # Find the next i for which we'll run a regression.
-            i, last_fit_i = update_indices(x, y_fit, delta, i, n, last_fit_i)
-
-            if last_fit_i >= n-1:
+                _interpolate_skipped_fits(x, y_fit, i, last_fit_i)
+
+            # Update the last fit counter to indicate we've now fit this
+            # point. For most points within delta of the current point, we
+            # skip the weighted linear regression, jump to the last point
+            # within delta and linearly interpolate in between. Repeated x's
+            # copy the already fitted y.
+            last_fit_i = i
+            next_k = last_fit_i
+            cutpoint = x[last_fit_i] + delta
+            for j in range(last_fit_i + 1, n):
+                next_k = j
+                if x[j] > cutpoint:
+                    break
+                if x[j] == x[last_fit_i]:
+                    y_fit[j] = y_fit[last_fit_i]
+                    last_fit_i = j
+
+            # The next point to fit is one prior to the first point outside
+            # of delta, and at least the next point.
+            i = next_k - 1 if next_k - 1 > last_fit_i + 1 else last_fit_i + 1
+
+            if last_fit_i >= n - 1:
                 break
 
         # Calculate residual weights, but don't bother on the last iteration.
-        if robiter < it - 1:
-            resid_weights = calculate_residual_weights(y, y_fit)
-
-    return np.array([x, y_fit]).T
-
-
-def update_neighborhood(np.ndarray[DTYPE_t, ndim = 1] x,
-                        Py_ssize_t i,
-                        Py_ssize_t n,
-                        Py_ssize_t left_end,
-                        Py_ssize_t right_end):
+        if robiter < it:
+            _calculate_residual_weights(y, y_fit, n, resid_weights, scratch)
+
+    # Evaluate at x_eval with the residual weights of the last iteration.
+    left_end = 0
+    for m in range(n_eval):
+        xi = x_eval[m]
+        if not (fabs(xi) <= 1.7976931348623157e308):
+            # nan or inf
+            y_eval[m] = NAN
+            continue
+        left_end = _update_neighborhood(x, n, k, xi, left_end)
+        radius = fmax(xi - x[left_end], x[left_end + k - 1] - xi)
+        if _calculate_weights(x, weights, resid_weights, xi, left_end,
+                              left_end + k, radius, it > 0):
+            y_eval[m] = _calculate_y_fit(x, y, weights, xi, left_end,
+                                         left_end + k)
+        else:
+            # a single point with positive weight is the local fit
+            n_nonzero = 0
+            for j in range(left_end, left_end + k):
+                if weights[j] != 0:
+                    n_nonzero += 1
+                    y_eval[m] = y[j]
+            if n_nonzero != 1:
+                y_eval[m] = NAN
+
+
+cdef inline Py_ssize_t _update_neighborhood(const double *x, Py_ssize_t n,
+                                            Py_ssize_t k, double xi,
+                                            Py_ssize_t left_end) nogil:
     '''
-    Find the indices bounding the k-nearest-neighbors of the current point.
+    Find the left end of the k-nearest-neighbors of xi.
 
-    Parameters
-    ----------
-    x: 1-D numpy array
-        The input x-values
-    i: indexing integer
-        The index of the point currently being fit.
-    n: indexing integer
-        The length of the input vectors, x and y.
-    left_end: indexing integer
-        The index of the left-most point in the neighborhood
-        of x[i-1] (the previously-fit point).
-    right_end: indexing integer
-        The index of the right-most point in the neighborhood
-        of x[i-1]. Non-inclusive, s.t. the neighborhood is
-        x[left_end] <= x < x[right_end].
-    radius: float
-        The radius of the current neighborhood. The larger of
-        distances between x[i] and its left-most or right-most
-        neighbor.
-
-    Returns
-    -------
-    left_end: indexing integer
-        The index of the left-most point in the neighborhood
-              of x[i] (the current point).
-    right_end: indexing integer
-        The index of the right-most point in the neighborhood
-               of x[i]. Non-inclusive, s.t. the neighborhood is
-               x[left_end] <= x < x[right_end].
-    radius: float
-        The radius of the current neighborhood. The larger of
-        distances between x[i] and its left-most or right-most
-        neighbor.
+    Start from the neighborhood of the previous point [left_end,
+    left_end + k), and shift it rightwards until xi is in the center (or
+    just to the left of the center) of the neighborhood. Once the right end
+    hits the end of the data, the neighborhood stays the same.
     '''
+    while left_end + k < n and xi > (x[left_end] + x[left_end + k]) / 2.0:
+        left_end += 1
+    return left_end
 
-    cdef double radius
-    # A subtle loop. Start from the current neighborhood range:
-    # [left_end, right_end). Shift both ends rightwards by one
-    # (so that the neighborhood still contains k points), until
-    # the current point is in the center (or just to the left of
-    # the center) of the neighborhood. This neighborhood will
-    # contain the k-nearest neighbors of x[i].
-    #
-    # Once the right end hits the end of the data, hold the
-    # neighborhood the same for the remaining x[i]s.
-    while True:
-        if right_end < n:
-
-            if (x[i] > (x[left_end] + x[right_end]) / 2.0):
-                left_end += 1
-                right_end += 1
-            else:
-                break
-        else:
-            break
-
-    radius = fmax(x[i] - x[left_end], x[right_end-1] - x[i])
-
-    return left_end, right_end, radius
 
-cdef bool calculate_weights(np.ndarray[DTYPE_t, ndim = 1] x,
-                            np.ndarray[DTYPE_t, ndim = 1] weights,
-                            np.ndarray[DTYPE_t, ndim = 1] resid_weights,
-                            Py_ssize_t i,
-                            Py_ssize_t left_end,
-                            Py_ssize_t right_end,
-                            double radius,
-                            bool use_resid_weights):
+cdef bint _calculate_weights(const double *x, double *weights,
+                             const double *resid_weights, double xi,
+                             Py_ssize_t left_end, Py_ssize_t right_end,
+                             double radius, bint use_resid_weights) nogil:
     '''
+    Tricube weights of the neighborhood [left_end, right_end) of xi,
+    multiplied by the residual weights if use_resid_weights.
 
-    Parameters
-    ----------
-    x: 1-D vector
-        The input x-values.
-    weights: 1-D numpy array
-        The vector of regression weights.
-    resid_weights: 1-D numpy array
-        The vector of residual weights from the last iteration.
-    i: indexing integer
-        The index of the point currently being fit.
-    left_end: indexing integer
-        The index of the left-most point in the neighborhood of
-        x[i].
-    right_end: indexing integer
-        The index of the right-most point in the neighborhood
-        of x[i]. Non-inclusive, s.t. the neighborhood is
-        x[left_end] <= x < x[right_end].
-    radius: float
-        The radius of the current neighborhood. The larger of
-        distances between x[i] and its left-most or right-most
-        neighbor.
-    use_resid_weights: boolean
-        If True, multiply the x-distance weights by the residual
-        weights from the last iteration of regressions. Set to
-        False on the first iteration (since there are no residuals
-        yet) and True on the subsequent ``robustifying`` iterations.
-
-
-    Returns
-    -------
-    reg_ok: boolean
-        If True, at least some points have positive weight, and the
-        regression will be run. If False, the regression is skipped
-        and y_fit[i] is set to equal y[i].
-    Also, changes elements of weights in-place.
+    The weights are normalized to sum to one. Returns False, and the
+    regression is skipped, if the sum of the weights is not positive or only
+    one weight is non-zero, which would give a divisor of zero in
+    _calculate_y_fit, see 1960.
     '''
-
     cdef:
-        np.ndarray[DTYPE_t, ndim = 1] x_j = x[left_end:right_end]
-        np.ndarray[DTYPE_t, ndim = 1] dist_i_j = np.abs(x_j - x[i]) / radius
-        bool reg_ok = True
-        double sum_weights
-
-    # Assign the distance measure to the weights, then apply the tricube
-    # function to change in-place.
-    # use_resid_weights will be False on the first iteration, then True
-    # on the subsequent ones, after some residuals have been calculated.
-    weights[left_end:right_end] = dist_i_j
-    if use_resid_weights == False:
-        tricube(weights[left_end:right_end])
-    if use_resid_weights == True:
-        tricube(weights[left_end:right_end])
-        weights[left_end:right_end] = (weights[left_end:right_end] *
-                                          resid_weights[left_end:right_end])
-
-    sum_weights = np.sum(weights[left_end:right_end])
-
-    if sum_weights <= 0.0 or (np.sum(weights[left_end:right_end] != 0) == 1):
-        # 2nd condition checks if only 1 local weight is non-zero, which
-        # will give a divisor of zero in calculate_y_fit
-        # see 1960
-        reg_ok = False
-    else:
-        weights[left_end:right_end] = weights[left_end:right_end] / sum_weights
-
-    return reg_ok
-
-
-cdef void calculate_y_fit(np.ndarray[DTYPE_t, ndim = 1] x,
-                          np.ndarray[DTYPE_t, ndim = 1] y,
-                          Py_ssize_t i,
-                          np.ndarray[DTYPE_t, ndim = 1] y_fit,
-                          np.ndarray[DTYPE_t, ndim = 1] weights,
-                          Py_ssize_t left_end,
-                          Py_ssize_t right_end,
-                          bool reg_ok):
+        Py_ssize_t j, n_nonzero = 0
+        double dist, w, sum_weights = 0.0
+
+    for j in range(left_end, right_end):
+        dist = fabs(x[j] - xi) / radius
+        w = 1.0 - dist * (dist * dist)
+        w = w * (w * w)
+        if use_resid_weights:
+            w = w * resid_weights[j]
+        weights[j] = w
+        sum_weights += w
+        if w != 0:
+            n_nonzero += 1
+
+    if sum_weights <= 0.0 or n_nonzero == 1:
+        return False
+    for j in range(left_end, right_end):
+        weights[j] = weights[j] / sum_weights
+    return True
+
+
+cdef double _calculate_y_fit(const double *x, const double *y,
+                             const double *weights, double xi,
+                             Py_ssize_t left_end, Py_ssize_t right_end) nogil:
     '''
-    Calculate smoothed/fitted y-value by weighted regression.
-
-    Parameters
-    ----------
-    x: 1-D numpy array
-        The vector of input x-values.
-    y: 1-D numpy array
-        The vector of input y-values.
-    i: indexing integer
-        The index of the point currently being fit.
-    y_fit: 1-D numpy array
-        The vector of fitted y-values.
-    weights: 1-D numpy array
-        The vector of regression weights.
-    left_end: indexing integer
-        The index of the left-most point in the neighborhood of
-        x[i].
-    right_end: indexing integers
-        The index of the right-most point in the neighborhood
-        of x[i]. Non-inclusive, s.t. the neighborhood is
-        x[left_end] <= x < x[right_end].
-    reg_ok: boolean
-        If True, at least some points have positive weight, and the
-        regression will be run. If False, the regression is skipped
-        and y_fit[i] is set to equal y[i].
+    Smoothed y-value at xi by weighted linear regression.
 
-    Returns
-    -------
-    Nothing. Changes y_fit[i] in-place.
-
-    Notes
-    -----
     No regression function (e.g. lstsq) is called. Instead "projection
-    vector" p_i_j is calculated, and y_fit[i] = sum(p_i_j * y[j]) = y_fit[i]
-    for j s.t. x[j] is in the neighborhood of x[i]. p_i_j is a function of
-    the weights, x[i], and its neighbors.
+    vector" p_i_j is calculated, and y_fit = sum(p_i_j * y[j]) for j in the
+    neighborhood of xi. p_i_j is a function of the weights, xi, and its
+    neighbors.
     '''
-
     cdef:
-       double sum_weighted_x = 0, weighted_sqdev_x = 0, p_i_j
-
-    if reg_ok == False:
-        y_fit[i] = y[i]
-    else:
-        for j in xrange(left_end, right_end):
-            sum_weighted_x += weights[j] * x[j]
-        for j in xrange(left_end, right_end):
-            weighted_sqdev_x += weights[j] * (x[j] - sum_weighted_x) ** 2
-        for j in xrange(left_end, right_end):
-            p_i_j = weights[j] * (1.0 + (x[i] - sum_weighted_x) *
-                             (x[j] - sum_weighted_x) / weighted_sqdev_x)
-            y_fit[i] += p_i_j * y[j]
-
-cdef void interpolate_skipped_fits(np.ndarray[DTYPE_t, ndim = 1] x,
-                                   np.ndarray[DTYPE_t, ndim = 1] y_fit,
-                                   Py_ssize_t i,
-                                   Py_ssize_t last_fit_i):
+        Py_ssize_t j
+        double sum_weighted_x = 0, weighted_sqdev_x = 0, p_i_j, y_fit = 0
+
+    for j in range(left_end, right_end):
+        sum_weighted_x += weights[j] * x[j]
+    for j in range(left_end, right_end):
+        weighted_sqdev_x += (weights[j] * (x[j] - sum_weighted_x) *
+                             (x[j] - sum_weighted_x))
+    for j in range(left_end, right_end):
+        p_i_j = weights[j] * (1.0 + (xi - sum_weighted_x) *
+                              (x[j] - sum_weighted_x) / weighted_sqdev_x)
+        y_fit += p_i_j * y[j]
+    return y_fit
+
+
+cdef void _interpolate_skipped_fits(const double *x, double *y_fit,
+                                    Py_ssize_t i,
+                                    Py_ssize_t last_fit_i) nogil:
     '''
-    Calculate smoothed/fitted y by linear interpolation between the current
-    and previous y fitted by weighted regression.
-    Called only if delta > 0.
-
-    Parameters
-    ----------
-    x: 1-D numpy array
-        The vector of input x-values.
-    y_fit: 1-D numpy array
-        The vector of fitted y-values
-    i: indexing integer
-        The index of the point currently being fit by weighted
-        regression.
-    last_fit_i: indexing integer
-        The index of the last point fit by weighted regression.
-
-    Returns
-    -------
-    Nothing: changes elements of y_fit in-place.
-    '''
-
-    cdef np.ndarray[DTYPE_t, ndim = 1] a
-
-    a = x[(last_fit_i + 1): i] - x[last_fit_i]
-    a =  a / (x[i] - x[last_fit_i])
-    y_fit[(last_fit_i + 1): i] = a * y_fit[i] + (1.0 - a) * y_fit[last_fit_i]
-
-
-def update_indices(np.ndarray[DTYPE_t, ndim = 1] x,
-                   np.ndarray[DTYPE_t, ndim = 1] y_fit,
-                   double delta,
-                   Py_ssize_t i,
-                   Py_ssize_t n,
-                   Py_ssize_t last_fit_i):
-    '''
-    Update the counters of the local regression.
-
-    Parameters
-    ----------
-    x: 1-D numpy array
-        The vector of input x-values.
-    y_fit: 1-D numpy array
-        The vector of fitted y-values
-    delta: float
-        Indicates the range of x values within which linear
-        interpolation should be used to estimate y_fit instead
-        of weighted regression.
-    i: indexing integer
-        The index of the current point being fit.
-    n: indexing integer
-        The length of the input vectors, x and y.
-    last_fit_i: indexing integer
-        The last point at which y_fit was calculated.
-
-    Returns
-    -------
-    i: indexing integer
-        The next point at which to run a weighted regression.
-    last_fit_i: indexing integer
-        The updated last point at which y_fit was calculated
-
-    Notes
-    -----
-    The relationship between the outputs is s.t. x[i+1] >
-    x[last_fit_i] + delta.
-
+    Fitted y by linear interpolation between the current and previous y
+    fitted by weighted regression. Called only if delta > 0.
     '''
     cdef:
-        Py_ssize_t k
-        double cutpoint
-
-    last_fit_i = i
-    k = last_fit_i
-    # For most points within delta of the current point, we skip the
-    # weighted linear regression (which save much computation of
-    # weights and fitted points). Instead, we'll jump to the last
-    # point within delta, fit the weighted regression at that point,
-    # and linearly interpolate in between.
-
-    # This loop increments until we fall just outside of delta distance,
-    # copying the results for any repeated x's along the way.
-    cutpoint = x[last_fit_i] + delta
-    for k in range(last_fit_i + 1, n):
-        if x[k] > cutpoint:
-            break
-        if x[k] == x[last_fit_i]:
-            # if tied with previous x-value, just use the already
-            # fitted y, and update the last-fit counter.
-            y_fit[k] = y_fit[last_fit_i]
-            last_fit_i = k
-
-    # i, which indicates the next point to fit the regression at, is
-    # either one prior to k (since k should be the first point outside
-    # of delta) or is just incremented + 1 if k = i+1. This insures we
-    # always step forward.
-    i = max(k-1, last_fit_i + 1)
-
-    return i, last_fit_i
-
-
-def calculate_residual_weights(np.ndarray[DTYPE_t, ndim = 1] y,
-                              np.ndarray[DTYPE_t, ndim = 1] y_fit):
-    '''
-    Calculate residual weights for the next `robustifying` iteration.
-
-    Parameters
-    ----------
-    y: 1-D numpy array
-        The vector of actual input y-values.
-    y_fit: 1-D numpy array
-        The vector of fitted y-values from the current
-        iteration.
-
-    Returns
-    -------
-    resid_weights: 1-D numpy array
-        The vector of residual weights, to be used in the
-        next iteration of regressions.
-    '''
-
-    std_resid = np.abs(y - y_fit)
-    median = np.median(std_resid)
-    if median == 0:
-        std_resid[std_resid > 0] = 1
-    else:
-        std_resid /= 6.0 * median
-
-    # Some trimming of outlier residuals.
-    std_resid[std_resid >= 1.0] = 1.0
-    #std_resid[std_resid >= 0.999] = 1.0
-    #std_resid[std_resid <= 0.001] = 0.0
+        Py_ssize_t j
+        double a
 
-    resid_weights = bisquare(std_resid)
+    for j in range(last_fit_i + 1, i):
+        a = (x[j] - x[last_fit_i]) / (x[i] - x[last_fit_i])
+        y_fit[j] = a * y_fit[i] + (1.0 - a) * y_fit[last_fit_i]
 
-    return resid_weights
 
+cdef int _compare_double(const void *a, const void *b) nogil:
+    cdef double da = (<const double *>a)[0], db = (<const double *>b)[0]
+    return (da > db) - (da < db)
 
-cdef void tricube(np.ndarray[DTYPE_t, ndim = 1] x):
-    '''
-    The tri-cubic function (1 - x**3)**3. Used to weight neighboring
-    points along the x-axis based on their distance to the current point.
-
-    Parameters
-    ----------
-    x: 1-D numpy array
-        A vector of neighbors` distances from the current point,
-        in units of the neighborhood radius.
-
-    Returns
-    -------
-    Nothing. Changes array elements in-place
-    '''
 
-    # fast_array_cube is an elementwise, in-place cubed-power
-    # operator.
-    fast_array_cube(x)
-    x[:] = np.negative(x)
-    x += 1
-    fast_array_cube(x)
-
-
-cdef void fast_array_cube(np.ndarray[DTYPE_t, ndim = 1] x):
+cdef void _calculate_residual_weights(const double *y, const double *y_fit,
+                                      Py_ssize_t n, double *resid_weights,
+                                      double *scratch) nogil:
     '''
-    A fast, elementwise, in-place cube operator. Called by the
-    tricube function.
-
-    Parameters
-    ----------
-    x: 1-D numpy array
+    Residual weights for the next `robustifying` iteration.
 
-    Returns
-    -------
-    Nothing. Changes array elements in-place.
-    '''
-
-    x2 = x*x
-    x *= x2
-
-
-def bisquare(np.ndarray[DTYPE_t, ndim = 1] x):
-    '''
-    The bi-square function (1 - x**2)**2.
-
-    Used to weight the residuals in the `robustifying`
-    iterations. Called by the calculate_residual_weights function.
-
-    Parameters
-    ----------
-    x: 1-D numpy array
-        A vector of absolute regression residuals, in units of
-        6 times the median absolute residual.
-
-    Returns
-    -------
-    A 1-D numpy array of residual weights.
+    The bi-square function (1 - r**2)**2 of the absolute residuals r in
+    units of 6 times the median absolute residual, residuals larger than
+    that get weight zero.
     '''
+    cdef:
+        Py_ssize_t i
+        double median, r
+
+    cdef bint has_nan = False
+
+    for i in range(n):
+        scratch[i] = fabs(y[i] - y_fit[i])
+        resid_weights[i] = scratch[i]
+        if scratch[i] != scratch[i]:
+            has_nan = True
+    if has_nan:
+        # nan propagates to all weights as with np.median
+        median = NAN
+    else:
+        qsort(scratch, n, sizeof(double), _compare_double)
+        if n % 2 == 1:
+            median = scratch[n // 2]
+        else:
+            median = (scratch[n // 2 - 1] + scratch[n // 2]) / 2.0
 
-    return (1.0 - x**2)**2
+    for i in range(n):
+        r = resid_weights[i]
+        if median == 0:
+            if r > 0:
+                r = 1.0
+        else:
+            r = r / (6.0 * median)
+        # Some trimming of outlier residuals.
+        if r >= 1.0:
+            r = 1.0
+        r = 1.0 - r * r
+        resid_weights[i] = r * r
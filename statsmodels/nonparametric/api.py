@@ -1,5 +1,5 @@
 from .kde import KDEUnivariate
-from .smoothers_lowess import lowess
+from .smoothers_lowess import lowess, lowess_grouped
 from . import bandwidths
 
 from .kernel_density import \
@@ -7,11 +7,14 @@ Author : Josef Perktold
 
 """
 
+import threading
+
 import numpy as np
 from ._smoothers_lowess import lowess as _lowess
+from ._smoothers_lowess import lowess_groups as _lowess_groups
 
-def lowess(endog, exog, frac=2.0/3.0, it=3, delta=0.0, is_sorted=False,
-           missing='drop', return_sorted=True):
+def lowess(endog, exog, frac=2.0/3.0, it=3, delta=0.0, xvals=None,
+           is_sorted=False, missing='drop', return_sorted=True):
     '''LOWESS (Locally Weighted Scatterplot Smoothing)
 
     A lowess function that outs smoothed estimates of endog
@@ -32,6 +35,10 @@ def lowess(endog, exog, frac=2.0/3.0, it=3, delta=0.0, is_sorted=False,
     delta: float
         Distance within which to use linear-interpolation
         instead of weighted regression.
+    xvals: 1-D numpy array
+        Values of the exogenous variable at which to evaluate the smooth,
+        in any order. If None (default), then the smooth is evaluated at
+        exog.
     is_sorted : bool
         If False (default), then the data will be sorted by exog before
         calculating lowess. If True, then it is assumed that the data is
@@ -49,6 +56,8 @@ def lowess(endog, exog, frac=2.0/3.0, it=3, delta=0.0, is_sorted=False,
     Returns
     -------
     out: ndarray, float
+        If xvals is given, then the one dimensional array of the smoothed
+        values at xvals, and return_sorted is ignored.
         The returned array is two-dimensional if return_sorted is True, and
         one dimensional if return_sorted is False.
         If return_sorted is True, then a numpy array with two columns. The
@@ -89,6 +98,14 @@ def lowess(endog, exog, frac=2.0/3.0, it=3, delta=0.0, is_sorted=False,
     Judicious choice of delta can cut computation time considerably
     for large data (N > 5000). A good choice is ``delta = 0.01 * range(exog)``.
 
+    If `xvals` is given, then the robustifying iterations are run on the
+    data and the local regressions at xvals use the residual weights of the
+    last iteration. With ``delta=0`` the smooth at ``xvals=exog`` is the same
+    as the smooth returned without xvals. If only one observation in the
+    neighborhood of a point of xvals has positive weight, then its endog
+    value is the estimate, if none has positive weight, then the estimate
+    is nan.
+
     Some experimentation is likely required to find a good
     choice of `frac` and `iter` for a particular dataset.
 
@@ -162,6 +179,16 @@ def lowess(endog, exog, frac=2.0/3.0, it=3, delta=0.0, is_sorted=False,
         x = np.array(x[sort_index])
         y = np.array(y[sort_index])
 
+    if xvals is not None:
+        xvals = np.asarray(xvals, float)
+        if xvals.ndim != 1:
+            raise ValueError('xvals must be a vector')
+        sort_xvals = np.argsort(xvals)
+        yfitted = np.empty(xvals.shape[0])
+        yfitted[sort_xvals] = _lowess(y, x, frac=frac, it=it, delta=delta,
+                                      xvals=xvals[sort_xvals])
+        return yfitted
+
     res = _lowess(y, x, frac=frac, it=it, delta=delta)
     _, yfitted = res.T
 
@@ -186,3 +213,144 @@ def lowess(endog, exog, frac=2.0/3.0, it=3, delta=0.0, is_sorted=False,
 
         # we don't need to return exog anymore
         return yfitted
+
+
+def lowess_grouped(endog, exog, groups, frac=2.0/3.0, it=3, delta=0.0,
+                   xvals=None, missing='drop', n_jobs=1):
+    """LOWESS smoothing of each group of observations
+
+    Each group is smoothed separately with the same options as in `lowess`.
+    All groups are sorted at once and smoothed in a single call to the
+    compiled code.
+
+    Parameters
+    ----------
+    endog: 1-D numpy array
+        The y-values of the observed points
+    exog: 1-D numpy array
+        The x-values of the observed points
+    groups: 1-D array_like
+        Group labels of the observations, any sortable values.
+    frac: float
+        Between 0 and 1. The fraction of the data of a group used
+        when estimating each y-value.
+    it: int
+        The number of residual-based reweightings
+        to perform.
+    delta: float
+        Distance within which to use linear-interpolation
+        instead of weighted regression.
+    xvals: 1-D numpy array
+        Values of the exogenous variable at which the smooth of every group
+        is evaluated. If None (default), then the smooth is evaluated at
+        the exog values of the groups.
+    missing : str
+        Available options are 'drop' and 'raise'. If 'drop', any
+        observations with nans are dropped. If 'raise', an error is raised.
+        Default is 'drop'.
+    n_jobs : int
+        Number of threads. The groups are split into `n_jobs` ranges with
+        about the same number of observations, the compiled code releases
+        the GIL.
+
+    Returns
+    -------
+    out: ndarray, float
+        If xvals is None, then the one dimensional array of smoothed
+        values in the same sequence of observations as the input arrays,
+        nan for missing observations.
+        Otherwise, the two dimensional array of shape
+        (number of groups, len(xvals)) with the smooth of group
+        ``np.unique(groups)[i]`` at xvals in row i. Rows of groups without
+        valid observations are nan.
+
+    See Also
+    --------
+    lowess
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from statsmodels.nonparametric.smoothers_lowess import lowess_grouped
+    >>> groups = np.repeat(np.arange(1000), 50)
+    >>> x = np.random.uniform(0, 10, size=len(groups))
+    >>> y = np.sin(x) + groups / 100 + np.random.normal(size=len(x))
+    >>> grid = np.linspace(0, 10, 21)
+    >>> fitted = lowess_grouped(y, x, groups, frac=0.5, xvals=grid)
+    """
+    endog = np.asarray(endog, float)
+    exog = np.asarray(exog, float)
+    groups = np.asarray(groups)
+    if exog.ndim != 1 or endog.ndim != 1 or groups.ndim != 1:
+        raise ValueError('endog, exog and groups must be vectors')
+    if not endog.shape[0] == exog.shape[0] == groups.shape[0]:
+        raise ValueError('endog, exog and groups must have same length')
+    if missing not in ['drop', 'raise']:
+        raise ValueError("missing can only be 'drop' or 'raise'")
+
+    labels, codes = np.unique(groups, return_inverse=True)
+    n_groups = labels.shape[0]
+    mask_valid = np.isfinite(exog) & np.isfinite(endog)
+    all_valid = np.all(mask_valid)
+    if not all_valid and missing == 'raise':
+        raise ValueError('nan or inf found in data')
+    idx = np.arange(exog.shape[0])
+    if not all_valid:
+        idx = idx[mask_valid]
+    # sort by group and by exog within groups
+    idx = idx[np.lexsort((exog[idx], codes[idx]))]
+    x = exog[idx]
+    y = endog[idx]
+    offsets = np.zeros(n_groups + 1, dtype=np.intp)
+    offsets[1:] = np.cumsum(np.bincount(codes[idx], minlength=n_groups))
+
+    if xvals is not None:
+        xvals = np.asarray(xvals, float)
+        if xvals.ndim != 1:
+            raise ValueError('xvals must be a vector')
+        sort_xvals = np.argsort(xvals)
+        out = np.empty(n_groups * xvals.shape[0])
+        xvals_sorted = xvals[sort_xvals]
+    else:
+        out = np.empty(x.shape[0])
+        xvals_sorted = None
+
+    def smooth(start, stop):
+        _lowess_groups(y, x, offsets, out, xvals=xvals_sorted, frac=frac,
+                       it=it, delta=delta, start=start, stop=stop)
+
+    n_jobs = max(1, min(int(n_jobs), n_groups))
+    if n_jobs == 1:
+        smooth(0, n_groups)
+    else:
+        # ranges of groups with about the same number of observations
+        bounds = np.searchsorted(offsets[1:],
+                                 np.linspace(0, x.shape[0], n_jobs + 1)[1:-1])
+        bounds = np.unique(np.r_[0, bounds, n_groups])
+        errors = []
+
+        def smooth_thread(start, stop):
+            # exceptions are not propagated by threads, re-raised below
+            try:
+                smooth(start, stop)
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=smooth_thread, args=(start, stop))
+                   for start, stop in zip(bounds[:-1], bounds[1:])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+
+    if xvals is not None:
+        fitted = np.empty((n_groups, xvals.shape[0]))
+        fitted[:, sort_xvals] = out.reshape(n_groups, -1)
+        return fitted
+
+    yfitted = np.empty(endog.shape[0])
+    yfitted.fill(np.nan)
+    yfitted[idx] = out
+    return yfitted
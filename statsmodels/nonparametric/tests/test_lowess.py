@@ -15,7 +15,7 @@ import numpy as np
 from numpy.testing import (assert_almost_equal, assert_, assert_raises,
                            assert_equal)
 
-from statsmodels.nonparametric.smoothers_lowess import lowess
+from statsmodels.nonparametric.smoothers_lowess import lowess, lowess_grouped
 
 # Number of decimals to test equality with.
 # The default is 7.
@@ -154,3 +154,81 @@ def test_returns_inputs():
     x = np.arange(20)
     result = lowess(y, x, frac=.4)
     assert_almost_equal(result, np.column_stack((x, y)))
+
+
+def test_xvals():
+    rfile = os.path.join(rpath, 'test_lowess_simple.csv')
+    test_data = np.genfromtxt(rfile, delimiter=',', names=True)
+    y, x = test_data['y'], test_data['x']
+
+    # the smooth at the data points is the same as without xvals
+    for it in [0, 3]:
+        res = lowess(y, x, it=it, return_sorted=False)
+        res_x = lowess(y, x, it=it, xvals=x)
+        assert_almost_equal(res_x, res, decimal=13)
+        res_x = lowess(y, x, it=it, xvals=x[::-1])
+        assert_almost_equal(res_x, res[::-1], decimal=13)
+
+    # between and beyond the data
+    xvals = np.array([x.max() + 1, (x[3] + x[4]) / 2, x.min() - 1, np.nan])
+    res_x = lowess(y, x, frac=0.5, xvals=xvals)
+    assert_(np.isnan(res_x[3]))
+    assert_(np.all(np.isfinite(res_x[:3])))
+    # exact for linear data
+    res_x = lowess(2 + 0.5 * x, x, frac=0.5, xvals=xvals[:3])
+    assert_almost_equal(res_x, 2 + 0.5 * xvals[:3], decimal=10)
+
+
+def test_grouped():
+    np.random.seed(987125)
+    n_groups = 30
+    nobs = np.random.randint(3, 60, size=n_groups)
+    groups = np.repeat(np.arange(n_groups), nobs)
+    x = np.random.uniform(0, 10, size=len(groups))
+    y = np.sin(x) + groups + np.random.standard_t(3, size=len(x))
+    y[[3, 40]] = np.nan
+    perm = np.random.permutation(len(x))
+    x, y, groups = x[perm], y[perm], groups[perm]
+    xvals = np.linspace(10, 0, 7)
+
+    res = lowess_grouped(y, x, groups, frac=0.5)
+    res2 = lowess_grouped(y, x, groups, frac=0.5, n_jobs=3)
+    res_x = lowess_grouped(y, x, groups, frac=0.5, xvals=xvals, delta=0.1)
+    res_x2 = lowess_grouped(y, x, groups, frac=0.5, xvals=xvals, delta=0.1,
+                            n_jobs=4)
+    assert_equal(res2, res)
+    assert_equal(res_x2, res_x)
+    assert_equal(res_x.shape, (n_groups, len(xvals)))
+    assert_equal(np.isnan(res), np.isnan(y))
+    for g in range(n_groups):
+        mask = groups == g
+        res_g = lowess(y[mask], x[mask], frac=0.5, return_sorted=False)
+        assert_almost_equal(res[mask], res_g, decimal=13)
+        res_g = lowess(y[mask], x[mask], frac=0.5, xvals=xvals, delta=0.1)
+        assert_almost_equal(res_x[g], res_g, decimal=13)
+
+    # string labels, rows in sorted order of the labels
+    labels = np.array(['b', 'a'])[groups % 2]
+    res_x = lowess_grouped(y, x, labels, xvals=xvals)
+    res_g = lowess(y[labels == 'a'], x[labels == 'a'], xvals=xvals)
+    assert_almost_equal(res_x[0], res_g, decimal=13)
+    assert_raises(ValueError, lowess_grouped, y, x, groups, missing='raise')
+
+
+def test_grouped_thread_error(monkeypatch):
+    # errors in the worker threads are raised in the caller
+    import statsmodels.nonparametric.smoothers_lowess as sl
+
+    def failing_groups(*args, **kwargs):
+        if kwargs['start'] > 0:
+            raise MemoryError()
+        return _lowess_groups(*args, **kwargs)
+
+    _lowess_groups = sl._lowess_groups
+    monkeypatch.setattr(sl, '_lowess_groups', failing_groups)
+    np.random.seed(987125)
+    groups = np.repeat(np.arange(4), 20)
+    x = np.random.uniform(0, 10, size=len(groups))
+    y = np.sin(x) + np.random.standard_normal(len(x))
+    lowess_grouped(y, x, groups, n_jobs=1)
+    assert_raises(MemoryError, lowess_grouped, y, x, groups, n_jobs=2)
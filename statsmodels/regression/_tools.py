@@ -100,3 +100,115 @@ class _MinimalWLS(object):
 
         return Bunch(params=params, fittedvalues=fitted_values, resid=resid,
                      model=self, scale=scale)
+
+
+class _ChunkedWLS(object):
+    """
+    Weighted least squares from normal equations accumulated in row blocks
+
+    Parameters
+    ----------
+    endog : ndarray
+        1d endogenous response variable.
+    exog : ndarray
+        nobs x k array of regressors. It is not copied, only blocks of
+        `chunksize` rows are weighted at a time.
+    weights : ndarray or float
+        1d array of weights or a scalar.
+    chunksize : int, optional
+        Number of rows in a block. The default uses blocks of about 2**20
+        elements.
+    dtype : dtype, optional
+        If given, for example ``np.float32``, the blocks are converted to
+        this dtype before forming the cross products. The sums over blocks
+        and the solution are always computed in float64.
+
+    Notes
+    -----
+    The parameters are computed by a Cholesky factorization of X'WX which
+    is kept for the computation of `normalized_cov_params`. If X'WX is not
+    numerically positive definite, the Moore-Penrose pseudoinverse of X'WX
+    is used instead which gives the same minimum norm solution as `pinv`
+    in _MinimalWLS.
+
+    Does not perform any checks on the input data.
+    """
+
+    def __init__(self, endog, exog, weights=1.0, chunksize=None, dtype=None):
+        k = exog.shape[1]
+        self.xtwx = np.zeros((k, k))
+        self.xtwz = np.zeros(k)
+        self._factor = None
+        self._pinv = None
+        self.update(endog, exog, weights, chunksize=chunksize, dtype=dtype)
+
+    def update(self, endog, exog, weights=1.0, chunksize=None, dtype=None):
+        """
+        Add the cross products of additional observations
+
+        Parameters
+        ----------
+        endog, exog, weights, chunksize, dtype
+            See the class docstring.
+        """
+        nobs, k = exog.shape
+        if chunksize is None:
+            chunksize = max(1, 2**20 // max(k, 1))
+        weights = np.broadcast_to(weights, (nobs,))
+        for start in range(0, nobs, chunksize):
+            sl = slice(start, start + chunksize)
+            x = exog[sl]
+            w = weights[sl]
+            z = endog[sl]
+            if dtype is not None:
+                x = x.astype(dtype)
+                w = w.astype(dtype)
+                z = z.astype(dtype)
+            wx = x * w[:, None]
+            self.xtwx += wx.T.dot(x)
+            self.xtwz += wx.T.dot(z)
+        self._factor = None
+        self._pinv = None
+
+    def fit(self):
+        """
+        Solve the normal equations
+
+        Returns
+        -------
+        results : Bunch
+            Bunch with the estimated `params`, the `method` that was used,
+            either "cholesky" or "pinv", and the `model`.
+        """
+        from scipy import linalg
+        xtwx = self.xtwx
+        k = xtwx.shape[0]
+        method = 'cholesky'
+        try:
+            factor = linalg.cho_factor(xtwx, lower=False, check_finite=False)
+            d = np.abs(np.diag(factor[0]))
+            # squared diagonal ratio of the factor is a cheap estimate of
+            # the reciprocal condition number of X'WX
+            if d.min() ** 2 <= k * np.finfo(float).eps * d.max() ** 2:
+                raise linalg.LinAlgError('X\'WX is near singular')
+        except linalg.LinAlgError:
+            method = 'pinv'
+        if method == 'cholesky':
+            self._factor = factor
+            params = linalg.cho_solve(factor, self.xtwz, check_finite=False)
+        else:
+            self._pinv = np.linalg.pinv(xtwx)
+            params = self._pinv.dot(self.xtwz)
+        return Bunch(params=params, method=method, model=self)
+
+    @property
+    def normalized_cov_params(self):
+        """Inverse of X'WX using the factorization from `fit`"""
+        if self._factor is not None:
+            from scipy import linalg
+            k = self.xtwx.shape[0]
+            return linalg.cho_solve(self._factor, np.eye(k),
+                                    check_finite=False)
+        if self._pinv is None:
+            self._pinv = np.linalg.pinv(self.xtwx)
+        return self._pinv
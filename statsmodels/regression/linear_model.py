@@ -990,6 +990,10 @@ class OLS(WLS):
             score_kwds = {"scale": 1}
             hess_kwds = {"scale": 1}
 
+        # The residual sum of squares is quadratic, the profile
+        # likelihood is not.
+        quadratic = None if profile_scale else self._elastic_net_quadratic
+
         return fit_elasticnet(self, method=method,
                               alpha=alpha,
                               L1_wt=L1_wt,
@@ -999,10 +1003,71 @@ class OLS(WLS):
                               hess_kwds=hess_kwds,
                               refit=refit,
                               check_step=False,
+                              quadratic=quadratic,
                               **defaults)
 
     fit_regularized.__doc__ = _fit_regularized_doc
 
+    def _elastic_net_quadratic(self, params):
+        """
+        RSS / (2 * nobs) as a quadratic function for elastic net fitting.
+        """
+        if not hasattr(self, "_wexog_xprod"):
+            self._setup_score_hess()
+        return (self._wexog_xprod / self.nobs,
+                self._wexog_x_wendog / self.nobs, True)
+
+    def fit_regularized_path(self, alphas, L1_wt=1., start_params=None,
+                             profile_scale=False, **kwargs):
+        """
+        Elastic net fits along a sequence of penalty weights.
+
+        Parameters
+        ----------
+        alphas : array-like
+            Scalar penalty weights. Each fit is warm-started at the
+            solution for the previous weight, a decreasing sequence is
+            most efficient.
+        L1_wt : scalar
+            The fraction of the penalty given to the L1 penalty term.
+        start_params : array-like
+            Starting values for the first fit.
+        profile_scale : bool
+            If True the fits use the profile log-likelihood, see
+            `fit_regularized`.
+        **kwargs
+            `maxiter`, `cnvrg_tol` and `zero_tol` as in `fit_regularized`.
+
+        Returns
+        -------
+        Bunch
+            `alphas`, `params`, an array with the coefficients for each
+            penalty weight in the rows, and `n_iter`.
+
+        See Also
+        --------
+        fit_regularized
+        statsmodels.base.elastic_net.fit_elasticnet_path
+
+        Notes
+        -----
+        If `profile_scale` is False, the residual sum of squares is
+        minimized by coordinate descent using the precomputed Gram matrix
+        and the sequential strong rule to discard variables.
+        """
+        from statsmodels.base.elastic_net import fit_elasticnet_path
+
+        defaults = {"maxiter": 50, "cnvrg_tol": 1e-10, "zero_tol": 1e-10}
+        defaults.update(kwargs)
+        if profile_scale:
+            return fit_elasticnet_path(self, alphas, L1_wt=L1_wt,
+                                       start_params=start_params,
+                                       check_step=False, **defaults)
+        return fit_elasticnet_path(self, alphas, L1_wt=L1_wt,
+                                   start_params=start_params,
+                                   quadratic=self._elastic_net_quadratic,
+                                   loglike_kwds={"scale": 1}, **defaults)
+
     def _fit_ridge(self, alpha):
         """
         Fit a linear model using ridge regression.
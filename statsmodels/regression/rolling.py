@@ -0,0 +1,590 @@
+"""
+Rolling and expanding window least squares
+
+The moment matrices X'WX, X'Wy and y'Wy of every window are obtained as
+differences of running sums of the centered data, so that each window
+costs O(k**2) to update instead of a full refit, and all windows are then
+solved in one batched Cholesky decomposition.
+
+License: BSD-3
+"""
+from __future__ import division
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from statsmodels.tools.data import _is_using_pandas
+from statsmodels.tools.decorators import cache_readonly
+from statsmodels.tools.parallel import parallel_func
+from statsmodels.tools.sm_exceptions import MissingDataError
+
+__all__ = ['RollingWLS', 'RollingOLS', 'RollingRegressionResults']
+
+
+def _shift_chunk(x, y, w, const_idx):
+    """
+    Shift the regressors and the response by their weighted means
+
+    With a constant in column `const_idx`, subtracting multiples of the
+    constant column is a reparametrization of the intercept. The moments
+    of the shifted data are much smaller for regressors with a large mean,
+    which avoids the cancellation in the running sums and in the normal
+    equations. Returns the shifted data and the shifts ``a``, ``b`` with
+    ``x = xs + x[:, const_idx] a'`` and ``y = ys + x[:, const_idx] b``.
+    """
+    k = x.shape[1]
+    if const_idx is None:
+        return x, y, np.zeros(k), 0.
+    s = np.sqrt(w)
+    denom = np.dot(s, x[:, const_idx])
+    if denom == 0:
+        return x, y, np.zeros(k), 0.
+    a = np.dot(s, x) / denom
+    a[const_idx] = 0
+    b = np.dot(s, y) / denom
+    xs = x - x[:, const_idx:const_idx + 1] * a
+    ys = y - x[:, const_idx] * b
+    return xs, ys, a, b
+
+
+def _window_moments(x, y, w, valid, window, first, start, stop):
+    """
+    Moment matrices for the windows ending at observations start, ..., stop-1
+
+    `x`, `y`, `w` and `valid` hold the rows from `first`, the first
+    observation that enters the first window of the chunk. Anchoring the
+    running sums there bounds the cancellation error of the add/drop
+    updates by the size of the chunk rather than of the sample.
+    """
+    k = x.shape[1]
+
+    def running(a):
+        out = np.zeros((a.shape[0] + 1,) + a.shape[1:])
+        np.cumsum(a, axis=0, out=out[1:])
+        return out
+
+    xpx = running(x[:, :, None] * x[:, None, :])
+    xpy = running(x * y[:, None])
+    ypy = running(y ** 2)
+    # needed for the weighted centered total sum of squares
+    sw = running(w)
+    swy = running(np.sqrt(w) * y)
+    nobs = running(valid.astype(np.int64))
+
+    end = np.arange(start, stop) - first + 1
+    # only the windows of an expanding fit can start before the first row
+    begin = np.maximum(end - window, 0)
+
+    def diff(a):
+        return a[end] - a[begin]
+
+    out = (diff(xpx).reshape(-1, k, k), diff(xpy), diff(ypy), diff(sw),
+           diff(swy), diff(nobs))
+    return out
+
+
+def _batched_cholesky(corr):
+    """Cholesky factors of a stack of matrices and a mask of failures"""
+    try:
+        return np.linalg.cholesky(corr), np.zeros(corr.shape[0], bool)
+    except np.linalg.LinAlgError:
+        pass
+    chol = np.zeros_like(corr)
+    failed = np.zeros(corr.shape[0], bool)
+    for i in range(corr.shape[0]):
+        try:
+            chol[i] = np.linalg.cholesky(corr[i])
+        except np.linalg.LinAlgError:
+            failed[i] = True
+    return chol, failed
+
+
+def _solve_windows(xpx, xpy):
+    """Batched normal equations by a Cholesky decomposition
+
+    X'X is scaled to unit diagonal and factored by a batched Cholesky
+    decomposition, the inverse is obtained from the inverse of the
+    triangular factor. Windows with a failed factorization or a relative
+    pivot below sqrt(eps) are flagged and left to the caller.
+    """
+    d = np.sqrt(np.einsum('ijj->ij', xpx))
+    bad = (d == 0).any(1)
+    dg = d[~bad]
+    corr = xpx[~bad] / (dg[:, :, None] * dg[:, None, :])
+    chol, failed = _batched_cholesky(corr)
+    piv = np.einsum('ijj->ij', chol) ** 2
+    failed |= piv.min(1) < np.sqrt(np.finfo(float).eps)
+    good = np.nonzero(~bad)[0][~failed]
+    bad[~bad] = failed
+
+    xpxi = np.zeros_like(xpx)
+    if good.shape[0]:
+        cinv = np.linalg.inv(chol[~failed])
+        dg = d[good]
+        xpxi[good] = (np.matmul(np.swapaxes(cinv, 1, 2), cinv) /
+                      (dg[:, :, None] * dg[:, None, :]))
+    params = np.matmul(xpxi, xpy[:, :, None])[:, :, 0]
+    return params, xpxi, bad
+
+
+def _window_ssr(x, y, params, window, end):
+    """Sum of squared residuals of the windows with rows end-window:end
+
+    Rows before the first row of `x` count as zero, invalid rows are zero
+    in the whitened data.
+    """
+    nrows, k = x.shape
+    x = np.concatenate((np.zeros((window, k)), x))
+    y = np.concatenate((np.zeros(window), y))
+    ssr = np.empty(end.shape[0])
+    offsets = np.arange(window)
+    blocksize = max(1, 2 ** 18 // (window * k))
+    for i in range(0, end.shape[0], blocksize):
+        # rows of the windows, shifted by the zero padding
+        rows = end[i:i + blocksize, None] + offsets
+        resid = y[rows] - np.einsum('ijk,ik->ij', x[rows],
+                                    params[i:i + blocksize])
+        ssr[i:i + blocksize] = (resid ** 2).sum(1)
+    return ssr
+
+
+def _fit_chunk(wexog, wendog, weights, valid, window, start, stop,
+               params_only, const_idx=None):
+    first = max(start - window + 1, 0)
+    sl = slice(first, stop)
+    x, y, w = wexog[sl], wendog[sl], weights[sl]
+    xs, ys, a, b = _shift_chunk(x, y, w, const_idx)
+    xpx, xpy, ypy, sw, swy, nobs = _window_moments(
+        xs, ys, w, valid[sl], window, first, start, stop)
+    params, xpxi, bad = _solve_windows(xpx, xpy)
+    end = np.arange(start, stop) - first + 1
+    ssr = _window_ssr(xs, ys, params, window, end)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        centered_tss = ypy - swy ** 2 / sw
+    # uncentered moments are not affected by cancellation
+    ypy_raw = np.zeros(y.shape[0] + 1)
+    np.cumsum(y ** 2, out=ypy_raw[1:])
+    begin = np.maximum(end - window, 0)
+    uncentered_tss = ypy_raw[end] - ypy_raw[begin]
+
+    # back to the parametrization of the unshifted data
+    if const_idx is not None:
+        params[:, const_idx] += b
+        params[:, const_idx] -= np.dot(params, a)
+        trans = np.eye(params.shape[1])
+        trans[const_idx] -= a
+        xpxi = np.matmul(np.matmul(trans, xpxi), trans.T)
+
+    # singular or ill-conditioned windows are solved from the rows
+    rank = np.full(end.shape[0], x.shape[1], dtype=np.int64)
+    for i in np.nonzero(bad)[0]:
+        xw, yw = x[begin[i]:end[i]], y[begin[i]:end[i]]
+        pinv_x = np.linalg.pinv(xw)
+        params[i] = np.dot(pinv_x, yw)
+        xpxi[i] = np.dot(pinv_x, pinv_x.T)
+        ssr[i] = ((yw - np.dot(xw, params[i])) ** 2).sum()
+        rank[i] = np.linalg.matrix_rank(xw)
+    if params_only:
+        xpxi = None
+    return params, ssr, xpxi, rank, uncentered_tss, centered_tss, nobs
+
+
+class RollingWLS(object):
+    """
+    Rolling Weighted Least Squares
+
+    Parameters
+    ----------
+    endog : array-like
+        1-d endogenous response variable.
+    exog : array-like
+        A nobs x k array of regressors. An intercept is not included by
+        default and should be added by the user. See
+        :func:`statsmodels.tools.add_constant`.
+    window : int
+        Length of the rolling window. Must be strictly larger than the
+        number of variables in `exog`.
+    weights : array-like, optional
+        1-d array of weights. If you supply 1/W then the variables are
+        pre-multiplied by 1/sqrt(W). If no weights are supplied the default
+        value is 1 and WLS results are the same as OLS.
+    min_nobs : int, optional
+        Minimum number of observations required to estimate a model when
+        data are missing or when `expanding` is True. Must be at least the
+        number of variables in `exog`. Default is the number of variables.
+    missing : {'drop', 'skip', 'raise'}
+        Handling of rows that contain a missing value.
+
+        * 'drop' removes the missing rows from the windows that contain
+          them; the window is estimated if at least `min_nobs` rows remain.
+        * 'skip' sets the results of every window that contains a missing
+          row to NaN.
+        * 'raise' raises a MissingDataError.
+    expanding : bool
+        If True, the first `window - 1` windows expand from the first
+        observation until they reach `window` observations. Otherwise these
+        windows are not estimated and their results are NaN.
+
+    Notes
+    -----
+    The window that ends at observation t contains observations
+    ``t - window + 1, ..., t``. Results are aligned with the last
+    observation of the window, so that the first `window - 1` rows are NaN
+    unless `expanding` is True.
+
+    The moment matrices of all windows are computed from running sums of
+    the rank-one terms :math:`w_t x_t x_t^\\prime` and
+    :math:`w_t x_t y_t`, adding the entering and dropping the leaving
+    observation. If the model has a constant, the data of each chunk are
+    first centered at their weighted means, which keeps the running sums
+    small for regressors with a large mean. The estimates of all windows
+    are then obtained from one batched Cholesky decomposition of the
+    normal equations, and the residual sum of squares is computed from the
+    residuals of each window. Windows that are singular or ill-conditioned
+    are solved from their observations with a pseudo-inverse.
+
+    See Also
+    --------
+    statsmodels.regression.linear_model.WLS
+    statsmodels.regression.recursive_ls.RecursiveLS
+
+    Examples
+    --------
+    >>> import statsmodels.api as sm
+    >>> from statsmodels.regression.rolling import RollingOLS
+    >>> data = sm.datasets.longley.load_pandas()
+    >>> exog = sm.add_constant(data.exog[['GNP', 'UNEMP']])
+    >>> res = RollingOLS(data.endog, exog, window=8).fit()
+    >>> res.params.tail()
+    """
+    def __init__(self, endog, exog, window, weights=None, min_nobs=None,
+                 missing='drop', expanding=False):
+        self._use_pandas = _is_using_pandas(endog, exog)
+        self._index = None
+        self.exog_names = None
+        self.endog_name = None
+        if isinstance(endog, (pd.Series, pd.DataFrame)):
+            self._index = endog.index
+            self.endog_name = getattr(endog, 'name', None)
+        if isinstance(exog, pd.DataFrame):
+            self._index = exog.index if self._index is None else self._index
+            self.exog_names = [str(c) for c in exog.columns]
+        elif isinstance(exog, pd.Series):
+            self.exog_names = [str(exog.name)]
+
+        endog = np.asarray(endog, dtype=float).squeeze()
+        exog = np.asarray(exog, dtype=float)
+        if exog.ndim == 1:
+            exog = exog[:, None]
+        if endog.ndim != 1 or endog.shape[0] != exog.shape[0]:
+            raise ValueError('endog must be 1-d and have the same number of '
+                             'observations as exog')
+        nobs, k = exog.shape
+        if self.exog_names is None:
+            self.exog_names = ['x%d' % i for i in range(1, k + 1)]
+
+        window = int(window)
+        if window <= k or window > nobs:
+            raise ValueError('window must be larger than the number of '
+                             'variables in exog and at most nobs')
+        min_nobs = k if min_nobs is None else int(min_nobs)
+        if min_nobs < k or min_nobs > window:
+            raise ValueError('min_nobs must be at least the number of '
+                             'variables in exog and at most window')
+        if missing not in ('drop', 'skip', 'raise'):
+            raise ValueError("missing must be 'drop', 'skip' or 'raise'")
+
+        if weights is None:
+            weights = np.ones(nobs)
+        else:
+            weights = np.asarray(weights, dtype=float).squeeze()
+            if weights.shape != (nobs,):
+                raise ValueError('weights must be 1-d with length nobs')
+
+        valid = (np.isfinite(endog) & np.isfinite(exog).all(1) &
+                 np.isfinite(weights))
+        if missing == 'raise' and not valid.all():
+            raise MissingDataError('exog, endog or weights contain missing '
+                                   'values')
+
+        self.endog = endog
+        self.exog = exog
+        self.weights = weights
+        self.window = window
+        self.min_nobs = min_nobs
+        self.missing = missing
+        self.expanding = expanding
+        self.nobs = nobs
+        self.k_exog = k
+        self._valid = valid
+        exog_valid = exog[valid]
+        const = ((np.ptp(exog_valid, 0) == 0) & (exog_valid != 0).any(0))
+        self.k_constant = int(const.any())
+        self._const_idx = np.flatnonzero(const)[0] if const.any() else None
+
+    def _whitened(self):
+        w = np.where(self._valid, self.weights, 0.)
+        w_half = np.sqrt(w)
+        wexog = np.where(self._valid[:, None], self.exog, 0.) * w_half[:, None]
+        wendog = np.where(self._valid, self.endog, 0.) * w_half
+        return wexog, wendog, w
+
+    def fit(self, params_only=False, chunksize=None, n_jobs=1):
+        """
+        Estimate the model for every window
+
+        Parameters
+        ----------
+        params_only : bool, optional
+            If True, the inverse moment matrices are not kept and the
+            parameter covariances, standard errors and t-values are not
+            available.
+        chunksize : int, optional
+            Number of consecutive windows that share one set of running
+            sums. Smaller chunks reduce the rounding error of the add/drop
+            updates and are the unit of work when running in parallel.
+            Default is ``max(10 * window, 1000)``.
+        n_jobs : int, optional
+            Number of jobs used to estimate the chunks in parallel. Requires
+            joblib. Default is 1, no parallelism.
+
+        Returns
+        -------
+        RollingRegressionResults
+        """
+        nobs, k = self.nobs, self.k_exog
+        wexog, wendog, w = self._whitened()
+        first = 0 if self.expanding else self.window - 1
+        if chunksize is None:
+            chunksize = max(10 * self.window, 1000)
+        bounds = list(range(first, nobs, int(chunksize))) + [nobs]
+        chunks = list(zip(bounds[:-1], bounds[1:]))
+
+        args = (wexog, wendog, w, self._valid, self.window)
+        rest = (params_only, self._const_idx)
+        if n_jobs == 1 or len(chunks) == 1:
+            out = [_fit_chunk(*(args + chunk + rest)) for chunk in chunks]
+        else:
+            parallel, p_func, n_jobs = parallel_func(_fit_chunk, n_jobs,
+                                                     verbose=0)
+            out = parallel(p_func(*(args + chunk + rest)) for chunk in chunks)
+
+        def stack(i, shape):
+            res = np.full((nobs,) + shape, np.nan)
+            if out[0][i] is not None:
+                res[first:] = np.concatenate([o[i] for o in out])
+            return res
+
+        params = stack(0, (k,))
+        ssr = stack(1, ())
+        xpxi = stack(2, (k, k)) if not params_only else None
+        rank = stack(3, ())
+        uncentered_tss = stack(4, ())
+        centered_tss = stack(5, ())
+        nobs_win = stack(6, ())
+
+        # windows that cannot be estimated
+        with np.errstate(invalid='ignore'):
+            bad = np.isnan(nobs_win) | (nobs_win < self.min_nobs)
+            if self.missing == 'skip':
+                bad |= nobs_win != self._window_len()
+            bad |= nobs_win - rank <= 0
+        for arr in (params, ssr, rank, uncentered_tss, centered_tss):
+            arr[bad] = np.nan
+        if xpxi is not None:
+            xpxi[bad] = np.nan
+        nobs_win[bad] = np.nan
+
+        return RollingRegressionResults(self, params, ssr, xpxi, rank,
+                                        nobs_win, uncentered_tss,
+                                        centered_tss)
+
+    def _window_len(self):
+        end = np.arange(1, self.nobs + 1)
+        return np.minimum(end, self.window).astype(float)
+
+    def _wrap(self, arr, columns=None):
+        if not self._use_pandas or self._index is None:
+            return arr
+        if arr.ndim == 1:
+            return pd.Series(arr, index=self._index)
+        if arr.ndim == 2:
+            return pd.DataFrame(arr, index=self._index, columns=columns)
+        return arr
+
+
+class RollingOLS(RollingWLS):
+    __doc__ = RollingWLS.__doc__.replace(
+        'Rolling Weighted Least Squares', 'Rolling Ordinary Least Squares',
+        1).replace("""    weights : array-like, optional
+        1-d array of weights. If you supply 1/W then the variables are
+        pre-multiplied by 1/sqrt(W). If no weights are supplied the default
+        value is 1 and WLS results are the same as OLS.
+""", '').replace('linear_model.WLS', 'linear_model.OLS')
+
+    def __init__(self, endog, exog, window, min_nobs=None, missing='drop',
+                 expanding=False):
+        super(RollingOLS, self).__init__(endog, exog, window, weights=None,
+                                         min_nobs=min_nobs, missing=missing,
+                                         expanding=expanding)
+
+
+class RollingRegressionResults(object):
+    """
+    Results from rolling or expanding window regressions
+
+    All attributes are arrays with one row per observation, aligned with
+    the last observation of each window. Windows that are not estimated
+    are NaN. If the model was created from pandas objects, results are
+    returned as Series and DataFrames sharing the index of the data.
+
+    Parameters
+    ----------
+    model : RollingWLS
+        The model instance.
+    params : ndarray
+        nobs x k array of estimated parameters.
+    ssr : ndarray
+        Sum of squared (whitened) residuals of each window.
+    normalized_cov_params : ndarray or None
+        nobs x k x k array of the inverse moment matrices.
+    rank : ndarray
+        Rank of the design matrix of each window.
+    nobs : ndarray
+        Number of observations used in each window.
+    uncentered_tss : ndarray
+        Uncentered total sum of squares of each window.
+    centered_tss : ndarray
+        Weighted centered total sum of squares of each window.
+    """
+    def __init__(self, model, params, ssr, normalized_cov_params, rank, nobs,
+                 uncentered_tss, centered_tss):
+        self.model = model
+        self._params = params
+        self._ssr = ssr
+        self._normalized_cov_params = normalized_cov_params
+        self._rank = rank
+        self._nobs = nobs
+        self._uncentered_tss = uncentered_tss
+        self._centered_tss = centered_tss
+        self.k_constant = model.k_constant
+
+    def _wrap(self, arr, columns=None):
+        return self.model._wrap(arr, columns)
+
+    @cache_readonly
+    def params(self):
+        """Estimated parameters of each window"""
+        return self._wrap(self._params, self.model.exog_names)
+
+    @cache_readonly
+    def nobs(self):
+        """Number of observations in each window"""
+        return self._wrap(self._nobs)
+
+    @cache_readonly
+    def df_model(self):
+        """Model degrees of freedom of each window"""
+        return self._wrap(self._rank - self.k_constant)
+
+    @cache_readonly
+    def df_resid(self):
+        """Residual degrees of freedom of each window"""
+        return self._wrap(self._nobs - self._rank)
+
+    @cache_readonly
+    def ssr(self):
+        """Sum of squared (whitened) residuals of each window"""
+        return self._wrap(self._ssr)
+
+    @cache_readonly
+    def centered_tss(self):
+        """Centered total sum of squares of each window"""
+        return self._wrap(self._centered_tss)
+
+    @cache_readonly
+    def uncentered_tss(self):
+        """Uncentered total sum of squares of each window"""
+        return self._wrap(self._uncentered_tss)
+
+    @cache_readonly
+    def _scale(self):
+        return self._ssr / (self._nobs - self._rank)
+
+    @cache_readonly
+    def mse_resid(self):
+        """Residual variance, ssr / df_resid, of each window"""
+        return self._wrap(self._scale)
+
+    scale = mse_resid
+
+    @cache_readonly
+    def _rsquared(self):
+        tss = self._centered_tss if self.k_constant else self._uncentered_tss
+        return 1 - self._ssr / tss
+
+    @cache_readonly
+    def rsquared(self):
+        """R-squared of each window"""
+        return self._wrap(self._rsquared)
+
+    @cache_readonly
+    def rsquared_adj(self):
+        """Adjusted R-squared of each window"""
+        df_resid = self._nobs - self._rank
+        rsq_adj = (1 - (self._nobs - self.k_constant) / df_resid *
+                   (1 - self._rsquared))
+        return self._wrap(rsq_adj)
+
+    def cov_params(self):
+        """
+        Estimated covariance of the parameters of each window
+
+        Returns
+        -------
+        cov_params : ndarray
+            nobs x k x k array. For pandas input this is a DataFrame with a
+            MultiIndex of the observation index and the parameter names.
+        """
+        if self._normalized_cov_params is None:
+            raise ValueError('cov_params is not available when the model is '
+                             'fit with params_only=True')
+        cov = self._normalized_cov_params * self._scale[:, None, None]
+        if not self.model._use_pandas or self.model._index is None:
+            return cov
+        names = self.model.exog_names
+        nobs, k = cov.shape[:2]
+        index = pd.MultiIndex.from_product([self.model._index, names])
+        return pd.DataFrame(cov.reshape(nobs * k, k), index=index,
+                            columns=names)
+
+    @cache_readonly
+    def _bse(self):
+        if self._normalized_cov_params is None:
+            raise ValueError('bse is not available when the model is fit '
+                             'with params_only=True')
+        diag = np.diagonal(self._normalized_cov_params, axis1=1, axis2=2)
+        return np.sqrt(diag * self._scale[:, None])
+
+    @cache_readonly
+    def bse(self):
+        """Standard errors of the parameters of each window"""
+        return self._wrap(self._bse, self.model.exog_names)
+
+    @cache_readonly
+    def _tvalues(self):
+        return self._params / self._bse
+
+    @cache_readonly
+    def tvalues(self):
+        """t-statistics of the parameters of each window"""
+        return self._wrap(self._tvalues, self.model.exog_names)
+
+    @cache_readonly
+    def pvalues(self):
+        """Two-sided p-values of the t-statistics of each window"""
+        df_resid = (self._nobs - self._rank)[:, None]
+        with np.errstate(invalid='ignore'):
+            pvalues = stats.t.sf(np.abs(self._tvalues), df_resid) * 2
+        return self._wrap(pvalues, self.model.exog_names)
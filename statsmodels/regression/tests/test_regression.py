@@ -1249,6 +1249,42 @@ def test_regularized_options():
     assert_allclose(result1.params, result2.params)
 
 
+def test_regularized_path():
+    from statsmodels.base.elastic_net import fit_elasticnet
+    n = 200
+    p = 20
+    np.random.seed(3132)
+    xmat = np.random.normal(size=(n, p))
+    yvec = xmat[:, :4].sum(1) + np.random.normal(size=n)
+    model = OLS(yvec, xmat)
+    alphas = [1., 0.3, 0.1, 0.03, 0.01]
+    for L1_wt in 1, 0.5:
+        path = model.fit_regularized_path(alphas, L1_wt=L1_wt)
+        assert_equal(path.params.shape, (len(alphas), p))
+        for alpha, params in zip(alphas, path.params):
+            result = model.fit_regularized(alpha=alpha, L1_wt=L1_wt)
+            assert_allclose(params, result.params, rtol=1e-8, atol=1e-10)
+            # generic coordinate descent, it can get stuck if a variable
+            # leaves its active set, the path is never worse
+            result = fit_elasticnet(model, alpha=alpha, L1_wt=L1_wt,
+                                    loglike_kwds={"scale": 1},
+                                    score_kwds={"scale": 1},
+                                    hess_kwds={"scale": 1}, maxiter=200,
+                                    cnvrg_tol=1e-12, zero_tol=1e-10,
+                                    check_step=False)
+            assert_allclose(params, result.params, atol=1e-3)
+
+            def objective(params):
+                ssr = np.sum((yvec - xmat.dot(params))**2)
+                pen = ((1 - L1_wt) * np.sum(params**2) / 2 +
+                       L1_wt * np.sum(np.abs(params)))
+                return ssr / (2 * n) + alpha * pen
+
+            assert_(objective(params) <= objective(result.params) + 1e-14)
+    # the largest penalty removes all variables
+    assert_equal(model.fit_regularized_path([10.]).params, np.zeros((1, p)))
+
+
 def test_burg():
     rnd = np.random.RandomState(12345)
     e = rnd.randn(10001)
@@ -0,0 +1,162 @@
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+import pandas as pd
+import pytest
+
+from statsmodels.regression.linear_model import OLS, WLS
+from statsmodels.regression.rolling import RollingOLS, RollingWLS
+from statsmodels.tools.sm_exceptions import MissingDataError
+from statsmodels.tools.tools import add_constant
+
+
+def gen_data(nobs=250, k=3, missing=False):
+    rs = np.random.RandomState(12345)
+    exog = add_constant(rs.standard_normal((nobs, k - 1)))
+    endog = exog.sum(1) + rs.standard_normal(nobs)
+    weights = rs.chisquare(5, nobs) / 5
+    if missing:
+        endog[[30, 31, 100]] = np.nan
+        exog[150, 1] = np.nan
+    return endog, exog, weights
+
+
+def _compare(res, endog, exog, weights, window, t, nan_rows=True):
+    sl = slice(max(t - window + 1, 0), t + 1)
+    y, x, w = endog[sl], exog[sl], weights[sl]
+    keep = np.isfinite(y) & np.isfinite(x).all(1)
+    ols = WLS(y[keep], x[keep], weights=w[keep]).fit()
+    assert_allclose(res.params[t], ols.params, rtol=1e-8)
+    assert_allclose(res.bse[t], ols.bse, rtol=1e-8)
+    assert_allclose(res.tvalues[t], ols.tvalues, rtol=1e-8)
+    assert_allclose(res.pvalues[t], ols.pvalues, rtol=1e-6)
+    assert_allclose(res.cov_params()[t], ols.cov_params(), rtol=1e-8)
+    assert_allclose(res.ssr[t], ols.ssr, rtol=1e-8)
+    assert_allclose(res.mse_resid[t], ols.mse_resid, rtol=1e-8)
+    assert_allclose(res.rsquared[t], ols.rsquared, rtol=1e-8)
+    assert_allclose(res.rsquared_adj[t], ols.rsquared_adj, rtol=1e-8)
+    assert_equal(res.nobs[t], ols.nobs)
+    assert_equal(res.df_resid[t], ols.df_resid)
+
+
+@pytest.mark.parametrize('weighted', [True, False])
+def test_against_loop(weighted):
+    endog, exog, weights = gen_data()
+    window = 30
+    if weighted:
+        res = RollingWLS(endog, exog, window, weights=weights).fit()
+    else:
+        weights = np.ones_like(endog)
+        res = RollingOLS(endog, exog, window).fit()
+    assert np.all(np.isnan(res.params[:window - 1]))
+    for t in [window - 1, 50, 149, 249]:
+        _compare(res, endog, exog, weights, window, t)
+
+
+def test_chunks_parallel():
+    endog, exog, weights = gen_data(nobs=500)
+    res = RollingWLS(endog, exog, 25, weights=weights).fit()
+    res_chunked = RollingWLS(endog, exog, 25, weights=weights).fit(
+        chunksize=17, n_jobs=2)
+    assert_allclose(res_chunked.params, res.params, rtol=1e-10)
+    assert_allclose(res_chunked.bse, res.bse, rtol=1e-10)
+
+
+def test_expanding():
+    endog, exog, weights = gen_data()
+    res = RollingWLS(endog, exog, 40, weights=weights, min_nobs=10,
+                     expanding=True).fit()
+    assert np.all(np.isnan(res.params[:9]))
+    for t in [9, 20, 39, 100]:
+        _compare(res, endog, exog, weights, 40, t)
+
+
+def test_missing():
+    endog, exog, weights = gen_data(missing=True)
+    window = 20
+    res = RollingWLS(endog, exog, window, weights=weights).fit()
+    for t in [31, 40, 50, 100, 119, 150, 169, 170]:
+        _compare(res, endog, exog, weights, window, t)
+    assert_equal(res.nobs[40], window - 2)
+
+    res_skip = RollingWLS(endog, exog, window, weights=weights,
+                          missing='skip').fit()
+    assert np.all(np.isnan(res_skip.params[30:51]))
+    assert np.all(np.isfinite(res_skip.params[51:100]))
+    assert np.all(np.isnan(res_skip.params[150:170]))
+    assert_allclose(res_skip.params[170:], res.params[170:])
+
+    with pytest.raises(MissingDataError):
+        RollingWLS(endog, exog, window, missing='raise')
+
+
+def test_params_only():
+    endog, exog, _ = gen_data()
+    res = RollingOLS(endog, exog, 30).fit(params_only=True)
+    res_full = RollingOLS(endog, exog, 30).fit()
+    assert_allclose(res.params, res_full.params)
+    with pytest.raises(ValueError):
+        res.bse
+    with pytest.raises(ValueError):
+        res.cov_params()
+
+
+def test_pandas():
+    endog, exog, _ = gen_data()
+    index = pd.date_range('2000-01-01', periods=endog.shape[0], freq='D')
+    endog = pd.Series(endog, index=index, name='y')
+    exog = pd.DataFrame(exog, index=index, columns=['const', 'a', 'b'])
+    res = RollingOLS(endog, exog, 30).fit()
+    assert isinstance(res.params, pd.DataFrame)
+    assert_equal(list(res.params.columns), ['const', 'a', 'b'])
+    assert res.params.index.equals(index)
+    assert isinstance(res.rsquared, pd.Series)
+    cov = res.cov_params()
+    assert_equal(cov.shape, (3 * endog.shape[0], 3))
+    ols = OLS(endog.iloc[20:50], exog.iloc[20:50]).fit()
+    assert_allclose(res.params.iloc[49], ols.params)
+    assert_allclose(cov.loc[index[49]], ols.cov_params())
+
+
+def test_collinear_window():
+    endog, exog, _ = gen_data()
+    exog = np.column_stack([exog, exog[:, 1]])
+    res = RollingOLS(endog, exog, 30).fit()
+    ols = OLS(endog[20:50], exog[20:50]).fit()
+    assert_allclose(res.params[49], ols.params, rtol=1e-6)
+    assert_equal(res.df_model[49], ols.df_model)
+    assert_allclose(res.rsquared[49], ols.rsquared, rtol=1e-8)
+
+    # regressor that is zero in the early windows
+    exog = np.column_stack([exog[:, :3], np.arange(250) >= 100])
+    res = RollingOLS(endog, exog, 30).fit()
+    for t in [49, 110, 200]:
+        ols = OLS(endog[t - 29:t + 1], exog[t - 29:t + 1]).fit()
+        assert_allclose(res.params[t], ols.params, rtol=1e-8, atol=1e-12)
+        assert_equal(res.df_model[t], ols.df_model)
+
+
+@pytest.mark.parametrize('window', [10, 12, 16])
+def test_longley(window):
+    # regressors with large means and an ill-conditioned design
+    from statsmodels.datasets import longley
+    data = longley.load_pandas()
+    endog = data.endog.values
+    exog = add_constant(data.exog.values)
+    res = RollingOLS(endog, exog, window).fit()
+    for t in range(window - 1, endog.shape[0]):
+        sl = slice(t - window + 1, t + 1)
+        ols = OLS(endog[sl], exog[sl]).fit()
+        assert_allclose(res.params[t], ols.params, rtol=1e-7)
+        assert_allclose(res.bse[t], ols.bse, rtol=1e-7)
+        assert_allclose(res.ssr[t], ols.ssr, rtol=1e-7)
+        assert_allclose(res.rsquared[t], ols.rsquared, rtol=1e-7)
+
+
+def test_errors():
+    endog, exog, _ = gen_data()
+    with pytest.raises(ValueError):
+        RollingOLS(endog, exog, 3)
+    with pytest.raises(ValueError):
+        RollingOLS(endog, exog, 30, min_nobs=2)
+    with pytest.raises(ValueError):
+        RollingOLS(endog, exog, 30, missing='none')
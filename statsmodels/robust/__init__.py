@@ -1,9 +1,11 @@
 """
 Robust statistical models
 """
-__all__ = ["norms", "mad", "Huber", "HuberScale", "hubers_scale"]
+__all__ = ["norms", "mad", "Huber", "HuberScale", "hubers_scale",
+           "fast_lts", "fast_s"]
 from . import norms
 from .scale import mad, Huber, HuberScale, hubers_scale
+from .high_breakdown import fast_lts, fast_s
 
 from statsmodels import PytestTester
 test = PytestTester()
@@ -0,0 +1,438 @@
+"""
+High breakdown point estimators for linear regression
+
+FAST-LTS and the fast S-estimator search over random elemental subsets,
+exact fits to as many observations as there are regressors.  The candidates
+are improved by concentration steps, least squares fits to the observations
+with the smallest residuals for LTS and iteratively reweighted least squares
+steps for S.  All candidates of a block are evaluated jointly with stacked
+linear algebra, blocks of subsets can be processed by an executor.
+
+The estimates can be used as robust starting values in RLM, an MM-estimator
+is an M-estimator with redescending norm that starts at an S-estimate and
+keeps its scale fixed.
+
+References
+----------
+Rousseeuw, P. J. and K. Van Driessen (2006). Computing LTS regression for
+large data sets. Data Mining and Knowledge Discovery 12, 29-45.
+
+Salibian-Barrera, M. and V. J. Yohai (2006). A fast algorithm for
+S-regression estimates. Journal of Computational and Graphical Statistics
+15, 414-427.
+
+Yohai, V. J. (1987). High breakdown-point and high efficiency robust
+estimates for regression. The Annals of Statistics 15, 642-656.
+"""
+import numpy as np
+from scipy import stats
+
+from statsmodels.tools.tools import Bunch
+
+__all__ = ['fast_lts', 'fast_s']
+
+# maximum number of elements of (nobs, ncandidates) arrays in one block
+_BLOCK_SIZE = 2**22
+
+# tuning constant of the bisquare rho for breakdown point 0.5 and
+# consistency at the normal distribution
+_S_C = 1.547645
+
+
+def _random_state(seed):
+    if isinstance(seed, np.random.RandomState):
+        return seed
+    return np.random.RandomState(seed)
+
+
+def _draw_subsets(nobs, k_vars, n_subsets, random_state):
+    """indices of random subsets of size k_vars without repeated elements"""
+    subsets = random_state.randint(0, nobs, size=(n_subsets, k_vars))
+    while True:
+        repeated = (np.diff(np.sort(subsets, 1), axis=1) == 0).any(1)
+        if not repeated.any():
+            return subsets
+        subsets[repeated] = random_state.randint(
+            0, nobs, size=(repeated.sum(), k_vars))
+
+
+def _elemental_fits(endog, exog, subsets):
+    """parameters of exact fits to elemental subsets, singular subsets are
+    dropped"""
+    xs = exog[subsets]
+    sv = np.linalg.svd(xs, compute_uv=False)
+    ok = sv[:, -1] > 1e-8 * sv[:, 0]
+    ys = endog[subsets[ok]]
+    return np.linalg.solve(xs[ok], ys[:, :, None])[:, :, 0]
+
+
+def _wls_batch(endog, exog, weights):
+    """WLS parameters for the weights in the columns of `weights`"""
+    nobs, k_vars = exog.shape
+    # cross products of the rows, the weighted sums are matrix products
+    xx = (exog[:, :, None] * exog[:, None, :]).reshape(nobs, k_vars**2)
+    xtwx = weights.T.dot(xx).reshape(-1, k_vars, k_vars)
+    xtwy = weights.T.dot(exog * endog[:, None])
+    try:
+        return np.linalg.solve(xtwx, xtwy[:, :, None])[:, :, 0]
+    except np.linalg.LinAlgError:
+        # some weights select a singular design
+        return np.array([np.linalg.lstsq(a, b, rcond=-1)[0]
+                         for a, b in zip(xtwx, xtwy)])
+
+
+def _blocks(nobs, ncand):
+    step = max(1, _BLOCK_SIZE // nobs)
+    return [slice(start, start + step) for start in range(0, ncand, step)]
+
+
+def _run_tasks(func, tasks, executor):
+    if executor is None:
+        return [func(task) for task in tasks]
+    return list(executor.map(func, tasks))
+
+
+def _split_subsets(subsets, n_chunks, executor):
+    if n_chunks is None:
+        n_chunks = 1 if executor is None else 8
+    n_chunks = max(1, min(n_chunks, len(subsets)))
+    return np.array_split(subsets, n_chunks)
+
+
+# FAST-LTS
+# --------
+
+def _lts_h(nobs, k_vars, alpha):
+    """number of observations in the LTS objective, as in robustbase"""
+    n2 = (nobs + k_vars + 1) // 2
+    return int(np.floor(2 * n2 - nobs + 2 * (nobs - n2) * alpha))
+
+
+def _lts_objective(resid2, h):
+    return np.partition(resid2, h - 1, axis=0)[:h].sum(0)
+
+
+def _lts_csteps(endog, exog, params, h, n_steps):
+    """concentration steps, params in rows, returns params and objective"""
+    nobs = exog.shape[0]
+    params = params.copy()
+    obj = np.empty(params.shape[0])
+    for sl in _blocks(nobs, params.shape[0]):
+        p = params[sl]
+        cols = np.arange(p.shape[0])
+        for _ in range(n_steps):
+            resid2 = (endog[:, None] - exog.dot(p.T))**2
+            idx = np.argpartition(resid2, h - 1, axis=0)[:h]
+            weights = np.zeros(resid2.shape)
+            weights[idx, cols] = 1
+            p = _wls_batch(endog, exog, weights)
+        resid2 = (endog[:, None] - exog.dot(p.T))**2
+        params[sl] = p
+        obj[sl] = _lts_objective(resid2, h)
+    return params, obj
+
+
+def _lts_candidates(task):
+    """best candidates of a chunk of elemental subsets, used by executors"""
+    endog, exog, subsets, h, n_csteps, n_best = task
+    params = _elemental_fits(endog, exog, subsets)
+    params, obj = _lts_csteps(endog, exog, params, h, n_csteps)
+    best = np.argsort(obj)[:n_best]
+    return params[best], obj[best]
+
+
+def fast_lts(endog, exog, alpha=0.5, n_subsets=500, n_csteps=2, n_best=10,
+             maxiter=100, seed=None, executor=None, n_chunks=None):
+    """
+    Least trimmed squares regression with the FAST-LTS algorithm
+
+    Parameters
+    ----------
+    endog : array_like
+        1d dependent variable
+    exog : array_like
+        2d array of regressors, including the constant
+    alpha : float in [0.5, 1]
+        fraction of observations in the trimmed sum of squares, 0.5 gives
+        the highest breakdown point.
+    n_subsets : int
+        number of random elemental subsets
+    n_csteps : int
+        number of concentration steps for all candidates
+    n_best : int
+        number of best candidates of each chunk that are iterated to
+        convergence
+    maxiter : int
+        maximum number of concentration steps for the best candidates
+    seed : None, int or RandomState
+        seed for drawing the subsets
+    executor : None or executor
+        If not None, then the chunks of subsets are evaluated with
+        ``executor.map``, for example with a
+        ``concurrent.futures.ProcessPoolExecutor``.
+    n_chunks : None or int
+        number of chunks of subsets. The default is 1 without executor and
+        8 with an executor.
+
+    Returns
+    -------
+    res : Bunch
+        with attributes
+
+        - params : reweighted least squares estimate
+        - scale : scale estimate of the reweighted fit
+        - weights : 0-1 weights of the reweighting step, zero for outliers
+        - raw_params : LTS estimate
+        - raw_scale : LTS scale estimate, corrected for consistency at the
+          normal distribution
+        - h : number of observations in the trimmed sum of squares
+        - objective : trimmed sum of squared residuals of ``raw_params``
+
+    Notes
+    -----
+    The subsets are processed in blocks. For each block the exact fits, the
+    residuals of all candidates and the least squares fits of the
+    concentration steps are computed with stacked linear algebra. The
+    nested subsampling of the original algorithm for large samples is not
+    used.
+
+    The reweighting step drops observations with absolute standardized
+    residual larger than the 0.9875 quantile of the normal distribution.
+
+    References
+    ----------
+    Rousseeuw, P. J. and K. Van Driessen (2006). Computing LTS regression for
+    large data sets. Data Mining and Knowledge Discovery 12, 29-45.
+    """
+    endog = np.asarray(endog, dtype=float)
+    exog = np.asarray(exog, dtype=float)
+    nobs, k_vars = exog.shape
+    if nobs <= k_vars:
+        raise ValueError('LTS requires more observations than regressors')
+    h = _lts_h(nobs, k_vars, alpha)
+    rs = _random_state(seed)
+    subsets = _draw_subsets(nobs, k_vars, n_subsets, rs)
+
+    tasks = [(endog, exog, sub, h, n_csteps, n_best)
+             for sub in _split_subsets(subsets, n_chunks, executor)]
+    results = _run_tasks(_lts_candidates, tasks, executor)
+    params = np.concatenate([r[0] for r in results])
+    obj = np.concatenate([r[1] for r in results])
+    if params.shape[0] == 0:
+        raise ValueError('all elemental subsets are singular')
+    best = np.argsort(obj)[:n_best]
+    params, obj = params[best], obj[best]
+
+    # concentration steps until the objective does not decrease
+    for _ in range(maxiter):
+        params_new, obj_new = _lts_csteps(endog, exog, params, h, 1)
+        improved = obj_new < obj * (1 - 1e-12)
+        params[improved] = params_new[improved]
+        obj[improved] = obj_new[improved]
+        if not improved.any():
+            break
+
+    best = np.argmin(obj)
+    raw_params, objective = params[best], obj[best]
+
+    # consistency factors at the normal distribution
+    q = stats.chi2.ppf(h / float(nobs), 1)
+    factor = stats.chi2.cdf(q, 3) / (h / float(nobs))
+    raw_scale = np.sqrt(objective / h / factor)
+
+    # reweighting step
+    resid = endog - exog.dot(raw_params)
+    if raw_scale > 0:
+        cutoff = np.sqrt(stats.chi2.ppf(0.975, 1))
+        weights = (np.abs(resid / raw_scale) <= cutoff).astype(float)
+    else:
+        # exact fit of at least h observations
+        weights = (resid == 0).astype(float)
+    params = _wls_batch(endog, exog, weights[:, None])[0]
+    resid = endog - exog.dot(params)
+    nobs_w = weights.sum()
+    factor_w = stats.chi2.cdf(stats.chi2.ppf(0.975, 1), 3) / 0.975
+    scale = np.sqrt((weights * resid**2).sum() / (nobs_w - k_vars) / factor_w)
+
+    return Bunch(params=params, scale=scale, weights=weights,
+                 raw_params=raw_params, raw_scale=raw_scale, h=h,
+                 objective=objective)
+
+
+# fast S-estimator
+# ----------------
+
+def _rho_bisquare(u, c):
+    """bisquare rho normalized to a maximum of one"""
+    t = np.minimum((u / c)**2, 1)
+    return 1 - (1 - t)**3
+
+
+def _weights_bisquare(u, c):
+    t = np.minimum((u / c)**2, 1)
+    return (1 - t)**2
+
+
+def _mscale(resid, c=_S_C, b=0.5, scale=None, maxiter=200, tol=1e-10):
+    """M-scale of the columns of resid, mean(rho(resid / scale)) = b"""
+    if scale is None:
+        scale = np.median(np.abs(resid), axis=0) / 0.6745
+    scale = np.maximum(scale, np.finfo(float).tiny)
+    for _ in range(maxiter):
+        scale_new = scale * np.sqrt(_rho_bisquare(resid / scale, c).mean(0)
+                                    / b)
+        if np.all(np.abs(scale_new - scale) <= tol * scale):
+            scale = scale_new
+            break
+        scale = np.maximum(scale_new, np.finfo(float).tiny)
+    return scale
+
+
+def _s_irwls(endog, exog, params, scale, c, b, n_steps, scale_iter=1):
+    """IRWLS steps of the S-estimator, params in rows"""
+    for _ in range(n_steps):
+        resid = endog[:, None] - exog.dot(params.T)
+        weights = _weights_bisquare(resid / scale, c)
+        params = _wls_batch(endog, exog, weights)
+        resid = endog[:, None] - exog.dot(params.T)
+        scale = _mscale(resid, c, b, scale=scale, maxiter=scale_iter)
+    return params, scale
+
+
+def _s_candidates(task):
+    """best candidates of a chunk of elemental subsets, used by executors"""
+    endog, exog, subsets, c, b, n_steps, n_best = task
+    params = _elemental_fits(endog, exog, subsets)
+    nobs = exog.shape[0]
+    blocks = _blocks(nobs, params.shape[0])
+    scale = np.empty(params.shape[0])
+    for sl in blocks:
+        resid = endog[:, None] - exog.dot(params[sl].T)
+        # approximate scale with one step from the MAD
+        s = _mscale(resid, c, b, maxiter=1)
+        params[sl], scale[sl] = _s_irwls(endog, exog, params[sl], s, c, b,
+                                         n_steps)
+
+    # The M-scale of a candidate is smaller than s_max if and only if
+    # mean(rho(resid / s_max)) < b, the exact M-scale is only computed for
+    # the candidates that pass this check.
+    best = np.argsort(scale)[:n_best]
+    resid = endog[:, None] - exog.dot(params[best].T)
+    scale_best = _mscale(resid, c, b, scale=scale[best], tol=1e-6)
+    s_max = scale_best.max()
+    check = np.ones(params.shape[0], bool)
+    check[best] = False
+    for sl in blocks:
+        idx = np.arange(params.shape[0])[sl][check[sl]]
+        resid = endog[:, None] - exog.dot(params[idx].T)
+        smaller = _rho_bisquare(resid / s_max, c).mean(0) < b
+        if smaller.any():
+            idx = idx[smaller]
+            best = np.concatenate((best, idx))
+            scale_best = np.concatenate((scale_best, _mscale(
+                resid[:, smaller], c, b, scale=scale[idx], tol=1e-6)))
+    order = np.argsort(scale_best)[:n_best]
+    return params[best[order]], scale_best[order]
+
+
+def fast_s(endog, exog, c=_S_C, b=0.5, n_subsets=500, n_steps=2, n_best=5,
+           maxiter=100, tol=1e-10, seed=None, executor=None, n_chunks=None):
+    """
+    S-estimator of regression with the fast-S algorithm
+
+    The S-estimator minimizes the M-scale of the residuals defined by the
+    bisquare rho function.
+
+    Parameters
+    ----------
+    endog : array_like
+        1d dependent variable
+    exog : array_like
+        2d array of regressors, including the constant
+    c : float
+        tuning constant of the bisquare rho function. The default together
+        with ``b=0.5`` has breakdown point 0.5 and is consistent at the
+        normal distribution.
+    b : float
+        expected value of rho, normalized to a maximum of one, that defines
+        the M-scale. The M-scale s solves
+        ``sum(rho(resid / s)) / (nobs - k_vars) = b`` as in lmrob of the R
+        package robustbase.
+    n_subsets : int
+        number of random elemental subsets
+    n_steps : int
+        number of IRWLS refinement steps for all candidates
+    n_best : int
+        number of best candidates of each chunk that are iterated to
+        convergence
+    maxiter : int
+        maximum number of IRWLS steps for the best candidates
+    tol : float
+        relative convergence tolerance for the scale of the best candidates
+    seed : None, int or RandomState
+        seed for drawing the subsets
+    executor : None or executor
+        If not None, then the chunks of subsets are evaluated with
+        ``executor.map``, for example with a
+        ``concurrent.futures.ProcessPoolExecutor``.
+    n_chunks : None or int
+        number of chunks of subsets. The default is 1 without executor and
+        8 with an executor.
+
+    Returns
+    -------
+    res : Bunch
+        with attributes
+
+        - params : S-estimate of the parameters
+        - scale : M-scale of the residuals at ``params``
+        - weights : bisquare weights at the solution
+
+    Notes
+    -----
+    The candidates of each block of subsets are refined jointly: the
+    residuals, the M-scales of all candidates and the weighted least squares
+    fits of the IRWLS steps are computed with stacked linear algebra.
+
+    References
+    ----------
+    Salibian-Barrera, M. and V. J. Yohai (2006). A fast algorithm for
+    S-regression estimates. Journal of Computational and Graphical
+    Statistics 15, 414-427.
+    """
+    endog = np.asarray(endog, dtype=float)
+    exog = np.asarray(exog, dtype=float)
+    nobs, k_vars = exog.shape
+    if nobs <= k_vars:
+        raise ValueError('S-estimation requires more observations than '
+                         'regressors')
+    rs = _random_state(seed)
+    subsets = _draw_subsets(nobs, k_vars, n_subsets, rs)
+    # degrees of freedom correction, mean(rho) = b_nobs
+    b = b * (nobs - k_vars) / float(nobs)
+
+    tasks = [(endog, exog, sub, c, b, n_steps, n_best)
+             for sub in _split_subsets(subsets, n_chunks, executor)]
+    results = _run_tasks(_s_candidates, tasks, executor)
+    params = np.concatenate([r[0] for r in results])
+    scale = np.concatenate([r[1] for r in results])
+    if params.shape[0] == 0:
+        raise ValueError('all elemental subsets are singular')
+    best = np.argsort(scale)[:n_best]
+    params, scale = params[best], scale[best]
+
+    # IRWLS with one step scale updates for the best candidates until the
+    # parameters converge
+    for _ in range(maxiter):
+        params_new, scale = _s_irwls(endog, exog, params, scale, c, b, 1)
+        change = np.abs(params_new - params).max(1)
+        params = params_new
+        if np.all(change <= tol * (1 + np.abs(params).max(1))):
+            break
+    resid = endog[:, None] - exog.dot(params.T)
+    scale = _mscale(resid, c, b, scale=scale, tol=tol)
+
+    best = np.argmin(scale)
+    params, scale = params[best], scale[best]
+    weights = _weights_bisquare((endog - exog.dot(params)) / scale, c)
+    return Bunch(params=params, scale=scale, weights=weights)
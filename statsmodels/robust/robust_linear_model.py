@@ -16,12 +16,14 @@ R Venables, B Ripley. 'Modern Applied Statistics in S'  Springer, New York,
 import numpy as np
 import scipy.stats as stats
 
+from statsmodels.tools.tools import Bunch
 from statsmodels.tools.decorators import (cache_readonly,
                                                   resettable_cache)
 import statsmodels.regression.linear_model as lm
 import statsmodels.regression._tools as reg_tools
 import statsmodels.robust.norms as norms
 import statsmodels.robust.scale as scale
+import statsmodels.robust.high_breakdown as high_breakdown
 import statsmodels.base.model as base
 import statsmodels.base.wrapper as wrap
 from statsmodels.compat.numpy import np_matrix_rank
@@ -181,6 +183,35 @@ class RLM(base.LikelihoodModel):
             history['weights'].append(tmp_results.model.weights)
         return history
 
+    def _fit_start(self, init, init_kwds=None):
+        """
+        High breakdown point estimate used as starting values.
+        """
+        if init_kwds is None:
+            init_kwds = {}
+        init_lower = init.lower() if isinstance(init, str) else init
+        if init_lower == 'lts':
+            return high_breakdown.fast_lts(self.endog, self.exog,
+                                           **init_kwds)
+        elif init_lower == 's':
+            return high_breakdown.fast_s(self.endog, self.exog, **init_kwds)
+        else:
+            raise ValueError("Option %s for init not understood" % init)
+
+    def _start_results(self, start_params):
+        """
+        Minimal results of the starting values for the IRLS iterations.
+        """
+        params = np.asarray(start_params, dtype=float)
+        if params.shape != (self.exog.shape[1],):
+            raise ValueError("start_params has the wrong length")
+        fittedvalues = self.exog.dot(params)
+        resid = self.endog - fittedvalues
+        return Bunch(params=params, fittedvalues=fittedvalues,
+                     resid=resid,
+                     model=reg_tools._MinimalWLS(self.endog, self.exog),
+                     scale=np.dot(resid, resid) / self.df_resid)
+
     def _estimate_scale(self, resid):
         """
         Estimates the scale based on the option provided to the fit method.
@@ -197,7 +228,7 @@ class RLM(base.LikelihoodModel):
             return scale.scale_est(self, resid)**2
 
     def fit(self, maxiter=50, tol=1e-8, scale_est='mad', init=None, cov='H1',
-            update_scale=True, conv='dev'):
+            update_scale=True, conv='dev', start_params=None, init_kwds=None):
         """
         Fits the model using iteratively reweighted least squares.
 
@@ -219,7 +250,14 @@ class RLM(base.LikelihoodModel):
         init : string
             Specifies method for the initial estimates of the parameters.
             Default is None, which means that the least squares estimate
-            is used.  Currently it is the only available choice.
+            is used, unless `start_params` are given.  Other options are
+            high breakdown point estimates, 'lts' for least trimmed squares
+            and 's' for the S-estimator, see
+            statsmodels.robust.high_breakdown.  The scale of the high
+            breakdown estimate is used as the initial scale.
+        init_kwds : dict, optional
+            Keyword arguments for the estimator of the initial estimates,
+            ``fast_lts`` or ``fast_s``, for example `seed` or `executor`.
         maxiter : int
             The maximum number of iterations to try. Default is 50.
         scale_est : string or HuberScale()
@@ -236,11 +274,26 @@ class RLM(base.LikelihoodModel):
             If `update_scale` is False then the scale estimate for the
             weights is held constant over the iteration.  Otherwise, it
             is updated for each fit in the iteration.  Default is True.
+        start_params : array_like, optional
+            Initial estimates of the parameters, the initial scale is
+            estimated from their residuals. Cannot be combined with `init`.
 
         Returns
         -------
         results : object
             statsmodels.rlm.RLMresults
+
+        Notes
+        -----
+        The IRLS iterations of redescending norms, like TukeyBiweight,
+        converge to a local solution that depends on the starting values.
+        The least squares start is not robust to outliers in the regressors.
+        An MM-estimator, with breakdown point 0.5 and 95% efficiency at the
+        normal distribution, uses a high breakdown S-estimate as start and
+        keeps its scale fixed::
+
+            mod = RLM(endog, exog, M=norms.TukeyBiweight(c=4.685))
+            res = mod.fit(init='s', update_scale=False)
         """
         if not cov.upper() in ["H1","H2","H3"]:
             raise ValueError("Covariance matrix %s not understood" % cov)
@@ -252,9 +305,20 @@ class RLM(base.LikelihoodModel):
                 % conv)
         self.scale_est = scale_est
 
-        wls_results = lm.WLS(self.endog, self.exog).fit()
-        if not init:
+        if init is not None and start_params is not None:
+            raise ValueError("init and start_params cannot both be used")
+        if init is None and start_params is None:
+            wls_results = lm.WLS(self.endog, self.exog).fit()
             self.scale = self._estimate_scale(wls_results.resid)
+        else:
+            if init is not None:
+                start = self._fit_start(init, init_kwds)
+                start_params = start.params
+            wls_results = self._start_results(start_params)
+            if init is not None:
+                self.scale = start.scale
+            else:
+                self.scale = self._estimate_scale(wls_results.resid)
 
         history = dict(params = [np.inf], scale = [])
         if conv == 'coefs':
@@ -288,7 +352,8 @@ class RLM(base.LikelihoodModel):
         history['iteration'] = iteration
         results.fit_history = history
         results.fit_options = dict(cov=cov.upper(), scale_est=scale_est,
-                                   norm=self.M.__class__.__name__, conv=conv)
+                                   norm=self.M.__class__.__name__, conv=conv,
+                                   init=init)
         #norm is not changed in fit, no old state
 
         #doing the next causes exception
@@ -0,0 +1,125 @@
+"""
+Tests for high breakdown point regression estimators
+"""
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+import pytest
+
+import statsmodels.api as sm
+from statsmodels.robust.high_breakdown import fast_lts, fast_s
+from statsmodels.robust.robust_linear_model import RLM
+import statsmodels.robust.norms as norms
+
+
+class _MapExecutor(object):
+    # records the number of tasks
+
+    def __init__(self):
+        self.ntasks = 0
+
+    def map(self, func, tasks):
+        tasks = list(tasks)
+        self.ntasks += len(tasks)
+        return map(func, tasks)
+
+
+def _stackloss():
+    data = sm.datasets.stackloss.load(as_pandas=False)
+    return np.asarray(data.endog), sm.add_constant(np.asarray(data.exog))
+
+
+def _contaminated(nobs=400, frac=0.3, seed=987125):
+    rs = np.random.RandomState(seed)
+    exog = np.column_stack((np.ones(nobs), rs.randn(nobs, 3)))
+    params = np.array([1., 2., -1., 0.5])
+    endog = exog.dot(params) + rs.randn(nobs)
+    outl = np.arange(nobs) < int(frac * nobs)
+    # bad leverage points
+    endog[outl] += 20
+    exog[outl, 1] += 5
+    return endog, exog, params, outl
+
+
+def test_lts_stackloss():
+    endog, exog = _stackloss()
+    res = fast_lts(endog, exog, seed=0)
+    # global minimum of the LTS objective by exhaustive search over the
+    # subsets of h = 13 observations
+    assert_equal(res.h, 13)
+    assert_allclose(res.objective, 2.9323912461199715, rtol=1e-10)
+    assert_allclose(res.raw_params,
+                    [-37.3233265, 0.740921064, 0.391526723, 0.0111345398],
+                    rtol=1e-7)
+    # reweighted estimate is least squares without the outliers
+    mask = res.weights == 1
+    res_ols = sm.OLS(endog[mask], exog[mask]).fit()
+    assert_allclose(res.params, res_ols.params, rtol=1e-10)
+    assert np.all(res.weights[[0, 2, 3, 20]] == 0)
+
+
+def test_s_mm_stackloss():
+    endog, exog = _stackloss()
+    res = fast_s(endog, exog, seed=0)
+    # lmrob in R package robustbase
+    assert_allclose(res.scale, 1.912, rtol=1e-3)
+
+    mod = RLM(endog, exog, M=norms.TukeyBiweight(c=4.685))
+    res_mm = mod.fit(init='s', update_scale=False, tol=1e-12,
+                     init_kwds=dict(seed=0))
+    assert_allclose(res_mm.params, [-41.5246, 0.9388, 0.5796, -0.1129],
+                    atol=1e-4)
+    assert_allclose(res_mm.scale, res.scale, rtol=1e-10)
+    assert_equal(res_mm.fit_options['init'], 's')
+
+
+def test_contaminated():
+    endog, exog, params, outl = _contaminated()
+    res_ols = sm.OLS(endog, exog).fit()
+    assert np.abs(res_ols.params[1] - params[1]) > 1
+
+    res_lts = fast_lts(endog, exog, seed=1)
+    assert_allclose(res_lts.params, params, atol=0.2)
+    assert res_lts.weights[outl].max() == 0
+    assert_allclose(res_lts.scale, 1, rtol=0.15)
+
+    res_s = fast_s(endog, exog, seed=1)
+    assert_allclose(res_s.params, params, atol=0.2)
+    assert_allclose(res_s.weights[outl], 0)
+
+    mod = RLM(endog, exog, M=norms.TukeyBiweight())
+    res_mm = mod.fit(init='s', update_scale=False, init_kwds=dict(seed=1))
+    assert_allclose(res_mm.params, params, atol=0.2)
+    res_lts_start = mod.fit(init='lts', init_kwds=dict(seed=1))
+    assert_allclose(res_lts_start.params, params, atol=0.2)
+
+
+@pytest.mark.parametrize('func', [fast_lts, fast_s])
+def test_seed_executor(func):
+    endog, exog, params, outl = _contaminated(nobs=200)
+    res1 = func(endog, exog, seed=5, n_chunks=4)
+    res2 = func(endog, exog, seed=np.random.RandomState(5), n_chunks=4)
+    executor = _MapExecutor()
+    res3 = func(endog, exog, seed=5, n_chunks=4, executor=executor)
+    assert_equal(executor.ntasks, 4)
+    assert_equal(res2.params, res1.params)
+    assert_equal(res3.params, res1.params)
+    assert_equal(res3.scale, res1.scale)
+
+    # chunks only change which candidates are iterated to convergence
+    res4 = func(endog, exog, seed=5)
+    assert_allclose(res4.params, res1.params, rtol=1e-6)
+
+
+def test_rlm_start_params():
+    endog, exog, params, outl = _contaminated()
+    mod = RLM(endog, exog, M=norms.TukeyBiweight())
+    start = fast_s(endog, exog, seed=1)
+    res1 = mod.fit(start_params=start.params)
+    res2 = mod.fit(init='s', init_kwds=dict(seed=1))
+    assert_allclose(res1.params, res2.params, rtol=1e-6)
+    assert_allclose(res1.params, params, atol=0.2)
+
+    with pytest.raises(ValueError):
+        mod.fit(init='s', start_params=start.params)
+    with pytest.raises(ValueError):
+        mod.fit(init='lms')
@@ -32,8 +32,10 @@ missing:
 from __future__ import print_function
 from statsmodels.compat.python import iteritems, lrange, map, long
 import numpy as np
-from scipy import stats
+import pandas as pd
+from scipy import linalg, stats
 from statsmodels.regression.linear_model import OLS
+from statsmodels.tools.linalg import stacked_qr
 from statsmodels.tools.tools import add_constant
 from statsmodels.tsa.stattools import acf, adfuller
 from statsmodels.tsa.tsatools import lagmat
@@ -673,6 +675,411 @@ def het_white(resid, exog, retres=False):
     lmpval = stats.chi2.sf(lm, resols.df_model)
     return lm, lmpval, fval, fpval
 
+# batched versions for many series
+# ---------------------------------
+
+# number of series that are processed at the same time if the auxiliary
+# design differs across series
+_BATCH_CHUNKSIZE = 1024
+
+
+def _batch_input(resid):
+    """2-d residual array with series in columns, and column names"""
+    names = resid.columns if isinstance(resid, pd.DataFrame) else None
+    resid = np.asarray(resid, dtype=float)
+    if resid.ndim == 1:
+        resid = resid[:, None]
+    elif resid.ndim != 2:
+        raise ValueError('resid has to be 1-d or 2-d with series in columns')
+    return resid, names
+
+
+def _batch_lm_output(names, lm, lmpval, fval, fpval):
+    if names is None:
+        return lm, lmpval, fval, fpval
+    return pd.DataFrame(np.column_stack((lm, lmpval, fval, fpval)),
+                        index=names,
+                        columns=['lm', 'lm_pvalue', 'fvalue', 'f_pvalue'])
+
+
+def _ols_batch(endog, exog):
+    """OLS fit statistics of many dependent variables with a common design
+
+    The design is factorized once with a singular value decomposition.
+
+    Parameters
+    ----------
+    endog : ndarray, (nobs, nseries)
+    exog : ndarray, (nobs, k_vars)
+
+    Returns
+    -------
+    rsquared, fvalue, f_pvalue : ndarray, (nseries,)
+        as in RegressionResults for each column of endog
+    df_model, df_resid : float
+    """
+    # degrees of freedom and constant detection as in OLS
+    model = OLS(endog[:, 0], exog)
+    u, sv, _ = np.linalg.svd(exog, full_matrices=False)
+    rank = (sv > sv.max() * max(exog.shape) * np.finfo(float).eps).sum()
+    u = u[:, :rank]
+    model.rank = rank
+    df_model, df_resid = model.df_model, model.df_resid
+
+    resid = endog - u.dot(u.T.dot(endog))
+    ssr = np.einsum('ij,ij->j', resid, resid)
+    if model.k_constant:
+        endog_c = endog - endog.mean(0)
+        tss = np.einsum('ij,ij->j', endog_c, endog_c)
+    else:
+        tss = np.einsum('ij,ij->j', endog, endog)
+    rsquared = 1 - ssr / tss
+    fvalue = (tss - ssr) / df_model / (ssr / df_resid)
+    f_pvalue = stats.f.sf(fvalue, df_model, df_resid)
+    return rsquared, fvalue, f_pvalue, df_model, df_resid
+
+
+def _lag_regression_batch(y, lags, exog_basis=None):
+    """residual and total sum of squares of regressions on series own lags
+
+    Each series in the columns of y is regressed on a constant and on its own
+    lagged values. The constant, and optional common regressors, are
+    partialled out with the orthonormal basis ``exog_basis`` before the
+    lags of all series are factorized jointly with a stacked QR
+    decomposition.
+
+    Parameters
+    ----------
+    y : ndarray, (nobs, nseries)
+    lags : ndarray, (nobs, nseries, nlags)
+    exog_basis : None or ndarray, (nobs, rank)
+        orthonormal basis of the common regressors including the constant.
+        If None, then only the constant is partialled out.
+
+    Returns
+    -------
+    ssr, centered_tss : ndarray, (nseries,)
+    """
+    if exog_basis is None:
+        y_t = y - y.mean(0)
+        lags_t = lags - lags.mean(0)
+    else:
+        y_t = y - exog_basis.dot(exog_basis.T.dot(y))
+        lags_t = lags - np.einsum('ir,rjk->ijk', exog_basis,
+                                  np.einsum('ir,ijk->rjk', exog_basis, lags))
+    # stacked QR of the lags, series in the leading axis
+    lags_t = lags_t.transpose(1, 0, 2)
+    r, qty = stacked_qr(lags_t, y_t.T)
+    params = np.linalg.solve(r, qty[:, :r.shape[-1], None])[:, :, 0]
+    resid = y_t - np.einsum('jik,jk->ij', lags_t, params)
+    ssr = np.einsum('ij,ij->j', resid, resid)
+    y_c = y - y.mean(0)
+    centered_tss = np.einsum('ij,ij->j', y_c, y_c)
+    return ssr, centered_tss
+
+
+def acorr_ljungbox_batch(x, lags=None, boxpierce=False):
+    """
+    Ljung-Box test for no autocorrelation for many series
+
+    Parameters
+    ----------
+    x : array_like, 2d
+        data series in columns, regression residuals when used as diagnostic
+        test. A 1d array is treated as one series.
+    lags : None, int or array_like
+        lags for which the test is reported, see ``acorr_ljungbox``
+    boxpierce : {False, True}
+        If true, then additional to the results of the Ljung-Box test also the
+        Box-Pierce test results are returned
+
+    Returns
+    -------
+    lbvalue : ndarray, (nlags, nseries)
+        test statistic
+    pvalue : ndarray, (nlags, nseries)
+        p-value based on chi-square distribution
+    bpvalue : (optional), ndarray, (nlags, nseries)
+        test statistic for Box-Pierce test
+    bppvalue : (optional), ndarray, (nlags, nseries)
+        p-value based for Box-Pierce test on chi-square distribution
+
+    If x is a DataFrame, then the results are returned as a DataFrame with
+    one row for each series and lag.
+
+    Notes
+    -----
+    The results agree with ``acorr_ljungbox`` applied to each column. The
+    autocorrelations of all series are computed jointly.
+
+    See Also
+    --------
+    acorr_ljungbox
+    """
+    x, names = _batch_input(x)
+    nobs = x.shape[0]
+    if lags is None:
+        lags = np.arange(1, min((nobs // 2 - 2), 40) + 1)
+    elif isinstance(lags, (int, long)):
+        lags = np.arange(1, lags + 1)
+    lags = np.asarray(lags)
+    maxlag = max(lags)
+
+    xd = x - x.mean(0)
+    acov0 = np.einsum('ij,ij->j', xd, xd)
+    acfx = np.empty((maxlag, x.shape[1]))
+    for lag in range(1, maxlag + 1):
+        acfx[lag - 1] = np.einsum('ij,ij->j', xd[lag:], xd[:-lag]) / acov0
+    acf2 = acfx**2
+    acf2norm = acf2 / (nobs - np.arange(1, maxlag + 1))[:, None]
+    qljungbox = nobs * (nobs + 2) * np.cumsum(acf2norm, 0)[lags - 1]
+    pval = stats.chi2.sf(qljungbox, lags[:, None])
+    res = [qljungbox, pval]
+    if boxpierce:
+        qboxpierce = nobs * np.cumsum(acf2, 0)[lags - 1]
+        pvalbp = stats.chi2.sf(qboxpierce, lags[:, None])
+        res.extend([qboxpierce, pvalbp])
+
+    if names is None:
+        return tuple(res)
+    columns = ['lb_stat', 'lb_pvalue', 'bp_stat', 'bp_pvalue'][:len(res)]
+    index = pd.MultiIndex.from_product([names, lags], names=['series', 'lag'])
+    return pd.DataFrame(np.column_stack([r.T.ravel() for r in res]),
+                        index=index, columns=columns)
+
+
+def het_arch_batch(resid, maxlag=None):
+    '''Engle's test for ARCH for many series
+
+    Parameters
+    ----------
+    resid : array_like, 2d
+        residuals from an estimation, or time series, in columns. A 1d array
+        is treated as one series.
+    maxlag : int
+        highest lag to use. The default is the same as in ``het_arch``.
+
+    Returns
+    -------
+    lm : ndarray
+        Lagrange multiplier test statistic for each series
+    lmpval : ndarray
+        p-value for Lagrange multiplier test
+    fval : ndarray
+        fstatistic for F test, alternative version of the same test based on
+        F test for the parameter restriction
+    fpval : ndarray
+        pvalue for F test
+
+    If resid is a DataFrame, then the results are returned as a DataFrame
+    with one row for each series.
+
+    Notes
+    -----
+    The results agree with ``het_arch`` with ``autolag=None`` applied to each
+    column. Automatic lag selection is not available. The auxiliary
+    regressions are solved jointly for blocks of series with the normal
+    equations of the demeaned lags.
+
+    See Also
+    --------
+    het_arch
+    '''
+    resid, names = _batch_input(resid)
+    x = resid**2
+    nobs = x.shape[0]
+    if maxlag is None:
+        maxlag = int(np.ceil(12. * np.power(nobs/100., 1/4.)))
+
+    nobs_short = nobs - maxlag
+    ssr = np.empty(x.shape[1])
+    tss = np.empty(x.shape[1])
+    for start in range(0, x.shape[1], _BATCH_CHUNKSIZE):
+        xc = x[:, start:start + _BATCH_CHUNKSIZE]
+        lags = np.dstack([xc[maxlag - lag:nobs - lag]
+                          for lag in range(1, maxlag + 1)])
+        sl = slice(start, start + xc.shape[1])
+        ssr[sl], tss[sl] = _lag_regression_batch(xc[maxlag:], lags)
+
+    df_resid = nobs_short - maxlag - 1
+    fval = (tss - ssr) / maxlag / (ssr / df_resid)
+    fpval = stats.f.sf(fval, maxlag, df_resid)
+    lm = nobs_short * (1 - ssr / tss)
+    lmpval = stats.chi2.sf(lm, maxlag)
+    return _batch_lm_output(names, lm, lmpval, fval, fpval)
+
+
+def acorr_breusch_godfrey_batch(resid, exog=None, nlags=None):
+    '''Breusch Godfrey tests for residual autocorrelation for many series
+
+    Parameters
+    ----------
+    resid : array_like, 2d
+        residuals of regressions that have the same design matrix ``exog``,
+        in columns. A 1d array is treated as one series.
+    exog : None or array_like, 2d
+        explanatory variables of the regressions that produced the residuals.
+        If None, then only a constant is used in the auxiliary regressions.
+    nlags : int
+        Number of lags to include in the auxiliary regression. (nlags is
+        highest lag)
+
+    Returns
+    -------
+    lm : ndarray
+        Lagrange multiplier test statistic for each series
+    lmpval : ndarray
+        p-value for Lagrange multiplier test
+    fval : ndarray
+        fstatistic for F test, alternative version of the same test based on
+        F test for the parameter restriction
+    fpval : ndarray
+        pvalue for F test
+
+    If resid is a DataFrame, then the results are returned as a DataFrame
+    with one row for each series.
+
+    Notes
+    -----
+    The results agree with ``acorr_breusch_godfrey`` applied to the
+    regression results of each column. The common regressors are factorized
+    once and partialled out, only the small systems for the lagged residuals
+    differ across series.
+
+    See Also
+    --------
+    acorr_breusch_godfrey
+    '''
+    resid, names = _batch_input(resid)
+    nobs = resid.shape[0]
+    if nlags is None:
+        nlags = int(np.trunc(12. * np.power(nobs/100., 1/4.)))
+
+    if exog is None:
+        exog_aux = np.ones((nobs, 1))
+    else:
+        exog_aux = np.column_stack((np.asarray(exog, dtype=float),
+                                    np.ones(nobs)))
+    u, sv, _ = np.linalg.svd(exog_aux, full_matrices=False)
+    rank = (sv > sv.max() * max(exog_aux.shape) * np.finfo(float).eps).sum()
+    u = u[:, :rank]
+
+    ssr = np.empty(resid.shape[1])
+    tss = np.empty(resid.shape[1])
+    for start in range(0, resid.shape[1], _BATCH_CHUNKSIZE):
+        xc = resid[:, start:start + _BATCH_CHUNKSIZE]
+        # lagged residuals with zeros for the presample values
+        xpad = np.concatenate((np.zeros((nlags, xc.shape[1])), xc))
+        lags = np.dstack([xpad[nlags - lag:nlags - lag + nobs]
+                          for lag in range(1, nlags + 1)])
+        sl = slice(start, start + xc.shape[1])
+        ssr[sl], tss[sl] = _lag_regression_batch(xc, lags, exog_basis=u)
+
+    # the restricted model contains only the common regressors
+    u_resid = resid - u.dot(u.T.dot(resid))
+    ssr_restricted = np.einsum('ij,ij->j', u_resid, u_resid)
+    df_resid = nobs - rank - nlags
+    fval = (ssr_restricted - ssr) / nlags / (ssr / df_resid)
+    fpval = stats.f.sf(fval, nlags, df_resid)
+    lm = nobs * (1 - ssr / tss)
+    lmpval = stats.chi2.sf(lm, nlags)
+    return _batch_lm_output(names, lm, lmpval, fval, fpval)
+
+
+def het_breuschpagan_batch(resid, exog_het):
+    '''Breusch-Pagan Lagrange Multiplier test for many residual series
+
+    Parameters
+    ----------
+    resid : array_like, 2d
+        residuals in columns. A 1d array is treated as one series.
+    exog_het : array_like
+        This contains variables that might create data dependent
+        heteroscedasticity, common to all series.
+
+    Returns
+    -------
+    lm : ndarray
+        lagrange multiplier statistic for each series
+    lm_pvalue : ndarray
+        p-value of lagrange multiplier test
+    fvalue : ndarray
+        f-statistic of the hypothesis that the error variance does not depend
+        on x
+    f_pvalue : ndarray
+        p-value for the f-statistic
+
+    If resid is a DataFrame, then the results are returned as a DataFrame
+    with one row for each series.
+
+    Notes
+    -----
+    The results agree with ``het_breuschpagan`` applied to each column. The
+    auxiliary design is factorized only once.
+
+    See Also
+    --------
+    het_breuschpagan
+    '''
+    resid, names = _batch_input(resid)
+    x = np.asarray(exog_het)
+    nobs, nvars = x.shape
+    rsquared, fval, fpval, _, _ = _ols_batch(resid**2, x)
+    lm = nobs * rsquared
+    return _batch_lm_output(names, lm, stats.chi2.sf(lm, nvars - 1), fval,
+                            fpval)
+
+
+def het_white_batch(resid, exog):
+    '''White's Lagrange Multiplier test for many residual series
+
+    Parameters
+    ----------
+    resid : array_like, 2d
+        residuals in columns, square of it is used as endogenous variable.
+        A 1d array is treated as one series.
+    exog : array_like
+        possible explanatory variables for variance, common to all series.
+        Squares and interaction terms are included in the auxilliary
+        regression.
+
+    Returns
+    -------
+    lm : ndarray
+        lagrange multiplier statistic for each series
+    lm_pvalue : ndarray
+        p-value of lagrange multiplier test
+    fvalue : ndarray
+        f-statistic of the hypothesis that the error variance does not depend
+        on x. This is an alternative test variant not the original LM test.
+    f_pvalue : ndarray
+        p-value for the f-statistic
+
+    If resid is a DataFrame, then the results are returned as a DataFrame
+    with one row for each series.
+
+    Notes
+    -----
+    The results agree with ``het_white`` applied to each column. The
+    auxiliary design is factorized only once.
+
+    See Also
+    --------
+    het_white
+    '''
+    resid, names = _batch_input(resid)
+    x = np.asarray(exog)
+    if x.ndim == 1:
+        raise ValueError('x should have constant and at least one more variable')
+    nobs, nvars0 = x.shape
+    i0, i1 = np.triu_indices(nvars0)
+    exog = x[:, i0] * x[:, i1]
+    rsquared, fval, fpval, df_model, _ = _ols_batch(resid**2, exog)
+    lm = nobs * rsquared
+    lmpval = stats.chi2.sf(lm, df_model)
+    return _batch_lm_output(names, lm, lmpval, fval, fpval)
+
+
 def _het_goldfeldquandt2_old(y, x, idx, split=None, retres=False):
     '''test whether variance is the same in 2 subsamples
 
@@ -1100,6 +1507,98 @@ def _recursive_olsresiduals2(olsresults, skip):
             rcusum, rcusumci)
 
 
+def _qr_add_row(r, z, xrow, yrow):
+    '''update the QR factor r and z = Q'y in place for an additional row
+
+    The new row is eliminated with Givens rotations, O(nvars**2) operations.
+    '''
+    xrow = np.array(xrow, dtype=float)
+    for j in range(r.shape[0]):
+        if xrow[j] == 0:
+            continue
+        h = np.hypot(r[j, j], xrow[j])
+        c, s = r[j, j] / h, xrow[j] / h
+        rj = r[j, j:].copy()
+        r[j, j:] = c * rj + s * xrow[j:]
+        xrow[j:] = c * xrow[j:] - s * rj
+        z[j], yrow = c * z[j] + s * yrow, c * yrow - s * z[j]
+
+
+def _recursive_ls(endog, exog, skip, lamda=0.0):
+    '''recursive least squares, shared core of the recursive tests
+
+    The triangular factor R of the QR decomposition of the regressors,
+    R'R = X'X, and Q'y are updated with Givens rotations for each new
+    observation, and the parameters are solved from the updated factor, so
+    that each observation costs O(nvars**2) operations without forming the
+    inverse of X'X.
+
+    Parameters
+    ----------
+    endog : ndarray, (nobs,)
+    exog : ndarray, (nobs, nvars)
+    skip : int
+        number of observations used for the initial OLS estimate
+    lamda : float
+        weight for Ridge correction to initial X'X
+
+    Returns
+    -------
+    rresid, rparams, rypred, rvarraw : ndarray
+        as in recursive_olsresiduals, rvarraw is the variance factor of the
+        prediction error, ``1 + x_t (X'X)^{-1} x_t'`` with X'X based on the
+        observations before t. Elements before ``skip - 1`` are nan.
+    '''
+    y = endog
+    x = exog
+    nobs, nvars = x.shape
+    rparams = np.nan * np.zeros((nobs, nvars))
+    rresid = np.nan * np.zeros((nobs))
+    rypred = np.nan * np.zeros((nobs))
+    rvarraw = np.nan * np.zeros((nobs))
+
+    def solve(r, b, trans=0):
+        # triangular solve without the overhead of scipy.linalg wrappers
+        sol, info = linalg.lapack.dtrtrs(r, b, trans=trans)
+        if info > 0:
+            raise np.linalg.LinAlgError('Singular matrix')
+        return sol
+
+    #intialize with skip observations
+    x0 = x[:skip]
+    y0 = y[:skip]
+    #add Ridge to start (not in jplv), rows sqrt(lamda) * I add lamda I to X'X
+    if lamda != 0:
+        x0 = np.vstack((x0, np.sqrt(lamda) * np.eye(nvars)))
+        y0 = np.concatenate((y0, np.zeros(nvars)))
+    q, r0 = np.linalg.qr(x0)
+    r = np.zeros((nvars, nvars))
+    r[:r0.shape[0]] = r0
+    z = np.zeros(nvars)
+    z[:r0.shape[0]] = np.dot(q.T, y0)
+    beta = solve(r, z)
+    rparams[skip-1] = beta
+    rypred[skip-1] = np.dot(x[skip-1], beta)
+    rresid[skip-1] = y[skip-1] - rypred[skip-1]
+    u = solve(r, x[skip-1], trans=1)
+    rvarraw[skip-1] = 1 + np.dot(u, u)
+
+    for i in range(skip, nobs):
+        xi = x[i]
+        # x_t (X'X)^{-1} x_t' = u'u with R'u = x_t, X'X based on observations
+        # before t
+        u = solve(r, xi, trans=1)
+        ypred = np.dot(xi, beta)
+        rypred[i] = ypred
+        rresid[i] = y[i] - ypred
+        rvarraw[i] = 1 + np.dot(u, u)
+        _qr_add_row(r, z, xi, y[i])
+        beta = solve(r, z)
+        rparams[i] = beta
+
+    return rresid, rparams, rypred, rvarraw
+
+
 def recursive_olsresiduals(olsresults, skip=None, lamda=0.0, alpha=0.95):
     '''calculate recursive ols with residuals and cusum test statistic
 
@@ -1137,9 +1636,9 @@ def recursive_olsresiduals(olsresults, skip=None, lamda=0.0, alpha=0.95):
 
     Notes
     -----
-    It produces same recursive residuals as other version. This version updates
-    the inverse of the X'X matrix and does not require matrix inversion during
-    updating. looks efficient but no timing
+    It produces same recursive residuals as other version. The recursion
+    updates the QR factor of the regressors with Givens rotations, see
+    ``_recursive_ls``.
 
     Confidence interval in Greene and Brown, Durbin and Evans is the same as
     in Ploberger after a little bit of algebra.
@@ -1162,62 +1661,7 @@ def recursive_olsresiduals(olsresults, skip=None, lamda=0.0, alpha=0.95):
     nobs, nvars = x.shape
     if skip is None:
         skip = nvars
-    rparams = np.nan * np.zeros((nobs,nvars))
-    rresid = np.nan * np.zeros((nobs))
-    rypred = np.nan * np.zeros((nobs))
-    rvarraw = np.nan * np.zeros((nobs))
-
-
-    #intialize with skip observations
-    x0 = x[:skip]
-    y0 = y[:skip]
-    #add Ridge to start (not in jplv
-    XTXi = np.linalg.inv(np.dot(x0.T, x0)+lamda*np.eye(nvars))
-    XTY = np.dot(x0.T, y0) #xi * y   #np.dot(xi, y)
-    #beta = np.linalg.solve(XTX, XTY)
-    beta = np.dot(XTXi, XTY)
-    #print('beta', beta
-    rparams[skip-1] = beta
-    yipred = np.dot(x[skip-1], beta)
-    rypred[skip-1] = yipred
-    rresid[skip-1] = y[skip-1] - yipred
-    rvarraw[skip-1] = 1 + np.dot(x[skip-1],np.dot(XTXi, x[skip-1]))
-    for i in range(skip,nobs):
-        xi = x[i:i+1,:]
-        yi = y[i]
-        #xxT = np.dot(xi.T, xi)  #xi is 2d 1 row
-        xy = (xi*yi).ravel() # XTY is 1d  #np.dot(xi, yi)   #np.dot(xi, y)
-        #print(xy.shape, XTY.shape
-        #print(XTX
-        #print(XTY
-
-        # get prediction error with previous beta
-        yipred = np.dot(xi, beta)
-        rypred[i] = yipred
-        residi = yi - yipred
-        rresid[i] = residi
-
-        #update beta and inverse(X'X)
-        tmp = np.dot(XTXi, xi.T)
-        ft = 1 + np.dot(xi, tmp)
-
-        XTXi = XTXi - np.dot(tmp,tmp.T) / ft  #BigJudge equ 5.5.15
-
-        #print('beta', beta
-        beta = beta + (tmp*residi / ft).ravel()  #BigJudge equ 5.5.14
-#        #version for testing
-#        XTY += xy
-#        beta = np.dot(XTXi, XTY)
-#        print((tmp*yipred / ft).shape
-#        print('tmp.shape, ft.shape, beta.shape', tmp.shape, ft.shape, beta.shape
-        rparams[i] = beta
-        rvarraw[i] = ft
-
-
-
-    i = nobs
-    #beta = np.linalg.solve(XTX, XTY)
-    #rparams[i] = beta
+    rresid, rparams, rypred, rvarraw = _recursive_ls(y, x, skip, lamda=lamda)
 
     rresid_scaled = rresid/np.sqrt(rvarraw)   #this is N(0,sigma2) distributed
     nrr = nobs-skip
@@ -1355,6 +1799,139 @@ def breaks_cusumolsresid(olsresidual, ddof=0):
     pval = stats.kstwobign.sf(sup_b)
     return sup_b, pval, crit
 
+def breaks_cusumsq(olsresults, skip=None):
+    '''cusum of squares test for parameter stability, recursive residuals
+
+    Parameters
+    ----------
+    olsresults : instance of RegressionResults
+        uses only endog and exog
+    skip : int or None
+        number of observations to use for initial OLS, if None then skip is
+        set equal to the number of regressors (columns in exog)
+
+    Returns
+    -------
+    sup_d : float
+        test statistic, maximum absolute deviation of the cusum of squares
+        from its expected value under the null
+    pval : float
+        asymptotic p-value, see Notes
+    cusumsq : ndarray
+        cumulative sum of squared recursive residuals divided by the sum over
+        all recursive residuals, for observations ``skip`` to ``nobs - 1``
+    expected : ndarray
+        expected value of ``cusumsq`` under the null of no structural change
+
+    Notes
+    -----
+    The p-value uses that ``sqrt(m / 2) * sup_d``, where m is the number of
+    recursive residuals, converges to the supremum of the absolute value of a
+    Brownian Bridge if the errors are normally distributed. Brown, Durbin and
+    Evans tabulate exact small sample critical values.
+
+    References
+    ----------
+    Brown, R. L., J. Durbin, and J. M. Evans. “Techniques for Testing the
+    Constancy of Regression Relationships over Time.”
+    Journal of the Royal Statistical Society. Series B (Methodological) 37,
+    no. 2 (1975): 149-192.
+
+    '''
+    y = olsresults.model.endog
+    x = olsresults.model.exog
+    nobs, nvars = x.shape
+    if skip is None:
+        skip = nvars
+    rresid, _, _, rvarraw = _recursive_ls(y, x, skip)
+    rresid_scaled = rresid[skip:] / np.sqrt(rvarraw[skip:])
+    cumsq = np.cumsum(rresid_scaled**2)
+    cusumsq = cumsq / cumsq[-1]
+    nrr = nobs - skip
+    expected = np.arange(1, nrr + 1) / float(nrr)
+    sup_d = np.abs(cusumsq - expected).max()
+    pval = stats.kstwobign.sf(np.sqrt(nrr / 2.) * sup_d)
+    return sup_d, pval, cusumsq, expected
+
+
+def _recursive_ssr(endog, exog):
+    '''residual sum of squares of OLS on the first t observations
+
+    Element t - 1 is the ssr of the first t observations, it is nan for
+    t < nvars. This uses that the ssr increases by the squared scaled
+    recursive residual of each new observation.
+    '''
+    nobs, nvars = exog.shape
+    rresid, _, _, rvarraw = _recursive_ls(endog, exog, nvars)
+    ssr = np.nan * np.zeros(nobs)
+    # the initial estimate fits the first nvars observations exactly
+    ssr[nvars - 1] = 0
+    ssr[nvars:] = np.cumsum(rresid[nvars:]**2 / rvarraw[nvars:])
+    return ssr
+
+
+def breaks_supf(olsresults, trim=0.15):
+    '''Chow tests for a structural break at all candidate break points
+
+    Parameters
+    ----------
+    olsresults : instance of RegressionResults
+        uses only the whitened endog and exog, wendog and wexog, of the
+        model, so that the test for WLS and GLS is based on the weighted
+        residual sums of squares
+    trim : float in [0, 0.5)
+        fraction of observations at the beginning and at the end of the
+        sample that are excluded as break points. Both subsamples have at
+        least as many observations as regressors.
+
+    Returns
+    -------
+    supf : float
+        maximum of the Chow F statistics over the candidate break points
+    breakpoint : int
+        index of the first observation of the second regime at the maximum
+    fvalues : ndarray, (nobs,)
+        Chow F statistic for a break before observation t, nan if t is not
+        a candidate break point
+
+    Notes
+    -----
+    The residual sums of squares of all subsamples that start at the first
+    or end at the last observation follow from a forward and a backward
+    recursive least squares pass, so that all Chow statistics are computed
+    in one pass each.
+
+    The F distribution of the Chow statistic is only valid for a known break
+    point. The maximum over break points has the non-standard distribution
+    derived in Andrews (1993), p-values for it are not available yet.
+
+    References
+    ----------
+    Andrews, Donald W. K. “Tests for Parameter Instability and Structural
+    Change With Unknown Change Point.” Econometrica 61, no. 4 (1993):
+    821-856.
+
+    '''
+    y = olsresults.model.wendog
+    x = olsresults.model.wexog
+    nobs, nvars = x.shape
+    # ssr of observations before t, and of observations t and after, the
+    # last forward element is the ssr of the full sample
+    ssr_fwd = _recursive_ssr(y, x)
+    ssr_full = ssr_fwd[-1]
+    ssr1 = np.r_[np.nan, ssr_fwd[:-1]]
+    ssr2 = _recursive_ssr(y[::-1], x[::-1])[::-1]
+
+    low = max(nvars, int(np.floor(trim * nobs)))
+    upp = min(nobs - nvars, int(np.ceil((1 - trim) * nobs)))
+    fvalues = np.nan * np.zeros(nobs)
+    ssr_u = ssr1[low:upp + 1] + ssr2[low:upp + 1]
+    df_resid = nobs - 2 * nvars
+    fvalues[low:upp + 1] = ((ssr_full - ssr_u) / nvars) / (ssr_u / df_resid)
+    breakpoint = np.nanargmax(fvalues)
+    return fvalues[breakpoint], breakpoint, fvalues
+
+
 #def breaks_cusum(recolsresid):
 #    '''renormalized cusum test for parameter stability based on recursive residuals
 #
@@ -1287,6 +1287,98 @@ def tukeyhsd(mean_all, nobs_all, var_all, df=None, alpha=0.05, q_crit=None):
     return (idx1, idx2), reject, meandiffs, std_pairs, confint, q_crit, \
            df_total, reject2
 
+def tukeyhsd_batch(data, groups, alpha=0.05):
+    '''Tukey HSD for all pairs of groups for each column of data
+
+    This is a vectorized version of MultiComparison.tukeyhsd for many
+    response variables that share the same groups.  The group means are
+    computed with a single pass of group sums over all columns, and the
+    p-values of the studentized range statistic are computed for all pairs
+    and columns at once.
+
+    Parameters
+    ----------
+    data : array_like, 1-D or 2-D
+        response variables with observations in rows
+    groups : array_like, 1-D
+        group labels for each observation, can be string or integers
+    alpha : float
+        Value of FWER at which to calculate HSD.
+
+    Returns
+    -------
+    res : Bunch
+        An object with the following attributes. Arrays with results for
+        all pairs have the pairs in rows and the columns of data in columns.
+
+        - groupsunique : the sorted unique group labels
+        - pairindices : tuple of index arrays of the first and second
+          group of each pair in groupsunique
+        - groupmeans : array (n_groups, n_columns) of group means
+        - groupnobs : array of the number of observations in each group
+        - variance : within group variance of each column
+        - df_total : degrees of freedom of the within group variance
+        - meandiffs : difference of the second minus the first group mean
+        - std_pairs : standard error of the studentized range statistic
+        - q_crit : critical value of the studentized range distribution
+        - confint : array (n_pairs, n_columns, 2) of the lower and upper
+          simultaneous confidence limits
+        - reject : boolean array, True if the hypothesis of equal means is
+          rejected at level alpha
+        - pvalues : p-values of the studentized range statistic
+
+    Notes
+    -----
+    The p-values are based on the approximation of the studentized range
+    distribution in `statsmodels.stats.libqsturng.psturng` and are bound
+    between 0.001 and 0.9.
+
+    See Also
+    --------
+    MultiComparison.tukeyhsd
+    '''
+    from statsmodels.tools.grouputils import group_sums
+    from statsmodels.tools.tools import Bunch
+    from statsmodels.stats.libqsturng import qsturng, psturng
+
+    data = np.asarray(data, dtype=float)
+    if data.ndim == 1:
+        data = data[:, None]
+    groupsunique, groupintlab = np.unique(np.asarray(groups),
+                                          return_inverse=True)
+    if len(data) != len(groupintlab):
+        raise ValueError('data has %d rows and groups has %d elements' %
+                         (len(data), len(groupintlab)))
+    n_groups = len(groupsunique)
+    if n_groups < 2:
+        raise ValueError('2 or more groups required for multiple comparisons')
+
+    gnobs = np.bincount(groupintlab).astype(float)
+    gmeans = group_sums(data, groupintlab).T / gnobs[:, None]
+    resid = data - gmeans[groupintlab]
+    df_total = len(data) - n_groups
+    var_ = np.einsum('ij,ij->j', resid, resid) / df_total
+    del resid
+
+    idx1, idx2 = np.triu_indices(n_groups, 1)
+    meandiffs = gmeans[idx2] - gmeans[idx1]
+    var_pairs = varcorrection_pairs_unbalanced(gnobs, srange=True)[idx1, idx2]
+    std_pairs = np.sqrt(var_pairs[:, None] * var_)
+
+    q_crit = qsturng(1 - alpha, n_groups, df_total)
+    st_range = np.abs(meandiffs) / std_pairs
+    pvalues = np.asarray(psturng(st_range, n_groups, df_total))
+    pvalues = pvalues.reshape(st_range.shape)
+    crit_int = std_pairs * q_crit
+    confint = np.stack((meandiffs - crit_int, meandiffs + crit_int), axis=-1)
+
+    return Bunch(groupsunique=groupsunique, pairindices=(idx1, idx2),
+                 groupmeans=gmeans, groupnobs=gnobs, variance=var_,
+                 df_total=df_total, meandiffs=meandiffs, std_pairs=std_pairs,
+                 q_crit=q_crit, confint=confint, reject=st_range > q_crit,
+                 pvalues=pvalues)
+
+
 def simultaneous_ci(q_crit, var, groupnobs, pairindices=None):
     """Compute simultaneous confidence intervals for comparison of means.
 
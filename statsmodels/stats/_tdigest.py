@@ -0,0 +1,169 @@
+"""
+Mergeable sketch for approximate weighted quantiles
+
+The sketch is a merging t-digest (Dunning and Ertl).  The data are
+summarized by a sorted set of centroids, weighted means of adjacent
+observations.  Centroids are small in the tails and larger in the center of
+the distribution, so that the relative accuracy of extreme quantiles is
+high.  Observations are collected in a buffer that is merged into the
+centroids when it is full; the merge is a sort followed by a vectorized
+assignment of the sorted values to clusters.
+
+References
+----------
+Dunning, T. and O. Ertl (2019). Computing extremely accurate quantiles using
+t-digests. arXiv:1902.04023.
+"""
+import numpy as np
+
+
+class TDigest(object):
+    """
+    Approximate weighted quantiles of a data stream
+
+    Parameters
+    ----------
+    compression : float
+        Compression parameter delta.  The sketch keeps at most about
+        `compression` centroids.  The error in the cumulative probability of
+        an estimated quantile at probability p is at most approximately
+        ``pi * sqrt(p * (1 - p)) / compression`` and usually much smaller.
+    buffer_size : int
+        Number of observations that are collected before they are merged
+        into the centroids.  Larger buffers are faster and use more memory.
+
+    Attributes
+    ----------
+    total_weight : float
+        sum of the weights of all observations
+    min, max : float
+        smallest and largest observation
+
+    Notes
+    -----
+    Observations that are nan are ignored.
+    """
+
+    def __init__(self, compression=200, buffer_size=8192):
+        if compression < 1:
+            raise ValueError('compression has to be at least 1')
+        self.compression = compression
+        self.buffer_size = int(buffer_size)
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.total_weight = 0.
+        self.min = np.inf
+        self.max = -np.inf
+        self._buffer = []
+        self._nbuffer = 0
+
+    def update(self, x, weights=None):
+        """
+        Add observations to the sketch
+
+        Parameters
+        ----------
+        x : array_like
+            observations, flattened
+        weights : None or array_like
+            weights with the same number of elements as `x`.  If None, then
+            all observations have weight one.
+
+        Returns
+        -------
+        self : TDigest
+        """
+        x = np.asarray(x, dtype=float).ravel()
+        if weights is None:
+            weights = np.ones(x.shape[0])
+        else:
+            weights = np.asarray(weights, dtype=float).ravel()
+            if weights.shape != x.shape:
+                raise ValueError('x and weights need to have the same '
+                                 'number of elements')
+        # process large inputs in blocks to bound the temporary memory
+        for start in range(0, x.shape[0], self.buffer_size):
+            xb = x[start:start + self.buffer_size]
+            wb = weights[start:start + self.buffer_size]
+            mask = (wb != 0) & ~np.isnan(xb)
+            if not mask.all():
+                xb = xb[mask]
+                wb = wb[mask]
+            if xb.shape[0] == 0:
+                continue
+            self._add(xb, wb)
+        return self
+
+    def merge(self, other):
+        """
+        Add the observations summarized by another sketch
+
+        Parameters
+        ----------
+        other : TDigest
+
+        Returns
+        -------
+        self : TDigest
+            this instance updated in place, `other` is not changed
+        """
+        other._compress()
+        if other.total_weight != 0:
+            self._add(other.means, other.weights, other.min, other.max)
+        return self
+
+    def _add(self, x, weights, xmin=None, xmax=None):
+        self._buffer.append((x, weights))
+        self._nbuffer += x.shape[0]
+        self.total_weight += weights.sum()
+        self.min = min(self.min, x.min() if xmin is None else xmin)
+        self.max = max(self.max, x.max() if xmax is None else xmax)
+        if self._nbuffer >= self.buffer_size:
+            self._compress()
+
+    def _compress(self):
+        if not self._buffer:
+            return
+        x = np.concatenate([self.means] + [b[0] for b in self._buffer])
+        w = np.concatenate([self.weights] + [b[1] for b in self._buffer])
+        self._buffer = []
+        self._nbuffer = 0
+
+        order = np.argsort(x, kind='mergesort')
+        x = x[order]
+        w = w[order]
+        cw = np.cumsum(w)
+        q = (cw - w / 2) / cw[-1]
+        # scale function k_1, centroids cover at most one unit of k
+        k = self.compression * (np.arcsin(2 * q - 1) / np.pi + 0.5)
+        cluster = np.floor(k)
+        starts = np.r_[0, np.flatnonzero(np.diff(cluster)) + 1]
+        weights = np.add.reduceat(w, starts)
+        self.means = np.add.reduceat(w * x, starts) / weights
+        self.weights = weights
+
+    def quantile(self, probs):
+        """
+        Approximate quantiles
+
+        Parameters
+        ----------
+        probs : array_like
+            probability points in [0, 1]
+
+        Returns
+        -------
+        quantiles : ndarray
+            estimated quantiles with the shape of `probs`, nan if the sketch
+            is empty
+        """
+        probs = np.asarray(probs, dtype=float)
+        self._compress()
+        if self.total_weight == 0:
+            return np.nan * np.ones(probs.shape)
+        # piecewise linear interpolation between the centroid means placed
+        # at the center of their weight, and the extremes at 0 and 1
+        center = np.cumsum(self.weights) - self.weights / 2
+        xp = np.r_[0, center, self.total_weight]
+        fp = np.r_[self.min, self.means, self.max]
+        return np.interp(probs * self.total_weight, xp, fp)
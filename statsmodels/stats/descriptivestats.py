@@ -127,8 +127,8 @@ class Describe(object):
         self._columns_list = None
 
     def _percentiles(self,x):
-        p = [stats.scoreatpercentile(x,per) for per in
-             (1,5,10,25,50,75,90,95,99)]
+        # one partial sort (selection) for all percentiles
+        p = list(np.percentile(x, (1,5,10,25,50,75,90,95,99)))
         return p
     def _mode_val(self,x):
         return stats.mode(x)[0][0]
@@ -215,14 +215,13 @@ class Describe(object):
         #hack around percentiles multiple output
 
         #bad naming
-        import scipy.stats
         #BUG: the following has all per the same per=99
         ##perdict = dict(('perc_%2d'%per, [lambda x:
         #       scipy.stats.scoreatpercentile(x, per), None, None])
         ##          for per in (1,5,10,25,50,75,90,95,99))
 
         def _fun(per):
-            return lambda x: scipy.stats.scoreatpercentile(x, per)
+            return lambda x: np.percentile(x, per)
 
         perdict = dict(('perc_%02d' % per, [_fun(per), None, None])
                        for per in (1,5,10,25,50,75,90,95,99))
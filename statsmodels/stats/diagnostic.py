@@ -1,12 +1,15 @@
 #collect some imports of verified (at least one example) functions
 from statsmodels.sandbox.stats.diagnostic import (
-    acorr_ljungbox, breaks_cusumolsresid, breaks_hansen, CompareCox, CompareJ,
+    acorr_ljungbox, breaks_cusumolsresid, breaks_hansen, breaks_cusumsq,
+    breaks_supf, CompareCox, CompareJ,
     compare_cox, compare_j, het_breuschpagan, HetGoldfeldQuandt,
     het_goldfeldquandt, het_arch,
     het_white, recursive_olsresiduals, acorr_breusch_godfrey,
     linear_harvey_collier, linear_rainbow, linear_lm,
     unitroot_adf,
-    het_breushpagan, acorr_breush_godfrey  # deprecated because of misspelling
+    het_breushpagan, acorr_breush_godfrey,  # deprecated because of misspelling
+    acorr_ljungbox_batch, het_arch_batch, acorr_breusch_godfrey_batch,
+    het_breuschpagan_batch, het_white_batch
     )
 
 from ._lilliefors import (kstest_fit, lilliefors, lillifors, kstest_normal,
@@ -30,6 +30,8 @@ import numpy as np
 
 from scipy.optimize import fminbound
 
+from statsmodels.tools.rootfinding import root_bracket_vec
+
 inf = np.inf
 
 __version__ = '0.2.3'
@@ -791,7 +793,7 @@ def qsturng(p, r, v):
 
     if all(map(_isfloat, [p, r, v])):
         return _qsturng(p, r, v)
-    return _vqsturng(p, r, v)
+    return _qsturng_vec(p, r, v)
 
 ##def _qsturng0(p, r, v):
 ####    print 'q0',p
@@ -872,7 +874,297 @@ def psturng(q, r, v):
     """
     if all(map(_isfloat, [q, r, v])):
         return _psturng(q, r, v)
-    return _vpsturng(q, r, v)
+    return _psturng_vec(q, r, v)
+
+
+# Vectorized versions
+# -------------------
+# The functions below mirror the scalar implementation above operation by
+# operation for arrays of p, r and v, using arrays of the table
+# coefficients and boolean masks instead of branches.
+
+_p_keys_arr = np.array(p_keys)
+_v_keys_arr = np.array([1.] + v_keys)
+_A_arr = np.empty((len(p_keys), len(_v_keys_arr), 4))
+_A_arr.fill(np.nan)
+for (_p, _v), _a in A.items():
+    _A_arr[np.searchsorted(_p_keys_arr, _p),
+           np.searchsorted(_v_keys_arr, _v)] = _a
+del _p, _v, _a
+
+# break points and interpolation points of _select_ps
+_ps_breaks = np.array([.500, .675, .7625, .825, .875, .9125, .95, .975, .99])
+_ps_points = np.array([(.100, .500, .675), (.500, .675, .750),
+                       (.675, .750, .800), (.750, .800, .850),
+                       (.800, .850, .900), (.850, .900, .950),
+                       (.900, .950, .975), (.950, .975, .990),
+                       (.975, .990, .995), (.990, .995, .999)])
+
+_phi_a = (-3.969683028665376e+01,  2.209460984245205e+02,
+          -2.759285104469687e+02,  1.383577518672690e+02,
+          -3.066479806614716e+01,  2.506628277459239e+00)
+_phi_b = (-5.447609879822406e+01,  1.615858368580409e+02,
+          -1.556989798598866e+02,  6.680131188771972e+01,
+          -1.328068155288572e+01, 1.)
+_phi_c = (-7.784894002430293e-03, -3.223964580411365e-01,
+          -2.400758277161838e+00, -2.549732539343734e+00,
+          4.374664141464968e+00,  2.938163982698783e+00)
+_phi_d = (7.784695709041462e-03,  3.224671290700398e-01,
+          2.445134137142996e+00,  3.754408661907416e+00, 1.)
+
+
+def _phi_vec(p):
+    """vector version of _phi"""
+    p = np.asarray(p, dtype=float)
+    if np.any((p <= 0) | (p >= 1)):
+        raise ValueError("Argument to ltqnorm must be in open interval (0,1)")
+
+    plow = 0.02425
+    lower = p < plow
+    upper = 1 - plow < p
+    central = ~(lower | upper)
+    out = np.empty(p.shape)
+
+    q = np.sqrt(-2 * np.log(p[lower]))
+    out[lower] = -np.polyval(_phi_c, q) / np.polyval(_phi_d, q)
+    q = np.sqrt(-2 * np.log(1 - p[upper]))
+    out[upper] = np.polyval(_phi_c, q) / np.polyval(_phi_d, q)
+    q = p[central] - 0.5
+    r = q * q
+    out[central] = -np.polyval(_phi_a, r) * q / np.polyval(_phi_b, r)
+    return out
+
+
+def _ptransform_vec(p):
+    """vector version of _ptransform"""
+    return -1. / (1. + 1.5 * _phi_vec((1. + p)/2.))
+
+
+def _table_vec(p, v):
+    """coefficients of the A table for arrays of tabled p and v"""
+    return _A_arr[np.searchsorted(_p_keys_arr, p),
+                  np.searchsorted(_v_keys_arr, v)]
+
+
+def _func_vec(a, p, r, v):
+    """vector version of _func, a has the coefficients in the last axis"""
+    log_r = np.log(r - 1.)
+    f = a[..., 0]*log_r + a[..., 1]*log_r**2 + \
+        a[..., 2]*log_r**3 + a[..., 3]*log_r**4
+
+    r3 = (r == 3)
+    if np.any(r3):
+        v_ = np.where(np.isinf(v), 1e38, v)
+        corr = -0.002 / (1. + 12. * _phi_vec(p)**2)
+        corr += np.where(v_ <= 4.364, 1. / 517. - 1. / (312. * v_),
+                         1. / (191. * v_))
+        f = f + np.where(r3, corr, 0.)
+
+    return -f
+
+
+def _quad_interp_vec(x, x0, x1, x2, y0, y1, y2, forward):
+    """quadratic interpolation through 3 points as used by qsturng"""
+    d2 = 2*((y2-y1)/(x2-x1) - (y1-y0)/(x1-x0))/(x2-x0)
+    d1 = np.where(forward, (y2-y1)/(x2-x1) - 0.5*d2*(x2-x1),
+                  (y1-y0)/(x1-x0) + 0.5*d2*(x1-x0))
+    return (d2/2.) * (x-x1)**2. + d1 * (x-x1) + y1
+
+
+def _select_vs_vec(v, p):
+    """vector version of _select_vs"""
+    conds = [v >= 120., v >= 60., v >= 40., v >= 30., v >= 24., v >= 19.5,
+             (p >= .9) & (v < 2.5), (p < .9) & (v < 3.5)]
+    vi = np.round(np.where(np.isinf(v), 0, v))
+    v0 = np.select(conds, [60, 40, 30, 24, 20, 19, 1, 2], vi - 1)
+    v1 = np.select(conds, [120, 60, 40, 30, 24, 20, 2, 3], vi)
+    v2 = np.select(conds, [inf, 120, 60, 40, 30, 24, 3, 4], vi + 1)
+    return v0.astype(float), v1.astype(float), v2.astype(float)
+
+
+def _interpolate_p_vec(p, r, v):
+    """vector version of _interpolate_p, v has to be in the table"""
+    idx = np.searchsorted(_ps_breaks, p, side='right')
+    # the table for v = 1 starts at p = .9, the scalar version fails for
+    # .9 < p < .9125 because .85 is not available
+    idx[(v == 1) & (idx < 6)] = 6
+    p0, p1, p2 = _ps_points[idx].T
+
+    y0 = _func_vec(_table_vec(p0, v), p0, r, v) + 1.
+    y1 = _func_vec(_table_vec(p1, v), p1, r, v) + 1.
+    y2 = _func_vec(_table_vec(p2, v), p2, r, v) + 1.
+
+    y = np.empty(p.shape)
+    forward = (p2+p0) >= (p1+p1)
+
+    # quadratic interpolation in log(y + r/v), for p > .85 in
+    # transformed p
+    mask = p > .5
+    if np.any(mask):
+        rv = r[mask] / v[mask]
+        y_log0 = np.log(y0[mask] + rv)
+        y_log1 = np.log(y1[mask] + rv)
+        y_log2 = np.log(y2[mask] + rv)
+        pm, p0m, p1m, p2m = p[mask], p0[mask], p1[mask], p2[mask]
+        trans = pm > .85
+        if np.any(trans):
+            pm = np.where(trans, _ptransform_vec(pm), pm)
+            p0m = np.where(trans, _ptransform_vec(p0m), p0m)
+            p1m = np.where(trans, _ptransform_vec(p1m), p1m)
+            p2m = np.where(trans, _ptransform_vec(p2m), p2m)
+        y_log = _quad_interp_vec(pm, p0m, p1m, p2m, y_log0, y_log1, y_log2,
+                                 forward[mask])
+        y[mask] = np.exp(y_log) - rv
+
+    # linear interpolation in q and p
+    mask = ~mask
+    if np.any(mask):
+        pm, p0m, p1m = p[mask], p0[mask], p1[mask]
+        vm = np.minimum(v[mask], 1e38)
+        q0 = math.sqrt(2) * -y0[mask] * scipy.stats.t.isf((1.+p0m)/2., vm)
+        q1 = math.sqrt(2) * -y1[mask] * scipy.stats.t.isf((1.+p1m)/2., vm)
+        d1 = (q1-q0)/(p1m-p0m)
+        q = d1 * (pm-p0m) + q0
+        y[mask] = -q / (math.sqrt(2) * scipy.stats.t.isf((1.+pm)/2., vm))
+
+    return y
+
+
+def _interpolate_v_vec(p, r, v):
+    """vector version of _interpolate_v, p has to be in the table"""
+    v0, v1, v2 = _select_vs_vec(v, p)
+
+    y0_sq = (_func_vec(_table_vec(p, v0), p, r, v0) + 1.)**2.
+    y1_sq = (_func_vec(_table_vec(p, v1), p, r, v1) + 1.)**2.
+    y2_sq = (_func_vec(_table_vec(p, v2), p, r, v2) + 1.)**2.
+
+    v2 = np.minimum(v2, 1e38)
+    v_, v0_, v1_, v2_ = 1./v, 1./v0, 1./v1, 1./v2
+    y_sq = _quad_interp_vec(v_, v0_, v1_, v2_, y0_sq, y1_sq, y2_sq,
+                            (v2_ + v0_) >= (v1_ + v1_))
+    return np.sqrt(y_sq)
+
+
+def _interpolate_pv_vec(p, r, v):
+    """interpolation in p and v if neither is in the table"""
+    v0, v1, v2 = _select_vs_vec(v, p)
+
+    r0_sq = _interpolate_p_vec(p, r, v0)**2
+    r1_sq = _interpolate_p_vec(p, r, v1)**2
+    r2_sq = _interpolate_p_vec(p, r, v2)**2
+
+    v_, v0_, v1_, v2_ = 1./v, 1./v0, 1./v1, 1./v2
+    y_sq = _quad_interp_vec(v_, v0_, v1_, v2_, r0_sq, r1_sq, r2_sq,
+                            (v2_ + v0_) >= (v1_ + v1_))
+    return np.sqrt(y_sq)
+
+
+def _qsturng_vec(p, r, v):
+    """vector version of qsturng, returns an array with the broadcast shape
+    of p, r and v
+    """
+    p, r, v = np.broadcast_arrays(np.asarray(p, dtype=float),
+                                  np.asarray(r, dtype=float),
+                                  np.asarray(v, dtype=float))
+    shape = p.shape
+    p, r, v = p.ravel(), r.ravel(), v.ravel()
+
+    if np.any((p < .1) | (p > .999)):
+        raise ValueError('p must be between .1 and .999')
+    if np.any((p < .9) & (v < 2)):
+        raise ValueError('v must be > 2 when p < .9')
+    if np.any(v < 1):
+        raise ValueError('v must be > 1 when p >= .9')
+    if np.any(r <= 1):
+        raise ValueError('r must be > 1')
+
+    p_in = np.in1d(p, _p_keys_arr)
+    v_in = np.in1d(v, v_keys) | ((v == 1) & (p >= .9))
+
+    y = np.empty(p.shape)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for mask, func in [(p_in & v_in, None),
+                           (~p_in & ~v_in, _interpolate_pv_vec),
+                           (p_in & ~v_in, _interpolate_v_vec),
+                           (~p_in & v_in, _interpolate_p_vec)]:
+            if not np.any(mask):
+                continue
+            if func is None:
+                y[mask] = _func_vec(_table_vec(p[mask], v[mask]), p[mask],
+                                    r[mask], v[mask]) + 1.
+            else:
+                y[mask] = func(p[mask], r[mask], v[mask])
+
+    v = np.minimum(v, 1e38)
+    q = math.sqrt(2) * -y * scipy.stats.t.isf((1. + p) / 2., v)
+    return q.reshape(shape)
+
+
+def _group_index(*arrays):
+    """integer labels of the unique combinations of values in 1-d arrays"""
+    order = np.lexsort(arrays[::-1])
+    change = np.zeros(len(order), bool)
+    for arr in arrays:
+        change[1:] |= arr[order][1:] != arr[order][:-1]
+    labels = np.empty(len(order), int)
+    labels[order] = np.cumsum(change)
+    return labels, order[np.r_[True, change[1:]]]
+
+
+def _psturng_vec(q, r, v):
+    """vector version of psturng, returns an array with the broadcast shape
+    of q, r and v
+
+    The quantile function is inverted with a vectorized bracketing root
+    finder.  The brackets are narrowed on a grid of probabilities for each
+    distinct pair of r and v if the grid evaluation is cheaper than
+    starting from the full range.
+    """
+    q, r, v = np.broadcast_arrays(np.asarray(q, dtype=float),
+                                  np.asarray(r, dtype=float),
+                                  np.asarray(v, dtype=float))
+    shape = q.shape
+    q, r, v = q.ravel(), r.ravel(), v.ravel()
+    if np.any(q < 0.):
+        raise ValueError('q should be >= 0')
+
+    p_low = np.where(v == 1, .9, .1)
+    p_upp = np.ones(q.shape) * .999
+    q_low = _qsturng_vec(p_low, r, v)
+    q_upp = _qsturng_vec(p_upp, r, v)
+
+    res = np.empty(q.shape)
+    below = q < q_low
+    above = q > q_upp
+    res[below] = np.where(v[below] == 1, .1, .9)
+    res[above] = .001
+    inside = np.flatnonzero(~(below | above))
+    if len(inside) == 0:
+        return res.reshape(shape)
+
+    q, r, v = q[inside], r[inside], v[inside]
+    p_low, p_upp = p_low[inside], p_upp[inside]
+    q_low, q_upp = q_low[inside], q_upp[inside]
+
+    ngrid = 512
+    labels, first = _group_index(r, v)
+    if len(first) * ngrid < len(q):
+        # narrow the brackets to neighboring grid points
+        for label, i in enumerate(first):
+            grid = np.linspace(p_low[i], .999, ngrid)
+            q_grid = _qsturng_vec(grid, r[i], v[i])
+            mask = labels == label
+            j = np.searchsorted(q_grid, q[mask]).clip(1, ngrid - 1)
+            p_low[mask], p_upp[mask] = grid[j - 1], grid[j]
+            q_low[mask], q_upp[mask] = q_grid[j - 1], q_grid[j]
+
+    def func(p, idx):
+        return _qsturng_vec(p, r[idx], v[idx]) - q[idx]
+
+    p = root_bracket_vec(func, p_low, p_upp, q_low - q, q_upp - q,
+                         rtol=0, ftol=1e-10 * np.maximum(1, q))
+    res[inside] = 1. - p
+    return res.reshape(shape)
 
 ##p, r, v = .9, 10, 20
 ##print
@@ -8,7 +8,7 @@ extensively ensure the stability and accuracy of the functions"""
 from statsmodels.compat.python import iterkeys, lzip, lmap
 
 from numpy.testing import (
-    assert_equal,
+    assert_equal, assert_allclose,
     assert_almost_equal, assert_array_almost_equal,
     assert_raises)
 
@@ -196,5 +196,34 @@ class TestPsturng(object):
 
         assert_equal(np.array([]), np.where(errors > 1e-5)[0])
 
+    def test_vectorized_handful(self, reset_randomstate):
+        # the vectorized versions give the same results as the scalar ones
+        from statsmodels.stats.libqsturng import qsturng_
+        n = 60
+        ps = np.random.random(n)*(.999 - .1) + .1
+        ps[:10] = qsturng_.p_keys[:10]
+        rs = np.random.randint(2, 101, n).astype(float)
+        rs[::5] = 3
+        vs = np.random.choice([2., 3., 7.4, 20., 21.7, 120., 500., np.inf],
+                              n)
+        ps[-5:] = np.random.random(5)*(.999 - .9125) + .9125
+        vs[-5:] = 1
+
+        q_scalar = np.array([qsturng_._qsturng(p, r, v)
+                             for p, r, v in zip(ps, rs, vs)])
+        assert_allclose(qsturng(ps, rs, vs), q_scalar, rtol=1e-12)
+
+        # scalar psturng fails for some values if v = 1
+        p_scalar = np.array([qsturng_._psturng(q, r, v)
+                             for q, r, v in zip(q_scalar[:-5], rs, vs)])
+        p_vec = psturng(q_scalar.reshape(6, 10), rs.reshape(6, 10),
+                        vs.reshape(6, 10))
+        assert_equal(p_vec.shape, (6, 10))
+        assert_allclose(p_vec.ravel()[:-5], p_scalar, atol=2e-5)
+        assert_allclose(p_vec.ravel(), 1 - ps, atol=1e-8)
+
+        assert_raises(ValueError, qsturng, [.5, .5], 5, [1, 3])
+        assert_raises(ValueError, psturng, [-.1, 1], 5, 6)
+
 ##     def test_more_exotic_stuff(self, level=3):
 ##         something_obscure_and_expensive()
@@ -5,7 +5,8 @@ Created on Fri Mar 30 18:27:25 2012
 Author: Josef Perktold
 """
 
-from statsmodels.sandbox.stats.multicomp import tukeyhsd, MultiComparison
+from statsmodels.sandbox.stats.multicomp import (tukeyhsd, tukeyhsd_batch,
+                                                 MultiComparison)
 
 def pairwise_tukeyhsd(endog, groups, alpha=0.05):
     '''calculate all pairwise comparisons with TukeyHSD confidence intervals
@@ -36,3 +37,33 @@ def pairwise_tukeyhsd(endog, groups, alpha=0.05):
     '''
 
     return MultiComparison(endog, groups).tukeyhsd(alpha=alpha)
+
+
+def pairwise_tukeyhsd_batch(endog, groups, alpha=0.05):
+    '''pairwise comparisons with TukeyHSD for many response variables
+
+    this is a wrapper around `tukeyhsd_batch`, which computes the results
+    for all columns of `endog` at once
+
+    Parameters
+    ----------
+    endog : ndarray, float, 1d or 2d
+        response variables in columns
+    groups : ndarray, 1d
+        array with groups, can be string or integers
+    alpha : float
+        significance level for the test
+
+    Returns
+    -------
+    results : Bunch
+        see `tukeyhsd_batch`
+
+    See Also
+    --------
+    pairwise_tukeyhsd
+    statsmodels.sandbox.stats.multicomp.tukeyhsd_batch
+
+    '''
+
+    return tukeyhsd_batch(endog, groups, alpha=alpha)
@@ -31,10 +31,11 @@ refactoring
 
 """
 from __future__ import print_function
-from statsmodels.compat.python import iteritems
+from statsmodels.compat.python import iteritems, string_types
+from collections import OrderedDict
 import numpy as np
 from scipy import stats, optimize
-from statsmodels.tools.rootfinding import brentq_expanding
+from statsmodels.tools.rootfinding import brentq_expanding, root_expanding_vec
 
 def ttest_power(effect_size, nobs, alpha, df=None, alternative='two-sided'):
     '''Calculate power of a ttest
@@ -149,6 +150,15 @@ def ftest_power(effect_size, df_num, df_denom, alpha, ncc=1):
     return pow_ #, crit, nc
 
 
+def _hashable(value):
+    """convert scalar and array parameters to hashable values"""
+    if isinstance(value, np.ndarray):
+        return tuple(value.ravel().tolist())
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
 #class based implementation
 #--------------------------
 
@@ -158,6 +168,9 @@ class Power(object):
     so far this could all be class methods
     '''
 
+    # maximum number of solutions of solve_power that are cached
+    _solve_cache_size = 10000
+
     def __init__(self, **kwds):
         self.__dict__.update(kwds)
         # used only for instance level start values
@@ -179,6 +192,8 @@ class Power(object):
             self.start_bqexp[key] = dict(low=1e-8, start_upp=2)
         for key in ['alpha']:
             self.start_bqexp[key] = dict(low=1e-12, upp=1 - 1e-12)
+        # solutions of solve_power keyed by parameters and start values
+        self._solve_cache = OrderedDict()
 
     def power(self, *args, **kwds):
         raise NotImplementedError
@@ -195,6 +210,12 @@ class Power(object):
 
         exactly one needs to be ``None``, all others need numeric values
 
+        If any of the numeric values is an array, then the values are
+        broadcast and the root is found for every combination. The roots are
+        found jointly with a vectorized root finder, elements for which it
+        does not converge are solved separately with the scalar solvers. The
+        return is an array with the broadcast shape.
+
         *attaches*
 
         cache_fit_res : list
@@ -202,8 +223,16 @@ class Power(object):
             call to ``solve_power``, mainly for debugging purposes.
             The first element is the success indicator, one if successful.
             The remaining elements contain the return information of the up to
-            three solvers that have been tried.
+            three solvers that have been tried. If the parameters are arrays,
+            then the first element is an array of success indicators and the
+            second element is the information of the vectorized root finder.
 
+        Notes
+        -----
+        Successful solutions are cached on the instance by the values of the
+        parameters and the start values of the root finding, so that repeated
+        calls with the same parameters do not need to solve again. Array
+        arguments are cached elementwise.
 
         '''
         #TODO: maybe use explicit kwds,
@@ -219,17 +248,25 @@ class Power(object):
             del kwds['power']
             return self.power(**kwds)
 
+        if any(np.ndim(v) > 0 for v in kwds.values()
+               if not isinstance(v, string_types)):
+            return self._solve_power_vec(key, kwds)
+
         if kwds['effect_size'] == 0:
             import warnings
             from statsmodels.tools.sm_exceptions import HypothesisTestWarning
             warnings.warn('Warning: Effect size of 0 detected', HypothesisTestWarning)
-            if key == 'power':
-                return alpha
             if key == 'alpha':
-                return power
+                return kwds['power']
             else:
                 raise ValueError('Cannot detect an effect-size of 0. Try changing your effect-size.')
 
+        cache_key = self._solve_cache_key(key, kwds)
+        if cache_key in self._solve_cache:
+            val, fit_res = self._solve_cache[cache_key]
+            self.cache_fit_res = fit_res
+            return val
+
 
         self._counter = 0
 
@@ -303,8 +340,107 @@ class Power(object):
         #attach fit_res, for reading only, should be needed only for debugging
         fit_res.insert(0, success)
         self.cache_fit_res = fit_res
+        if success == 1:
+            self._cache_solution(cache_key, val, fit_res)
         return val
 
+    def _solve_cache_key(self, key, kwds):
+        """hashable key of a scalar root finding problem for the cache"""
+        start = self.start_bqexp[key]
+        start = tuple(sorted((k, _hashable(v)) for k, v in iteritems(start)))
+        params = tuple(sorted((k, _hashable(v)) for k, v in iteritems(kwds)
+                              if k != key))
+        return (key, start, _hashable(self.start_ttp.get(key)), params)
+
+    def _cache_solution(self, cache_key, val, fit_res=None):
+        cache = self._solve_cache
+        cache[cache_key] = (val, fit_res)
+        while len(cache) > self._solve_cache_size:
+            cache.popitem(last=False)
+
+    def _solve_power_vec(self, key, kwds):
+        """solve_power for array arguments
+
+        All elements that are not in the cache are solved jointly with
+        ``root_expanding_vec``. Elements for which this does not converge
+        are solved with the scalar ``solve_power``.
+        """
+        names = [k for k, v in iteritems(kwds) if k != key and
+                 not isinstance(v, string_types)]
+        options = dict((k, v) for k, v in iteritems(kwds)
+                       if isinstance(v, string_types))
+        arrays = np.broadcast_arrays(*[np.asarray(kwds[k], dtype=float)
+                                       for k in names])
+        shape = arrays[0].shape
+        params = dict((k, a.ravel()) for k, a in zip(names, arrays))
+        nobs = arrays[0].size
+        val = np.nan * np.ones(nobs)
+        success = np.zeros(nobs, int)
+
+        # elementwise cache lookup, the keys agree with the scalar problems
+        fit_kwds = self.start_bqexp[key]
+        cache_keys = []
+        for i in range(nobs):
+            kwds_i = dict(options)
+            kwds_i.update((k, params[k][i]) for k in names)
+            cache_key = self._solve_cache_key(key, kwds_i)
+            cache_keys.append(cache_key)
+            if cache_key in self._solve_cache:
+                val[i] = self._solve_cache[cache_key][0]
+                success[i] = 1
+        todo = np.flatnonzero(success == 0)
+
+        if 'effect_size' in params and len(todo):
+            zero = params['effect_size'][todo] == 0
+            if zero.any():
+                import warnings
+                from statsmodels.tools.sm_exceptions import (
+                    HypothesisTestWarning)
+                warnings.warn('Warning: Effect size of 0 detected',
+                              HypothesisTestWarning)
+                if key != 'alpha':
+                    raise ValueError('Cannot detect an effect-size of 0. '
+                                     'Try changing your effect-size.')
+                val[todo[zero]] = params['power'][todo[zero]]
+                success[todo[zero]] = 1
+                todo = todo[~zero]
+
+        info = None
+        if len(todo):
+            params_todo = dict((k, params[k][todo]) for k in names)
+
+            def func(x, idx):
+                kwds_i = dict(options)
+                kwds_i.update((k, params_todo[k][idx]) for k in names)
+                kwds_i[key] = x
+                fval = self._power_identity(**kwds_i)
+                return np.where(np.isnan(fval), np.inf, fval)
+
+            # bounds can be arrays with the shape of the parameters
+            fit_kwds_todo = {}
+            for k, v in iteritems(fit_kwds):
+                if np.ndim(v) > 0:
+                    v = np.broadcast_to(v, shape).ravel()[todo]
+                fit_kwds_todo[k] = v
+            x, info = root_expanding_vec(func, (len(todo),), full_output=True,
+                                         **fit_kwds_todo)
+            converged = info.converged
+            val[todo[converged]] = x[converged]
+            success[todo[converged]] = 1
+            for i in todo[converged]:
+                self._cache_solution(cache_keys[i], val[i])
+
+            # scalar solvers as backup
+            for i in todo[~converged]:
+                kwds_i = dict(options)
+                kwds_i.update((k, params[k][i]) for k in names)
+                kwds_i[key] = None
+                val[i] = self.solve_power(**kwds_i)
+                success[i] = self.cache_fit_res[0]
+
+        self.cache_fit_res = [success.reshape(shape), info]
+        return val.reshape(shape)
+
     def plot_power(self, dep_var='nobs', nobs=None, effect_size=None,
                    alpha=0.05, ax=None, title=None, plt_kwds=None, **kwds):
         '''plot power with number of observations or effect size on x-axis
@@ -342,6 +478,10 @@ class Power(object):
 
         Notes
         -----
+        The power for all curves is computed in one call to the ``power``
+        method by broadcasting the curve values against the values on the
+        horizontal axis.
+
         This works only for classes where the ``power`` method has
         ``effect_size``, ``nobs`` and ``alpha`` as the first three arguments.
         If the second argument is ``nobs1``, then the number of observations
@@ -359,31 +499,38 @@ class Power(object):
         colormap = plt.cm.Dark2 #pylint: disable-msg=E1101
         plt_alpha = 1 #0.75
         lw = 2
+        # power for all curves in one call, one row per curve
         if dep_var == 'nobs':
-            colors = rainbow(len(effect_size))
+            effect_size = np.atleast_1d(effect_size)
+            power = self.power(effect_size[:, None], np.asarray(nobs),
+                               alpha, **kwds)
+            power = np.broadcast_to(power, (len(effect_size), np.size(nobs)))
             colors = [colormap(i) for i in np.linspace(0, 0.9, len(effect_size))]
             for ii, es in enumerate(effect_size):
-                power = self.power(es, nobs, alpha, **kwds)
-                ax.plot(nobs, power, lw=lw, alpha=plt_alpha,
+                ax.plot(nobs, power[ii], lw=lw, alpha=plt_alpha,
                         color=colors[ii], label='es=%4.2F' % es)
-                xlabel = 'Number of Observations'
+            xlabel = 'Number of Observations'
         elif dep_var in ['effect size', 'effect_size', 'es']:
-            colors = rainbow(len(nobs))
+            nobs = np.atleast_1d(nobs)
+            power = self.power(np.asarray(effect_size), nobs[:, None],
+                               alpha, **kwds)
+            power = np.broadcast_to(power, (len(nobs), np.size(effect_size)))
             colors = [colormap(i) for i in np.linspace(0, 0.9, len(nobs))]
             for ii, n in enumerate(nobs):
-                power = self.power(effect_size, n, alpha, **kwds)
-                ax.plot(effect_size, power, lw=lw, alpha=plt_alpha,
+                ax.plot(effect_size, power[ii], lw=lw, alpha=plt_alpha,
                         color=colors[ii], label='N=%4.2F' % n)
-                xlabel = 'Effect Size'
+            xlabel = 'Effect Size'
         elif dep_var in ['alpha']:
             # experimental nobs as defining separate lines
+            nobs = np.atleast_1d(nobs)
+            power = self.power(effect_size, nobs[:, None], np.asarray(alpha),
+                               **kwds)
+            power = np.broadcast_to(power, (len(nobs), np.size(alpha)))
             colors = rainbow(len(nobs))
-
             for ii, n in enumerate(nobs):
-                power = self.power(effect_size, n, alpha, **kwds)
-                ax.plot(alpha, power, lw=lw, alpha=plt_alpha,
+                ax.plot(alpha, power[ii], lw=lw, alpha=plt_alpha,
                         color=colors[ii], label='N=%4.2F' % n)
-                xlabel = 'alpha'
+            xlabel = 'alpha'
         else:
             raise ValueError('depvar not implemented')
 
@@ -665,7 +812,13 @@ class NormalIndPower(Power):
         ddof = self.ddof  # for correlation, ddof=3
 
         # get effective nobs, factor for std of test statistic
-        if ratio > 0:
+        if np.ndim(ratio) > 0:
+            # elementwise, ratio=0 is the one sample case
+            with np.errstate(divide='ignore'):
+                nobs2 = nobs1 * ratio
+                nobs = 1. / (1. / (nobs1 - ddof) + 1. / (nobs2 - ddof))
+            nobs = np.where(np.asarray(ratio) > 0, nobs, nobs1 - ddof)
+        elif ratio > 0:
             nobs2 = nobs1*ratio
             #equivalent to nobs = n1*n2/(n1+n2)=n1*ratio/(1+ratio)
             nobs = 1./ (1. / (nobs1 - ddof) + 1. / (nobs2 - ddof))
@@ -915,11 +1068,14 @@ class FTestAnovaPower(Power):
         '''
         # update start values for root finding
         if not k_groups is None:
-            self.start_ttp['nobs'] = k_groups * 10
-            self.start_bqexp['nobs'] = dict(low=k_groups * 2,
-                                            start_upp=k_groups * 10)
-        # first attempt at special casing
-        if effect_size is None:
+            k_groups_ = np.asarray(k_groups)
+            if k_groups_.ndim == 0:
+                self.start_ttp['nobs'] = k_groups * 10
+            self.start_bqexp['nobs'] = dict(low=k_groups_ * 2.,
+                                            start_upp=k_groups_ * 10.)
+        # first attempt at special casing, scalar problems only
+        scalar = all(np.ndim(v) == 0 for v in (nobs, alpha, power, k_groups))
+        if effect_size is None and scalar:
             return self._solve_effect_size(effect_size=effect_size,
                                            nobs=nobs,
                                            alpha=alpha,
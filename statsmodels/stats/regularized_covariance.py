@@ -1,7 +1,61 @@
+from functools import partial
+
 from statsmodels.regression.linear_model import OLS
 import numpy as np
 
 
+def _nodewise_from_gram(gram, idx, alpha):
+    """calculates the nodewise_row and nodewise_weight values for the idxth
+    variable from the Gram matrix of the design.
+
+    Parameters
+    ----------
+    gram : ndarray
+        exog.T exog / n for the weighted design matrix exog.
+    idx : scalar
+        Index of the current variable.
+    alpha : scalar or array-like
+        The penalty weight.  If a scalar, the same penalty weight
+        applies to all variables in the model.  If a vector, it
+        must have the same length as `params`, and contains a
+        penalty weight for each coefficient.
+
+    Returns
+    -------
+    A tuple of the nodewise_row array of length p-1 and the
+    nodewise_weight scalar.
+
+    Notes
+    -----
+    The lasso problem of the nodewise regression and the residual sum of
+    squares only depend on the design through the Gram matrix, which is
+    computed once for all variables.
+    """
+    from statsmodels.base.elastic_net import _coord_descent
+
+    p = gram.shape[0]
+    ind = list(range(p))
+    ind.pop(idx)
+    # handle array alphas
+    if not np.isscalar(alpha):
+        alpha = np.asarray(alpha)[ind]
+
+    gram_ind = gram[np.ix_(ind, ind)]
+    gram_idx = gram[ind, idx]
+
+    # same settings as the default of OLS.fit_regularized
+    nodewise_row, _ = _coord_descent(gram_ind, gram_idx,
+                                     alpha * np.ones(p - 1), np.zeros(p - 1),
+                                     np.zeros(p - 1), np.ones(p - 1, bool),
+                                     50, 1e-10)
+    nodewise_row[np.abs(nodewise_row) < 1e-10] = 0
+
+    d = (gram[idx, idx] - 2 * gram_idx.dot(nodewise_row) +
+         nodewise_row.dot(gram_ind.dot(nodewise_row)))
+    nodewise_weight = np.sqrt(d + alpha * np.linalg.norm(nodewise_row, 1))
+    return nodewise_row, nodewise_weight
+
+
 def _calc_nodewise_row(exog, idx, alpha):
     """calculates the nodewise_row values for the idxth variable, used to
     estimate approx_inv_cov.
@@ -30,13 +84,13 @@ def _calc_nodewise_row(exog, idx, alpha):
     """
 
     p = exog.shape[1]
+    ind = list(range(p))
+    ind.pop(idx)
+
     # handle array alphas
     if not np.isscalar(alpha):
         alpha = alpha[ind]
 
-    ind = list(range(p))
-    ind.pop(idx)
-
     tmod = OLS(exog[:, idx], exog[:, ind])
 
     nodewise_row = tmod.fit_regularized(alpha=alpha).params
@@ -74,13 +128,13 @@ def _calc_nodewise_weight(exog, nodewise_row, idx, alpha):
     """
 
     n, p = exog.shape
+    ind = list(range(p))
+    ind.pop(idx)
+
     # handle array alphas
     if not np.isscalar(alpha):
         alpha = alpha[ind]
 
-    ind = list(range(p))
-    ind.pop(idx)
-
     d = np.linalg.norm(exog[:, idx] - exog[:, ind].dot(nodewise_row))**2
     d = np.sqrt(d / n + alpha * np.linalg.norm(nodewise_row, 1))
     return d
@@ -147,7 +201,7 @@ class RegularizedInvCovariance(object):
         self.exog = exog
 
 
-    def fit(self, alpha=0):
+    def fit(self, alpha=0, executor=None):
         """estimates the regularized inverse covariance using nodewise
         regression
 
@@ -155,23 +209,24 @@ class RegularizedInvCovariance(object):
         ----------
         alpha : scalar
             Regularizing constant
+        executor : executor instance or None
+            If not None, an object with a ``map(func, iterable)`` method,
+            for example a ``concurrent.futures.ProcessPoolExecutor`` or a
+            ``multiprocessing.Pool``, that runs the nodewise regressions
+            in parallel. Only the p x p Gram matrix is sent to the workers.
         """
 
         n, p = self.exog.shape
+        gram = self.exog.T.dot(self.exog) / n
 
-        nodewise_row_l = []
-        nodewise_weight_l = []
-
-        for idx in range(p):
-            nodewise_row = _calc_nodewise_row(self.exog, idx, alpha)
-            nodewise_row_l.append(nodewise_row)
-
-            nodewise_weight = _calc_nodewise_weight(self.exog, nodewise_row,
-                                                    idx, alpha)
-            nodewise_weight_l.append(nodewise_weight)
+        func = partial(_nodewise_from_gram, gram, alpha=alpha)
+        if executor is None:
+            results = [func(idx) for idx in range(p)]
+        else:
+            results = list(executor.map(func, range(p)))
 
-        nodewise_row_l = np.array(nodewise_row_l)
-        nodewise_weight_l = np.array(nodewise_weight_l)
+        nodewise_row_l = np.array([r[0] for r in results])
+        nodewise_weight_l = np.array([r[1] for r in results])
 
         approx_inv_cov = _calc_approx_inv_cov(nodewise_row_l, nodewise_weight_l)
 
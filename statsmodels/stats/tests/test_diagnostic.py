@@ -18,7 +18,7 @@ from numpy.testing import (assert_, assert_almost_equal, assert_equal,
                            assert_allclose, assert_array_equal)
 import pytest
 
-from statsmodels.regression.linear_model import OLS
+from statsmodels.regression.linear_model import OLS, WLS
 from statsmodels.tools.tools import add_constant
 from statsmodels.datasets import macrodata
 
@@ -381,6 +381,53 @@ class TestDiagnosticG(object):
         compare_t_est([bp[-1], bppval[-1]], ljung_box_bp_small, decimal=(13, 13))
 
 
+    def test_batch(self):
+        # batched tests agree with the tests for single series
+        endog = np.asarray(self.endog)
+        exog = np.asarray(self.exog)
+        endogs = np.column_stack((endog, np.log(np.abs(endog) + 1),
+                                  endog[::-1]))
+        results = [OLS(endogs[:, j], exog).fit() for j in range(3)]
+        resid = np.column_stack([res.resid for res in results])
+
+        lb = smsdia.acorr_ljungbox_batch(resid, 4, boxpierce=True)
+        for j in range(3):
+            assert_allclose(np.array(lb)[:, :, j],
+                            smsdia.acorr_ljungbox(resid[:, j], 4,
+                                                  boxpierce=True),
+                            rtol=1e-10)
+
+        cases = [(smsdia.het_breuschpagan_batch(resid, exog),
+                  lambda j: smsdia.het_breuschpagan(resid[:, j], exog)),
+                 (smsdia.het_white_batch(resid, exog),
+                  lambda j: smsdia.het_white(resid[:, j], exog)),
+                 (smsdia.het_arch_batch(resid, maxlag=4),
+                  lambda j: smsdia.het_arch(resid[:, j], maxlag=4)),
+                 (smsdia.het_arch_batch(resid),
+                  lambda j: smsdia.het_arch(resid[:, j])),
+                 (smsdia.het_arch_batch(resid, maxlag=15),
+                  lambda j: smsdia.het_arch(resid[:, j], maxlag=15)),
+                 (smsdia.acorr_breusch_godfrey_batch(resid, exog, nlags=4),
+                  lambda j: smsdia.acorr_breusch_godfrey(results[j],
+                                                         nlags=4))]
+        for res_batch, func in cases:
+            for j in range(3):
+                assert_allclose(np.array(res_batch)[:, j], func(j),
+                                rtol=1e-10)
+
+        # DataFrame input returns DataFrame with one row per series
+        resid_df = pd.DataFrame(resid, columns=['a', 'b', 'c'])
+        res_df = smsdia.het_white_batch(resid_df, exog)
+        assert_equal(list(res_df.index), ['a', 'b', 'c'])
+        assert_equal(list(res_df.columns),
+                     ['lm', 'lm_pvalue', 'fvalue', 'f_pvalue'])
+        assert_allclose(res_df.values, np.column_stack(cases[1][0]),
+                        rtol=1e-13)
+        lb_df = smsdia.acorr_ljungbox_batch(resid_df, [1, 4])
+        assert_equal(list(lb_df.columns), ['lb_stat', 'lb_pvalue'])
+        assert_allclose(lb_df.loc[('b', 4)].values,
+                        np.array(lb)[:2, -1, 1], rtol=1e-13)
+
     def test_harvey_collier(self):
 
         #> hc = harvtest(fm, order.by = NULL, data = list())
@@ -578,6 +625,44 @@ class TestDiagnosticG(object):
         assert_almost_equal(rr[0][3:10], endog[3:10] - ypred, decimal=12)
         assert_almost_equal(rr[1][2:9], params, decimal=12)
 
+    def test_breaks_cusumsq(self):
+        from statsmodels.regression.recursive_ls import RecursiveLS
+        endog = np.asarray(self.res.model.endog)
+        exog = np.asarray(self.res.model.exog)
+        sup_d, pval, cusumsq, expected = smsdia.breaks_cusumsq(self.res)
+        res_rls = RecursiveLS(endog, exog).fit()
+        assert_allclose(cusumsq, res_rls.cusum_squares, rtol=1e-10)
+        assert_allclose(sup_d, np.abs(cusumsq - expected).max(), rtol=1e-13)
+        assert_equal(expected[-1], 1)
+        assert_(0 < pval < 1)
+
+    def test_breaks_supf(self):
+        endog = np.asarray(self.res.model.endog)
+        exog = np.asarray(self.res.model.exog)
+        nobs, k_vars = exog.shape
+        supf, breakpoint, fvalues = smsdia.breaks_supf(self.res, trim=0.15)
+        assert_equal(np.isnan(fvalues[:int(0.15 * nobs)]).all(), True)
+        assert_equal(supf, np.nanmax(fvalues))
+        assert_equal(fvalues[breakpoint], supf)
+        # compare with Chow test from explicit split sample OLS
+        for t in [breakpoint, 50, 150]:
+            ssr_u = (OLS(endog[:t], exog[:t]).fit().ssr +
+                     OLS(endog[t:], exog[t:]).fit().ssr)
+            fval = ((self.res.ssr - ssr_u) / k_vars /
+                    (ssr_u / (nobs - 2 * k_vars)))
+            assert_allclose(fvalues[t], fval, rtol=1e-10)
+
+        # WLS uses the weighted residual sums of squares
+        weights = np.linspace(1, 2, nobs)
+        res_wls = WLS(endog, exog, weights=weights).fit()
+        supf_wls, _, fvalues_wls = smsdia.breaks_supf(res_wls, trim=0.15)
+        for t in [50, 100, 150]:
+            ssr_u = (WLS(endog[:t], exog[:t], weights=weights[:t]).fit().ssr +
+                     WLS(endog[t:], exog[t:], weights=weights[t:]).fit().ssr)
+            fval = ((res_wls.ssr - ssr_u) / k_vars /
+                    (ssr_u / (nobs - 2 * k_vars)))
+            assert_allclose(fvalues_wls[t], fval, rtol=1e-10)
+
     def test_normality(self):
         res = self.res
 
@@ -733,6 +818,34 @@ def grangertest():
                        df=(198,193))
 
 
+def test_recursive_ls_many_regressors():
+    # recursive residuals with updated QR factor and many regressors
+    from statsmodels.sandbox.stats.diagnostic import _recursive_ls
+    np.random.seed(987125)
+    nobs, k_vars = 200, 70
+    exog = np.random.randn(nobs, k_vars)
+    endog = exog.sum(1) + np.random.randn(nobs)
+    rresid, rparams, rypred, rvarraw = _recursive_ls(endog, exog, k_vars)
+    for t in [70, 71, 100, 150, 199]:
+        res = OLS(endog[:t], exog[:t]).fit()
+        xtxi = np.linalg.inv(exog[:t].T.dot(exog[:t]))
+        assert_allclose(rypred[t], exog[t].dot(res.params), rtol=1e-8)
+        assert_allclose(rvarraw[t], 1 + exog[t].dot(xtxi).dot(exog[t]),
+                        rtol=1e-8)
+    res = OLS(endog, exog).fit()
+    assert_allclose(rparams[-1], res.params, rtol=1e-8)
+
+
+def test_het_arch_batch_many_lags():
+    # persistent series with nearly collinear lags
+    d = macrodata.load_pandas().data
+    x = d[['realgdp', 'realcons', 'realinv']].values
+    res_batch = np.array(smsdia.het_arch_batch(x, maxlag=15))
+    for j in range(3):
+        assert_allclose(res_batch[:, j], smsdia.het_arch(x[:, j], maxlag=15),
+                        rtol=1e-11)
+
+
 def test_outlier_influence_funcs(reset_randomstate):
     #smoke test
     x = add_constant(np.random.randn(10, 2))
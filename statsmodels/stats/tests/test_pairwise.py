@@ -148,6 +148,7 @@ dta5 = pd.DataFrame.from_records(dta5)
 sas_ = dta5.iloc[[1, 3, 2]]
 
 from statsmodels.stats.multicomp import (tukeyhsd, pairwise_tukeyhsd,
+                                         pairwise_tukeyhsd_batch,
                                          MultiComparison)
 #import statsmodels.sandbox.stats.multicomp as multi
 #print tukeyhsd(dta['Brand'], dta['Rust'])
@@ -187,6 +188,27 @@ class CheckTuckeyHSDMixin(object):
         res = pairwise_tukeyhsd(self.endog, self.groups, alpha=self.alpha)
         assert_almost_equal(res.confint, self.res.confint, decimal=14)
 
+    def test_batch(self):
+        # columns with a linear transformation of endog have the same
+        # tests and transformed mean differences
+        endog = np.asarray(self.endog, dtype=float)
+        data = np.column_stack((endog, 2 * endog + 5, -endog))
+        res = pairwise_tukeyhsd_batch(data, self.groups, alpha=self.alpha)
+        res0 = self.res
+        assert_equal(res.groupsunique, res0.groupsunique)
+        assert_allclose(res.q_crit, res0.q_crit, rtol=1e-13)
+        for col, scale in enumerate([1, 2, -1]):
+            assert_allclose(res.meandiffs[:, col], scale * res0.meandiffs,
+                            rtol=1e-12)
+            assert_allclose(res.std_pairs[:, col], abs(scale) *
+                            res0.std_pairs, rtol=1e-12)
+            confint = np.sort(scale * res0.confint, axis=1)
+            assert_allclose(res.confint[:, col], confint, rtol=1e-12)
+            assert_equal(res.reject[:, col], res0.reject)
+        assert_allclose(res.pvalues, res.pvalues[:, :1] * np.ones((1, 3)),
+                        rtol=1e-8)
+        assert_equal(res.pvalues < self.alpha, res.reject)
+
     @pytest.mark.matplotlib
     def test_plot_simultaneous_ci(self, close_figures):
         # smoke tests
@@ -318,6 +340,13 @@ class TestTuckeyHSD2s(CheckTuckeyHSDMixin):
         cls.confint2 = tukeyhsd2s[:, 1:3]
         pvals = tukeyhsd2s[:, 3]
         cls.reject2 = pvals < 0.01
+        cls.pvals2 = pvals
+
+    def test_batch_pvalues(self):
+        res = pairwise_tukeyhsd_batch(self.endog, self.groups,
+                                      alpha=self.alpha)
+        assert_allclose(res.pvalues[:, 0], self.pvals2, rtol=0.01,
+                        atol=1e-3)
 
 
 class TestTuckeyHSD3(CheckTuckeyHSDMixin):
@@ -16,7 +16,7 @@ from distutils.version import LooseVersion
 
 import numpy as np
 from numpy.testing import (assert_almost_equal, assert_allclose, assert_raises,
-                           assert_equal, assert_warns)
+                           assert_equal, assert_warns, assert_)
 import pytest
 import scipy
 
@@ -89,6 +89,25 @@ class CheckPowerMixin(object):
             #yield assert_allclose, result, value, 0.001, 0, key+' failed'
             kwds[key] = value  # reset dict
 
+    def test_roots_vectorized(self):
+        kwds = copy.copy(self.kwds)
+        kwds.update(self.kwds_extra)
+
+        for key in self.kwds:
+            value = kwds[key]
+            kwds[key] = None
+            # one array argument triggers the vectorized solver
+            other = [k for k in self.kwds if k != key][0]
+            kwds_vec = copy.copy(kwds)
+            kwds_vec[other] = np.repeat(kwds[other], 3)
+            res1 = self.cls()
+            result = res1.solve_power(**kwds_vec)
+            assert_equal(result.shape, (3,))
+            assert_allclose(result, value, rtol=0.001, err_msg=key+' failed')
+            if key != 'power':
+                assert_equal(res1.cache_fit_res[0], np.ones(3))
+            kwds[key] = value  # reset dict
+
     @pytest.mark.matplotlib
     def test_power_plot(self, close_figures):
         if self.cls == smp.FTestPower:
@@ -771,3 +790,93 @@ def test_power_solver_warn():
                               alternative='larger')
         assert_equal(nip.cache_fit_res[0], 0)
         assert_equal(len(nip.cache_fit_res), 3)
+
+
+def test_solve_power_vectorized():
+    es = np.array([0.2, 0.35, 0.5])
+    nobs1 = np.array([[20.], [50], [100]])
+    tip = smp.TTestIndPower()
+    pow_ = tip.power(es, nobs1, 0.05, ratio=2, alternative='larger')
+    kwds = dict(effect_size=es, nobs1=nobs1, alpha=0.05, power=pow_, ratio=2,
+                alternative='larger')
+    for key in ['effect_size', 'nobs1', 'alpha', 'ratio']:
+        kwds_ = copy.copy(kwds)
+        kwds_[key] = None
+        res = smp.TTestIndPower().solve_power(**kwds_)
+        assert_equal(res.shape, (3, 3))
+        assert_allclose(res, np.broadcast_to(kwds[key], (3, 3)), rtol=1e-6,
+                        err_msg=key)
+
+        # compare with scalar solver
+        kwds_['power'] = pow_[1, 2]
+        kwds_.update((k, np.broadcast_to(kwds[k], (3, 3))[1, 2])
+                     for k in ['effect_size', 'nobs1', 'alpha', 'ratio']
+                     if k != key)
+        res_scalar = smp.TTestIndPower().solve_power(**kwds_)
+        assert_allclose(res[1, 2], res_scalar, rtol=1e-5, err_msg=key)
+
+    # effect size zero
+    nip = smp.NormalIndPower()
+    res = nip.solve_power(effect_size=[0, 0.1], nobs1=1600, alpha=None,
+                          power=[0.01, 0.69219411243824214],
+                          alternative='larger')
+    assert_allclose(res, [0.01, 0.01], rtol=1e-6)
+    assert_raises(ValueError, nip.solve_power, effect_size=[0, 0.1],
+                  nobs1=None, alpha=0.01, power=0.5)
+
+
+def test_solve_power_cache():
+    nip = smp.NormalIndPower()
+    kwds = dict(effect_size=None, nobs1=1600, alpha=0.01,
+                power=0.69219411243824214, ratio=1, alternative='larger')
+    es = nip.solve_power(**kwds)
+    assert_equal(len(nip._solve_cache), 1)
+    fit_res = nip.cache_fit_res
+    es2 = nip.solve_power(**kwds)
+    assert_equal(es2, es)
+    assert_equal(len(nip._solve_cache), 1)
+    assert_(nip.cache_fit_res is fit_res)
+
+    # array elements use the cache of scalar problems and fill it
+    es_vec = nip.solve_power(effect_size=None, nobs1=[1600, 800], alpha=0.01,
+                             power=0.69219411243824214, ratio=1,
+                             alternative='larger')
+    assert_equal(es_vec[0], es)
+    assert_equal(len(nip._solve_cache), 2)
+    es3 = nip.solve_power(effect_size=None, nobs1=800., alpha=0.01,
+                          power=0.69219411243824214, ratio=1,
+                          alternative='larger')
+    assert_equal(es3, es_vec[1])
+    assert_equal(len(nip._solve_cache), 2)
+
+    # changed start values are a different problem
+    nip.start_bqexp['effect_size'] = {'upp': 1}
+    nip.solve_power(**kwds)
+    assert_equal(len(nip._solve_cache), 3)
+
+    nip._solve_cache_size = 2
+    nip.solve_power(effect_size=0.1, nobs1=None, alpha=0.01,
+                    power=0.69219411243824214, ratio=1, alternative='larger')
+    assert_equal(len(nip._solve_cache), 2)
+
+
+@pytest.mark.matplotlib
+def test_plot_power_vectorized(close_figures):
+    tip = smp.TTestIndPower()
+    es = np.array([0.2, 0.5, 0.8])
+    nobs = np.arange(5, 50)
+    fig = tip.plot_power(dep_var='nobs', nobs=nobs, effect_size=es,
+                         alternative='larger')
+    lines = fig.axes[0].get_lines()
+    assert_equal(len(lines), 3)
+    for line, es_ in zip(lines, es):
+        assert_allclose(line.get_ydata(),
+                        tip.power(es_, nobs, 0.05, alternative='larger'),
+                        rtol=1e-12)
+
+    fig = tip.plot_power(dep_var='alpha', nobs=[10, 20], effect_size=0.5,
+                         alpha=np.linspace(0.01, 0.2, 5))
+    lines = fig.axes[0].get_lines()
+    assert_equal(len(lines), 2)
+    assert_allclose(lines[1].get_ydata(),
+                    tip.power(0.5, 20, np.linspace(0.01, 0.2, 5)), rtol=1e-12)
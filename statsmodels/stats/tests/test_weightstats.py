@@ -19,9 +19,10 @@ import numpy as np
 from scipy import stats
 import pandas as pd
 from numpy.testing import (assert_, assert_almost_equal, assert_equal,
-                           assert_allclose)
+                           assert_allclose, assert_raises)
 
 from statsmodels.stats.weightstats import (DescrStatsW, CompareMeans,
+                                           StreamingDescrStatsW,
                                            ttest_ind, ztest, zconfint)
 # import statsmodels.stats.weightstats as smws
 
@@ -511,6 +512,163 @@ class TestWeightstats2d_nobs(CheckWeightstats2dMixin):
         cls.x2r = cls.d2w.asrepeats()
 
 
+def _streaming_descrstats(x, w, ddof):
+    # accumulate in chunks of different size and merge two accumulators
+    d1 = StreamingDescrStatsW(x[:3], weights=w[:3], ddof=ddof)
+    d1.update(x[3:4], weights=w[3:4]).update(x[4:9], weights=w[4:9])
+    d2 = StreamingDescrStatsW(ddof=ddof)
+    d2.update(x[9:9], weights=w[9:9])
+    d2.update(x[9:], weights=w[9:])
+    return d1.merge(d2)
+
+
+class TestStreamingWeightstats2d(CheckWeightstats2dMixin):
+
+    @classmethod
+    def setup_class(cls):
+        np.random.seed(9876789)
+        n1, n2 = 20, 30
+        m1, m2 = 1, 1.2
+        x1 = m1 + np.random.randn(n1, 3)
+        x2 = m2 + np.random.randn(n2, 3)
+        w1 = np.random.randint(1, 4, n1)
+        w2 = np.random.randint(1, 4, n2)
+
+        cls.x1, cls.x2 = x1, x2
+        cls.w1, cls.w2 = w1, w2
+        cls.d1w = _streaming_descrstats(x1, w1, ddof=1)
+        cls.d2w = _streaming_descrstats(x2, w2, ddof=0)
+        cls.x1r = DescrStatsW(x1, weights=w1).asrepeats()
+        cls.x2r = DescrStatsW(x2, weights=w2).asrepeats()
+
+    def test_compare(self):
+        res1 = self.d1w.get_compare(self.d2w).ttest_ind(usevar='unequal')
+        res2 = stats.ttest_ind(self.x1r, self.x2r, equal_var=False)
+        assert_allclose(res1[:2], res2, rtol=1e-9)
+
+        d1 = DescrStatsW(self.x1, weights=self.w1, ddof=1)
+        assert_allclose(self.d1w.ztest_mean(1), d1.ztest_mean(1),
+                        rtol=1e-12)
+        assert_allclose(self.d1w.tconfint_mean(), d1.tconfint_mean(),
+                        rtol=1e-13)
+
+    def test_large_mean(self):
+        # sums of squares are not computed from raw moments
+        x = 1e9 + self.x1
+        res1 = _streaming_descrstats(x, self.w1, ddof=1)
+        res2 = DescrStatsW(x, weights=self.w1, ddof=1)
+        assert_allclose(res1.mean, res2.mean, rtol=1e-15)
+        assert_allclose(res1.cov, res2.cov, rtol=1e-6)
+
+
+class TestStreamingWeightstats1d(CheckWeightstats1dMixin):
+
+    @classmethod
+    def setup_class(cls):
+        np.random.seed(9876789)
+        n1, n2 = 20, 20
+        m1, m2 = 1, 1.2
+        x1 = m1 + np.random.randn(n1)
+        x2 = m2 + np.random.randn(n2)
+        w1 = np.random.randint(1, 4, n1)
+        w2 = np.random.randint(1, 4, n2)
+
+        cls.x1, cls.x2 = x1, x2
+        cls.w1, cls.w2 = w1, w2
+        cls.d1w = _streaming_descrstats(x1, w1, ddof=1)
+        cls.d2w = _streaming_descrstats(x2, w2, ddof=1)
+        cls.x1r = DescrStatsW(x1, weights=w1).asrepeats()
+        cls.x2r = DescrStatsW(x2, weights=w2).asrepeats()
+
+    def test_basic(self):
+        super(TestStreamingWeightstats1d, self).test_basic()
+        d1 = DescrStatsW(self.x1, weights=self.w1, ddof=1)
+        assert_(np.isscalar(self.d1w.mean))
+        assert_allclose(self.d1w.sum, d1.sum, rtol=1e-13)
+        assert_allclose(self.d1w.std_mean, d1.std_mean, rtol=1e-13)
+
+    def test_errors(self):
+        d1 = StreamingDescrStatsW()
+        assert_raises(ValueError, getattr, d1, 'mean')
+        d1.update(self.x1)
+        assert_raises(ValueError, d1.update, np.ones((3, 2)))
+        assert_raises(ValueError, d1.quantile, 0.5)
+        assert_raises(NotImplementedError, d1.quantile, 0.5, method='exact')
+        assert_raises(ValueError, d1.merge, StreamingDescrStatsW(
+            self.x1, compression=100))
+
+
+def _rank_error(x, probs, quantiles):
+    # difference between the empirical cdf at the quantiles and probs
+    x = np.sort(x)
+    cdf_low = np.searchsorted(x, quantiles, side='left') / float(len(x))
+    cdf_upp = np.searchsorted(x, quantiles, side='right') / float(len(x))
+    return np.maximum(cdf_low - probs, probs - cdf_upp).clip(0)
+
+
+class TestQuantileSketch(object):
+
+    @classmethod
+    def setup_class(cls):
+        np.random.seed(9876789)
+        cls.x = np.random.standard_t(3, size=(100000, 2))
+        cls.w = np.random.randint(1, 4, 100000)
+        cls.probs = np.array([0, 0.001, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9,
+                              0.99, 0.999, 1])
+
+    def test_accuracy(self):
+        x, probs = self.x, self.probs
+        for compression in [50, 200]:
+            d1 = DescrStatsW(x)
+            q = d1.quantile(probs, return_pandas=False, method='sketch',
+                            compression=compression)
+            assert_equal(q.shape, (len(probs), 2))
+            bound = np.pi * np.sqrt(probs * (1 - probs)) / compression
+            for j in range(2):
+                err = _rank_error(x[:, j], probs, q[:, j])
+                assert_(np.all(err <= bound + 1e-12))
+            assert_equal(q[[0, -1]], [x.min(0), x.max(0)])
+
+    def test_weights(self):
+        x, w, probs = self.x[:, 0], self.w, self.probs
+        q = DescrStatsW(x, weights=w).quantile(probs, method='sketch')
+        assert_equal(q.index.name, 'p')
+        xr = DescrStatsW(x, weights=w).asrepeats()
+        err = _rank_error(xr, probs, q.values)
+        assert_(np.all(err <= np.pi * np.sqrt(probs * (1 - probs)) / 200))
+
+    def test_small(self):
+        # with few distinct observations all clusters are single values,
+        # exact hits are the same as for the exact quantiles
+        x = np.array([3., 1, 4, 8, 5, 9, 2, 6, 7, 0])
+        probs = np.arange(0, 11) / 10.
+        d1 = DescrStatsW(x)
+        q1 = d1.quantile(probs, return_pandas=False, method='sketch')
+        q2 = d1.quantile(probs, return_pandas=False)
+        assert_allclose(q1[1:-1], q2[1:-1], rtol=1e-13)
+        assert_equal(q1[[0, -1]], [0, 9])
+        assert_raises(ValueError, d1.quantile, probs, method='approx')
+
+    def test_streaming_merge(self):
+        x, w, probs = self.x, self.w, self.probs
+        d1 = StreamingDescrStatsW(compression=200)
+        d2 = StreamingDescrStatsW(compression=200)
+        for start in range(0, 60000, 7000):
+            d1.update(x[start:min(start + 7000, 60000)],
+                      w[start:min(start + 7000, 60000)])
+        d2.update(x[60000:], w[60000:])
+        d1.merge(d2)
+        q = d1.quantile(probs)
+        assert_equal(list(q.columns), ['col1', 'col2'])
+
+        xr = DescrStatsW(x, weights=w).asrepeats()
+        bound = np.pi * np.sqrt(probs * (1 - probs)) / 200
+        for j in range(2):
+            err = _rank_error(xr[:, j], probs, q.values[:, j])
+            assert_(np.all(err <= bound + 1e-12))
+        assert_allclose(d1.mean, np.dot(w, x) / w.sum(), rtol=0, atol=1e-13)
+
+
 def test_ttest_ind_with_uneq_var():
 
     # from scipy
@@ -224,7 +224,8 @@ class DescrStatsW(object):
         return std / np.sqrt(self.sum_weights - 1)
 
 
-    def quantile(self, probs, return_pandas=True):
+    def quantile(self, probs, return_pandas=True, method='exact',
+                 compression=200):
         """
         Compute quantiles for a weighted sample.
 
@@ -236,6 +237,16 @@ class DescrStatsW(object):
         return_pandas : bool
             If True, return value is a Pandas DataFrame or Series.
             Otherwise returns a ndarray.
+        method : {'exact', 'sketch'}
+            If 'exact', the quantiles are computed from the sorted data as
+            described in the Notes.  If 'sketch', approximate quantiles are
+            computed from a t-digest sketch of each column, which does not
+            sort the data and uses memory independent of the number of
+            observations.
+        compression : float
+            Only used if method is 'sketch'.  The error in the cumulative
+            probability of an approximate quantile at probability p is at
+            most approximately ``pi * sqrt(p * (1 - p)) / compression``.
 
         Returns
         -------
@@ -261,36 +272,51 @@ class DescrStatsW(object):
         y_{j+1}.  If pW = s_j then the estimated quantile is (y_j +
         y_{j+1})/2.  If pW < p_1 then the estimated quantile is y_1.
 
+        The approximate quantiles of method 'sketch' interpolate linearly
+        between the means of clusters of adjacent observations, placed at
+        the center of the cumulative weight of the cluster.  The smallest
+        and largest observations are used for p = 0 and p = 1.
+
         References
         ----------
         SAS documentation for weighted quantiles:
 
         https://support.sas.com/documentation/cdl/en/procstat/63104/HTML/default/viewer.htm#procstat_univariate_sect028.htm
-        """
 
-        import pandas as pd
+        Dunning, T. and O. Ertl (2019). Computing extremely accurate
+        quantiles using t-digests. arXiv:1902.04023.
+        """
 
         probs = np.asarray(probs)
         probs = np.atleast_1d(probs)
 
-        if self.data.ndim == 1:
-            rslt = self._quantile(self.data, probs)
-            if return_pandas:
-                rslt = pd.Series(rslt, index=probs)
+        if method == 'exact':
+            if self.data.ndim == 1:
+                rslt = self._quantile(self.data, probs)
+            else:
+                rslt = np.column_stack([self._quantile(vec, probs)
+                                        for vec in self.data.T])
+        elif method == 'sketch':
+            rslt = self._quantile_sketch(probs, compression)
         else:
-            rslt = []
-            for vec in self.data.T:
-                rslt.append(self._quantile(vec, probs))
-            rslt = np.column_stack(rslt)
-            if return_pandas:
-                columns = ["col%d" % (j+1) for j in range(rslt.shape[1])]
-                rslt = pd.DataFrame(data=rslt, columns=columns, index=probs)
+            raise ValueError("method has to be 'exact' or 'sketch'")
 
         if return_pandas:
-            rslt.index.name = "p"
+            rslt = _quantile_frame(rslt, probs)
 
         return rslt
 
+    def _quantile_sketch(self, probs, compression):
+        # approximate quantiles from a t-digest of each column
+        from statsmodels.stats._tdigest import TDigest
+
+        data = self.data
+        if data.ndim == 1:
+            return TDigest(compression).update(data, self.weights).quantile(
+                probs)
+        return np.column_stack([TDigest(compression).update(vec, self.weights)
+                                .quantile(probs) for vec in data.T])
+
 
     def _quantile(self, vec, probs):
         # Helper function to calculate weighted quantiles for one column.
@@ -593,7 +619,7 @@ class DescrStatsW(object):
         CompareMeans
 
         '''
-        if not isinstance(other, self.__class__):
+        if not isinstance(other, DescrStatsW):
             d2 = DescrStatsW(other, weights)
         else:
             d2 = other
@@ -610,6 +636,317 @@ class DescrStatsW(object):
 
 
 
+class StreamingDescrStatsW(DescrStatsW):
+    '''descriptive statistics and tests with weights for data in chunks
+
+    Accumulates the weighted sums needed by DescrStatsW from a sequence of
+    data chunks without keeping the data.  Accumulators for different
+    parts of the data, for example computed in different processes, can
+    be combined with `merge`.  Means and sums of squares and cross-products
+    of deviations from the mean are updated with the pairwise formulas of
+    Chan, Golub and LeVeque, which are numerically stable also if the mean
+    is large relative to the standard deviation.
+
+    The weighted moments, the tests and confidence intervals for the mean
+    and the comparison of means with `get_compare` and `CompareMeans` are
+    available as in DescrStatsW.  Approximate quantiles are available if
+    `compression` is not None.  Statistics that require the data,
+    `demeaned`, exact quantiles and `asrepeats`, are not available.
+
+    Parameters
+    ----------
+    data : None or array_like, 1-D or 2-D
+        optional first chunk of the data, see `update`
+    weights : None or 1-D ndarray
+        weights for the observations in `data`
+    ddof : int
+        default ddof=0, degrees of freedom correction used for second
+        moments, var, std, cov, corrcoef.
+    compression : None or float
+        If not None, a t-digest sketch with this compression is kept for
+        each variable for approximate quantiles, see
+        `DescrStatsW.quantile`.
+
+    See Also
+    --------
+    DescrStatsW
+
+    Notes
+    -----
+    The accumulator keeps the weighted mean and, for 2-D data, the
+    ``(nvars, nvars)`` matrix of weighted cross-products of deviations from
+    the mean, so memory does not depend on the number of observations.
+    Accumulators can only be merged if both or neither keep sketches.
+
+    References
+    ----------
+    Chan, T. F., G. H. Golub and R. J. LeVeque (1979). Updating formulae and
+    a pairwise algorithm for computing sample variances. Technical Report
+    STAN-CS-79-773, Stanford University.
+
+    Examples
+    --------
+    >>> d1 = StreamingDescrStatsW(ddof=1)
+    >>> for x, w in chunks:
+    ...     d1.update(x, weights=w)
+    >>> d1.merge(d2)  # accumulated in another process
+    >>> tstat, pval, df = d1.ttest_mean(0)
+    '''
+
+    def __init__(self, data=None, weights=None, ddof=0, compression=None):
+        self.ddof = ddof
+        self.compression = compression
+        self._sum_weights = 0.
+        self._mean = None
+        self._comoment = None
+        self._sketches = None
+        if data is not None:
+            self.update(data, weights=weights)
+
+    def update(self, data, weights=None):
+        '''add a chunk of observations
+
+        Parameters
+        ----------
+        data : array_like, 1-D or 2-D
+            observations in rows, variables in columns.  The number and
+            layout of variables has to be the same in all chunks.
+        weights : None or 1-D ndarray
+            weights for each observation, with same length as zero axis of
+            data.  If None, then all observations have weight one.
+
+        Returns
+        -------
+        self : StreamingDescrStatsW
+        '''
+        data = np.asarray(data, dtype=float)
+        if weights is None:
+            weights = np.ones(data.shape[0])
+        else:
+            weights = np.asarray(weights, dtype=float).reshape(-1)
+        if weights.shape[0] != data.shape[0]:
+            raise ValueError('data and weights need to have the same '
+                             'number of observations')
+
+        sum_weights = weights.sum()
+        if sum_weights == 0:
+            return self
+        if self._mean is not None and data.shape[1:] != self._mean.shape:
+            raise ValueError('the number of variables does not match the '
+                             'accumulated data')
+        if self.compression is not None:
+            self._update_sketches(data, weights)
+        mean = np.dot(data.T, weights) / sum_weights
+        demeaned = data - mean
+        if data.ndim == 1:
+            comoment = np.dot(demeaned**2, weights)
+        else:
+            comoment = np.dot(weights * demeaned.T, demeaned)
+        self._combine(sum_weights, mean, comoment)
+        return self
+
+    def merge(self, other):
+        '''combine with the statistics accumulated by another instance
+
+        Parameters
+        ----------
+        other : StreamingDescrStatsW
+            accumulator for other observations of the same variables
+
+        Returns
+        -------
+        self : StreamingDescrStatsW
+            this instance updated in place, `other` is not changed
+        '''
+        if not isinstance(other, StreamingDescrStatsW):
+            raise TypeError('other has to be a StreamingDescrStatsW '
+                            'instance')
+        if (self.compression is None) != (other.compression is None):
+            raise ValueError('either both or none of the instances need to '
+                             'keep quantile sketches')
+        if other._sum_weights == 0:
+            return self
+        if self._mean is not None and other._mean.shape != self._mean.shape:
+            raise ValueError('the number of variables does not match the '
+                             'accumulated data')
+        if other._sketches is not None:
+            if self._sketches is None:
+                self._sketches = [self._new_sketch() for _ in
+                                  other._sketches]
+            for sketch, other_sketch in zip(self._sketches,
+                                            other._sketches):
+                sketch.merge(other_sketch)
+        self._combine(other._sum_weights, other._mean, other._comoment)
+        return self
+
+    def _new_sketch(self):
+        from statsmodels.stats._tdigest import TDigest
+        return TDigest(self.compression)
+
+    def _update_sketches(self, data, weights):
+        columns = [data] if data.ndim == 1 else data.T
+        if self._sketches is None:
+            self._sketches = [self._new_sketch() for _ in columns]
+        for sketch, vec in zip(self._sketches, columns):
+            sketch.update(vec, weights)
+
+    def _combine(self, sum_weights, mean, comoment):
+        if self._mean is None:
+            self._sum_weights = sum_weights
+            self._mean = np.array(mean, dtype=float)
+            self._comoment = np.array(comoment, dtype=float)
+            return
+        total = self._sum_weights + sum_weights
+        delta = mean - self._mean
+        factor = self._sum_weights * sum_weights / total
+        self._mean = self._mean + delta * (sum_weights / total)
+        if self._comoment.ndim == 2:
+            self._comoment += factor * np.outer(delta, delta)
+        else:
+            self._comoment += factor * delta**2
+        self._comoment += comoment
+        self._sum_weights = total
+
+    def _check_data(self):
+        if self._mean is None:
+            raise ValueError('no observations have been added')
+
+    @property
+    def sum_weights(self):
+        return self._sum_weights
+
+    @property
+    def nobs(self):
+        '''alias for number of observations/cases, equal to sum of weights
+        '''
+        return self._sum_weights
+
+    @property
+    def sum(self):
+        '''weighted sum of data'''
+        return self.mean * self._sum_weights
+
+    @property
+    def mean(self):
+        '''weighted mean of data'''
+        self._check_data()
+        return self._mean.copy()[()]
+
+    @property
+    def sumsquares(self):
+        '''weighted sum of squares of demeaned data'''
+        self._check_data()
+        if self._comoment.ndim == 2:
+            return np.diag(self._comoment).copy()
+        return self._comoment.copy()[()]
+
+    @property
+    def var(self):
+        '''variance with default degrees of freedom correction
+        '''
+        return self.sumsquares / (self.sum_weights - self.ddof)
+
+    @property
+    def _var(self):
+        '''variance without degrees of freedom correction
+
+        used for statistical tests with controlled ddof
+        '''
+        return self.sumsquares / self.sum_weights
+
+    @property
+    def std(self):
+        '''standard deviation with default degrees of freedom correction
+        '''
+        return np.sqrt(self.var)
+
+    @property
+    def cov(self):
+        '''weighted covariance of data if data is 2 dimensional
+
+        assumes variables in columns and observations in rows
+        uses default ddof
+        '''
+        self._check_data()
+        return self._comoment / (self.sum_weights - self.ddof)
+
+    @property
+    def corrcoef(self):
+        '''weighted correlation with default ddof
+
+        assumes variables in columns and observations in rows
+        '''
+        return self.cov / self.std / self.std[:, None]
+
+    @property
+    def std_mean(self):
+        '''standard deviation of weighted mean
+        '''
+        std = self.std
+        if self.ddof != 0:
+            std = std * np.sqrt((self.sum_weights - self.ddof)
+                                / self.sum_weights)
+
+        return std / np.sqrt(self.sum_weights - 1)
+
+    @property
+    def demeaned(self):
+        raise NotImplementedError('the data is not available')
+
+    def quantile(self, probs, return_pandas=True, method='sketch',
+                 compression=None):
+        '''approximate quantiles from the t-digest sketches
+
+        Parameters
+        ----------
+        probs : array-like
+            A vector of probability points at which to calculate the
+            quantiles.  Each element of `probs` should fall in [0, 1].
+        return_pandas : bool
+            If True, return value is a Pandas DataFrame or Series.
+            Otherwise returns a ndarray.
+        method : 'sketch'
+            Exact quantiles are not available.
+        compression : None
+            Not used, the compression is set when the instance is created.
+
+        Returns
+        -------
+        quantiles : Series, DataFrame, or ndarray
+            See `DescrStatsW.quantile`.
+        '''
+        if method != 'sketch':
+            raise NotImplementedError('the data is not available')
+        return super(StreamingDescrStatsW, self).quantile(
+            probs, return_pandas=return_pandas, method=method)
+
+    def _quantile_sketch(self, probs, compression):
+        if self.compression is None:
+            raise ValueError('quantiles require compression to be set when '
+                             'the instance is created')
+        self._check_data()
+        rslt = [sketch.quantile(probs) for sketch in self._sketches]
+        if self._mean.ndim == 0:
+            return rslt[0]
+        return np.column_stack(rslt)
+
+    def asrepeats(self):
+        raise NotImplementedError('the data is not available')
+
+
+def _quantile_frame(rslt, probs):
+    # Series for 1-D data, DataFrame with a column for each variable else
+    import pandas as pd
+
+    if rslt.ndim == 1:
+        rslt = pd.Series(rslt, index=probs)
+    else:
+        columns = ["col%d" % (j+1) for j in range(rslt.shape[1])]
+        rslt = pd.DataFrame(data=rslt, columns=columns, index=probs)
+    rslt.index.name = "p"
+    return rslt
+
+
 def _tstat_generic(value1, value2, std_diff, dof, alternative, diff=0):
     '''generic ttest to save typing'''
 
@@ -0,0 +1,75 @@
+"""
+Import-time guards for the lazily loaded api modules
+"""
+import json
+import subprocess
+import sys
+
+import pytest
+
+LAZY = sys.version_info >= (3, 7)
+
+_SCRIPT = """
+import json, sys
+before = set(sys.modules)
+import {module}
+{access}
+new = sorted(set(sys.modules) - before)
+print(json.dumps({{'modules': new}}))
+"""
+
+
+def _import_in_subprocess(module, access=''):
+    script = _SCRIPT.format(module=module, access=access)
+    out = subprocess.check_output([sys.executable, '-c', script])
+    return json.loads(out.decode('utf-8').strip().splitlines()[-1])
+
+
+@pytest.mark.skipif(not LAZY, reason='lazy attributes require Python 3.7')
+@pytest.mark.parametrize('module', ['statsmodels.api', 'statsmodels.tsa.api',
+                                    'statsmodels.stats.api',
+                                    'statsmodels.genmod.api',
+                                    'statsmodels.graphics.api'])
+def test_api_import_is_lazy(module):
+    res = _import_in_subprocess(module)
+    loaded = res['modules']
+    assert module in loaded
+    for heavy in ['numpy', 'scipy', 'pandas', 'matplotlib', 'patsy',
+                  'distutils.version', 'statsmodels.regression',
+                  'statsmodels.tsa.statespace', 'statsmodels.base.model',
+                  'statsmodels.tools.tools', 'statsmodels.tools.data',
+                  'statsmodels.tsa.stattools', 'statsmodels.discrete',
+                  'statsmodels.genmod.generalized_linear_model',
+                  'statsmodels.stats.diagnostic', 'statsmodels.iolib',
+                  'statsmodels.graphics.tsaplots']:
+        assert heavy not in loaded, heavy
+
+
+@pytest.mark.skipif(not LAZY, reason='lazy attributes require Python 3.7')
+def test_ols_does_not_load_other_models():
+    res = _import_in_subprocess('statsmodels.api as sm', 'sm.OLS')
+    loaded = res['modules']
+    assert 'statsmodels.regression.linear_model' in loaded
+    for other in ['statsmodels.tsa.statespace', 'statsmodels.tsa.api',
+                  'statsmodels.discrete.discrete_model',
+                  'statsmodels.genmod.generalized_estimating_equations',
+                  'statsmodels.graphics.api', 'statsmodels.imputation.mice',
+                  'statsmodels.multivariate.pca']:
+        assert other not in loaded, other
+
+
+def test_api_attributes():
+    import statsmodels.api as sm
+    import statsmodels.tsa.api as tsa
+    from statsmodels.tsa import stattools
+
+    assert set(stattools.__all__) <= set(dir(tsa))
+    from statsmodels.tools._lazy import module_all
+    assert module_all('statsmodels.tsa.stattools') == stattools.__all__
+    assert 'OLS' in dir(sm)
+    from statsmodels.regression.linear_model import OLS
+    assert sm.OLS is OLS
+    assert sm.tsa.statespace.SARIMAX.__name__ == 'SARIMAX'
+    assert sm.robust.norms.HuberT.__name__ == 'HuberT'
+    with pytest.raises(AttributeError):
+        sm.not_a_model
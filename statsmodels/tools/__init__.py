@@ -1 +1,7 @@
-from .tools import add_constant, categorical
+from ._lazy import install_lazy_attributes
+
+install_lazy_attributes(globals(), {
+    'add_constant': ('statsmodels.tools.tools', 'add_constant'),
+    'categorical': ('statsmodels.tools.tools', 'categorical'),
+    })
+del install_lazy_attributes
@@ -0,0 +1,83 @@
+"""
+Lazy attribute loading for the api modules
+
+On Python 3.7 and later the attributes of an api module are imported on
+first access through a module level ``__getattr__`` (PEP 562). On older
+versions all attributes are imported eagerly, which is the behavior of the
+explicit import statements that the api modules used before.
+"""
+import ast
+import importlib
+import pkgutil
+import sys
+
+LAZY = sys.version_info >= (3, 7)
+
+
+def module_all(module_name):
+    """
+    Return ``__all__`` of a module without importing it
+
+    The literal ``__all__`` assignment is parsed from the source of the
+    module. If the source is not available, then the module is imported.
+    """
+    loader = pkgutil.get_loader(module_name)
+    source = loader.get_source(module_name) if loader is not None else None
+    if source is not None:
+        for node in ast.parse(source).body:
+            if not isinstance(node, ast.Assign):
+                continue
+            if any(getattr(target, 'id', None) == '__all__'
+                   for target in node.targets):
+                return list(ast.literal_eval(node.value))
+    return list(importlib.import_module(module_name).__all__)
+
+
+def install_lazy_attributes(module_globals, attributes):
+    """
+    Make the attributes of a module load on first access
+
+    Parameters
+    ----------
+    module_globals : dict
+        The ``globals()`` of the module.
+    attributes : dict
+        Maps attribute names to ``(module, attr)`` tuples. `module` is an
+        absolute module name and `attr` is the name of the object in that
+        module, or None if the attribute is the module itself.
+
+    Notes
+    -----
+    ``__all__`` of the module is extended by the lazy attributes so that
+    ``from module import *`` keeps working, at the cost of importing
+    everything.
+    """
+    module_name = module_globals['__name__']
+    public = [name for name in attributes if not name.startswith('_')]
+    module_globals['__all__'] = sorted(
+        set(module_globals.get('__all__', [])) | set(public))
+
+    def _load(name):
+        modname, attr = attributes[name]
+        value = importlib.import_module(modname)
+        if attr is not None:
+            value = getattr(value, attr)
+        module_globals[name] = value
+        return value
+
+    if not LAZY:
+        for name in attributes:
+            _load(name)
+        return
+
+    def __getattr__(name):
+        if name not in attributes:
+            raise AttributeError('module %r has no attribute %r'
+                                 % (module_name, name))
+        return _load(name)
+
+    def __dir__():
+        return sorted(set(module_globals) | set(attributes))
+
+    module_globals['__getattr__'] = __getattr__
+    module_globals['__dir__'] = __dir__
@@ -75,3 +75,61 @@ def stationary_solve(r, b):
         x = x[:, 0]
 
     return x
+
+
+def stacked_qr(a, b=None):
+    """
+    QR decomposition of a stack of matrices by Householder reflections.
+
+    The reflections are computed for all matrices of the stack at once,
+    which is much faster than a loop for many small problems. numpy only
+    supports stacked arrays in `np.linalg.qr` since version 1.22.
+
+    Parameters
+    ----------
+    a : array-like
+        3d array with shape (m, n, k) and n >= k, a stack of m matrices.
+    b : array-like, optional
+        2d array with shape (m, n) or 3d array with shape (m, n, p), the
+        right-hand sides that are multiplied by the transpose of Q.
+
+    Returns
+    -------
+    r : ndarray
+        The upper triangular factors with shape (m, k, k).
+    qtb : ndarray
+        The product Q'b with the same shape as b, where Q is the full
+        orthogonal matrix with shape (m, n, n). The first k rows are the
+        coefficients of b in the column space of a, the sum of squares of
+        the remaining rows is the residual sum of squares. Only returned if
+        b is not None.
+    """
+    a = np.array(a, dtype=np.double)
+    m, n, k = a.shape
+    if n < k:
+        raise ValueError('the matrices need at least as many rows as columns')
+    if b is not None:
+        b = np.array(b, dtype=np.double)
+        vector = b.ndim == 2
+        if vector:
+            b = b[:, :, None]
+    for j in range(k):
+        v = a[:, j:, j].copy()
+        norm = np.sqrt((v ** 2).sum(1))
+        # reflect onto -sign(v[0]) e_1 to avoid cancellation
+        v[:, 0] += np.where(v[:, 0] < 0, -norm, norm)
+        vnorm2 = (v ** 2).sum(1)
+        nonzero = vnorm2 > 0
+        beta = np.zeros(m)
+        beta[nonzero] = 2 / vnorm2[nonzero]
+        beta_v = beta[:, None] * v
+        sub = a[:, j:, j:]
+        sub -= beta_v[:, :, None] * np.einsum('mi,mik->mk', v, sub)[:, None]
+        if b is not None:
+            sub = b[:, j:]
+            sub -= (beta_v[:, :, None] *
+                    np.einsum('mi,mip->mp', v, sub)[:, None])
+    r = np.triu(a[:, :k])
+    if b is None:
+        return r
+    return r, b[:, :, 0] if vector else b
@@ -14,6 +14,8 @@ from __future__ import print_function
 import numpy as np
 from scipy import optimize
 
+from statsmodels.tools.tools import Bunch
+
 DEBUG = False
 
 
@@ -218,3 +220,320 @@ def brentq_expanding(func, low=None, upp=None, args=(), xtol=1e-5,
         return val, info
     else:
         return res
+
+
+def root_bracket_vec(func, low, upp, f_low=None, f_upp=None, args=(),
+                     xtol=1e-10, rtol=4 * np.finfo(float).eps, ftol=0.,
+                     maxiter=100, full_output=False):
+    '''find the roots of many functions in bracketing intervals
+
+    Each element of ``low`` and ``upp`` defines a separate root finding
+    problem. All problems are solved at the same time with the Illinois
+    version of the regula falsi method, so that ``func`` is evaluated on
+    arrays.
+
+    Parameters
+    ----------
+    func : callable
+        ``func(x, idx, *args)`` returns the function values at the points
+        ``x`` for the problems with indices ``idx``. ``idx`` is an integer
+        array of the same length as ``x`` that indexes the flattened arrays
+        of bounds.
+    low, upp : array_like
+        bounds of the bracketing intervals. The function values at the
+        bounds need to have opposite signs.
+    f_low, f_upp : None or array_like
+        function values at the bounds. They are computed if they are None.
+    args : tuple
+        optional additional arguments for ``func``
+    xtol, rtol : float
+        absolute and relative tolerance, an element is converged if the
+        length of the bracket is at most ``xtol + rtol * abs(x)``.
+    ftol : float or array_like
+        an element is also converged if the absolute value of the function is
+        at most ``ftol``.
+    maxiter : int
+        maximum number of iterations
+    full_output : bool, optional
+        If full_output is False, the roots are returned. If full_output is
+        True, the return value is (x, info).
+
+    Returns
+    -------
+    x : ndarray
+        roots with the broadcast shape of ``low`` and ``upp``. The roots are
+        nan for problems for which the bounds do not bracket a root.
+    info : Bunch (optional)
+        returned if ``full_output`` is True.
+        attributes:
+
+         - converged : boolean array, True if the element converged
+         - iterations : number of iterations for each element
+         - function_calls : number of calls to ``func``
+
+    Notes
+    -----
+    A bisection step is used instead of the regula falsi step if the length
+    of the bracket did not shrink by at least half in the previous two
+    iterations, so that the bracket length is halved at least every three
+    iterations.
+
+    The function values need to be finite at points inside the brackets.
+    If a function value at a bound is infinite, then bisection is used
+    until this bound has been replaced.
+
+    See Also
+    --------
+    root_expanding_vec
+    '''
+    low, upp = np.broadcast_arrays(np.asarray(low, dtype=float),
+                                   np.asarray(upp, dtype=float))
+    shape = low.shape
+    low, upp = low.ravel().copy(), upp.ravel().copy()
+    n = low.shape[0]
+    all_idx = np.arange(n)
+    n_calls = 0
+    if f_low is None:
+        f_low = func(low, all_idx, *args)
+        n_calls += 1
+    if f_upp is None:
+        f_upp = func(upp, all_idx, *args)
+        n_calls += 1
+    f_low = np.broadcast_to(np.asarray(f_low, dtype=float), shape).ravel()
+    f_upp = np.broadcast_to(np.asarray(f_upp, dtype=float), shape).ravel()
+    f_low, f_upp = f_low.copy(), f_upp.copy()
+    ftol = np.broadcast_to(np.asarray(ftol, dtype=float), shape).ravel()
+
+    x = np.nan * np.ones(n)
+    converged = np.zeros(n, bool)
+    iterations = np.zeros(n, int)
+    # roots at the bounds
+    at_low = f_low == 0
+    at_upp = (f_upp == 0) & ~at_low
+    x[at_low] = low[at_low]
+    x[at_upp] = upp[at_upp]
+    converged[at_low | at_upp] = True
+    # side of the last replaced bound, -1 lower, 1 upper
+    side = np.zeros(n, int)
+    # bracket lengths of the two previous iterations for the safeguard
+    width1 = upp - low
+    width2 = np.inf * np.ones(n)
+    with np.errstate(invalid='ignore'):
+        valid = np.sign(f_low) * np.sign(f_upp) < 0
+    active = np.flatnonzero(valid)
+    for _ in range(maxiter):
+        if len(active) == 0:
+            break
+        lo, up = low[active], upp[active]
+        fl, fu = f_low[active], f_upp[active]
+        mid = (lo + up) / 2.
+        # bisect if the bracket did not shrink by half in two iterations,
+        # this is slow convergence, e.g. at multiple roots
+        width = up - lo
+        slow = width > 0.5 * width2[active]
+        width2[active], width1[active] = width1[active], width
+        with np.errstate(invalid='ignore', divide='ignore'):
+            xi = lo - fl * (up - lo) / (fu - fl)
+            xi = np.where((xi > lo) & (xi < up) & ~slow, xi, mid)
+        fx = np.asarray(func(xi, active, *args), dtype=float)
+        n_calls += 1
+        x[active] = xi
+        iterations[active] += 1
+
+        # Illinois modification, halve the function value at a bound that
+        # is retained twice in a row
+        new_low = np.sign(fx) == np.sign(fl)
+        i_low, i_upp = active[new_low], active[~new_low]
+        low[i_low] = xi[new_low]
+        f_low[i_low] = fx[new_low]
+        f_upp[i_low[side[i_low] == -1]] /= 2
+        upp[i_upp] = xi[~new_low]
+        f_upp[i_upp] = fx[~new_low]
+        f_low[i_upp[side[i_upp] == 1]] /= 2
+        side[active] = np.where(new_low, -1, 1)
+
+        done = ((np.abs(fx) <= ftol[active]) |
+                (upp[active] - low[active] <= xtol + rtol * np.abs(xi)))
+        converged[active[done]] = True
+        active = active[~done]
+
+    x = x.reshape(shape)
+    if full_output:
+        info = Bunch(converged=converged.reshape(shape),
+                     iterations=iterations.reshape(shape),
+                     function_calls=n_calls)
+        return x, info
+    return x
+
+
+def root_expanding_vec(func, shape, low=None, upp=None, args=(),
+                       start_low=None, start_upp=None, increasing=None,
+                       max_it=100, factor=10, xtol=1e-10,
+                       rtol=4 * np.finfo(float).eps, ftol=0., maxiter=100,
+                       full_output=False):
+    '''find the roots of many monotonic functions by expanding and bracketing
+
+    This is the vectorized version of ``brentq_expanding``. The starting
+    bounds are expanded separately for each element until they bracket the
+    root, then the roots are found with ``root_bracket_vec``.
+
+    Parameters
+    ----------
+    func : callable
+        ``func(x, idx, *args)`` returns the function values at the points
+        ``x`` for the problems with indices ``idx``. ``idx`` is an integer
+        array of the same length as ``x`` that indexes the flattened problems.
+    shape : tuple
+        shape of the array of root finding problems
+    low : None or array_like
+        lower bound, if None, then the lower bound is found by expansion.
+    upp : None or array_like
+        upper bound, if None, then the upper bound is found by expansion.
+    args : tuple
+        optional additional arguments for ``func``
+    start_low : None or array_like
+        starting bound for expansion with decreasing ``x``. It needs to be
+        negative. If None, then it is set to -1.
+    start_upp : None or array_like
+        starting bound for expansion with increasing ``x``. It needs to be
+        positive. If None, then it is set to 1.
+    increasing : None, bool or array_like
+        If None, then the function is evaluated at the initial bounds to
+        determine for each element whether the function is increasing or not.
+    max_it : int
+        maximum number of expansion steps for each element.
+    factor : float
+        expansion factor for step of shifting the bounds interval, default is
+        10.
+    xtol, rtol, ftol, maxiter :
+        options for ``root_bracket_vec``
+    full_output : bool, optional
+        If full_output is False, the roots are returned. If full_output is
+        True, the return value is (x, info).
+
+    Returns
+    -------
+    x : ndarray
+        roots with the given shape, nan if no bracket has been found.
+    info : Bunch (optional)
+        returned if ``full_output`` is True.
+        attributes:
+
+         - start_bounds : tuple of arrays, starting bounds for expansion
+         - bounds : tuple of arrays, brackets after expansion
+         - iterations_expand : number of expansion steps for each element
+         - increasing : boolean array
+         - converged : boolean array, True if the element converged
+         - iterations : number of bracketing iterations for each element
+         - function_calls : number of calls to ``func``
+
+    See Also
+    --------
+    brentq_expanding : scalar version that uses scipy's brentq
+    root_bracket_vec
+    '''
+    shape = tuple(np.atleast_1d(shape)) if np.ndim(shape) else (int(shape),)
+    n = int(np.prod(shape))
+
+    def _flat(value):
+        return np.broadcast_to(np.asarray(value, dtype=float),
+                               shape).ravel().copy()
+
+    # start_upp first because of possible sl = -1 > upp
+    if upp is not None:
+        su = _flat(upp)
+    elif start_upp is not None:
+        if np.any(np.asarray(start_upp) < 0):
+            raise ValueError('start_upp needs to be positive')
+        su = _flat(start_upp)
+    else:
+        su = np.ones(n)
+
+    if low is not None:
+        sl = _flat(low)
+    elif start_low is not None:
+        if np.any(np.asarray(start_low) > 0):
+            raise ValueError('start_low needs to be negative')
+        sl = _flat(start_low)
+    else:
+        sl = np.minimum(-1., su - 1.)
+
+    if upp is None:
+        su = np.maximum(su, sl + 1.)
+
+    all_idx = np.arange(n)
+    f_low = np.asarray(func(sl, all_idx, *args), dtype=float)
+    f_upp = np.asarray(func(su, all_idx, *args), dtype=float)
+    n_calls = 2
+    failed = np.zeros(n, bool)
+
+    # comparisons with nan function values are False
+    with np.errstate(invalid='ignore'):
+        if increasing is None:
+            # special case for F-distribution (symmetric around zero for effect
+            # size)
+            symm = (np.abs(f_upp - f_low) < 1e-15) & (sl == -1) & (su == 1)
+            if symm.any() and ((low is None) or (upp is None)):
+                idx = np.flatnonzero(symm)
+                sl[idx] = 1e-8
+                f_low[idx] = func(sl[idx], idx, *args)
+                n_calls += 1
+
+            # possibly func returns nan, don't change the bounds, only use
+            # interior points to find ``increasing``
+            fl_inc, fu_inc = f_low.copy(), f_upp.copy()
+            delta = su - sl
+            for fraction in [0.25, 0.5, 0.75]:
+                idx = np.flatnonzero(np.isnan(fl_inc))
+                if len(idx):
+                    fl_inc[idx] = func(sl[idx] + fraction * delta[idx], idx,
+                                       *args)
+                    n_calls += 1
+                idx = np.flatnonzero(np.isnan(fu_inc))
+                if len(idx):
+                    fu_inc[idx] = func(su[idx] + fraction * delta[idx], idx,
+                                       *args)
+                    n_calls += 1
+            failed = np.isnan(fl_inc) | np.isnan(fu_inc)
+            increasing = fl_inc < fu_inc
+        else:
+            increasing = np.broadcast_to(np.asarray(increasing, bool),
+                                         shape).ravel()
+        sign = np.where(increasing, 1., -1.)
+        start_bounds = (sl.copy().reshape(shape), su.copy().reshape(shape))
+
+        # expand the bounds, g = sign * f is increasing
+        n_it = np.zeros(n, int)
+        if low is None:
+            idx = np.flatnonzero((sign * f_low > 0) & (sl != 0) & ~failed)
+            while len(idx):
+                su[idx], f_upp[idx] = sl[idx], f_low[idx]
+                sl[idx] *= factor
+                f_low[idx] = func(sl[idx], idx, *args)
+                n_calls += 1
+                n_it[idx] += 1
+                idx = idx[(sign[idx] * f_low[idx] > 0) & (n_it[idx] < max_it)]
+        if upp is None:
+            idx = np.flatnonzero((sign * f_upp < 0) & (su != 0) & ~failed)
+            while len(idx):
+                sl[idx], f_low[idx] = su[idx], f_upp[idx]
+                su[idx] *= factor
+                f_upp[idx] = func(su[idx], idx, *args)
+                n_calls += 1
+                n_it[idx] += 1
+                idx = idx[(sign[idx] * f_upp[idx] < 0) & (n_it[idx] < max_it)]
+
+    f_low[failed] = np.nan
+    x, info = root_bracket_vec(func, sl, su, f_low, f_upp, args=args,
+                               xtol=xtol, rtol=rtol, ftol=ftol,
+                               maxiter=maxiter, full_output=True)
+    if not full_output:
+        return x.reshape(shape)
+    info.start_bounds = start_bounds
+    info.bounds = (sl.reshape(shape), su.reshape(shape))
+    info.iterations_expand = n_it.reshape(shape)
+    info.increasing = increasing.reshape(shape)
+    info.converged = info.converged.reshape(shape)
+    info.iterations = info.iterations.reshape(shape)
+    info.function_calls += n_calls
+    return x.reshape(shape), info
@@ -22,3 +22,22 @@ def test_stationary_solve_2d():
     soln = np.linalg.solve(tmat, b)
     soln1 = linalg.stationary_solve(r, b)
     assert_allclose(soln, soln1, rtol=1e-5, atol=1e-5)
+
+
+def test_stacked_qr():
+    rs = np.random.RandomState(0)
+    a = rs.standard_normal((5, 20, 4))
+    b = rs.standard_normal((5, 20))
+    r, qtb = linalg.stacked_qr(a, b)
+    for i in range(5):
+        q1, r1 = np.linalg.qr(a[i])
+        # the factors are unique up to the signs of the rows of r
+        sign = np.sign(np.diag(r1)) * np.sign(np.diag(r[i]))
+        assert_allclose(r[i], sign[:, None] * r1, atol=1e-12)
+        assert_allclose(qtb[i, :4], sign * q1.T.dot(b[i]), atol=1e-12)
+        ssr = np.sum((b[i] - q1.dot(q1.T.dot(b[i]))) ** 2)
+        assert_allclose(np.sum(qtb[i, 4:] ** 2), ssr)
+    r2, qtb2 = linalg.stacked_qr(a, b[:, :, None])
+    assert_allclose(r2, r)
+    assert_allclose(qtb2[:, :, 0], qtb)
+    assert_allclose(linalg.stacked_qr(a), r)
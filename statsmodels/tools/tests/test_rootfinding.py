@@ -7,10 +7,12 @@ Author: Josef Perktold
 """
 
 import numpy as np
-from statsmodels.tools.rootfinding import brentq_expanding
+from statsmodels.tools.rootfinding import (brentq_expanding,
+                                           root_bracket_vec,
+                                           root_expanding_vec)
 
 from numpy.testing import (assert_allclose, assert_equal, assert_raises,
-                           assert_array_less)
+                           assert_array_less, assert_)
 
 def func(x, a):
     f = (x - a)**3
@@ -91,3 +93,104 @@ def test_brentq_expanding():
         assert_equal(info1[k], info.__dict__[k])
 
     assert_allclose(info.root, a, rtol=1e-5)
+
+
+def test_root_expanding_vec():
+    # same cases as test_brentq_expanding, solved jointly
+    cases = [
+        (0, {}),
+        (50, {}),
+        (-50, {}),
+        (500000, dict(low=10000)),
+        (-50000, dict(upp=-1000)),
+        (500000, dict(low=300000, upp=700000)),
+        (-50000, dict(low=-70000, upp=-1000))
+        ]
+
+    funcs = [(func, None),
+             (func, True),
+             (funcn, None),
+             (funcn, False)]
+
+    for f, inc in funcs:
+        for a, kwds in cases:
+            a_vec = a + np.array([0, 0.5, 5])
+
+            def f_vec(x, idx):
+                return f(x, a_vec[idx])
+
+            res = root_expanding_vec(f_vec, 3, increasing=inc, xtol=1e-5,
+                                     **kwds)
+            assert_allclose(res, a_vec, rtol=1e-5, atol=1e-5)
+
+    # elementwise bounds and roots that are not bracketed
+    a_vec = np.array([-50000., 20, 500000])
+
+    def f_vec(x, idx):
+        return funcn(x, a_vec[idx])
+
+    res, info = root_expanding_vec(f_vec, 3, low=[-70000, 0, 0],
+                                   upp=[-1000, 10, 700000], xtol=1e-5,
+                                   full_output=True)
+    assert_allclose(res[[0, 2]], a_vec[[0, 2]], rtol=1e-5)
+    assert_(np.isnan(res[1]))
+    assert_equal(info.converged, [True, False, True])
+    assert_equal(info.iterations_expand, [0, 0, 0])
+
+    # max_it too low to find root bounds
+    def f_vec(x, idx):
+        return func(x, -50000)
+
+    res, info = root_expanding_vec(f_vec, (2,), max_it=2, full_output=True)
+    assert_equal(info.converged, [False, False])
+    assert_equal(info.iterations_expand, [2, 2])
+
+    # cannot determine whether increasing, all 4 low trial points return nan
+    def f_vec(x, idx):
+        return func_nan(x, np.array([-20, 3])[idx], np.array([0.6, -2])[idx])
+
+    res, info = root_expanding_vec(f_vec, 2, full_output=True)
+    assert_(np.isnan(res[0]))
+    assert_allclose(res[1], 3, rtol=1e-5)
+    assert_equal(info.converged, [False, True])
+
+    # full_output, 500 is bracketed by the same bounds as in brentq_expanding
+    res, info = root_expanding_vec(lambda x, idx: func(x, 500), (), xtol=1e-5,
+                                   full_output=True)
+    assert_allclose(res, 500, rtol=1e-5)
+    assert_equal(info.bounds, (100, 1000))
+    assert_equal(info.start_bounds, (-1, 1))
+    assert_equal(info.iterations_expand, 3)
+    assert_(info.converged)
+
+
+def test_root_bracket_vec():
+    target = np.array([0.5, 2, 10, 1e-5, 0.1])
+
+    def f(x, idx):
+        return np.log(x) - np.log(target[idx])
+
+    res, info = root_bracket_vec(f, 1e-8 * np.ones(5), 100., full_output=True)
+    assert_allclose(res, target, rtol=1e-10)
+    assert_(info.converged.all())
+    assert_array_less(info.iterations, 50)
+
+    # decreasing function, roots at the bounds and invalid brackets
+    low = np.array([0.1, 0.5, 1, 3, 20])
+    upp = np.array([1., 2, 3, 5, 30])
+
+    def f(x, idx):
+        return np.log(target[idx]) - np.log(x)
+
+    res, info = root_bracket_vec(f, low, upp, full_output=True)
+    assert_allclose(res[:2], target[:2], rtol=1e-10)
+    assert_(np.isnan(res[2:]).all())
+    assert_equal(info.converged, [True, True, False, False, False])
+
+    # infinite function value at a bound
+    def f(x, idx):
+        with np.errstate(divide='ignore'):
+            return np.log(x) - np.log(target[idx])
+
+    res = root_bracket_vec(f, np.zeros(5), 100.)
+    assert_allclose(res, target, rtol=1e-10)
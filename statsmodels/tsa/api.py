@@ -1,27 +1,57 @@
-from .ar_model import AR
-from .arima_model import ARMA, ARIMA
-from . import vector_ar as var
-from .arima_process import arma_generate_sample, ArmaProcess
-from .vector_ar.var_model import VAR
-from .vector_ar.vecm import VECM
-from .vector_ar.svar_model import SVAR
-from .vector_ar.dynamic import DynamicVAR
-from .filters import api as filters
-from . import tsatools
-from .tsatools import (add_trend, detrend, lagmat, lagmat2ds, add_lag)
-from . import interp
-from . import stattools
-from .stattools import *
-from .base import datetools
-from .seasonal import seasonal_decompose
-from ..graphics import tsaplots as graphics
-from .x13 import x13_arima_select_order
-from .x13 import x13_arima_analysis
-from .statespace import api as statespace
-from .statespace.sarimax import SARIMAX
-from .statespace.structural import UnobservedComponents
-from .statespace.varmax import VARMAX
-from .statespace.dynamic_factor import DynamicFactor
-from .regime_switching.markov_regression import MarkovRegression
-from .regime_switching.markov_autoregression import MarkovAutoregression
-from .holtwinters import ExponentialSmoothing, SimpleExpSmoothing, Holt
\ No newline at end of file
+"""
+Time series analysis API
+
+Models and functions are imported on first access, see
+statsmodels.tools._lazy.
+"""
+from statsmodels.tools._lazy import install_lazy_attributes, module_all
+
+install_lazy_attributes(globals(), dict(
+    [(name, ('statsmodels.tsa.stattools', name))
+     for name in module_all('statsmodels.tsa.stattools')] + [
+        ('AR', ('statsmodels.tsa.ar_model', 'AR')),
+        ('ARMA', ('statsmodels.tsa.arima_model', 'ARMA')),
+        ('ARIMA', ('statsmodels.tsa.arima_model', 'ARIMA')),
+        ('var', ('statsmodels.tsa.vector_ar', None)),
+        ('arma_generate_sample', ('statsmodels.tsa.arima_process',
+                                  'arma_generate_sample')),
+        ('ArmaProcess', ('statsmodels.tsa.arima_process', 'ArmaProcess')),
+        ('VAR', ('statsmodels.tsa.vector_ar.var_model', 'VAR')),
+        ('VECM', ('statsmodels.tsa.vector_ar.vecm', 'VECM')),
+        ('SVAR', ('statsmodels.tsa.vector_ar.svar_model', 'SVAR')),
+        ('DynamicVAR', ('statsmodels.tsa.vector_ar.dynamic', 'DynamicVAR')),
+        ('filters', ('statsmodels.tsa.filters.api', None)),
+        ('tsatools', ('statsmodels.tsa.tsatools', None)),
+        ('add_trend', ('statsmodels.tsa.tsatools', 'add_trend')),
+        ('detrend', ('statsmodels.tsa.tsatools', 'detrend')),
+        ('lagmat', ('statsmodels.tsa.tsatools', 'lagmat')),
+        ('lagmat2ds', ('statsmodels.tsa.tsatools', 'lagmat2ds')),
+        ('add_lag', ('statsmodels.tsa.tsatools', 'add_lag')),
+        ('interp', ('statsmodels.tsa.interp', None)),
+        ('stattools', ('statsmodels.tsa.stattools', None)),
+        ('datetools', ('statsmodels.tsa.base.datetools', None)),
+        ('seasonal_decompose', ('statsmodels.tsa.seasonal',
+                                'seasonal_decompose')),
+        ('graphics', ('statsmodels.graphics.tsaplots', None)),
+        ('x13_arima_select_order', ('statsmodels.tsa.x13',
+                                    'x13_arima_select_order')),
+        ('x13_arima_analysis', ('statsmodels.tsa.x13', 'x13_arima_analysis')),
+        ('statespace', ('statsmodels.tsa.statespace.api', None)),
+        ('SARIMAX', ('statsmodels.tsa.statespace.sarimax', 'SARIMAX')),
+        ('UnobservedComponents', ('statsmodels.tsa.statespace.structural',
+                                  'UnobservedComponents')),
+        ('VARMAX', ('statsmodels.tsa.statespace.varmax', 'VARMAX')),
+        ('DynamicFactor', ('statsmodels.tsa.statespace.dynamic_factor',
+                           'DynamicFactor')),
+        ('MarkovRegression', ('statsmodels.tsa.regime_switching.'
+                              'markov_regression', 'MarkovRegression')),
+        ('MarkovAutoregression', ('statsmodels.tsa.regime_switching.'
+                                  'markov_autoregression',
+                                  'MarkovAutoregression')),
+        ('ExponentialSmoothing', ('statsmodels.tsa.holtwinters',
+                                  'ExponentialSmoothing')),
+        ('SimpleExpSmoothing', ('statsmodels.tsa.holtwinters',
+                                'SimpleExpSmoothing')),
+        ('Holt', ('statsmodels.tsa.holtwinters', 'Holt')),
+        ]))
+del install_lazy_attributes, module_all
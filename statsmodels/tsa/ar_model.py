@@ -5,6 +5,7 @@ from statsmodels.compat.python import iteritems, range, string_types, lmap, long
 import numpy as np
 from numpy import dot, identity
 from numpy.linalg import inv, slogdet
+from scipy.linalg import toeplitz
 from scipy.stats import norm
 from statsmodels.regression.linear_model import OLS
 from statsmodels.tsa.tsatools import (lagmat, add_trend,
@@ -13,7 +14,8 @@ import statsmodels.tsa.base.tsa_model as tsbase
 import statsmodels.base.model as base
 from statsmodels.tools.decorators import (resettable_cache,
                                           cache_readonly, cache_writable)
-from statsmodels.tools.numdiff import approx_fprime, approx_hess
+from statsmodels.tools.numdiff import (approx_fprime, approx_fprime_cs,
+                                       approx_hess)
 from statsmodels.tsa.kalmanf.kalmanfilter import KalmanFilter
 import statsmodels.base.wrapper as wrap
 from statsmodels.tsa.vector_ar import util
@@ -247,20 +249,42 @@ class AR(tsbase.TimeSeriesModel):
         -----
         See Hamilton p. 125
         """
-        k = self.k_trend
-        p = self.k_ar
-        p1 = p+1
-
-        # get inv(Vp) Hamilton 5.3.7
-        params0 = np.r_[-1, params[k:]]
+        # get inv(Vp) Hamilton 5.3.7, which has the Gohberg-Semencul form
+        # L1 L1' - L2 L2' with lower triangular Toeplitz L1 and L2
+        l1, l2 = self._presample_factors(params)
+        return dot(l1, l1.T) - dot(l2, l2.T)
 
-        Vpinv = np.zeros((p, p), dtype=params.dtype)
-        for i in range(1, p1):
-            Vpinv[i-1, i-1:] = np.correlate(params0, params0[:i],)[:-1]
-            Vpinv[i-1, i-1:] -= np.correlate(params0[-i:], params0,)[:-1]
-
-        Vpinv = Vpinv + Vpinv.T - np.diag(Vpinv.diagonal())
-        return Vpinv
+    def _presample_factors(self, params):
+        """
+        Toeplitz factors of the inverse presample variance-covariance.
+        """
+        p = self.k_ar
+        if p == 0:
+            empty = np.zeros((0, 0), dtype=params.dtype)
+            return empty, empty
+        arparams = params[self.k_trend:]
+        zeros = np.zeros(p - 1, dtype=params.dtype)
+        l1 = toeplitz(np.r_[1, -arparams[:-1]], np.r_[1, zeros])
+        l2 = toeplitz(arparams[::-1], np.r_[arparams[-1], zeros])
+        return l1, l2
+
+    def _presample_varcov_deriv(self, params):
+        """
+        Derivatives of the inverse presample variance-covariance with respect
+        to the AR coefficients, stacked along the first axis.
+        """
+        p = self.k_ar
+        l1, l2 = self._presample_factors(params)
+        deriv = np.empty((p, p, p), dtype=l1.dtype)
+        for i in range(1, p + 1):
+            # L1 = I - sum_i ar_i S^i and L2 = sum_i ar_i S^(p - i), where S
+            # is the shift matrix
+            dl1 = -np.eye(p, k=-i)
+            dl2 = np.eye(p, k=i - p)
+            dl1l1 = dot(dl1, l1.T)
+            dl2l2 = dot(dl2, l2.T)
+            deriv[i - 1] = dl1l1 + dl1l1.T - dl2l2 - dl2l2.T
+        return deriv
 
     def _loglike_css(self, params):
         """
@@ -311,6 +335,44 @@ class AR(tsbase.TimeSeriesModel):
                            logdet + diffpVpinv / sigma2 + ssr / sigma2)
         return loglike
 
+    def _score_mle(self, params):
+        """
+        Analytic score of the exact loglikelihood of an AR(p) process
+        """
+        nobs = self.nobs
+        X = self.X
+        k_ar = self.k_ar
+        k_trend = self.k_trend
+        trans_params = params
+        if self.transparams:
+            params = self._transparams(params)
+
+        # presample deviations from the mean and their derivatives
+        denom = 1 - np.sum(params[k_trend:])
+        const = params[0] if k_trend else 0
+        diffp = self.endog[:k_ar, 0] - const / denom
+        ddiffp = np.zeros((k_ar, len(params)), dtype=params.dtype)
+        if k_trend:
+            ddiffp[:, 0] = -1. / denom
+        ddiffp[:, k_trend:] = -const / denom ** 2
+
+        Vpinv = self._presample_varcov(params)
+        dVpinv = self._presample_varcov_deriv(params)
+        Vpinv_diffp = dot(Vpinv, diffp)
+        resid = self.endog[k_ar:, 0] - dot(X, params)
+
+        # the concentrated loglikelihood only depends on the params through
+        # the sum of squares and the determinant of Vpinv
+        sigma2 = (dot(diffp, Vpinv_diffp) + dot(resid, resid)) / nobs
+        dss = 2 * dot(Vpinv_diffp, ddiffp) - 2 * dot(resid, X)
+        dss[k_trend:] += np.einsum('i,kij,j->k', diffp, dVpinv, diffp)
+        score = -dss / (2 * sigma2)
+        score[k_trend:] += 0.5 * np.einsum('ij,kji->k', inv(Vpinv), dVpinv)
+        if self.transparams:
+            score = dot(score, approx_fprime_cs(trans_params,
+                                                self._transparams))
+        return score
+
     def loglike(self, params):
         """
         The loglikelihood of an AR(p) process
@@ -361,10 +423,17 @@ class AR(tsbase.TimeSeriesModel):
 
         Notes
         -----
-        Returns numerical gradient.
+        The score of the conditional and of the exact loglikelihood are
+        analytic. The exact score is computed with numpy from the presample
+        covariance and its derivative, there is no compiled kernel for it.
+        If the parameters are transformed, then the Jacobian of the
+        transformation is a numerical derivative.
         """
-        loglike = self.loglike
-        return approx_fprime(params, loglike, epsilon=1e-8)
+        params = np.asarray(params)
+        if self.method == "cmle":
+            resid = self.Y[:, 0] - dot(self.X, params)
+            return self.nobs / dot(resid, resid) * dot(resid, self.X)
+        return self._score_mle(params)
 
     def information(self, params):
         """
@@ -374,10 +443,23 @@ class AR(tsbase.TimeSeriesModel):
 
     def hessian(self, params):
         """
-        Returns numerical hessian for now.
+        Returns the hessian of the loglikelihood.
+
+        Notes
+        -----
+        The hessian of the conditional loglikelihood is analytic. The hessian
+        of the exact loglikelihood is a numerical derivative of the score.
         """
-        loglike = self.loglike
-        return approx_hess(params, loglike)
+        params = np.asarray(params)
+        if self.method == "cmle":
+            X = self.X
+            resid = self.Y[:, 0] - dot(X, params)
+            ssr = dot(resid, resid)
+            score = dot(resid, X)
+            return self.nobs * (-dot(X.T, X) / ssr +
+                                2 * np.outer(score, score) / ssr ** 2)
+        hess = approx_fprime(params, self.score, centered=True)
+        return (hess + hess.T) / 2.
 
     def _stackX(self, k_ar, trend):
         """
@@ -572,7 +654,6 @@ class AR(tsbase.TimeSeriesModel):
                 kwargs.setdefault('pgtol', 1e-8)
                 kwargs.setdefault('factr', 1e2)
                 kwargs.setdefault('m', 12)
-                kwargs.setdefault('approx_grad', True)
             mlefit = super(AR, self).fit(start_params=start_params,
                                          method=solver, maxiter=maxiter,
                                          full_output=full_output, disp=disp,
@@ -359,6 +359,64 @@ def _arma_predict_in_sample(start, end, endog, resid, k_ar, method):
     return fittedvalues[fv_start:fv_end]
 
 
+def _arma_css_errors(endog, exog, params, k, k_ar, jac=False):
+    """
+    Errors of the conditional sum of squares recursion and their Jacobian
+
+    Parameters
+    ----------
+    endog : ndarray
+        1d endogenous variable
+    exog : ndarray or None
+        Exogenous variables including the trend, only used if k > 0
+    params : ndarray
+        Untransformed parameters, exog params first, then AR and MA params
+    k : int
+        Number of exogenous variables including the trend
+    k_ar : int
+        AR order, the remaining params are MA params
+    jac : bool
+        If True, also return the derivative of the errors with respect to
+        params, as array with shape (nobs - k_ar, len(params)).
+
+    Notes
+    -----
+    The errors are zero for the first k_ar observations and the presample
+    errors are zero. The AR part is applied by differencing and the MA part
+    by a single call to lfilter. The Jacobian columns are obtained by
+    filtering the stacked derivatives of the AR filtered series with the same
+    MA polynomial, so the score is available from one filter pass.
+    """
+    arparams = params[k:k + k_ar]
+    maparams = params[k + k_ar:]
+    k_ma = len(maparams)
+    y = endog.astype(params.dtype)
+    if k > 0:
+        y = y - dot(exog, params[:k])
+    nobs = len(y) - k_ar
+    # AR filtered series u_t = y_t - sum_i ar_i y_{t-i}, t >= k_ar
+    u = y[k_ar:].copy()
+    for i in range(1, k_ar + 1):
+        u -= arparams[i - 1] * y[k_ar - i:k_ar - i + nobs]
+    a = np.r_[1, maparams]
+    errors = lfilter([1.], a, u)
+    if not jac:
+        return errors
+
+    du = np.empty((nobs, len(params)), dtype=params.dtype)
+    if k > 0:
+        exog_ar = exog[k_ar:].astype(params.dtype)
+        for i in range(1, k_ar + 1):
+            exog_ar -= arparams[i - 1] * exog[k_ar - i:k_ar - i + nobs]
+        du[:, :k] = -exog_ar
+    for i in range(1, k_ar + 1):
+        du[:, k + i - 1] = -y[k_ar - i:k_ar - i + nobs]
+    for j in range(1, k_ma + 1):
+        du[:j, k + k_ar + j - 1] = 0
+        du[j:, k + k_ar + j - 1] = -errors[:nobs - j]
+    return errors, lfilter([1.], a, du, axis=0)
+
+
 def _unpack_params(params, order, k_trend, k_exog, reverse=False):
     p, q = order
     k = k_trend + k_exog
@@ -557,12 +615,13 @@ class ARMA(tsbase.TimeSeriesModel):
         else:  # use CSS to get start params
             func = lambda params: -self.loglike_css(params)
             #start_params = [.1]*(k_ar+k_ma+k_exog) # different one for k?
+            fprime = lambda params: -self.score_css(params)
             start_params = self._fit_start_params_hr(order, start_ar_lags)
             if self.transparams:
                 start_params = self._invtransparams(start_params)
             bounds = [(None,)*2]*sum(order)
             mlefit = optimize.fmin_l_bfgs_b(func, start_params,
-                                            approx_grad=True, m=12,
+                                            fprime=fprime, m=12,
                                             pgtol=1e-7, factr=1e3,
                                             bounds=bounds, iprint=-1)
             start_params = mlefit[0]
@@ -576,8 +635,15 @@ class ARMA(tsbase.TimeSeriesModel):
 
         Notes
         -----
-        This is a numerical approximation.
+        This is analytic if the model is fit by 'css', see `score_css`.
+
+        If the model is fit by 'mle' or 'css-mle', then the score of the
+        exact loglikelihood is the complex step derivative of `loglike`,
+        which requires one Kalman filter pass per parameter. An analytic
+        score of the exact loglikelihood is not implemented.
         """
+        if getattr(self, 'method', None) == 'css':
+            return self.score_css(params)
         return approx_fprime_cs(params, self.loglike, args=(False,))
 
     def hessian(self, params):
@@ -586,8 +652,16 @@ class ARMA(tsbase.TimeSeriesModel):
 
         Notes
         -----
-        This is a numerical approximation.
+        This is a numerical approximation. If the model is fit by 'css'
+        and the parameters are not transformed, then it is the complex step
+        derivative of the analytic score. Otherwise it is the complex step
+        second derivative of `loglike`, which for the exact loglikelihood
+        requires a Kalman filter pass for each pair of parameters.
         """
+        if getattr(self, 'method', None) == 'css' and not self.transparams:
+            hess = approx_fprime_cs(np.asarray(params, dtype=float),
+                                    self.score_css)
+            return (hess + hess.T) / 2.
         return approx_hess_cs(params, self.loglike, args=(False,))
 
     def _transparams(self, params):
@@ -688,24 +762,7 @@ class ARMA(tsbase.TimeSeriesModel):
             if isinstance(errors, tuple):
                 errors = errors[0]  # non-cython version returns a tuple
         else:  # use scipy.signal.lfilter
-            y = self.endog.copy()
-            k = self.k_exog + self.k_trend
-            if k > 0:
-                y -= dot(self.exog, params[:k])
-
-            k_ar = self.k_ar
-            k_ma = self.k_ma
-
-            (trendparams, exparams,
-             arparams, maparams) = _unpack_params(params, (k_ar, k_ma),
-                                                  self.k_trend, self.k_exog,
-                                                  reverse=False)
-            b, a = np.r_[1, -arparams], np.r_[1, maparams]
-            zi = zeros((max(k_ar, k_ma)))
-            for i in range(k_ar):
-                zi[i] = sum(-b[:i+1][::-1]*y[:i+1])
-            e = lfilter(b, a, y, zi=zi)
-            errors = e[0][k_ar:]
+            errors = _arma_css_errors(self.endog, self.exog, params, k, k_ar)
         return errors.squeeze()
 
     def predict(self, params, start=None, end=None, exog=None, dynamic=False):
@@ -791,24 +848,15 @@ class ARMA(tsbase.TimeSeriesModel):
         """
         Conditional Sum of Squares likelihood function.
         """
-        k_ar = self.k_ar
-        k_ma = self.k_ma
-        k = self.k_exog + self.k_trend
-        y = self.endog.copy().astype(params.dtype)
         nobs = self.nobs
         # how to handle if empty?
         if self.transparams:
             newparams = self._transparams(params)
         else:
             newparams = params
-        if k > 0:
-            y -= dot(self.exog, newparams[:k])
-        # the order of p determines how many zeros errors to set for lfilter
-        b, a = np.r_[1, -newparams[k:k + k_ar]], np.r_[1, newparams[k + k_ar:]]
-        zi = np.zeros((max(k_ar, k_ma)), dtype=params.dtype)
-        for i in range(k_ar):
-            zi[i] = sum(-b[:i + 1][::-1] * y[:i + 1])
-        errors = lfilter(b, a, y, zi=zi)[0][k_ar:]
+        k = self.k_exog + self.k_trend
+        errors = _arma_css_errors(self.endog, self.exog, newparams, k,
+                                  self.k_ar)
 
         ssr = np.dot(errors, errors)
         sigma2 = ssr/nobs
@@ -817,6 +865,31 @@ class ARMA(tsbase.TimeSeriesModel):
         llf = -nobs/2.*(log(2*pi) + log(sigma2)) - ssr/(2*sigma2)
         return llf
 
+    def score_css(self, params):
+        """
+        Analytic score of the conditional sum of squares likelihood.
+
+        Notes
+        -----
+        The derivatives of the errors are obtained from a single filter pass,
+        see `loglike_css`. If the parameters are transformed, then the
+        Jacobian of the transformation is computed by complex step
+        differentiation, which does not require filtering.
+        """
+        params = np.asarray(params)
+        if self.transparams:
+            newparams = self._transparams(params)
+        else:
+            newparams = params
+        k = self.k_exog + self.k_trend
+        errors, jac = _arma_css_errors(self.endog, self.exog, newparams, k,
+                                       self.k_ar, jac=True)
+        ssr = np.dot(errors, errors)
+        score = -self.nobs / ssr * dot(errors, jac)
+        if self.transparams:
+            score = dot(score, approx_fprime_cs(params, self._transparams))
+        return score
+
     def fit(self, start_params=None, trend='c', method="css-mle",
             transparams=True, solver='lbfgs', maxiter=500, full_output=1,
             disp=5, callback=None, start_ar_lags=None, **kwargs):
@@ -950,7 +1023,8 @@ class ARMA(tsbase.TimeSeriesModel):
             kwargs.setdefault('pgtol', 1e-8)
             kwargs.setdefault('factr', 1e2)
             kwargs.setdefault('m', 12)
-            kwargs.setdefault('approx_grad', True)
+            # the css score is analytic
+            kwargs.setdefault('approx_grad', method != 'css')
         mlefit = super(ARMA, self).fit(start_params, method=solver,
                                        maxiter=maxiter,
                                        full_output=full_output, disp=disp,
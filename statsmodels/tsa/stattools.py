@@ -5,6 +5,8 @@ from statsmodels.compat.python import (iteritems, range, lrange, string_types,
                                        lzip, zip, long)
 from statsmodels.compat.scipy import _next_regular
 
+import time
+
 import numpy as np
 import pandas as pd
 from numpy.linalg import LinAlgError
@@ -15,6 +17,7 @@ from statsmodels.tools.sm_exceptions import (InterpolationWarning,
                                              MissingDataError,
                                              CollinearityWarning)
 from statsmodels.tools.tools import add_constant, Bunch
+from statsmodels.tools.linalg import stacked_qr
 from statsmodels.tsa._bds import bds
 from statsmodels.tsa.adfvalues import mackinnonp, mackinnoncrit
 from statsmodels.tsa.arima_model import ARMA
@@ -22,8 +25,9 @@ from statsmodels.tsa.tsatools import lagmat, lagmat2ds, add_trend
 
 __all__ = ['acovf', 'acf', 'pacf', 'pacf_yw', 'pacf_ols', 'ccovf', 'ccf',
            'periodogram', 'q_stat', 'coint', 'arma_order_select_ic',
-           'adfuller', 'kpss', 'bds', 'pacf_burg', 'innovations_algo',
-           'innovations_filter', 'levinson_durbin_pacf', 'levinson_durbin']
+           'adfuller', 'adfuller_many', 'kpss', 'bds', 'pacf_burg',
+           'innovations_algo', 'innovations_filter', 'levinson_durbin_pacf',
+           'levinson_durbin']
 
 SQRTEPS = np.sqrt(np.finfo(np.double).eps)
 
@@ -84,8 +88,15 @@ def _autolag(mod, endog, exog, startlag, maxlag, method, modargs=(),
     #TODO: This could be changed to laggedRHS and exog keyword arguments if
     #    this will be more general.
 
-    results = {}
     method = method.lower()
+    if (mod is OLS and not modargs and not fitargs and not regresults and
+            method in ("aic", "bic", "t-stat")):
+        # all nested regressions from a single QR of the full lag matrix
+        nested = _autolag_ols(endog, exog[:, :startlag + maxlag])
+        if nested is not None:
+            return _select_lag(nested, startlag, method)
+
+    results = {}
     for lag in range(startlag, startlag + maxlag + 1):
         mod_instance = mod(endog, exog[:, :lag], *modargs)
         results[lag] = mod_instance.fit()
@@ -112,6 +123,95 @@ def _autolag(mod, endog, exog, startlag, maxlag, method, modargs=(),
         return icbest, bestlag, results
 
 
+def _nested_ols_stats(qty, rdiag, ssr, nobs):
+    """
+    Fit statistics of the OLS regressions on nested leading column subsets
+
+    Parameters
+    ----------
+    qty : ndarray
+        Rotated endog, Q'y, from a triangular factorization X = QR of the
+        full design. The last axis indexes the columns of the design, leading
+        axes index independent regressions.
+    rdiag : ndarray
+        Diagonal of the triangular factor R, same shape as `qty`.
+    ssr : array_like
+        Sum of squared residuals of the regression on all columns, shape of
+        `qty` without the last axis.
+    nobs : int
+        Number of observations.
+
+    Returns
+    -------
+    res : Bunch
+        Bunch with `ssr`, `aic`, `bic` and `tvalues`. Element ``m`` along the
+        last axis belongs to the regression on the first ``m + 1`` columns,
+        `tvalues` is the t-value of the last included column.
+
+    Notes
+    -----
+    The sum of squared residuals of the regression on the first ``m + 1``
+    columns is the one of the full regression plus the squared components
+    ``m + 1, ..., k - 1`` of Q'y. The standard error of the last coefficient
+    of a nested regression only depends on the corresponding diagonal element
+    of R, so all nested regressions are available from one factorization.
+    The information criteria are the same as in `RegressionResults`.
+    """
+    qty2 = qty ** 2
+    tail = np.cumsum(qty2[..., ::-1], axis=-1)[..., ::-1]
+    ssr = np.asarray(ssr)[..., None] + tail - qty2
+    k = np.arange(1, qty.shape[-1] + 1)
+    nobs2 = nobs / 2.0
+    llf = -nobs2 * np.log(2 * np.pi) - nobs2 * np.log(ssr / nobs) - nobs2
+    aic = -2 * llf + 2 * k
+    bic = -2 * llf + np.log(nobs) * k
+    tvalues = np.sign(rdiag) * qty / np.sqrt(ssr / (nobs - k))
+    return Bunch(ssr=ssr, aic=aic, bic=bic, tvalues=tvalues)
+
+
+def _autolag_ols(endog, exog):
+    """
+    Statistics of all nested OLS regressions of endog on leading exog columns
+
+    Returns None if exog is rank deficient, in which case the nested models
+    have to be estimated one at a time with a generalized inverse.
+    """
+    q, r = np.linalg.qr(exog)
+    rdiag = np.diag(r)
+    tol = np.abs(rdiag).max() * max(exog.shape) * np.finfo(np.double).eps
+    if np.any(np.abs(rdiag) <= tol):
+        return None
+    qty = q.T.dot(endog)
+    ssr = np.sum((endog - q.dot(qty)) ** 2)
+    return _nested_ols_stats(qty, rdiag, ssr, exog.shape[0])
+
+
+def _select_lag(nested, startlag, method):
+    """
+    Lag length selection from the statistics of nested regressions
+
+    `nested` is the Bunch returned by `_nested_ols_stats`, with an optional
+    leading axis indexing independent series. Returns the best criterion and
+    the column count of the selected regression as in `_autolag`.
+    """
+    if method == "t-stat":
+        stop = 1.6448536269514722
+        tvalues = np.abs(nested.tvalues[..., startlag - 1:])
+        # the last lag whose t-value is significant, lag 0 if there is none
+        signif = tvalues[..., ::-1] >= stop
+        idx = tvalues.shape[-1] - 1 - np.argmax(signif, axis=-1)
+        idx = np.where(signif.any(-1), idx, 0)
+        ic = tvalues
+    else:
+        ic = nested[method][..., startlag - 1:]
+        # argmin returns the first, i.e. shortest, lag length on ties
+        idx = np.argmin(ic, axis=-1)
+    bestlag = idx + startlag
+    if ic.ndim == 1:
+        return ic[idx], int(bestlag)
+    return ic[np.arange(ic.shape[0]), idx], bestlag
+
+
 #this needs to be converted to a class like HetGoldfeldQuandt,
 # 3 different returns are a mess
 # See:
@@ -298,6 +398,157 @@ def adfuller(x, maxlag=None, regression="c", autolag='AIC',
             return adfstat, pvalue, usedlag, nobs, critvalues, icbest
 
 
+def _adf_regressors_many(x, xdiff, lags, regression, level_last=False):
+    """
+    ADF regression data for many series
+
+    `x` and `xdiff` hold one series per row. Returns the transposed design
+    with shape (nseries, k, nobs), trend rows first, and endog with shape
+    (nseries, nobs).
+    """
+    nobs = xdiff.shape[1] - lags
+    k_trend = 0 if regression == 'nc' else len(regression)
+    exog = np.empty((x.shape[0], k_trend + lags + 1, nobs))
+    if k_trend:
+        exog[:, :k_trend] = add_trend(np.empty((nobs, 0)), regression,
+                                      prepend=True).T
+    lvl = k_trend + lags if level_last else k_trend
+    exog[:, lvl] = x[:, -nobs - 1:-1]
+    first = k_trend if level_last else k_trend + 1
+    for j in range(1, lags + 1):
+        exog[:, first + j - 1] = xdiff[:, lags - j:lags - j + nobs]
+    return exog, xdiff[:, -nobs:]
+
+
+def _nested_ols_stats_many(endog, exog):
+    """
+    `_nested_ols_stats` for a stack of independent regressions
+
+    `exog` is the stack of transposed designs with shape (nseries, k, nobs).
+    The designs of all series are factorized together by `stacked_qr`.
+    Raises LinAlgError if any design is rank deficient.
+    """
+    r, qty = stacked_qr(exog.transpose(0, 2, 1), endog)
+    k = r.shape[-1]
+    rdiag = np.diagonal(r, axis1=-2, axis2=-1)
+    tol = (np.abs(rdiag).max(-1) * max(exog.shape[1:]) *
+           np.finfo(np.double).eps)
+    if np.any(np.abs(rdiag) <= tol[:, None]):
+        raise LinAlgError('Singular matrix')
+    qty = qty[:, :k]
+    params = np.linalg.solve(r, qty[..., None])
+    resid = endog - np.matmul(params.transpose(0, 2, 1), exog)[:, 0]
+    ssr = np.einsum('in,in->i', resid, resid)
+    return _nested_ols_stats(qty, rdiag, ssr, endog.shape[1])
+
+
+def adfuller_many(x, maxlag=None, regression="c", autolag='AIC'):
+    """
+    Augmented Dickey-Fuller unit root test for many series
+
+    Vectorized version of `adfuller` for series of equal length.
+
+    Parameters
+    ----------
+    x : array_like, 2d
+        data, each column is a series
+    maxlag : int
+        Maximum lag which is included in test, default 12*(nobs/100)^{1/4}
+    regression : {'c','ct','ctt','nc'}
+        Constant and trend order to include in regression, see `adfuller`
+    autolag : {'AIC', 'BIC', 't-stat', None}
+        Lag length selection, see `adfuller`. The lag length is selected
+        separately for each series.
+
+    Returns
+    -------
+    adf : ndarray
+        Test statistics
+    pvalue : ndarray
+        MacKinnon's approximate p-values
+    usedlag : ndarray
+        Number of lags used
+    nobs : ndarray
+        Number of observations used for the ADF regression and calculation of
+        the critical values
+    critical values : dict
+        Arrays of critical values at the 1 %, 5 %, and 10 % levels.
+    icbest : ndarray
+        The maximized information criterion if autolag is not None.
+
+    Notes
+    -----
+    All nested lag length regressions of a series are obtained from a single
+    factorization of the regressors with the maximal lag length, and the
+    factorizations of all series are computed together. If the regressors of
+    any series are singular, then the test falls back to calling `adfuller`
+    on each series.
+
+    If autolag is 't-stat' and no lag is significant, then no lags are used.
+
+    See Also
+    --------
+    adfuller
+    """
+    trenddict = {None: 'nc', 0: 'c', 1: 'ct', 2: 'ctt'}
+    if regression is None or isinstance(regression, (int, long)):
+        regression = trenddict[regression]
+    regression = regression.lower()
+    if regression not in ['c', 'nc', 'ct', 'ctt']:
+        raise ValueError("regression option %s not understood" % regression)
+    if autolag:
+        method = autolag.lower()
+        if method not in ('aic', 'bic', 't-stat'):
+            raise ValueError("autolag option %s not understood" % autolag)
+    x = np.asarray(x, dtype=np.double)
+    if x.ndim != 2:
+        raise ValueError("x must be 2-d with one series in each column")
+    nobs, nseries = x.shape
+
+    if maxlag is None:
+        maxlag = int(np.ceil(12. * np.power(nobs / 100., 1 / 4.)))
+
+    # one series per row keeps the lag slices contiguous
+    x = np.ascontiguousarray(x.T)
+    xdiff = np.diff(x, axis=1)
+    try:
+        if autolag:
+            exog, endog = _adf_regressors_many(x, xdiff, maxlag, regression)
+            startlag = exog.shape[1] - maxlag
+            nested = _nested_ols_stats_many(endog, exog)
+            icbest, bestlag = _select_lag(nested, startlag, method)
+            usedlag = bestlag - startlag
+        else:
+            usedlag = np.repeat(maxlag, nseries)
+            icbest = None
+
+        adfstat = np.empty(nseries)
+        for lag in np.unique(usedlag):
+            idx = usedlag == lag
+            exog, endog = _adf_regressors_many(x[idx], xdiff[idx], lag,
+                                               regression, level_last=True)
+            nested = _nested_ols_stats_many(endog, exog)
+            adfstat[idx] = nested.tvalues[:, -1]
+    except LinAlgError:
+        res = [adfuller(x[i], maxlag=maxlag, regression=regression,
+                        autolag=autolag) for i in range(nseries)]
+        adfstat, _, usedlag, _, _ = [np.array(r) for r in lzip(*res)][:5]
+        icbest = np.array([r[5] for r in res]) if autolag else None
+
+    usedlag = np.asarray(usedlag, dtype=int)
+    nobs = nobs - 1 - usedlag
+    pvalue = np.array([mackinnonp(stat, regression=regression, N=1)
+                       for stat in adfstat])
+    critvalues = mackinnoncrit(N=1, regression=regression,
+                               nobs=nobs[:, None])
+    critvalues = {"1%": critvalues[:, 0], "5%": critvalues[:, 1],
+                  "10%": critvalues[:, 2]}
+    if not autolag:
+        return adfstat, pvalue, usedlag, nobs, critvalues
+    else:
+        return adfstat, pvalue, usedlag, nobs, critvalues, icbest
+
+
 def acovf(x, unbiased=False, demean=True, fft=None, missing='none', nlag=None):
     """
     Autocovariance for 1D
@@ -405,7 +656,11 @@ def acovf(x, unbiased=False, demean=True, fft=None, missing='none', nlag=None):
         return acov
 
     if unbiased and deal_with_masked and missing == 'conservative':
-        d = np.correlate(notmask_int, notmask_int, 'full')
+        if fft:
+            d = _fft_correlate(notmask_int, notmask_int)
+            d = np.round(np.hstack((d[:0:-1], d)))
+        else:
+            d = np.correlate(notmask_int, notmask_int, 'full')
         d[d == 0] = 1
     elif unbiased:
         xi = np.arange(1, n + 1)
@@ -430,12 +685,86 @@ def acovf(x, unbiased=False, demean=True, fft=None, missing='none', nlag=None):
     return acov
 
 
+def _fft_correlate(x, y):
+    """
+    Lagged cross products sum_t x[t + k] * y[t] for k = 0, ..., nobs - 1
+
+    Computed by zero padded FFT along the first axis, for all columns of 2-d
+    inputs at once.
+    """
+    nobs = x.shape[0]
+    n = _next_regular(2 * nobs + 1)
+    fx = np.fft.rfft(x, n=n, axis=0)
+    fy = fx if y is x else np.fft.rfft(y, n=n, axis=0)
+    return np.fft.irfft(fx * np.conjugate(fy), n=n, axis=0)[:nobs]
+
+
+def _acovf_many(x, unbiased=False, demean=True, fft=True, missing='none',
+                nlag=None):
+    """
+    Autocovariances of the columns of a 2-d array
+
+    Same options as `acovf`, except that missing='drop' is not supported.
+    Returns an array with lags in rows and series in columns.
+    """
+    x = np.asarray(x, dtype=np.double)
+    nobs = x.shape[0]
+    missing = missing.lower()
+    if missing not in ['none', 'raise', 'conservative']:
+        raise ValueError("missing option %s not understood or not "
+                         "available for 2-d x" % missing)
+    deal_with_masked = missing != 'none' and has_missing(x)
+    if deal_with_masked:
+        if missing == 'raise':
+            raise MissingDataError("NaNs were encountered in the data")
+        notmask = (~np.isnan(x)).astype(np.double)
+        x = np.where(notmask > 0, x, 0)
+        count = notmask.sum(0)
+
+    if demean and deal_with_masked:
+        xo = (x - x.sum(0) / count) * notmask
+    elif demean:
+        xo = x - x.mean(0)
+    else:
+        xo = x
+
+    lag_len = nobs - 1 if nlag is None else nlag
+    if lag_len > nobs - 1:
+        raise ValueError('nlag must be smaller than nobs - 1')
+
+    if fft:
+        acov = _fft_correlate(xo, xo)[:lag_len + 1]
+    else:
+        acov = np.empty((lag_len + 1,) + x.shape[1:])
+        acov[0] = (xo * xo).sum(0)
+        for i in range(lag_len):
+            acov[i + 1] = (xo[i + 1:] * xo[:-(i + 1)]).sum(0)
+
+    if unbiased and deal_with_masked:
+        if fft:
+            d = np.round(_fft_correlate(notmask, notmask)[:lag_len + 1])
+        else:
+            d = np.empty_like(acov)
+            d[0] = count
+            for i in range(lag_len):
+                d[i + 1] = (notmask[i + 1:] * notmask[:-(i + 1)]).sum(0)
+        d[d == 0] = 1
+    elif unbiased:
+        d = (nobs - np.arange(lag_len + 1))[:, None]
+    elif deal_with_masked:
+        d = count
+    else:
+        d = nobs
+    return acov / d
+
+
 def q_stat(x, nobs, type="ljungbox"):
     """
     Return's Ljung-Box Q Statistic
 
     x : array-like
         Array of autocorrelation coefficients.  Can be obtained from acf.
+        If 2d, then each column holds the coefficients of one series.
     nobs : int
         Number of observations in the entire sample (ie., not just the length
         of the autocorrelation function results.
@@ -452,10 +781,12 @@ def q_stat(x, nobs, type="ljungbox"):
     Written to be used with acf.
     """
     x = np.asarray(x)
+    # lags along the first axis, series along a second axis if there is one
+    lags = np.arange(1, len(x) + 1).reshape((-1,) + (1,) * (x.ndim - 1))
     if type == "ljungbox":
         ret = (nobs * (nobs + 2) *
-               np.cumsum((1. / (nobs - np.arange(1, len(x) + 1))) * x**2))
-    chi2 = stats.chi2.sf(ret, np.arange(1, len(x) + 1))
+               np.cumsum((1. / (nobs - lags)) * x**2, axis=0))
+    chi2 = stats.chi2.sf(ret, lags)
     return ret, chi2
 
 
@@ -470,7 +801,8 @@ def acf(x, unbiased=False, nlags=40, qstat=False, fft=None, alpha=None,
     Parameters
     ----------
     x : array
-       Time series data
+       Time series data. If 2d, then each column is a series and the
+       autocorrelations of all series are computed together.
     unbiased : bool
        If True, then denominators for autocovariance are n-k, otherwise n
     nlags: int, optional
@@ -487,14 +819,16 @@ def acf(x, unbiased=False, nlags=40, qstat=False, fft=None, alpha=None,
         Bartlett\'s formula.
     missing : str, optional
         A string in ['none', 'raise', 'conservative', 'drop'] specifying how the NaNs
-        are to be treated.
+        are to be treated. 'drop' is not available for 2d x.
 
     Returns
     -------
     acf : array
-        autocorrelation function
+        autocorrelation function, lags in rows and series in columns if x
+        is 2d
     confint : array, optional
         Confidence intervals for the ACF. Returned if confint is not None.
+        The last axis holds the lower and upper bound.
     qstat : array, optional
         The Ljung-Box Q-Statistic.  Returned if q_stat is True.
     pvalues : array, optional
@@ -511,6 +845,10 @@ def acf(x, unbiased=False, nlags=40, qstat=False, fft=None, alpha=None,
     the time series is long and only a small number of autocovariances are
     needed.
 
+    The autocovariances of all columns of a 2d x are computed with a single
+    batched FFT, or with direct estimators that are vectorized across
+    series if fft is False.
+
     If unbiased is true, the denominator for the autocovariance is adjusted
     but the autocorrelation is not an unbiased estimator.
 
@@ -530,17 +868,23 @@ def acf(x, unbiased=False, nlags=40, qstat=False, fft=None, alpha=None,
         fft = False
 
     nobs = len(x)  # should this shrink for missing='drop' and NaNs in x?
-    avf = acovf(x, unbiased=unbiased, demean=True, fft=fft, missing=missing)
+    x_arr = np.asarray(x)
+    if x_arr.ndim == 2 and x_arr.shape[1] > 1:
+        avf = _acovf_many(x_arr, unbiased=unbiased, demean=True, fft=fft,
+                          missing=missing, nlag=min(nlags, nobs - 1))
+    else:
+        avf = acovf(x, unbiased=unbiased, demean=True, fft=fft,
+                    missing=missing)
     acf = avf[:nlags + 1] / avf[0]
     if not (qstat or alpha):
         return acf
     if alpha is not None:
-        varacf = np.ones(nlags + 1) / nobs
+        varacf = np.ones(acf.shape) / nobs
         varacf[0] = 0
         varacf[1] = 1. / nobs
-        varacf[2:] *= 1 + 2 * np.cumsum(acf[1:-1]**2)
+        varacf[2:] *= 1 + 2 * np.cumsum(acf[1:-1]**2, axis=0)
         interval = stats.norm.ppf(1 - alpha / 2.) * np.sqrt(varacf)
-        confint = np.array(lzip(acf - interval, acf + interval))
+        confint = np.stack((acf - interval, acf + interval), axis=-1)
         if not qstat:
             return acf, confint
     if qstat:
@@ -683,7 +1027,9 @@ def pacf(x, nlags=40, method='ywunbiased', alpha=None):
     Parameters
     ----------
     x : 1d array
-        observations of time series for which pacf is calculated
+        observations of time series for which pacf is calculated. If 2d,
+        then each column is a series and the partial autocorrelations of
+        all series are computed together.
     nlags : int
         largest lag for which pacf is returned
     method : {'ywunbiased', 'ywmle', 'ols'}
@@ -704,17 +1050,38 @@ def pacf(x, nlags=40, method='ywunbiased', alpha=None):
     Returns
     -------
     pacf : 1d array
-        partial autocorrelations, nlags elements, including lag zero
+        partial autocorrelations, nlags elements, including lag zero. Lags
+        are in rows and series in columns if x is 2d.
     confint : array, optional
         Confidence intervals for the PACF. Returned if confint is not None.
+        The last axis holds the lower and upper bound.
 
     Notes
     -----
     This solves yule_walker equations or ols for each desired lag
     and contains currently duplicate calculations.
-    """
 
-    if method == 'ols':
+    If x is 2d, then the Yule-Walker and Levinson-Durbin methods, which give
+    the same partial autocorrelations, compute the autocovariances of all
+    series with a single batched FFT and run the Levinson-Durbin recursion
+    vectorized across series. The ols regressions of all series are solved
+    together from their normal equations.
+    """
+    x_arr = np.asarray(x)
+    if x_arr.ndim == 2 and x_arr.shape[1] > 1:
+        if method == 'ols':
+            ret = _pacf_ols_many(x_arr, nlags)
+        elif method in ['yw', 'ywu', 'ywunbiased', 'yw_unbiased', 'ld',
+                        'ldu', 'ldunbiase', 'ld_unbiased']:
+            acv = _acovf_many(x_arr, unbiased=True, fft=True, nlag=nlags)
+            ret = _levinson_durbin_pacf_many(acv, nlags)
+        elif method in ['ywm', 'ywmle', 'yw_mle', 'ldb', 'ldbiased',
+                        'ld_biased']:
+            acv = _acovf_many(x_arr, unbiased=False, fft=True, nlag=nlags)
+            ret = _levinson_durbin_pacf_many(acv, nlags)
+        else:
+            raise ValueError('method not available')
+    elif method == 'ols':
         ret = pacf_ols(x, nlags=nlags)
     elif method in ['yw', 'ywu', 'ywunbiased', 'yw_unbiased']:
         ret = pacf_yw(x, nlags=nlags, method='unbiased')
@@ -735,74 +1102,98 @@ def pacf(x, nlags=40, method='ywunbiased', alpha=None):
     if alpha is not None:
         varacf = 1. / len(x) # for all lags >=1
         interval = stats.norm.ppf(1. - alpha / 2.) * np.sqrt(varacf)
-        confint = np.array(lzip(ret - interval, ret + interval))
-        confint[0] = ret[0]  # fix confidence interval for lag 0 to varpacf=0
+        confint = np.stack((ret - interval, ret + interval), axis=-1)
+        # fix confidence interval for lag 0 to varpacf=0
+        confint[0] = ret[0][..., None]
         return ret, confint
     else:
         return ret
 
 
-def ccovf(x, y, unbiased=True, demean=True):
+def ccovf(x, y, unbiased=True, demean=True, fft=False):
     ''' crosscovariance for 1D
 
     Parameters
     ----------
     x, y : arrays
-       time series data
+       time series data. If 2d, then the cross-covariances of corresponding
+       columns are computed.
     unbiased : boolean
        if True, then denominators is n-k, otherwise n
+    demean : boolean
+       if True, then subtract the mean from each series
+    fft : boolean
+       if True, use FFT convolution, otherwise np.correlate. FFT is much
+       faster for long time series. Default False.
 
     Returns
     -------
     ccovf : array
-        autocovariance function
+        autocovariance function, lags in rows and series in columns if x
+        and y are 2d
 
     Notes
     -----
-    This uses np.correlate which does full convolution. For very long time
-    series it is recommended to use fft convolution instead.
+    The cross-covariances at lags 0, ..., n - 1 are the covariances between
+    x[t + k] and y[t]. With fft=False this uses np.correlate which does full
+    convolution for 1d series, and a direct estimator vectorized across
+    series for 2d series.
     '''
+    x = np.asarray(x)
+    y = np.asarray(y)
     n = len(x)
     if demean:
-        xo = x - x.mean()
-        yo = y - y.mean()
+        xo = x - x.mean(0)
+        yo = y - y.mean(0)
     else:
         xo = x
         yo = y
     if unbiased:
-        xi = np.ones(n)
-        d = np.correlate(xi, xi, 'full')
+        d = n - np.arange(n)
+        if x.ndim == 2:
+            d = d[:, None]
     else:
         d = n
-    return (np.correlate(xo, yo, 'full') / d)[n - 1:]
+    if fft:
+        return _fft_correlate(xo, yo) / d
+    if x.ndim == 2:
+        cov = np.empty(xo.shape)
+        for k in range(n):
+            cov[k] = (xo[k:] * yo[:n - k]).sum(0)
+        return cov / d
+    return np.correlate(xo, yo, 'full')[n - 1:] / d
 
 
-def ccf(x, y, unbiased=True):
+def ccf(x, y, unbiased=True, fft=False):
     '''cross-correlation function for 1d
 
     Parameters
     ----------
     x, y : arrays
-       time series data
+       time series data. If 2d, then the cross-correlations of corresponding
+       columns are computed.
     unbiased : boolean
        if True, then denominators for autocovariance is n-k, otherwise n
+    fft : boolean
+       if True, use FFT convolution, otherwise np.correlate. Default False.
 
     Returns
     -------
     ccf : array
-        cross-correlation function of x and y
+        cross-correlation function of x and y, lags in rows and series in
+        columns if x and y are 2d
 
     Notes
     -----
-    This is based np.correlate which does full convolution. For very long time
-    series it is recommended to use fft convolution instead.
+    With fft=False this is based np.correlate which does full convolution.
+    For very long time series fft should be used.
 
     If unbiased is true, the denominator for the autocovariance is adjusted
     but the autocorrelation is not an unbiased estimtor.
 
     '''
-    cvf = ccovf(x, y, unbiased=unbiased, demean=True)
-    return cvf / (np.std(x) * np.std(y))
+    cvf = ccovf(x, y, unbiased=unbiased, demean=True, fft=fft)
+    return cvf / (np.std(x, axis=0) * np.std(y, axis=0))
 
 
 def periodogram(X):
@@ -901,6 +1292,50 @@ def levinson_durbin(s, nlags=10, isacov=False):
     return sigma_v, arcoefs, pacf_, sig, phi  # return everything
 
 
+def _levinson_durbin_pacf_many(acov, nlags):
+    """
+    Partial autocorrelations from autocovariances by Levinson-Durbin
+
+    Vectorized version of `levinson_durbin` for the columns of `acov`, which
+    holds lags 0, ..., nlags in rows.
+    """
+    acov = np.asarray(acov)
+    pacf = np.empty((nlags + 1,) + acov.shape[1:])
+    pacf[0] = 1.
+    phi = np.zeros_like(pacf)
+    sig = acov[0]
+    for k in range(1, nlags + 1):
+        phikk = (acov[k] - (phi[1:k] * acov[k - 1:0:-1]).sum(0)) / sig
+        phi[1:k] = phi[1:k] - phikk * phi[k - 1:0:-1]
+        phi[k] = phikk
+        sig = sig * (1 - phikk ** 2)
+        pacf[k] = phikk
+    return pacf
+
+
+def _pacf_ols_many(x, nlags):
+    """
+    Partial autocorrelations by OLS for the columns of a 2-d array
+
+    Same as `pacf_ols` applied to each column. The regressions of all series
+    on their lags are solved together from the normal equations of the
+    centered variables, which absorb the constant.
+    """
+    x = np.asarray(x, dtype=np.double)
+    nobs = x.shape[0]
+    pacf = np.empty((nlags + 1, x.shape[1]))
+    pacf[0] = 1.
+    for k in range(1, nlags + 1):
+        # lags 1, ..., k of observations k, ..., nobs - 1
+        xlags = np.stack([x[k - i - 1:nobs - i - 1] for i in range(k)], 1)
+        xlags = xlags - xlags.mean(0)
+        x0 = x[k:] - x[k:].mean(0)
+        xtx = np.einsum('tis,tjs->sij', xlags, xlags)
+        xty = np.einsum('tis,ts->si', xlags, x0)
+        pacf[k] = np.linalg.solve(xtx, xty[:, :, None])[:, -1, 0]
+    return pacf
+
+
 def levinson_durbin_pacf(pacf, nlags=None):
     """
     Levinson-Durbin algorithm that returns the acf and ar coefficients
@@ -1390,8 +1825,44 @@ def _safe_arma_fit(y, order, model_kw, trend, fit_kw, start_params=None):
         return
 
 
+def _arma_order_fit(y, order, model_kw, trend, fit_kw, ic, start_params):
+    """
+    Fit one ARMA order for arma_order_select_ic
+
+    Only returns the information criteria, the parameters and the fit time
+    so that little data has to be sent back from worker processes.
+    """
+    t0 = time.time()
+    res = None
+    if start_params is not None:
+        res = _safe_arma_fit(y, order, model_kw, trend, fit_kw, start_params)
+    if res is None:
+        res = _safe_arma_fit(y, order, model_kw, trend, fit_kw)
+    elapsed = time.time() - t0
+    if res is None:
+        return None, None, elapsed
+    return [getattr(res, crit) for crit in ic], res.params, elapsed
+
+
+def _arma_warm_start(params, order, neighbor):
+    """
+    Start parameters for `order` from the params of the smaller `neighbor`
+
+    The coefficient of the additional AR or MA lag starts at zero, which
+    keeps the neighbor's stationarity and invertibility.
+    """
+    params = np.asarray(params)
+    if order[0] > neighbor[0]:
+        # insert after the last AR coefficient
+        idx = len(params) - neighbor[1]
+    else:
+        idx = len(params)
+    return np.insert(params, idx, 0.)
+
+
 def arma_order_select_ic(y, max_ar=4, max_ma=2, ic='bic', trend='c',
-                         model_kw=None, fit_kw=None):
+                         model_kw=None, fit_kw=None, n_jobs=1,
+                         warm_start=False, prune=None):
     """
     Returns information criteria for many ARMA models
 
@@ -1412,13 +1883,35 @@ def arma_order_select_ic(y, max_ar=4, max_ma=2, ic='bic', trend='c',
         Keyword arguments to be passed to the ``ARMA`` model
     fit_kw : dict
         Keyword arguments to be passed to ``ARMA.fit``.
+    n_jobs : int
+        Number of processes used to fit models of the same total order
+        p + q. -1 uses all cpus. Requires joblib, the models are fit
+        sequentially if it is not available. Default 1.
+    warm_start : bool
+        If True, the estimation of the ARMA(p, q) model starts from the
+        parameters of the ARMA(p - 1, q) or ARMA(p, q - 1) model, whichever
+        has the lower first information criterion, with a zero coefficient
+        for the additional lag. Models are fit from start parameters based
+        on Hannan-Rissanen if the warm start fails. Default False.
+    prune : float, optional
+        If not None, then the ARMA(p, q) model is not estimated if the
+        estimated neighbors ARMA(p - 1, q) and ARMA(p, q - 1) all have a
+        first information criterion that exceeds the minimum of all
+        previously estimated models by more than `prune`. An order is
+        also not estimated if all of its neighbors were pruned or failed
+        to estimate, so that pruning extends to all larger orders. Pruned
+        orders are reported as NaN. This is a heuristic, the information
+        criterion is not monotonic in the orders and there is no guarantee
+        that a pruned order does not have the smallest information
+        criterion.
 
     Returns
     -------
     obj : Results object
         Each ic is an attribute with a DataFrame for the results. The AR order
         used is the row index. The ma order used is the column index. The
-        minimum orders are available as ``ic_min_order``.
+        minimum orders are available as ``ic_min_order``. The fit time in
+        seconds of each model is available as a DataFrame in ``fit_time``.
 
     Examples
     --------
@@ -1446,6 +1939,11 @@ def arma_order_select_ic(y, max_ar=4, max_ma=2, ic='bic', trend='c',
     therefore a little slow. An implementation using approximate estimates
     will be provided in the future. In the meantime, consider passing
     {method : 'css'} to fit_kw.
+
+    The models are estimated in increasing total order p + q, so that the
+    smaller neighbors used by `warm_start` and `prune` are always available.
+    All models of the same total order are independent and are estimated in
+    parallel if n_jobs is not 1.
     """
     from pandas import DataFrame
 
@@ -1456,23 +1954,61 @@ def arma_order_select_ic(y, max_ar=4, max_ma=2, ic='bic', trend='c',
     elif not isinstance(ic, (list, tuple)):
         raise ValueError("Need a list or a tuple for ic if not a string.")
 
-    results = np.zeros((len(ic), max_ar + 1, max_ma + 1))
+    results = np.empty((len(ic), max_ar + 1, max_ma + 1))
+    results.fill(np.nan)
+    fit_time = np.empty((max_ar + 1, max_ma + 1))
+    fit_time.fill(np.nan)
     model_kw = {} if model_kw is None else model_kw
     fit_kw = {} if fit_kw is None else fit_kw
     y_arr = np.asarray(y)
-    for ar in ar_range:
-        for ma in ma_range:
-            if ar == 0 and ma == 0 and trend == 'nc':
-                results[:, ar, ma] = np.nan
-                continue
 
-            mod = _safe_arma_fit(y_arr, (ar, ma), model_kw, trend, fit_kw)
-            if mod is None:
-                results[:, ar, ma] = np.nan
+    if n_jobs == 1:
+        parallel, p_func = list, _arma_order_fit
+    else:
+        from statsmodels.tools.parallel import parallel_func
+        parallel, p_func, n_jobs = parallel_func(_arma_order_fit, n_jobs,
+                                                 verbose=0)
+
+    params = {}
+    # orders that were pruned or failed to estimate
+    skipped = set()
+    ic_min = np.inf
+    for total in range(max_ar + max_ma + 1):
+        orders = []
+        start_params = []
+        for ar in range(max(0, total - max_ma), min(total, max_ar) + 1):
+            ma = total - ar
+            if ar == 0 and ma == 0 and trend == 'nc':
                 continue
 
-            for i, criteria in enumerate(ic):
-                results[i, ar, ma] = getattr(mod, criteria)
+            existing = [nb for nb in [(ar - 1, ma), (ar, ma - 1)]
+                        if min(nb) >= 0 and
+                        not (nb == (0, 0) and trend == 'nc')]
+            neighbors = [nb for nb in existing if nb in params]
+            neighbor_ic = [results[0][nb] for nb in neighbors]
+            if prune is not None and existing:
+                if (all(nb in skipped for nb in existing) or
+                        min(neighbor_ic) > ic_min + prune):
+                    skipped.add((ar, ma))
+                    continue
+
+            sp = None
+            if warm_start and neighbors:
+                nb = neighbors[int(np.argmin(neighbor_ic))]
+                sp = _arma_warm_start(params[nb], (ar, ma), nb)
+            orders.append((ar, ma))
+            start_params.append(sp)
+
+        fits = parallel(p_func(y_arr, order, model_kw, trend, fit_kw, ic, sp)
+                        for order, sp in zip(orders, start_params))
+        for order, (ics, order_params, elapsed) in zip(orders, fits):
+            fit_time[order] = elapsed
+            if ics is not None:
+                results[(slice(None),) + order] = ics
+                params[order] = order_params
+                ic_min = min(ic_min, ics[0])
+            else:
+                skipped.add(order)
 
     dfs = [DataFrame(res, columns=ma_range, index=ar_range) for res in results]
 
@@ -1484,6 +2020,7 @@ def arma_order_select_ic(y, max_ar=4, max_ma=2, ic='bic', trend='c',
         mins = np.where(result.min().min() == result)
         min_res.update({i + '_min_order': (mins[0][0], mins[1][0])})
     res.update(min_res)
+    res['fit_time'] = DataFrame(fit_time, columns=ma_range, index=ar_range)
 
     return Bunch(**res)
 
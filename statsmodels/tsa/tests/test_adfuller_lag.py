@@ -47,3 +47,39 @@ def test_adf_autolag():
     adf3 = tsast.adfuller(x, maxlag=0, autolag='aic',
                           regression=tr, store=True, regresults=True)
     assert_equal(len(adf3[-1].autolag_results), 0 + 1)
+
+
+def test_autolag_nested_ols():
+    # single factorization agrees with fitting each lag length separately
+    d2 = macrodata.load_pandas().data
+    x = np.log(d2['realgdp'].values)
+    for tr in ['nc', 'c', 'ct', 'ctt']:
+        for autolag in ['aic', 'bic', 't-stat']:
+            adf1 = tsast.adfuller(x, maxlag=None, autolag=autolag,
+                                  regression=tr)
+            adf2 = tsast.adfuller(x, maxlag=None, autolag=autolag,
+                                  regression=tr, store=True, regresults=True)
+            assert_equal(adf1[2], adf2[-1].usedlag)
+            assert_almost_equal(adf1[0], adf2[0], decimal=12)
+            assert_almost_equal(adf1[-1], adf2[-1].icbest, decimal=8)
+
+
+def test_adfuller_many():
+    d2 = macrodata.load_pandas().data
+    x = np.log(d2[['realgdp', 'realcons', 'realinv', 'cpi']].values)
+    x = np.column_stack([x[1:], np.diff(x, axis=0)])
+    for tr in ['nc', 'c', 'ct', 'ctt']:
+        for autolag in ['AIC', 'BIC', 't-stat', None]:
+            res = tsast.adfuller_many(x, maxlag=8, autolag=autolag,
+                                      regression=tr)
+            for i in range(x.shape[1]):
+                res1 = tsast.adfuller(x[:, i], maxlag=8, autolag=autolag,
+                                      regression=tr)
+                assert_almost_equal(res[0][i], res1[0], decimal=8)
+                assert_almost_equal(res[1][i], res1[1], decimal=8)
+                assert_equal(res[2][i], res1[2])
+                assert_equal(res[3][i], res1[3])
+                for level in ['1%', '5%', '10%']:
+                    assert_almost_equal(res[4][level][i], res1[4][level])
+                if autolag is not None:
+                    assert_almost_equal(res[5][i], res1[5], decimal=8)
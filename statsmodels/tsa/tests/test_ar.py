@@ -333,6 +333,45 @@ def test_ar_select_order_tstat():
     assert_equal(res, 0)
 
 
+def test_ar_score_analytic():
+    from statsmodels.tools.numdiff import approx_fprime
+    data = sm.datasets.sunspots.load(as_pandas=False)
+    endog = data.endog
+    for trend in ['c', 'nc']:
+        res = AR(endog).fit(maxlag=3, method='mle', trend=trend, disp=0)
+        mod = res.model
+        params = res.params + .01
+        for transparams in [True, False]:
+            mod.transparams = transparams
+            assert_allclose(mod.score(params),
+                            approx_fprime(params, mod.loglike,
+                                          centered=True), rtol=1e-6)
+
+        res = AR(endog).fit(maxlag=3, trend=trend)
+        mod = res.model
+        params = res.params + .01
+        assert_allclose(mod.score(params),
+                        approx_fprime(params, mod.loglike, centered=True),
+                        rtol=1e-6)
+        assert_allclose(mod.hessian(params),
+                        approx_fprime(params, mod.score, centered=True),
+                        rtol=1e-6)
+
+
+def test_ar_presample_varcov():
+    # Hamilton 5.3.7 element by element
+    mod = AR(np.random.RandomState(0).randn(50))
+    mod.k_trend, mod.k_ar = 1, 4
+    params = np.array([.5, .4, -.2, .1, .05])
+    params0 = np.r_[-1, params[1:]]
+    expected = np.zeros((4, 4))
+    for i in range(1, 5):
+        expected[i - 1, i - 1:] = np.correlate(params0, params0[:i])[:-1]
+        expected[i - 1, i - 1:] -= np.correlate(params0[-i:], params0)[:-1]
+    expected = expected + expected.T - np.diag(expected.diagonal())
+    assert_allclose(mod._presample_varcov(params), expected, atol=1e-14)
+
+
 #TODO: likelihood for ARX model?
 #class TestAutolagARX(object):
 #    def setup(self):
@@ -2428,3 +2428,25 @@ def test_endog_int():
     resf = ARIMA(yf.cumsum(), order=(1, 1, 1)).fit(disp=0)
     assert_allclose(res.params, resf.params, rtol=1e-6, atol=1e-5)
     assert_allclose(res.bse, resf.bse, rtol=1e-6, atol=1e-5)
+
+
+def test_arma_score_css():
+    from statsmodels.tools.numdiff import approx_fprime
+    data = load_macrodata_pandas().data
+    endog = np.diff(np.log(data['realgdp'].values))
+    exog = data['realint'].values[1:]
+    for trend in ['c', 'nc']:
+        for exog_ in [None, exog]:
+            mod = ARMA(endog, (1, 1), exog=exog_)
+            res = mod.fit(method='css', trend=trend, disp=-1)
+            params = res.params + .01
+            mod.method = 'css'
+            for transparams in [True, False]:
+                mod.transparams = transparams
+                assert_allclose(mod.score(params),
+                                approx_fprime(params, mod.loglike,
+                                              args=(False,), centered=True),
+                                rtol=1e-5)
+            assert_allclose(mod.hessian(params),
+                            approx_fprime(params, mod.score, centered=True),
+                            rtol=1e-5)
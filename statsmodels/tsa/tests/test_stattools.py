@@ -19,7 +19,8 @@ from statsmodels.tsa.stattools import (adfuller, acf, pacf_yw,
                                        coint, acovf, kpss,
                                        arma_order_select_ic, levinson_durbin,
                                        levinson_durbin_pacf, pacf_burg,
-                                       innovations_algo, innovations_filter)
+                                       innovations_algo, innovations_filter,
+                                       ccf, ccovf)
 
 DECIMAL_8 = 8
 DECIMAL_6 = 6
@@ -573,6 +574,60 @@ def test_arma_order_select_ic():
     assert_equal(res.aic_min_order, (1, 2))
 
 
+def test_arma_order_select_ic_warm_start_parallel():
+    from statsmodels.tsa.arima_process import arma_generate_sample
+
+    arparams = np.array([1, -.75, .25])
+    maparams = np.array([1, .65, .35])
+    np.random.seed(2014)
+    y = arma_generate_sample(arparams, maparams, 250)
+    fit_kw = {'method': 'css'}
+    res = arma_order_select_ic(y, max_ar=3, max_ma=2, ic=['aic', 'bic'],
+                               trend='nc', fit_kw=fit_kw)
+    assert_equal(res.fit_time.shape, (4, 3))
+    assert_(np.isnan(res.fit_time.iloc[0, 0]))
+    assert_(np.all(res.fit_time.values.ravel()[1:] >= 0))
+
+    res_par = arma_order_select_ic(y, max_ar=3, max_ma=2, ic=['aic', 'bic'],
+                                   trend='nc', fit_kw=fit_kw, n_jobs=2)
+    assert_allclose(res_par.aic.values, res.aic.values)
+    assert_allclose(res_par.bic.values, res.bic.values)
+
+    res_warm = arma_order_select_ic(y, max_ar=3, max_ma=2,
+                                    ic=['aic', 'bic'], trend='nc',
+                                    fit_kw=fit_kw, warm_start=True)
+    assert_allclose(res_warm.aic.values, res.aic.values, rtol=1e-3)
+    assert_equal(res_warm.aic_min_order, res.aic_min_order)
+
+    res_prune = arma_order_select_ic(y, max_ar=3, max_ma=2, ic='aic',
+                                     trend='nc', fit_kw=fit_kw, prune=2.)
+    aic = res_prune.aic.values
+    fitted = ~np.isnan(aic)
+    assert_(np.isnan(aic).sum() > 1)
+    assert_allclose(aic[fitted], res.aic.values[fitted])
+    assert_equal(res_prune.aic_min_order, res.aic_min_order)
+    assert_(np.all(np.isnan(res_prune.fit_time.values[~fitted])))
+
+
+def test_arma_order_select_ic_prune_propagates():
+    from statsmodels.tsa.arima_process import arma_generate_sample
+
+    np.random.seed(2014)
+    y = arma_generate_sample([1, -.8], [1], 250)
+    res = arma_order_select_ic(y, max_ar=4, max_ma=0, ic='aic', trend='nc')
+    aic = res.aic.values[:, 0]
+    assert_(np.all(np.diff(aic[1:]) > 0))
+
+    # AR(3) is pruned since AIC of AR(2) exceeds the AIC of AR(1), AR(4)
+    # is not estimated since its only neighbor AR(3) was pruned
+    res_prune = arma_order_select_ic(y, max_ar=4, max_ma=0, ic='aic',
+                                     trend='nc', prune=0.)
+    aic_prune = res_prune.aic.values[:, 0]
+    assert_allclose(aic_prune[:3], aic[:3])
+    assert_(np.all(np.isnan(aic_prune[3:])))
+    assert_(np.all(np.isnan(res_prune.fit_time.values[3:, 0])))
+
+
 def test_arma_order_select_ic_failure():
     # this should trigger an SVD convergence failure, smoke test that it
     # returns, likely platform dependent failure...
@@ -594,6 +649,70 @@ def test_arma_order_select_ic_failure():
         res = arma_order_select_ic(y)
 
 
+@pytest.mark.parametrize('fft', [True, False])
+@pytest.mark.parametrize('unbiased', [True, False])
+def test_acf_2d(fft, unbiased):
+    rs = np.random.RandomState(0)
+    x = rs.standard_normal((250, 4)).cumsum(0)
+    res = acf(x, nlags=20, unbiased=unbiased, fft=fft, alpha=.05, qstat=True)
+    assert_equal(res[0].shape, (21, 4))
+    assert_equal(res[1].shape, (21, 4, 2))
+    for i in range(4):
+        res1 = acf(x[:, i], nlags=20, unbiased=unbiased, fft=fft, alpha=.05,
+                   qstat=True)
+        for r, r1 in zip(res, res1):
+            assert_allclose(r[:, i], r1,
+                            rtol=1e-10, atol=1e-12)
+
+
+@pytest.mark.parametrize('fft', [True, False])
+@pytest.mark.parametrize('unbiased', [True, False])
+def test_acf_2d_conservative(fft, unbiased):
+    rs = np.random.RandomState(0)
+    x = rs.standard_normal((250, 3)).cumsum(0)
+    x[[3, 50, 51, 200], 0] = np.nan
+    x[[10, 11], 2] = np.nan
+    res = acf(x, nlags=20, unbiased=unbiased, fft=fft,
+              missing='conservative')
+    for i in range(3):
+        res1 = acf(x[:, i], nlags=20, unbiased=unbiased, fft=fft,
+                   missing='conservative')
+        assert_allclose(res[:, i], res1, rtol=1e-10)
+    with pytest.raises(MissingDataError):
+        acf(x, nlags=20, fft=fft, missing='raise')
+    with pytest.raises(ValueError):
+        acf(x, nlags=20, fft=fft, missing='drop')
+
+
+@pytest.mark.parametrize('method', ['ywunbiased', 'ywmle', 'ldb', 'ols'])
+def test_pacf_2d(method):
+    rs = np.random.RandomState(0)
+    x = rs.standard_normal((250, 3)).cumsum(0)
+    res, confint = pacf(x, nlags=10, method=method, alpha=.05)
+    assert_equal(confint.shape, (11, 3, 2))
+    assert_equal(confint[0], np.ones((3, 2)))
+    for i in range(3):
+        res1, confint1 = pacf(x[:, i], nlags=10, method=method, alpha=.05)
+        assert_allclose(res[:, i], res1, rtol=1e-8)
+        assert_allclose(confint[:, i], confint1, rtol=1e-8)
+
+
+def test_ccf_fft_2d():
+    rs = np.random.RandomState(0)
+    x = rs.standard_normal((100, 3))
+    y = x + rs.standard_normal((100, 3))
+    for unbiased in [True, False]:
+        res = ccf(x, y, unbiased=unbiased, fft=True)
+        assert_equal(res.shape, (100, 3))
+        assert_allclose(ccf(x, y, unbiased=unbiased), res, atol=1e-12)
+        for i in range(3):
+            res1 = ccf(x[:, i], y[:, i], unbiased=unbiased)
+            assert_allclose(res[:, i], res1, atol=1e-12)
+            res1 = ccovf(x[:, i], y[:, i], unbiased=unbiased)
+            assert_allclose(ccovf(x[:, i], y[:, i], unbiased=unbiased,
+                                  fft=True), res1, atol=1e-12)
+
+
 def test_acf_fft_dataframe():
     # regression test #322
 